@@ -0,0 +1,84 @@
+"""Benchmark looking up tip length and labware calibrations.
+
+Saves tip length calibrations for a few pipettes and tip racks, and offsets
+for a few labware, in a temporary directory, then looks up a tip length the
+way every tip rack load does and lists every calibration the way the robot
+server's calibration endpoints do, and prints the wall time of each.
+"""
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons import config
+from opentrons.calibration_storage import get, modify
+from opentrons.protocols.labware import get_labware_definition
+from opentrons.types import Point
+
+PIPETTES = [f"P300MV{n:02d}" for n in range(8)]
+TIPRACKS = [
+    "opentrons_96_tiprack_10ul",
+    "opentrons_96_tiprack_20ul",
+    "opentrons_96_tiprack_300ul",
+    "opentrons_96_tiprack_1000ul",
+    "opentrons_96_filtertiprack_200ul",
+]
+LABWARE = [
+    "corning_384_wellplate_112ul_flat",
+    "corning_96_wellplate_360ul_flat",
+    "nest_12_reservoir_15ml",
+    "nest_96_wellplate_100ul_pcr_full_skirt",
+]
+LOOKUPS = 100
+LISTINGS = 20
+
+
+def _time(description: str, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    print(f"calibration lookups: {description}: {elapsed * 1000:.1f} ms")
+
+
+def _use_config_dir(config_dir: Path) -> None:
+    for key in [
+        "labware_calibration_offsets_dir_v2",
+        "tip_length_calibration_dir",
+    ]:
+        config.CONFIG[key] = config_dir / key
+        config.CONFIG[key].mkdir()
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        _use_config_dir(Path(config_dir))
+
+        tipracks = [get_labware_definition(load_name) for load_name in TIPRACKS]
+        for pipette in PIPETTES:
+            for tiprack in tipracks:
+                modify.save_tip_length_calibration(
+                    pipette, modify.create_tip_length_data(tiprack, 50)
+                )
+        for load_name in LABWARE:
+            definition = get_labware_definition(load_name)
+            modify.save_labware_calibration(
+                f"{load_name}.json", definition, Point(1, 2, 3)
+            )
+
+        tiprack = tipracks[0]
+        start = time.perf_counter()
+        for _ in range(LOOKUPS):
+            get.load_tip_length_calibration(PIPETTES[0], tiprack)
+        _time(f"look up a tip length {LOOKUPS} times", start)
+
+        start = time.perf_counter()
+        for _ in range(LISTINGS):
+            get.get_all_tip_length_calibrations()
+        _time(f"list all tip length calibrations {LISTINGS} times", start)
+
+        start = time.perf_counter()
+        for _ in range(LISTINGS):
+            get.get_all_calibrations()
+        _time(f"list all labware calibrations {LISTINGS} times", start)
+
+
+if __name__ == "__main__":
+    main()
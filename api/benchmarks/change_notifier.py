@@ -0,0 +1,116 @@
+"""Benchmark ProtocolEngine state change wakeups with many concurrent waiters.
+
+Starts N tasks, each waiting for a different command to complete, then runs
+every command to completion. Counts how many times waiters re-check their
+conditions per action, with and without subscribing to a command's topic.
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+
+from opentrons_shared_data.deck import load as load_deck
+
+from opentrons.protocols.api_support.constants import STANDARD_OT2_DECK
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    Action,
+    PlayAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.state import CommandTopic, Config, StateStore
+
+WAITER_COUNTS = [10, 100, 1000]
+CREATED_AT = datetime(year=2022, month=1, day=1)
+
+
+def _build_run_actions(command_ids: List[str]) -> List[Action]:
+    actions: List[Action] = [PlayAction(requested_at=CREATED_AT)]
+
+    for command_id in command_ids:
+        for status in (
+            commands.CommandStatus.RUNNING,
+            commands.CommandStatus.SUCCEEDED,
+        ):
+            actions.append(
+                UpdateCommandAction(
+                    command=commands.WaitForResume.construct(
+                        id=command_id,
+                        key=command_id,
+                        createdAt=CREATED_AT,
+                        params=commands.WaitForResumeParams(),
+                        status=status,
+                    )
+                )
+            )
+
+    return actions
+
+
+async def _run(waiter_count: int, use_topics: bool) -> None:
+    state_store = StateStore(
+        config=Config(),
+        deck_definition=load_deck(STANDARD_OT2_DECK, 3),
+        deck_fixed_labware=[],
+        is_door_open=False,
+    )
+    command_ids = [f"command-{i}" for i in range(waiter_count)]
+    check_count = 0
+
+    def _get_is_complete(command_id: str) -> bool:
+        nonlocal check_count
+        check_count += 1
+        return state_store.commands.get_is_complete(command_id)
+
+    for command_id in command_ids:
+        state_store.handle_action(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=CREATED_AT,
+                request=commands.WaitForResumeCreate(
+                    params=commands.WaitForResumeParams()
+                ),
+            )
+        )
+
+    waiters = [
+        asyncio.create_task(
+            state_store.wait_for(
+                _get_is_complete,
+                command_id=command_id,
+                topics=[CommandTopic(command_id)] if use_topics else None,
+            )
+        )
+        for command_id in command_ids
+    ]
+    await asyncio.sleep(0)
+    check_count = 0
+
+    actions = _build_run_actions(command_ids)
+    start = time.perf_counter()
+
+    for action in actions:
+        state_store.handle_action(action)
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*waiters)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"change notifier: {waiter_count} waiters, "
+        f"{'command topics' if use_topics else 'all changes'}: "
+        f"{check_count / len(actions):.1f} wakeups/action, "
+        f"{elapsed / len(actions) * 1e6:.1f} us/action"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for waiter_count in WAITER_COUNTS:
+        for use_topics in (False, True):
+            asyncio.run(_run(waiter_count, use_topics))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark ProtocolEngine command state selectors over long runs.
+
+Replays queue, run, and succeed actions for every command of a large run
+through a CommandStore, evaluating the selectors that `StateStore.wait_for`
+predicates poll after every action. The time per action should stay flat
+as the number of commands grows.
+"""
+import time
+from datetime import datetime
+from typing import List
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    Action,
+    PlayAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.state import Config
+from opentrons.protocol_engine.state.commands import CommandStore, CommandView
+
+COMMAND_COUNTS = [1000, 10000, 50000]
+CREATED_AT = datetime(year=2022, month=1, day=1)
+
+
+def _build_actions(command_count: int) -> List[Action]:
+    queue_actions: List[Action] = []
+    run_actions: List[Action] = []
+
+    for i in range(command_count):
+        command_id = f"command-{i}"
+        params = commands.WaitForResumeParams()
+        queue_actions.append(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=CREATED_AT,
+                request=commands.WaitForResumeCreate(params=params),
+            )
+        )
+        for status in (
+            commands.CommandStatus.RUNNING,
+            commands.CommandStatus.SUCCEEDED,
+        ):
+            run_actions.append(
+                UpdateCommandAction(
+                    command=commands.WaitForResume.construct(
+                        id=command_id,
+                        key=command_id,
+                        createdAt=CREATED_AT,
+                        params=params,
+                        status=status,
+                    )
+                )
+            )
+
+    return [*queue_actions, PlayAction(requested_at=CREATED_AT), *run_actions]
+
+
+def _replay(actions: List[Action]) -> float:
+    subject = CommandStore(config=Config(), is_door_open=False)
+    start = time.perf_counter()
+
+    for action in actions:
+        subject.handle_action(action)
+        view = CommandView(subject.state)
+        view.get_current()
+        view.get_all_complete()
+        view.get_next_queued()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for command_count in COMMAND_COUNTS:
+        actions = _build_actions(command_count)
+        elapsed = _replay(actions)
+        print(
+            f"command store: {command_count} commands, {len(actions)} actions: "
+            f"{elapsed:.3f} s total, {elapsed / len(actions) * 1e6:.1f} us/action"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark loading large JSON protocols into a ProtocolEngine.
+
+Builds a JSONv6 protocol of tens of thousands of commands by repeating the
+liquid handling commands of a fixture from shared-data, then prints the
+wall time of queueing its commands one at a time and all at once, and of
+loading the whole protocol file with a ProtocolRunner.
+"""
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons_shared_data import load_shared_data
+
+from opentrons.hardware_control import API as HardwareAPI
+from opentrons.protocol_engine import Config, create_protocol_engine
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from opentrons.protocol_runner import create_simulating_runner
+from opentrons.protocol_runner.json_command_translator import JsonCommandTranslator
+from opentrons.protocol_runner.json_file_reader import JsonFileReader
+
+FIXTURE = "protocol/fixtures/6/transferSettings.json"
+COMMANDS = 30000
+
+
+def _write_large_protocol(directory: Path) -> Path:
+    protocol = json.loads(load_shared_data(FIXTURE))
+    setup = [c for c in protocol["commands"] if c["commandType"].startswith("load")]
+    steps = [c for c in protocol["commands"] if c not in setup]
+    protocol["commands"] = setup + [
+        steps[i % len(steps)] for i in range(COMMANDS - len(setup))
+    ]
+    protocol_file = directory / "large_protocol.json"
+    protocol_file.write_text(json.dumps(protocol))
+    return protocol_file
+
+
+def _time(description: str, count: int, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    print(f"json protocol loading: {description}: {count} commands: ", end="")
+    print(f"{elapsed * 1000:.1f} ms")
+
+
+async def _queue_commands(protocol_source: ProtocolSource) -> None:
+    protocol = JsonFileReader.read(protocol_source)
+    requests = JsonCommandTranslator().translate(protocol)
+    hardware_api = await HardwareAPI.build_hardware_simulator()
+
+    engine = await create_protocol_engine(hardware_api=hardware_api, config=Config())
+    start = time.perf_counter()
+    for request in requests:
+        engine.add_command(request)
+    _time("queue one at a time", len(requests), start)
+
+    engine = await create_protocol_engine(hardware_api=hardware_api, config=Config())
+    start = time.perf_counter()
+    engine.add_commands(requests)
+    _time("queue all at once", len(requests), start)
+
+
+async def _load_protocol(protocol_source: ProtocolSource) -> None:
+    runner = await create_simulating_runner()
+    start = time.perf_counter()
+    runner.load(protocol_source)
+    _time("load the protocol file", COMMANDS, start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with tempfile.TemporaryDirectory() as directory:
+        protocol_file = _write_large_protocol(Path(directory))
+        protocol_source = asyncio.run(
+            ProtocolReader().read_saved(files=[protocol_file], directory=None)
+        )
+        asyncio.run(_queue_commands(protocol_source))
+        asyncio.run(_load_protocol(protocol_source))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark loading labware definitions in the Protocol Engine.
+
+Loads a set of labware definitions through the LabwareDataProvider the way
+the loadLabware command does: cold, again in the same process, and then from
+a fresh registry that reads the definitions pre-parsed from a cache
+directory, the way a new analysis worker does, and prints the wall time of
+each pass.
+"""
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons.protocol_engine.resources import LabwareDataProvider
+from opentrons.protocols.api_support.constants import (
+    STANDARD_DEFS_PATH,
+    USER_DEFS_PATH,
+)
+from opentrons.protocols.labware import registry
+from opentrons_shared_data import get_shared_data_root
+
+LOAD_NAMES = [
+    "corning_384_wellplate_112ul_flat",
+    "nest_96_wellplate_100ul_pcr_full_skirt",
+    "opentrons_96_tiprack_300ul",
+    "opentrons_96_tiprack_20ul",
+    "nest_12_reservoir_15ml",
+    "opentrons_1_trash_1100ml_fixed",
+]
+
+
+async def _load_all(description: str) -> None:
+    provider = LabwareDataProvider()
+    start = time.perf_counter()
+    for load_name in LOAD_NAMES:
+        await provider.get_labware_definition(load_name, "opentrons", 1)
+    elapsed = time.perf_counter() - start
+    print(
+        f"labware definitions: {description}: {len(LOAD_NAMES)} definitions: "
+        f"{elapsed * 1000:.1f} ms"
+    )
+
+
+def _reset_registry(cache_dir: Path) -> None:
+    registry._registry = registry.LabwareDefinitionRegistry(
+        standard_root=get_shared_data_root() / STANDARD_DEFS_PATH,
+        custom_root=USER_DEFS_PATH,
+        cache_dir=cache_dir,
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _reset_registry(Path(cache_dir))
+        asyncio.run(_load_all("cold"))
+        asyncio.run(_load_all("warm"))
+        _reset_registry(Path(cache_dir))
+        asyncio.run(_load_all("new process, from the cache directory"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark loading 384-well plates and looking up their wells.
+
+Loads a deck of 384-well plates, then looks wells up by name, lists rows and
+columns, and plans an 8-channel transfer between two of the plates the way
+InstrumentContext.transfer does, and prints the wall time of each along with
+the memory the loaded plates hold on to.
+"""
+import time
+import tracemalloc
+from typing import List
+
+from opentrons import simulate
+from opentrons.protocol_api import labware
+from opentrons.protocols.advanced_control import transfers
+from opentrons.protocols.api_support.types import APIVersion
+
+PLATE = "corning_384_wellplate_112ul_flat"
+SLOTS = [str(slot) for slot in range(1, 12)]
+LOOKUPS = 20
+
+
+def _time(description: str, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    print(f"labware loading: {description}: {elapsed * 1000:.1f} ms")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    ctx = simulate.get_protocol_api("2.12")
+    definition = labware.get_labware_definition(PLATE)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    plates: List[labware.Labware] = [
+        ctx.load_labware_from_definition(definition, slot) for slot in SLOTS
+    ]
+    _time(f"load {len(plates)} 384-well plates", start)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"labware loading: memory held by the plates: {size / 1024:.0f} KiB")
+
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        for plate in plates:
+            plate["P24"].top()
+    _time(f"look up one well of every plate {LOOKUPS} times", start)
+
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        for plate in plates:
+            plate.wells_by_name()
+            plate.rows()
+            plate.columns()
+    _time(f"list the wells, rows and columns of every plate {LOOKUPS} times", start)
+
+    pipette = ctx.load_instrument("p300_multi_gen2", "left")
+    source, dest = plates[0], plates[1]
+    start = time.perf_counter()
+    plan = transfers.TransferPlan(
+        10,
+        source.rows()[0] + source.rows()[1],
+        dest.rows()[0] + dest.rows()[1],
+        pipette,
+        pipette.max_volume,
+        APIVersion(2, 12),
+        "transfer",
+    )
+    steps = sum(1 for _ in plan)
+    _time(f"plan an 8-channel transfer of {steps} steps", start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark analyzing large Python Protocol API v2 protocols.
+
+Analyzes protocols from g-code-testing with a simulating ProtocolRunner,
+the way `opentrons.cli.analyze` and the robot server do, and prints the wall
+time of each analysis along with how many commands it reported.
+"""
+import asyncio
+import time
+from pathlib import Path
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner import create_simulating_runner
+
+PROTOCOLS_DIR = (
+    Path(__file__).resolve().parents[2]
+    / "g-code-testing"
+    / "g_code_test_data"
+    / "protocol"
+)
+PROTOCOLS = [
+    "protocols/fast/beckman_coulter_rna_advance_viral_rna_isolation.py",
+    "protocols/slow/swift_smoke.py",
+]
+
+
+async def _analyze(protocol: Path) -> None:
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol], directory=None
+    )
+    start = time.perf_counter()
+    runner = await create_simulating_runner()
+    result = await runner.run(protocol_source)
+    elapsed = time.perf_counter() - start
+    assert result.state_summary.errors == [], result.state_summary.errors
+    print(
+        f"legacy analysis: {protocol.name}: {len(result.commands)} commands: "
+        f"{elapsed * 1000:.1f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for protocol in PROTOCOLS:
+        asyncio.run(_analyze(PROTOCOLS_DIR / protocol))
+
+
+if __name__ == "__main__":
+    main()
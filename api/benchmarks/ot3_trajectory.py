@@ -0,0 +1,76 @@
+"""Benchmark a 96-well transfer pattern on the OT-3 simulator.
+
+Moves the left mount from every well of one plate to the same well of
+another, arcing up to a safe height between wells, once with a move_to
+for every corner of the arc and once with a move_trajectory for each arc.
+Prints the wall time of each.
+"""
+import asyncio
+import time
+from typing import List
+
+from opentrons.hardware_control.ot3api import OT3API
+from opentrons.hardware_control.types import OT3Mount
+from opentrons.types import Point
+
+SOURCE_A1 = Point(14.4, 74.3, 0)
+DEST_A1 = Point(146.9, 74.3, 0)
+WELL_SPACING = 9.0
+SAFE_Z = 150.0
+WELL_Z = 80.0
+
+
+def _well_position(a1: Point, index: int) -> Point:
+    column, row = divmod(index, 8)
+    return Point(a1.x + column * WELL_SPACING, a1.y - row * WELL_SPACING, WELL_Z)
+
+
+def _arcs() -> List[List[Point]]:
+    arcs = []
+    for i in range(96):
+        for a1 in (SOURCE_A1, DEST_A1):
+            well = _well_position(a1, i)
+            arcs.append(
+                [
+                    Point(well.x, well.y, SAFE_Z),
+                    well,
+                ]
+            )
+    return arcs
+
+
+async def _move_to(api: OT3API, arcs: List[List[Point]]) -> None:
+    for arc in arcs:
+        current = await api.gantry_position(OT3Mount.LEFT)
+        await api.move_to(OT3Mount.LEFT, current._replace(z=SAFE_Z))
+        for point in arc:
+            await api.move_to(OT3Mount.LEFT, point)
+
+
+async def _move_trajectory(api: OT3API, arcs: List[List[Point]]) -> None:
+    for arc in arcs:
+        current = await api.gantry_position(OT3Mount.LEFT)
+        await api.move_trajectory(OT3Mount.LEFT, [current._replace(z=SAFE_Z)] + arc)
+
+
+async def _main() -> None:
+    api = await OT3API.build_hardware_simulator()
+    arcs = _arcs()
+    for description, transfer in (
+        ("move_to", _move_to),
+        ("move_trajectory", _move_trajectory),
+    ):
+        await api.home()
+        start = time.perf_counter()
+        await transfer(api, arcs)
+        elapsed = time.perf_counter() - start
+        print(f"ot3 trajectory: 96-well transfer with {description}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark loading the same protocols and labware repeatedly.
+
+Parses a long Python protocol, reads a Protocol API v3 protocol with the
+protocol runner's file reader, validates a JSON protocol against its schema,
+and verifies every standard labware definition twice, as repeated analyses
+and runs of the same protocols do, and prints the wall time of each.
+"""
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons_shared_data import get_shared_data_root, load_shared_data
+
+from opentrons.protocol_reader import ProtocolSource, PythonProtocolConfig
+from opentrons.protocol_runner.python_file_reader import PythonFileReader
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.labware import verify_definition
+from opentrons.protocols.parse import parse
+
+REPEATS = 50
+TRANSFERS = 500
+
+
+def _python_protocol(api_level: str) -> str:
+    lines = [
+        f'metadata = {{"apiLevel": "{api_level}"}}',
+        "",
+        "def run(ctx):",
+        '    tiprack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)',
+        '    plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)',
+        '    pipette = ctx.load_instrument("p300_single_gen2", "left", [tiprack])',
+    ]
+    for i in range(TRANSFERS):
+        source, dest = i % 96, (i + 1) % 96
+        lines.append(
+            f"    pipette.transfer({10 + i % 50}, plate.wells()[{source}],"
+            f" plate.wells()[{dest}], new_tip='always')"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _time(description: str, count: int, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    print(
+        f"protocol loading: {description}: {count} times: {elapsed * 1000:.1f} ms "
+        f"({elapsed / count * 1000:.2f} ms each)"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    python_protocol = _python_protocol("2.12")
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        parse(python_protocol, "protocol.py")
+    _time(f"parse a {TRANSFERS} transfer Python protocol", REPEATS, start)
+
+    with tempfile.TemporaryDirectory() as directory:
+        main_file = Path(directory) / "protocol.py"
+        main_file.write_text(_python_protocol("3.0"))
+        protocol_source = ProtocolSource(
+            directory=Path(directory),
+            main_file=main_file,
+            files=[],
+            metadata={},
+            config=PythonProtocolConfig(api_version=APIVersion(3, 0)),
+            labware_definitions=[],
+        )
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            PythonFileReader.read(protocol_source)
+        _time(f"read a {TRANSFERS} transfer Python v3 protocol", REPEATS, start)
+
+    json_protocol = load_shared_data("protocol/fixtures/4/simpleV4.json").decode()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        parse(json_protocol, "simpleV4.json")
+    _time("parse a JSON protocol", REPEATS, start)
+
+    definitions = [
+        json.loads(path.read_text())
+        for path in sorted(get_shared_data_root().glob("labware/definitions/2/*/*"))
+    ]
+    for verification in ("first", "second"):
+        start = time.perf_counter()
+        for definition in definitions:
+            verify_definition(definition)
+        _time(
+            f"verify standard labware definitions the {verification} time",
+            len(definitions),
+            start,
+        )
+
+
+if __name__ == "__main__":
+    main()
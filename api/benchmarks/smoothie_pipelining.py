@@ -0,0 +1,101 @@
+"""Benchmark a 96-well transfer against the Smoothie emulator.
+
+Runs the gantry and plunger moves of a single-channel transfer from every
+well of one plate to the same well of another through a SmoothieDriver
+connected to the Smoothie emulator, once waiting for every command to
+finish (M400) and once with pipelined moves. Prints the number of serial
+round-trips and the wall time of each.
+"""
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Tuple, TypeVar
+
+from opentrons.config import robot_configs
+from opentrons.drivers.smoothie_drivers import SmoothieDriver
+from opentrons.hardware_control.emulation.scripts import run_smoothie
+from opentrons.hardware_control.emulation.settings import Settings, SmoothieSettings
+
+PORT = 9986
+SOURCE_A1 = (14.4, 74.3)
+DEST_A1 = (146.9, 74.3)
+WELL_SPACING = 9.0
+SAFE_Z = 150.0
+WELL_Z = 80.0
+PLUNGER_BOTTOM = 2.0
+PLUNGER_ASPIRATED = 12.0
+
+_ReturnT = TypeVar("_ReturnT")
+
+
+def _run_emulator(settings: Settings) -> None:
+    asyncio.run(run_smoothie.run(settings))
+
+
+def _count_round_trips(driver: SmoothieDriver) -> Dict[str, int]:
+    connection = driver._connection
+    assert connection is not None
+    send_command = connection.send_command
+    counts = {"round trips": 0}
+
+    async def _counting_send_command(*args: object, **kwargs: object) -> str:
+        counts["round trips"] += 1
+        return await send_command(*args, **kwargs)  # type: ignore[arg-type]
+
+    connection.send_command = _counting_send_command  # type: ignore[assignment]
+    return counts
+
+
+def _well_position(a1: Tuple[float, float], index: int) -> Dict[str, float]:
+    column, row = divmod(index, 8)
+    return {"X": a1[0] + column * WELL_SPACING, "Y": a1[1] - row * WELL_SPACING}
+
+
+async def _transfer(driver: SmoothieDriver) -> None:
+    for i in range(96):
+        for a1, plunger in ((SOURCE_A1, PLUNGER_ASPIRATED), (DEST_A1, PLUNGER_BOTTOM)):
+            await driver.move(_well_position(a1, i))
+            await driver.move({"A": WELL_Z})
+            await driver.move({"C": plunger})
+            await driver.move({"A": SAFE_Z})
+    await driver.update_position()
+
+
+async def _time(description: str, func: Callable[[], Awaitable[_ReturnT]]) -> _ReturnT:
+    start = time.perf_counter()
+    result = await func()
+    elapsed = time.perf_counter() - start
+    print(f"smoothie pipelining: {description}: {elapsed:.2f} s")
+    return result
+
+
+async def _benchmark(pipelined: bool) -> None:
+    driver = await SmoothieDriver.build(
+        port=f"socket://127.0.0.1:{PORT}",
+        config=robot_configs.load_ot2(),
+        pipelined=pipelined,
+    )
+    await driver.home()
+    await driver.move({"A": SAFE_Z, "C": PLUNGER_BOTTOM})
+    counts = _count_round_trips(driver)
+
+    mode = "pipelined" if pipelined else "unpipelined"
+    await _time(f"{mode} 96-well transfer", lambda: _transfer(driver))
+    print(f"smoothie pipelining: {mode} round trips: {counts['round trips']}")
+
+    await driver.disconnect()
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    settings = Settings(smoothie=SmoothieSettings(host="127.0.0.1", port=PORT))
+    emulator = threading.Thread(target=_run_emulator, args=(settings,), daemon=True)
+    emulator.start()
+    time.sleep(0.5)
+
+    for pipelined in (False, True):
+        asyncio.run(_benchmark(pipelined))
+
+
+if __name__ == "__main__":
+    main()
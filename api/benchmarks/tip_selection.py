@@ -0,0 +1,54 @@
+"""Benchmark selecting tips across many tipracks.
+
+Picks up every tip of ten 96-well tipracks, one at a time with a single
+channel and one column at a time with an 8-channel, the way
+InstrumentContext.pick_up_tip chooses tips, and prints the wall time of each.
+"""
+import time
+from typing import List
+
+from opentrons.protocol_api import labware
+from opentrons.protocols.context.protocol_api.labware import LabwareImplementation
+from opentrons.types import Location, Point
+
+TIPRACKS = 10
+
+
+def _tipracks() -> List[labware.Labware]:
+    definition = labware.get_labware_definition("opentrons_96_tiprack_300ul")
+    return [
+        labware.Labware(
+            implementation=LabwareImplementation(
+                definition, Location(Point(0, 0, 0), f"Slot {i}")
+            )
+        )
+        for i in range(TIPRACKS)
+    ]
+
+
+def _pick_up_all(tipracks: List[labware.Labware], channels: int) -> int:
+    picked_up = 0
+    while True:
+        try:
+            tiprack, well = labware.next_available_tip(None, tipracks, channels)
+        except labware.OutOfTipsError:
+            return picked_up
+        tiprack.use_tips(well, channels)
+        picked_up += 1
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for channels in (1, 8):
+        tipracks = _tipracks()
+        start = time.perf_counter()
+        picked_up = _pick_up_all(tipracks, channels)
+        elapsed = time.perf_counter() - start
+        print(
+            f"tip selection: {picked_up} pickups with {channels} channel(s) "
+            f"from {TIPRACKS} tipracks: {elapsed * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
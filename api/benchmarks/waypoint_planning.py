@@ -0,0 +1,188 @@
+"""Benchmark ProtocolEngine waypoint planning over a long protocol.
+
+Loads a deck of tip racks, plates and a module with labware offsets into a
+StateStore, then plans the moves of a 20,000 command JSON protocol that
+transfers between plates, so that every move is a general arc over the
+whole deck. Prints the total and per-move planning time.
+"""
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+from opentrons_shared_data import load_shared_data
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware import load_definition
+
+from opentrons.protocols.api_support.constants import STANDARD_OT2_DECK
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.types import DeckSlotName, Point
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    AddLabwareOffsetAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.resources import DeckFixedLabware
+from opentrons.protocol_engine.state import Config, StateStore
+from opentrons.protocol_engine.state.pipettes import CurrentWell
+from opentrons.protocol_engine.types import (
+    DeckSlotLocation,
+    LabwareLocation,
+    LabwareOffsetCreate,
+    LabwareOffsetLocation,
+    LabwareOffsetVector,
+    ModuleDefinition,
+    ModuleLocation,
+    ModuleModel,
+    WellLocation,
+)
+
+COMMAND_COUNT = 20000
+CREATED_AT = datetime(year=2022, month=1, day=1)
+PLATE = "corning_96_wellplate_360ul_flat"
+TIPRACK = "opentrons_96_tiprack_300ul"
+
+
+def _labware_definition(load_name: str) -> LabwareDefinition:
+    return LabwareDefinition.parse_obj(load_definition(load_name, 1))
+
+
+def _load_labware(
+    labware_id: str, location: commands.LoadLabwareParams, offset_id: str
+) -> UpdateCommandAction:
+    definition = _labware_definition(location.loadName)
+    return UpdateCommandAction(
+        command=commands.LoadLabware(
+            id=f"load-{labware_id}",
+            key=f"load-{labware_id}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=CREATED_AT,
+            params=location,
+            result=commands.LoadLabwareResult(
+                labwareId=labware_id, definition=definition, offsetId=offset_id
+            ),
+        )
+    )
+
+
+def _build_state() -> Tuple[StateStore, List[str]]:
+    trash = _labware_definition("opentrons_1_trash_1100ml_fixed")
+    state = StateStore(
+        config=Config(),
+        deck_definition=load_deck(STANDARD_OT2_DECK, 3),
+        deck_fixed_labware=[
+            DeckFixedLabware(
+                labware_id="fixedTrash",
+                location=DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH),
+                definition=trash,
+            )
+        ],
+        is_door_open=False,
+    )
+
+    module_definition = ModuleDefinition.parse_raw(
+        load_shared_data("module/definitions/3/temperatureModuleV2.json")
+    )
+    state.handle_action(
+        UpdateCommandAction(
+            command=commands.LoadModule(
+                id="load-module",
+                key="load-module",
+                status=commands.CommandStatus.SUCCEEDED,
+                createdAt=CREATED_AT,
+                params=commands.LoadModuleParams(
+                    model=ModuleModel.TEMPERATURE_MODULE_V2,
+                    location=DeckSlotLocation(slotName=DeckSlotName.SLOT_10),
+                ),
+                result=commands.LoadModuleResult(
+                    moduleId="module",
+                    definition=module_definition,
+                    model=ModuleModel.TEMPERATURE_MODULE_V2,
+                    serialNumber="serial",
+                ),
+            )
+        )
+    )
+
+    plates = []
+    for slot in range(1, 11):
+        slot_name = DeckSlotName.from_primitive(slot)
+        load_name = TIPRACK if slot <= 3 else PLATE
+        labware_id = f"labware-{slot}"
+        if slot_name == DeckSlotName.SLOT_10:
+            location: LabwareLocation = ModuleLocation(moduleId="module")
+            offset_location = LabwareOffsetLocation(
+                slotName=slot_name, moduleModel=ModuleModel.TEMPERATURE_MODULE_V2
+            )
+        else:
+            location = DeckSlotLocation(slotName=slot_name)
+            offset_location = LabwareOffsetLocation(slotName=slot_name)
+        # Offsets for every slot, as Labware Position Check would create
+        state.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=f"offset-{slot}",
+                created_at=CREATED_AT,
+                request=LabwareOffsetCreate(
+                    definitionUri=f"opentrons/{load_name}/1",
+                    location=offset_location,
+                    vector=LabwareOffsetVector(x=0.1, y=0.2, z=0.3),
+                ),
+            )
+        )
+        state.handle_action(
+            _load_labware(
+                labware_id,
+                commands.LoadLabwareParams(
+                    loadName=load_name,
+                    namespace="opentrons",
+                    version=1,
+                    location=location,
+                ),
+                offset_id=f"offset-{slot}",
+            )
+        )
+        if load_name == PLATE:
+            plates.append(labware_id)
+
+    return state, plates
+
+
+def _plan(state: StateStore, plates: List[str]) -> float:
+    wells = state.labware.get_wells(plates[0])
+    well_location = WellLocation()
+    current_well = None
+    start = time.perf_counter()
+    for i in range(COMMAND_COUNT):
+        labware_id = plates[i % len(plates)]
+        well_name = wells[i // len(plates) % len(wells)]
+        state.motion.get_movement_waypoints_to_well(
+            pipette_id="pipette",
+            labware_id=labware_id,
+            well_name=well_name,
+            well_location=well_location,
+            origin=Point(0, 0, 100),
+            origin_cp=None,
+            max_travel_z=200,
+            current_well=current_well,
+        )
+        current_well = CurrentWell(
+            pipette_id="pipette", labware_id=labware_id, well_name=well_name
+        )
+        state.labware.find_applicable_labware_offset(
+            definition_uri=f"opentrons/{PLATE}/1",
+            location=LabwareOffsetLocation(slotName=DeckSlotName.SLOT_4),
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    state, plates = _build_state()
+    elapsed = _plan(state, plates)
+    print(
+        f"waypoint planning: {COMMAND_COUNT} moves: {elapsed:.2f} s "
+        f"({elapsed / COMMAND_COUNT * 1e6:.1f} us per move)"
+    )
+
+
+if __name__ == "__main__":
+    main()
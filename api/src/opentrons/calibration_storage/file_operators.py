@@ -9,6 +9,8 @@ import json
 import datetime
 import typing
 
+from opentrons.config.file_cache import FileCache
+
 from .types import StrPath
 from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
 
@@ -16,6 +18,8 @@ from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
 DecoderType = typing.Type[json.JSONDecoder]
 EncoderType = typing.Type[json.JSONEncoder]
 
+_read_cache: FileCache[typing.Dict[str, typing.Any]] = FileCache()
+
 
 def read_cal_file(
     filepath: StrPath, decoder: DecoderType = DateTimeDecoder
@@ -50,6 +54,21 @@ def read_cal_file(
     return calibration_data
 
 
+def read_cal_file_cached(filepath: StrPath) -> typing.Dict[str, typing.Any]:
+    """
+    Function used to read data from a file, reusing the data read
+    before if the file has not changed since
+
+    The data is shared between callers, so it must not be modified. Use
+    :py:func:`read_cal_file` to read data that will be modified and saved.
+
+    :param filepath: path to look for data at
+    :return: Data from the file
+    """
+    path = str(filepath)
+    return _read_cache.get(path, path, lambda: read_cal_file(path))
+
+
 def save_to_file(
     filepath: StrPath,
     data: typing.Mapping[str, typing.Any],
@@ -65,3 +84,4 @@ def save_to_file(
     """
     with open(filepath, "w") as f:
         json.dump(data, f, cls=encoder)
+    _read_cache.clear()
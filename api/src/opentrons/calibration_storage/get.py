@@ -26,8 +26,11 @@ log = logging.getLogger(__name__)
 def _format_calibration_type(
     data: "CalibrationDict",
 ) -> local_types.LabwareCalibrationTypes:
+    # The data may be shared with other readers, so copy the offset rather
+    # than handing out the list it holds
     offset = local_types.OffsetData(
-        value=data["default"]["offset"], last_modified=data["default"]["lastModified"]
+        value=list(data["default"]["offset"]),
+        last_modified=data["default"]["lastModified"],
     )
     # TODO(6/16): Tip calibration no longer exists in
     # the labware calibraiton file. We should
@@ -62,13 +65,13 @@ def get_all_calibrations() -> typing.List[local_types.CalibrationInformation]:
         return all_calibrations
 
     migration.check_index_version(index_path)
-    index_file = io.read_cal_file(str(index_path))
+    index_file = io.read_cal_file_cached(index_path)
     calibration_index = index_file.get("data", {})
     for key, data in calibration_index.items():
         cal_path = offset_path / f"{key}.json"
         if cal_path.exists():
             try:
-                cal_blob = io.read_cal_file(str(cal_path))
+                cal_blob = io.read_cal_file_cached(cal_path)
             except json.JSONDecodeError:
                 log.error(
                     f"Skipping corrupt calibration file (bad JSON): {str(cal_path)}"
@@ -97,7 +100,7 @@ def _get_tip_length_data(
 ) -> local_types.TipLengthCalibration:
     try:
         pip_tip_length_path = config.get_tip_length_cal_path() / f"{pip_id}.json"
-        tip_rack_data = io.read_cal_file(str(pip_tip_length_path))
+        tip_rack_data = io.read_cal_file_cached(pip_tip_length_path)
         tip_length_info = tip_rack_data[labware_hash]
         return local_types.TipLengthCalibration(
             tip_length=tip_length_info["tipLength"],
@@ -176,13 +179,13 @@ def get_all_tip_length_calibrations() -> typing.List[local_types.TipLengthCalibr
     if not index_path.exists():
         return all_calibrations
 
-    index_file = io.read_cal_file(str(index_path))
+    index_file = io.read_cal_file_cached(index_path)
     unique_pips = set(itertools.chain(*index_file.values()))
     for pip in unique_pips:
         cal_path = tip_length_dir / f"{pip}.json"
         if cal_path.exists():
             try:
-                data = io.read_cal_file(str(cal_path))
+                data = io.read_cal_file_cached(cal_path)
             except json.JSONDecodeError:
                 log.error(
                     f"Skipping corrupt calibration file (bad json): {str(cal_path)}"
@@ -5,11 +5,13 @@ This module has functions that you can import to save robot or
 labware calibration to its designated file location.
 """
 import json
-from typing import Any, Union, List, Dict, TYPE_CHECKING, cast
+from collections import OrderedDict
+from typing import Any, Union, List, Dict, Tuple, TYPE_CHECKING, cast
 from dataclasses import is_dataclass, asdict
 
 
 from hashlib import sha256
+from threading import Lock
 
 from . import types as local_types
 
@@ -20,6 +22,20 @@ if TYPE_CHECKING:
 
 DictionaryFactoryType = Union[List, Dict]
 
+# Keys of a labware definition that do not affect its hash
+_HASH_BLOCKLIST = ["metadata", "brand", "groups"]
+
+# How many recently hashed definitions to remember
+_HASH_CACHE_SIZE = 32
+
+# Recently hashed definitions, by identity, each with a copy of the hashed
+# keys as they were hashed so that a definition changed since is hashed
+# again. Holding the definition keeps its id from being reused.
+_hash_cache: "OrderedDict[int, Tuple[LabwareDefinition, Dict[str, Any], str]]" = (
+    OrderedDict()
+)
+_hash_cache_lock = Lock()
+
 
 def dict_filter_none(data: DictionaryFactoryType) -> Dict[str, Any]:
     """
@@ -53,11 +69,32 @@ def hash_labware_def(labware_def: "LabwareDefinition") -> str:
     :returns: sha256 string
     """
     # remove keys that do not affect run
-    blocklist = ["metadata", "brand", "groups"]
-    def_no_metadata = {k: v for k, v in labware_def.items() if k not in blocklist}
+    def_no_metadata = {k: v for k, v in labware_def.items() if k not in _HASH_BLOCKLIST}
+
+    # Comparing with the copy is much cheaper than serializing and hashing.
+    # It can't stand in for hashing a different definition, though, since
+    # values like 10 and 10.0 compare equal but hash differently.
+    with _hash_cache_lock:
+        cached = _hash_cache.get(id(labware_def))
+        if cached is not None:
+            _hash_cache.move_to_end(id(labware_def))
+    if cached is not None and cached[1] == def_no_metadata:
+        return cached[2]
+
     sorted_def_str = json.dumps(def_no_metadata, sort_keys=True, separators=(",", ":"))
+    labware_hash = sha256(sorted_def_str.encode("utf-8")).hexdigest()
+
+    with _hash_cache_lock:
+        _hash_cache[id(labware_def)] = (
+            labware_def,
+            json.loads(sorted_def_str),
+            labware_hash,
+        )
+        _hash_cache.move_to_end(id(labware_def))
+        while len(_hash_cache) > _HASH_CACHE_SIZE:
+            _hash_cache.popitem(last=False)
 
-    return sha256(sorted_def_str.encode("utf-8")).hexdigest()
+    return labware_hash
 
 
 def details_from_uri(uri: str, delimiter: str = "/") -> local_types.UriDetails:
@@ -2,7 +2,6 @@ import json
 import logging
 import os
 import sys
-from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -184,6 +183,18 @@ settings = [
         ),
         restart_required=False,
     ),
+    SettingDefinition(
+        _id="enableSmoothiePipelining",
+        title="Enable pipelined OT-2 motion",
+        description=(
+            "Experimental. Stream consecutive movements to the motion controller "
+            "without waiting for each one to finish. This can make protocols "
+            "with many short movements faster. Gantry motors are kept at full "
+            "current between movements, so they run warmer, and pausing lets "
+            "movements that were already sent finish first."
+        ),
+        restart_required=True,
+    ),
 ]
 
 if ARCHITECTURE == SystemArchitecture.BUILDROOT:
@@ -202,11 +213,33 @@ def get_adv_setting(setting: str) -> Optional[Setting]:
     return s.get(setting, None)
 
 
-@lru_cache(maxsize=1)
+# Settings read from each settings file. Feature flags are checked on hot
+# paths, so this is never checked against the file on disk; anything that
+# writes the file must call clear_settings_cache()
+_settings_cache: Dict["Path", Dict[str, Setting]] = {}
+
+
 def get_all_adv_settings() -> Dict[str, Setting]:
-    """Get all the advanced setting values and definitions"""
+    """Get all the advanced setting values and definitions
+
+    The settings file is only read on the first call, and again after
+    clear_settings_cache().
+    """
     settings_file = CONFIG["feature_flags_file"]
+    try:
+        return _settings_cache[settings_file]
+    except KeyError:
+        settings = _build_settings(settings_file)
+        _settings_cache[settings_file] = settings
+        return settings
 
+
+def clear_settings_cache() -> None:
+    """Make the next access to the settings read the settings file again"""
+    _settings_cache.clear()
+
+
+def _build_settings(settings_file: "Path") -> Dict[str, Setting]:
     values, _ = _read_settings_file(settings_file)
 
     return {
@@ -227,8 +260,7 @@ async def set_adv_setting(_id: str, value: Optional[bool]) -> None:
 
     setting_data.settings_map[_id] = value
     _write_settings_file(setting_data.settings_map, setting_data.version, settings_file)
-    # Clear the lru cache
-    get_all_adv_settings.cache_clear()
+    clear_settings_cache()
 
 
 def _clean_id(_id: str) -> str:
@@ -460,6 +492,16 @@ def _migrate14to15(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate15to16(previous: SettingsMap) -> SettingsMap:
+    """Migrate to version 16 of the feature flags file.
+
+    - adds enableSmoothiePipelining option
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap["enableSmoothiePipelining"] = None
+    return newmap
+
+
 _MIGRATIONS = [
     _migrate0to1,
     _migrate1to2,
@@ -476,6 +518,7 @@ _MIGRATIONS = [
     _migrate12to13,
     _migrate13to14,
     _migrate14to15,
+    _migrate15to16,
 ]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
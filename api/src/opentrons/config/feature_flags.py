@@ -34,3 +34,8 @@ def enable_ot3_hardware_controller() -> bool:
 def enable_heater_shaker_python_api() -> bool:
     """Get whether to use the Heater-Shaker python API."""
     return advs.get_setting_with_env_overload("enableHeaterShakerPAPI")
+
+
+def enable_smoothie_pipelining() -> bool:
+    """Get whether to stream OT-2 moves without waiting for each to finish."""
+    return advs.get_setting_with_env_overload("enableSmoothiePipelining")
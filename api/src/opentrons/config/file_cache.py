@@ -0,0 +1,66 @@
+"""
+Caching of values built from config files, so that reading a setting
+doesn't mean parsing its file again unless the file has changed.
+"""
+import os
+from pathlib import Path
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar, Union
+
+ValueT = TypeVar("ValueT")
+
+#: The device, inode, size and modification time of a file, or None if
+#: there is no file
+FileSignature = Optional[Tuple[int, int, int, int]]
+
+
+def file_signature(path: Union[str, Path]) -> FileSignature:
+    """Identify the current contents of a file without reading it."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class FileCache(Generic[ValueT]):
+    """
+    Values built from files, rebuilt when their file changes.
+
+    Each value is stored with the signature its file had when the value was
+    built, and is built again if the file has since been created, removed,
+    replaced or written. Code that writes the files should still call
+    :py:meth:`clear`, since a write may not change the modification time
+    of a file if it happens quickly enough.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Tuple[FileSignature, ValueT]] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        path: Optional[Union[str, Path]],
+        build: Callable[[], ValueT],
+    ) -> ValueT:
+        """
+        Get the value for a key, building it if necessary.
+
+        :param key: Identifies the value. This should include anything other
+                    than the file that the value depends on.
+        :param path: The file the value is built from, or None if it does
+                     not depend on a file.
+        :param build: Builds the value.
+        """
+        # Take the signature before building so that a write during the
+        # build causes a rebuild next time rather than a stale value
+        signature = file_signature(path) if path is not None else None
+        cached = self._values.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        value = build()
+        self._values[key] = (signature, value)
+        return value
+
+    def clear(self) -> None:
+        """Forget all values, so they are rebuilt on next access."""
+        self._values.clear()
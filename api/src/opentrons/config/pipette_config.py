@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Mapping, Optional, Union, Tuple, Sequence, c
 
 from opentrons import config
 from opentrons.config import feature_flags as ff
+from opentrons.config.file_cache import FileCache
 from opentrons_shared_data.pipette import model_config, name_config, fuse_specs
 from opentrons_shared_data.pipette.dev_types import (
     PipetteName,
@@ -111,8 +112,8 @@ def load(
     - any config overrides found in
       ``opentrons.config.CONFIG['pipette_config_overrides_dir']``
 
-    This function reads from disk each time, so changes to the overrides
-    will be picked up in subsequent calls.
+    The overrides are only read from disk again when they have changed, so
+    changes to the overrides will be picked up in subsequent calls.
 
     :param str pipette_model: The pipette model name (i.e. "p10_single_v1.3")
                               for which to load configuration
@@ -129,7 +130,27 @@ def load(
 
     :returns PipetteConfig: The configuration, loaded and checked
     """
+    old_aspiration_functions = ff.use_old_aspiration_functions()
+    override_file = (
+        config.CONFIG["pipette_config_overrides_dir"] / f"{pipette_id}.json"
+        if pipette_id
+        else None
+    )
+    return _config_cache.get(
+        (pipette_model, override_file, old_aspiration_functions),
+        override_file,
+        lambda: _build_config(pipette_model, pipette_id, old_aspiration_functions),
+    )
+
 
+_config_cache: FileCache[PipetteConfig] = FileCache()
+
+
+def _build_config(
+    pipette_model: PipetteModel,
+    pipette_id: Optional[str],
+    old_aspiration_functions: bool,
+) -> PipetteConfig:
     # Load the model config and update with the name config
     cfg = fuse_specs(pipette_model)
 
@@ -165,7 +186,7 @@ def load(
     # and last elements are the same, which is fine). If we add more in the
     # future, we’ll have to change this code to select items more
     # intelligently
-    if ff.use_old_aspiration_functions():
+    if old_aspiration_functions:
         log.debug("Using old aspiration functions")
         ul_per_mm = cfg["ulPerMm"][0]
     else:
@@ -334,6 +355,7 @@ def save_overrides(
     existing["model"] = model
     with (override_dir / f"{pipette_id}.json").open("w") as file:
         json.dump(existing, file)
+    _config_cache.clear()
 
 
 def change_quirks(
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import os
@@ -7,6 +8,7 @@ from typing import Any, Dict, List, Union, Optional, cast
 from typing_extensions import Literal
 
 from . import CONFIG, defaults_ot3, defaults_ot2, gripper_config
+from .file_cache import FileCache
 from .feature_flags import enable_ot3_hardware_controller
 from opentrons.hardware_control.types import BoardRevision
 from .types import CurrentDict, RobotConfig, AxisDict, OT3Config
@@ -60,10 +62,17 @@ def config_to_save(config: Union[RobotConfig, OT3Config]) -> Dict[str, Any]:
         return defaults_ot3.serialize(config)
 
 
+_settings_cache: FileCache[Dict[str, Any]] = FileCache()
+
+
 def _load_file() -> Dict[str, Any]:
     settings_file = CONFIG["robot_settings_file"]
     log.debug("Loading robot settings from {}".format(settings_file))
-    return _load_json(settings_file) or {}
+    settings = _settings_cache.get(
+        settings_file, settings_file, lambda: _load_json(settings_file) or {}
+    )
+    # The configs built from the settings may share their values
+    return copy.deepcopy(settings)
 
 
 def load() -> Union[RobotConfig, OT3Config]:
@@ -96,6 +105,7 @@ def save_robot_settings(
         root, ext = os.path.splitext(filename)
         filename = "{}-{}{}".format(root, tag, ext)
     _save_config_data(config_json, filename=filename)
+    _settings_cache.clear()
 
     return config_dict
 
@@ -132,6 +142,7 @@ def get_legacy_gantry_calibration() -> Optional[List[List[float]]]:
 
 def clear() -> None:
     _clear_file(CONFIG["robot_settings_file"])
+    _settings_cache.clear()
 
 
 def _clear_file(filename: Union[str, Path]) -> None:
@@ -119,3 +119,6 @@ MICROSTEPPING_GCODES = {
 
 GCODE_ROUNDING_PRECISION = 3
 """Number of digits after the decimal point for coordinates being sent to Smoothie"""
+
+STREAMABLE_PARAMETERS = AXES + "F"
+"""Parameters of a move that may be streamed without waiting for the previous move"""
@@ -52,6 +52,7 @@ from opentrons.drivers.smoothie_drivers.constants import (
     DEFAULT_COMMAND_RETRIES,
     MICROSTEPPING_GCODES,
     GCODE_ROUNDING_PRECISION,
+    STREAMABLE_PARAMETERS,
 )
 from opentrons.drivers.smoothie_drivers.errors import (
     SmoothieError,
@@ -85,6 +86,29 @@ def _command_builder() -> CommandBuilder:
     return CommandBuilder(terminator=SMOOTHIE_COMMAND_TERMINATOR)
 
 
+def _is_streamable(command: CommandBuilder) -> bool:
+    """True if the command only holds moves and speed changes.
+
+    These are queued in the Smoothie's planner, so they can be sent while
+    a previous move is still executing.
+    """
+    return bool(command) and all(
+        element == GCODE.MOVE or element[0] in STREAMABLE_PARAMETERS
+        for element in command
+    )
+
+
+def _is_wait(command: CommandBuilder) -> bool:
+    """True if the command is only a wait for motion to complete."""
+    return list(command) == [GCODE.WAIT]
+
+
+def _ends_with_move(command: CommandBuilder) -> bool:
+    """True if the last G or M code of the command is a move."""
+    codes = [element for element in command if element[0] in "GM"]
+    return len(codes) > 0 and codes[-1] == GCODE.MOVE
+
+
 class SmoothieDriver:
     @classmethod
     async def build(
@@ -92,6 +116,7 @@ class SmoothieDriver:
         port: str,
         config: RobotConfig,
         gpio_chardev: Optional[GPIODriverLike] = None,
+        pipelined: bool = False,
     ) -> SmoothieDriver:
         """
         Build a smoothie driver
@@ -100,6 +125,7 @@ class SmoothieDriver:
             port: The port
             config: Robot configuration
             gpio_chardev: Optional GPIO driver
+            pipelined: Whether to stream moves without waiting for each one.
 
         Returns:
             A SmoothieDriver instance.
@@ -114,7 +140,12 @@ class SmoothieDriver:
         )
         gpio_chardev = gpio_chardev or SimulatingGPIOCharDev("simulated")
 
-        instance = cls(config=config, connection=connection, gpio_chardev=gpio_chardev)
+        instance = cls(
+            config=config,
+            connection=connection,
+            gpio_chardev=gpio_chardev,
+            pipelined=pipelined,
+        )
         await instance._setup()
         return instance
 
@@ -123,6 +154,7 @@ class SmoothieDriver:
         config: RobotConfig,
         gpio_chardev: GPIODriverLike,
         connection: Optional[SerialConnection] = None,
+        pipelined: bool = False,
     ):
         """
         Constructor
@@ -131,6 +163,22 @@ class SmoothieDriver:
             config: The robot configuration
             gpio_chardev: GPIO device.
             connection: The serial connection.
+            pipelined: Stream moves into the Smoothie's planner without
+                waiting for each one to finish. The driver then only waits
+                for motion to complete (M400) before a command that is not a
+                plain move, such as reading the position, probing or homing.
+                Idle gantry axes are left at their active current rather
+                than lowered after every move, so that consecutive moves of
+                different axes do not have to wait on a current change.
+                This trades heat for speed: gantry motors that have moved
+                are not lowered to their dwelling current while other axes
+                move, or while the robot is paused between moves, so they
+                run warmer than they would unpipelined. Plunger axes
+                are still lowered after every move.
+
+                Moves already streamed into the Smoothie's planner are not
+                held back by pause(), which only stops new moves from being
+                sent; see pause() and hard_halt().
         """
         self.run_flag = asyncio.Event()
         self.run_flag.set()
@@ -146,6 +194,11 @@ class SmoothieDriver:
 
         self._gpio_chardev = gpio_chardev
 
+        # Pipelining: whether moves are streamed without a trailing M400,
+        # and whether any such move may still be executing on the Smoothie
+        self._pipelined = pipelined
+        self._motion_pending = False
+
         # Current settings:
         # The amperage of each axis, has been organized into three states:
         # Current-Settings is the amperage each axis was last set to
@@ -160,6 +213,10 @@ class SmoothieDriver:
         self._dwelling_current_settings = AxisCurrentSettings(
             val=current_for_revision(config.low_current, self._gpio_chardev.board_rev)
         )
+        # The currents the Smoothie is known to be set to, if any. Lets a
+        # pipelined move skip re-sending unchanged currents, which would
+        # otherwise force a wait for the previous move.
+        self._sent_current: Optional[Dict[str, float]] = None
 
         # Active axes are axes that are in use. An axis might be disabled if
         # a motor has had a failure and the robot is operating without that
@@ -210,6 +267,10 @@ class SmoothieDriver:
     def gpio_chardev(self, gpio_chardev: GPIODriverLike) -> None:
         self._gpio_chardev = gpio_chardev
 
+    @property
+    def pipelined(self) -> bool:
+        return self._pipelined
+
     @property
     def homed_position(self) -> Dict[str, float]:
         return self._homed_position.copy()
@@ -716,6 +777,7 @@ class SmoothieDriver:
         motor-driver.
         """
         await self._send_command(self._generate_current_command())
+        self._sent_current = self.current.copy()
 
     def _generate_current_command(self) -> CommandBuilder:
         """
@@ -811,12 +873,13 @@ class SmoothieDriver:
         await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
         log.debug("reset_from_error")
         self._is_hard_halting.clear()
+        self._motion_pending = False
+        self._sent_current = None
         await self._send_command(
             _command_builder().add_gcode(gcode=GCODE.RESET_FROM_ERROR)
         )
         await self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
     async def _send_command(
         self,
         command: CommandBuilder,
@@ -827,7 +890,10 @@ class SmoothieDriver:
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
-        done. This method also ensures that any command on the B or C axis
+        done. If the driver is pipelined, moves are not followed by an M400;
+        instead, an M400 is sent before the next command that is not a move,
+        and any alarm raised by a streamed move is reported there. This
+        method also ensures that any command on the B or C axis
         (the axis for plunger control) do current ramp-up and ramp-down, so
         that plunger motors rest at a low current to prevent burn-out.
 
@@ -862,11 +928,16 @@ class SmoothieDriver:
         """
         if self.simulating:
             return ""
+        motion_pending = self._motion_pending
         try:
             return await self._send_command_unsynchronized(
                 command, ack_timeout, timeout
             )
         except SmoothieError as se:
+            # The error may come from a streamed move rather than this
+            # command, so treat it like an error during a move
+            motion_pending = motion_pending or self._motion_pending
+            self._motion_pending = False
             # XXX: This is a reentrancy error because another command could
             # swoop in here. We're already resetting though and errors (should
             # be) rare so it's probably fine, but the actual solution to this
@@ -876,7 +947,7 @@ class SmoothieDriver:
             if not suppress_error_msg:
                 log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in command or GCODE.PROBE in command or motion_pending
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
@@ -889,22 +960,68 @@ class SmoothieDriver:
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
+        if GCODE.SET_CURRENT in command:
+            self._sent_current = None
         try:
-            command_result = await self._connection.send_command(
-                command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
-            )
-            wait_command = CommandBuilder(
-                terminator=SMOOTHIE_COMMAND_TERMINATOR
-            ).add_gcode(gcode=GCODE.WAIT)
-            await self._connection.send_command(
-                command=wait_command, retries=0, timeout=execute_timeout
-            )
+            if not self._pipelined:
+                command_result = await self._connection.send_command(
+                    command=command,
+                    retries=DEFAULT_COMMAND_RETRIES,
+                    timeout=ack_timeout,
+                )
+                await self._send_wait(execute_timeout)
+            else:
+                command_result = await self._send_pipelined_command(
+                    command, ack_timeout, execute_timeout
+                )
         except AlarmResponse as e:
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
             self._handle_return(ret_code=e.response, is_error=True)
         return command_result
 
+    async def _send_pipelined_command(
+        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+    ) -> str:
+        assert self._connection, "There is no connection."
+        if _is_wait(command):
+            # an explicit wait is the barrier itself
+            await self._send_wait(execute_timeout)
+            self._motion_pending = False
+            return ""
+        if _is_streamable(command):
+            # The Smoothie only acks a queued move once there is room in
+            # its planner, which may take as long as executing a move
+            command_result = await self._connection.send_command(
+                command=command,
+                retries=DEFAULT_COMMAND_RETRIES,
+                timeout=max(ack_timeout, execute_timeout),
+            )
+            self._motion_pending = True
+            return command_result
+        if self._motion_pending:
+            await self._send_wait(execute_timeout)
+            self._motion_pending = False
+        command_result = await self._connection.send_command(
+            command=command,
+            retries=DEFAULT_COMMAND_RETRIES,
+            timeout=ack_timeout,
+        )
+        if _ends_with_move(command):
+            self._motion_pending = True
+        else:
+            await self._send_wait(execute_timeout)
+        return command_result
+
+    async def _send_wait(self, execute_timeout: float) -> None:
+        assert self._connection, "There is no connection."
+        wait_command = CommandBuilder(terminator=SMOOTHIE_COMMAND_TERMINATOR).add_gcode(
+            gcode=GCODE.WAIT
+        )
+        await self._connection.send_command(
+            command=wait_command, retries=0, timeout=execute_timeout
+        )
+
     def _handle_return(
         self, ret_code: str, is_alarm: bool = False, is_error: bool = False
     ) -> None:
@@ -1322,7 +1439,12 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
-        self.dwell_axes("".join(non_moving_axes))
+        # pipelined moves leave idle gantry axes at their active current,
+        # because lowering it means waiting for the previous move to finish
+        dwelling_axes = "".join(
+            ax for ax in non_moving_axes if not self._pipelined or ax in "BC"
+        )
+        self.dwell_axes(dwelling_axes)
         self.activate_axes("".join(moving_axes))
 
         checked_speed = speed or self._combined_speed
@@ -1367,30 +1489,48 @@ class SmoothieDriver:
             split_command = _command_builder()
             split_postfix = _command_builder()
 
-        command = _command_builder()
+        speed_command = _command_builder()
 
         if split_command_string or (checked_speed != self._combined_speed):
-            command.add_builder(builder=self._build_speed_command(checked_speed))
+            speed_command.add_builder(builder=self._build_speed_command(checked_speed))
 
         # introduce the standard currents
-        command.add_builder(builder=self._generate_current_command())
+        move_current = self.current.copy()
+        current_command = self._generate_current_command()
 
         # move to target position, including any added backlash to B/C axes
-        command.add_gcode(GCODE.MOVE).add_builder(builder=primary_command_string)
+        move_command = (
+            _command_builder()
+            .add_gcode(GCODE.MOVE)
+            .add_builder(builder=primary_command_string)
+        )
         if backlash_command_string:
             # correct the B/C positions
-            command.add_gcode(gcode=GCODE.MOVE).add_builder(
+            move_command.add_gcode(gcode=GCODE.MOVE).add_builder(
                 builder=backlash_command_string
             )
 
         if checked_speed != self._combined_speed:
-            command.add_builder(builder=self._build_speed_command(self._combined_speed))
+            move_command.add_builder(
+                builder=self._build_speed_command(self._combined_speed)
+            )
 
         for axis in target.keys():
             self.engaged_axes[axis] = True
         if home_flagged_axes:
             await self.home_flagged_axes("".join(list(target.keys())))
 
+        # a pipelined move skips currents the Smoothie already has, since
+        # setting currents means waiting for the previous move to finish
+        command = _command_builder().add_builder(builder=speed_command)
+        if (
+            not self._pipelined
+            or split_command_string
+            or move_current != self._sent_current
+        ):
+            command.add_builder(builder=current_command)
+        command.add_builder(builder=move_command)
+
         async def _do_split() -> None:
             try:
                 for sc in (c for c in (split_prefix, split_command) if c):
@@ -1405,6 +1545,7 @@ class SmoothieDriver:
             # how long the movement is expected to take.
             await _do_split()
             await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            self._sent_current = move_current
         finally:
             # dwell pipette motors because they get hot
             plunger_axis_moved = "".join(set("BC") & set(target.keys()))
@@ -1694,7 +1835,26 @@ class SmoothieDriver:
             self.pop_active_current()
             await self.pop_axis_max_speed()
 
+    async def wait_for_motion(self) -> None:
+        """Wait for any moves streamed into the Smoothie's planner to finish.
+
+        Commands sent to the Smoothie already wait for streamed moves, but
+        anything that happens elsewhere, like a delay or a module command,
+        does not. Call this before such actions so that they do not start
+        while the gantry is still moving. If the driver is not pipelined,
+        or no move may still be executing, this does nothing.
+        """
+        if self._motion_pending:
+            await self._send_command(_command_builder().add_gcode(gcode=GCODE.WAIT))
+
     def pause(self) -> None:
+        """Stop sending moves and homes until resume() is called.
+
+        This does not interrupt motion. If the driver is pipelined, moves
+        already streamed into the Smoothie's planner keep running to
+        completion, so the robot may make several more moves before it
+        stops. Use hard_halt() to stop queued moves immediately.
+        """
         if not self.simulating:
             self.run_flag.clear()
 
@@ -1837,8 +1997,16 @@ class SmoothieDriver:
             await asyncio.sleep(0.25)
 
     async def hard_halt(self) -> None:
+        """Stop motion immediately with the Smoothie's halt pin.
+
+        This discards any moves still queued in the Smoothie's planner, so
+        they are no longer waited for by wait_for_motion(). The resulting
+        alarm is reported by the next command as a SmoothieAlarm, and the
+        position cache is only correct again after homing.
+        """
         log.debug(f"Halting Smoothie (simulating: {self.simulating}")
         self._is_hard_halting.set()
+        self._motion_pending = False
         if self.simulating:
             pass
         else:
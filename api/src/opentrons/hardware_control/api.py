@@ -124,6 +124,7 @@ class API(
         self._door_state = DoorState.CLOSED
         self._pause_manager = PauseManager()
         ExecutionManagerProvider.__init__(self, isinstance(backend, Simulator))
+        self._execution_manager.register_motion_waiter(self.wait_for_motion)
         RobotCalibrationProvider.__init__(self)
         PipetteHandlerProvider.__init__(
             self, {top_types.Mount.LEFT: None, top_types.Mount.RIGHT: None}
@@ -345,6 +346,7 @@ class API(
     @ExecutionManagerProvider.wait_for_running
     async def delay(self, duration_s: float) -> None:
         """Delay execution by pausing and sleeping."""
+        await self.wait_for_motion()
         self.pause(PauseType.DELAY)
         try:
             await self.do_delay(duration_s)
@@ -469,6 +471,17 @@ class API(
         await self._backend.hard_halt()
         asyncio.run_coroutine_threadsafe(self._execution_manager.cancel(), self._loop)
 
+    async def wait_for_motion(self) -> None:
+        """Wait until the gantry has finished every move it was sent.
+
+        If Smoothie pipelining is enabled, moves return once the Smoothie
+        has queued them. Call this before any action that does not go
+        through the Smoothie, so it does not start while the robot is
+        still moving.
+        """
+        async with self._motion_lock:
+            await self._backend.wait_for_motion()
+
     async def stop(self, home_after: bool = True) -> None:
         """
         Stop motion as soon as possible, reset, and optionally home.
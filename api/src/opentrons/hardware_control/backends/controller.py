@@ -24,7 +24,7 @@ except (OSError, ModuleNotFoundError):
 from opentrons.drivers.smoothie_drivers import SmoothieDriver
 from opentrons.drivers.rpi_drivers import build_gpio_chardev
 import opentrons.config
-from opentrons.config import pipette_config
+from opentrons.config import feature_flags, pipette_config
 from opentrons.config.types import RobotConfig
 from opentrons.types import Mount
 
@@ -85,7 +85,9 @@ class Controller:
         self._board_revision: Final = self.gpio_chardev.board_rev
         # We handle our own locks in the hardware controller thank you
         self._smoothie_driver = SmoothieDriver(
-            config=self.config, gpio_chardev=self._gpio_chardev
+            config=self.config,
+            gpio_chardev=self._gpio_chardev,
+            pipelined=feature_flags.enable_smoothie_pipelining(),
         )
         self._cached_fw_version: Optional[str] = None
         self._module_controls: Optional[AttachedModulesControl] = None
@@ -318,6 +320,9 @@ class Controller:
     async def halt(self) -> None:
         await self._smoothie_driver.kill()
 
+    async def wait_for_motion(self) -> None:
+        await self._smoothie_driver.wait_for_motion()
+
     async def hard_halt(self) -> None:
         await self._smoothie_driver.hard_halt()
 
@@ -23,6 +23,7 @@ from opentrons.config import pipette_config, gripper_config
 from .ot3utils import (
     axis_convert,
     create_move_group,
+    create_move_groups,
     axis_to_node,
     get_current_settings,
     create_home_group,
@@ -81,6 +82,7 @@ from opentrons_hardware.hardware_control.tool_sensors import (
     capacitive_pass,
 )
 from opentrons_hardware.drivers.gpio import OT3GPIO
+from opentrons_hardware.sensors.sensor_stream import SensorStream
 
 if TYPE_CHECKING:
     from opentrons_shared_data.pipette.dev_types import PipetteName, PipetteModel
@@ -221,6 +223,34 @@ class OT3Controller:
             self._position.update({axis: point[0]})
             self._encoder_position.update({axis: point[1]})
 
+    async def move_trajectory(
+        self,
+        origin: Coordinates[OT3Axis, float],
+        segments: List[List[Move[OT3Axis]]],
+        stop_condition: MoveStopCondition = MoveStopCondition.none,
+    ) -> None:
+        """Move through a trajectory.
+
+        Each segment is run as its own move group, and each group is sent
+        to the nodes while the one before it executes.
+
+        Args:
+            origin: The starting point of the trajectory
+            segments: List of segments, each a list of moves that end in a stop.
+            stop_condition: The stop condition.
+
+        Returns:
+            None
+        """
+        move_groups, _ = create_move_groups(
+            origin, segments, self._present_nodes, stop_condition
+        )
+        runner = MoveGroupRunner(move_groups=move_groups, prefetch=True)
+        positions = await runner.run(can_messenger=self._messenger)
+        for axis, point in positions.items():
+            self._position.update({axis: point[0]})
+            self._encoder_position.update({axis: point[1]})
+
     def _build_home_pipettes_runner(
         self, axes: Sequence[OT3Axis]
     ) -> Optional[MoveGroupRunner]:
@@ -714,6 +744,7 @@ class OT3Controller:
         moving: OT3Axis,
         distance_mm: float,
         speed_mm_per_s: float,
+        stream: Optional[SensorStream] = None,
     ) -> None:
         pos, _ = await capacitive_probe(
             self._messenger,
@@ -722,6 +753,7 @@ class OT3Controller:
             distance_mm,
             speed_mm_per_s,
             log_sensor_values=True,
+            stream=stream,
         )
 
         self._position[axis_to_node(moving)] = pos
@@ -732,6 +764,7 @@ class OT3Controller:
         moving: OT3Axis,
         distance_mm: float,
         speed_mm_per_s: float,
+        stream: Optional[SensorStream] = None,
     ) -> List[float]:
         data = await capacitive_pass(
             self._messenger,
@@ -739,6 +772,7 @@ class OT3Controller:
             axis_to_node(moving),
             distance_mm,
             speed_mm_per_s,
+            stream=stream,
         )
         self._position[axis_to_node(moving)] += distance_mm
         return data
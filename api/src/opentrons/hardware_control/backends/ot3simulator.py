@@ -23,6 +23,7 @@ from opentrons_shared_data.pipette import dummy_model_for_name
 from .ot3utils import (
     axis_convert,
     create_move_group,
+    create_move_groups,
     get_current_settings,
     node_to_axis,
     axis_to_node,
@@ -59,6 +60,7 @@ from opentrons.hardware_control.dev_types import (
     OT3AttachedInstruments,
 )
 from opentrons_hardware.drivers.gpio import OT3GPIO
+from opentrons_hardware.sensors.sensor_stream import SensorStream
 
 log = logging.getLogger(__name__)
 
@@ -215,6 +217,26 @@ class OT3Simulator:
         self._position.update(final_positions)
         self._encoder_position.update(final_positions)
 
+    async def move_trajectory(
+        self,
+        origin: Coordinates[OT3Axis, float],
+        segments: List[List[Move[OT3Axis]]],
+        stop_condition: MoveStopCondition = MoveStopCondition.none,
+    ) -> None:
+        """Move through a trajectory.
+
+        Args:
+            origin: The starting point of the trajectory
+            segments: List of segments, each a list of moves that end in a stop.
+            stop_condition: The stop condition.
+
+        Returns:
+            None
+        """
+        _, final_positions = create_move_groups(origin, segments, self._present_nodes)
+        self._position.update(final_positions)
+        self._encoder_position.update(final_positions)
+
     async def home(self, axes: Optional[List[OT3Axis]] = None) -> OT3AxisMap[float]:
         """Home axes.
 
@@ -477,8 +499,11 @@ class OT3Simulator:
         moving: OT3Axis,
         distance_mm: float,
         speed_mm_per_s: float,
+        stream: Optional[SensorStream] = None,
     ) -> None:
         self._position[axis_to_node(moving)] += distance_mm
+        if stream is not None:
+            stream.close()
 
     async def capacitive_pass(
         self,
@@ -486,6 +511,9 @@ class OT3Simulator:
         moving: OT3Axis,
         distance_mm: float,
         speed_mm_per_s: float,
+        stream: Optional[SensorStream] = None,
     ) -> List[float]:
         self._position[axis_to_node(moving)] += distance_mm
+        if stream is not None:
+            stream.close()
         return []
@@ -28,6 +28,7 @@ from opentrons_hardware.hardware_control.motion import (
     NodeIdMotionValues,
     create_home_step,
     MoveGroup,
+    MoveGroups,
     MoveType,
     MoveStopCondition,
     create_gripper_jaw_step,
@@ -202,6 +203,32 @@ def create_move_group(
     stop_condition: MoveStopCondition = MoveStopCondition.none,
 ) -> Tuple[MoveGroup, Dict[NodeId, float]]:
     pos = _convert_to_node_id_dict(origin)
+    move_group = _create_move_group_from(pos, moves, present_nodes, stop_condition)
+    return move_group, {k: float(v) for k, v in pos.items()}
+
+
+def create_move_groups(
+    origin: Coordinates[OT3Axis, CoordinateValue],
+    segments: List[List[Move[OT3Axis]]],
+    present_nodes: Iterable[NodeId],
+    stop_condition: MoveStopCondition = MoveStopCondition.none,
+) -> Tuple[MoveGroups, Dict[NodeId, float]]:
+    """Create a move group for each segment, each starting where the last ends."""
+    pos = _convert_to_node_id_dict(origin)
+    move_groups: MoveGroups = [
+        _create_move_group_from(pos, segment, present_nodes, stop_condition)
+        for segment in segments
+    ]
+    return move_groups, {k: float(v) for k, v in pos.items()}
+
+
+def _create_move_group_from(
+    pos: NodeIdMotionValues,
+    moves: List[Move[OT3Axis]],
+    present_nodes: Iterable[NodeId],
+    stop_condition: MoveStopCondition,
+) -> MoveGroup:
+    """Create a move group starting from pos, and move pos to where it ends."""
     move_group: MoveGroup = []
     for move in moves:
         unit_vector = move.unit_vector
@@ -221,7 +248,7 @@ def create_move_group(
             for ax in pos.keys():
                 pos[ax] += node_id_distances.get(ax, 0)
             move_group.append(step)
-    return move_group, {k: float(v) for k, v in pos.items()}
+    return move_group
 
 
 def create_home_group(
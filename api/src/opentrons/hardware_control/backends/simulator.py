@@ -341,6 +341,9 @@ class Simulator:
     def resume(self) -> None:
         self._run_flag.set()
 
+    async def wait_for_motion(self) -> None:
+        pass
+
     async def halt(self) -> None:
         self._run_flag.set()
 
@@ -1,6 +1,16 @@
 import asyncio
 import functools
-from typing import Set, TypeVar, Type, cast, Callable, Any, Awaitable, overload
+from typing import (
+    Set,
+    TypeVar,
+    Type,
+    cast,
+    Callable,
+    Any,
+    Awaitable,
+    Optional,
+    overload,
+)
 from .types import ExecutionState, ExecutionCancelledError
 
 
@@ -22,6 +32,7 @@ class ExecutionManager:
         # that you could possible call register_cancellable_task on unfortunately
         # so it's not gonna get typechecked
         self._cancellable_tasks: Set["asyncio.Task[Any]"] = set()
+        self._motion_waiter: Optional[Callable[[], Awaitable[None]]] = None
 
     async def pause(self) -> None:
         async with self._condition:
@@ -60,6 +71,18 @@ class ExecutionManager:
         self._cancellable_tasks.add(task)
         task.add_done_callback(lambda t: self._cancellable_tasks.discard(t))
 
+    def register_motion_waiter(self, waiter: Callable[[], Awaitable[None]]) -> None:
+        """Set the coroutine function that waits for the robot to stop moving.
+
+        The hardware controller registers this so that modules sharing this
+        execution manager can wait for the gantry before acting.
+        """
+        self._motion_waiter = waiter
+
+    async def wait_for_motion(self) -> None:
+        if self._motion_waiter:
+            await self._motion_waiter()
+
     async def wait_for_is_running(self) -> None:
         async with self._condition:
             if self._state == ExecutionState.PAUSED:
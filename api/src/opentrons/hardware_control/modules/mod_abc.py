@@ -101,6 +101,8 @@ class AbstractModule(abc.ABC):
     async def wait_for_is_running(self) -> None:
         if not self.is_simulated:
             await self._execution_manager.wait_for_is_running()
+            # don't let the module act while the gantry is still moving
+            await self._execution_manager.wait_for_motion()
 
     def make_cancellable(self, task: "asyncio.Task[TaskPayload]") -> None:
         self._execution_manager.register_cancellable_task(task)
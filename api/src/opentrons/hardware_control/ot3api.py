@@ -101,11 +101,30 @@ from .dev_types import (
 )
 from opentrons_hardware.hardware_control.motion_planning.move_utils import (
     MoveConditionNotMet,
+    split_at_stops,
 )
 
 mod_log = logging.getLogger(__name__)
 
 
+def _drop_unmoving_targets(
+    origin: OT3AxisMap[float], move_targets: List[MoveTarget[OT3Axis]]
+) -> List[MoveTarget[OT3Axis]]:
+    """Drop targets at the position of the target before them.
+
+    The planner cannot build a move that ends where it starts.
+    """
+    prev_pos = dict(origin)
+    moving_targets = []
+    for move_target in move_targets:
+        if any(prev_pos.get(ax) != pos for ax, pos in move_target.position.items()):
+            moving_targets.append(move_target)
+            prev_pos.update(
+                {ax: float(pos) for ax, pos in move_target.position.items()}
+            )
+    return moving_targets
+
+
 class OT3API(
     ExecutionManagerProvider,
     # This MUST be kept last in the inheritance list so that it is
@@ -524,6 +543,14 @@ class OT3API(
         await self._backend.hard_halt()
         asyncio.run_coroutine_threadsafe(self._execution_manager.cancel(), self._loop)
 
+    async def wait_for_motion(self) -> None:
+        """Wait until the gantry has finished every move it was sent.
+
+        Moves on the OT-3 only return once they are complete, so this
+        returns immediately.
+        """
+        pass
+
     async def stop(self, home_after: bool = True) -> None:
         """Stop motion as soon as possible, reset, and optionally home."""
         await self._backend.halt()
@@ -797,6 +824,38 @@ class OT3API(
             check_bounds=check_bounds,
         )
 
+    async def move_trajectory(
+        self,
+        mount: Union[top_types.Mount, OT3Mount],
+        waypoints: Sequence[top_types.Point],
+        speed: Optional[float] = None,
+        critical_point: Optional[CriticalPoint] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a list of
+        locations relative to the deck, at the specified speed.
+
+        The moves between the locations are planned together, and only
+        stop at locations where the motors can stop without exceeding
+        their speed discontinuity limits.
+        """
+        if not self._current_position:
+            await self.home()
+
+        realmount = OT3Mount.from_mount(mount)
+        target_positions = [
+            target_position_from_absolute(
+                realmount,
+                abs_position,
+                partial(self.critical_point_for, cp_override=critical_point),
+                top_types.Point(*self._config.left_mount_offset),
+                top_types.Point(*self._config.right_mount_offset),
+                top_types.Point(*self._config.gripper_mount_offset),
+            )
+            for abs_position in waypoints
+        ]
+        await self._cache_and_maybe_retract_mount(realmount)
+        await self._move_through(target_positions, speed=speed)
+
     async def _cache_and_maybe_retract_mount(self, mount: OT3Mount) -> None:
         """Retract the 'other' mount if necessary
 
@@ -865,6 +924,81 @@ class OT3API(
                 self._current_position.update(target_position)
                 self._encoder_current_position.update(encoder_pos)
 
+    @ExecutionManagerProvider.wait_for_running
+    async def _move_through(
+        self,
+        target_positions: Sequence["OrderedDict[OT3Axis, float]"],
+        speed: Optional[float] = None,
+        acquire_lock: bool = True,
+        check_bounds: MotionChecks = MotionChecks.NONE,
+    ) -> None:
+        """Worker function to move through several positions in one trajectory."""
+        bounds = self._backend.axis_bounds
+        move_targets = []
+        for target_position in target_positions:
+            machine_pos = machine_from_deck(
+                target_position,
+                self._transforms.deck_calibration.attitude,
+                self._transforms.carriage_offset,
+            )
+            to_check = {
+                ax: machine_pos[ax]
+                for ax in target_position.keys()
+                if ax in OT3Axis.gantry_axes()
+            }
+            check_motion_bounds(to_check, target_position, bounds, check_bounds)
+            # TODO: (2022-02-10) Use actual max speed for MoveTarget
+            move_targets.append(
+                MoveTarget.build(position=machine_pos, max_speed=speed or 500)
+            )
+
+        constraints = get_system_constraints(
+            self._config.motion_settings, self._gantry_load
+        )
+        self._move_manager.update_constraints(constraints)
+        # hold the lock for the whole trajectory, so that no other move can
+        # run between its segments or between reading the origin and moving
+        async with contextlib.AsyncExitStack() as stack:
+            if acquire_lock:
+                await stack.enter_async_context(self._motion_lock)
+            origin = await self._backend.update_position()
+            moving_targets = _drop_unmoving_targets(origin, move_targets)
+            if not moving_targets:
+                self._log.info(f"move through {target_positions} is already there")
+                return
+
+            blended, moves = self._move_manager.plan_motion(
+                origin=origin, target_list=moving_targets
+            )
+            if not blended:
+                self._log.warning(
+                    f"could not blend moves through {target_positions}, "
+                    "moving to each position separately"
+                )
+                for target_position in target_positions:
+                    await self._move(
+                        target_position,
+                        speed=speed,
+                        acquire_lock=False,
+                        check_bounds=check_bounds,
+                    )
+                return
+            segments = split_at_stops(constraints, moves[-1])
+            self._log.info(
+                f"move through: {target_positions} from {origin} requiring "
+                f"{len(segments)} segments"
+            )
+            try:
+                await self._backend.move_trajectory(origin, segments)
+                encoder_pos = await self._backend.update_encoder_position()
+            except Exception:
+                self._log.exception("Move failed")
+                self._current_position.clear()
+                raise
+            else:
+                self._current_position.update(target_positions[-1])
+                self._encoder_current_position.update(encoder_pos)
+
     @ExecutionManagerProvider.wait_for_running
     async def home(
         self, axes: Optional[Union[List[Axis], List[OT3Axis]]] = None
@@ -22,6 +22,15 @@ class MotionController(Protocol):
         """
         ...
 
+    async def wait_for_motion(self) -> None:
+        """Wait until the gantry has finished every move it was sent.
+
+        Call this before any action that does not involve the gantry, like
+        a delay or a module command, so that it does not start while the
+        robot is still moving.
+        """
+        ...
+
     async def stop(self, home_after: bool = True) -> None:
         """
         Stop motion as soon as possible, reset, and optionally home.
@@ -12,9 +12,22 @@ import logging
 
 from pathlib import Path
 from itertools import dropwhile
-from typing import Any, AnyStr, List, Dict, Optional, Union, Tuple, TYPE_CHECKING
-
-
+from typing import (
+    Any,
+    AnyStr,
+    Callable,
+    List,
+    Dict,
+    Optional,
+    Sequence,
+    Union,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+
+from opentrons.protocols.api_support.tip_tracker import select_next_tip
 from opentrons.protocols.api_support.util import requires_version
 from opentrons.protocols.context.labware import AbstractLabware
 from opentrons.protocols.geometry.well_geometry import WellGeometry
@@ -34,6 +47,8 @@ if TYPE_CHECKING:
         LabwareParameters,
     )
 
+_WellsT = TypeVar("_WellsT")
+
 
 MODULE_LOG = logging.getLogger(__name__)
 
@@ -265,6 +280,9 @@ class Labware(DeckItem):
             )
         self._api_version = api_level
         self._implementation = implementation
+        # Wells and containers of them already built from the implementation's
+        self._well_cache: Dict[str, Well] = {}
+        self._container_cache: Dict[str, Tuple[Any, Any]] = {}
 
     @property
     def separate_calibration(self) -> bool:
@@ -276,7 +294,7 @@ class Labware(DeckItem):
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._well_from_impl(self._implementation.get_well(key))
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -369,9 +387,10 @@ class Labware(DeckItem):
     def well(self, idx: Union[int, str]) -> Well:
         """Deprecated---use result of `wells` or `wells_by_name`"""
         if isinstance(idx, int):
-            res = self._implementation.get_wells()[idx]
+            names = self._implementation.get_well_arrays().names
+            res = self._implementation.get_well(names[idx])
         elif isinstance(idx, str):
-            res = self._implementation.get_wells_by_name()[idx]
+            res = self._implementation.get_well(idx)
         else:
             res = NotImplemented
         return self._well_from_impl(res)
@@ -395,12 +414,14 @@ class Labware(DeckItem):
         :return: Ordered list of all wells in a labware
         """
         if not args:
-            res = self._implementation.get_wells()
+            return list(
+                self._from_cache("wells", self._implementation.get_wells(), self._wrap)
+            )
         elif isinstance(args[0], int):
-            res = [self._implementation.get_wells()[idx] for idx in args]  # type: ignore[index]
+            names = self._implementation.get_well_arrays().names
+            res = [self._implementation.get_well(names[idx]) for idx in args]  # type: ignore[index]
         elif isinstance(args[0], str):
-            by_name = self._implementation.get_wells_by_name()
-            res = [by_name[idx] for idx in args]  # type: ignore[index]
+            res = [self._implementation.get_well(idx) for idx in args]  # type: ignore[arg-type]
         else:
             raise TypeError
         return [self._well_from_impl(w) for w in res]
@@ -416,8 +437,12 @@ class Labware(DeckItem):
 
         :return: Dictionary of well objects keyed by well name
         """
-        wells = self._implementation.get_wells_by_name()
-        return {k: self._well_from_impl(v) for k, v in wells.items()}
+        wells = self._from_cache(
+            "wells_by_name",
+            self._implementation.get_wells_by_name(),
+            lambda by_name: {k: self._well_from_impl(v) for k, v in by_name.items()},
+        )
+        return dict(wells)
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -449,7 +474,8 @@ class Labware(DeckItem):
         """
         grid = self._implementation.get_well_grid()
         if not args:
-            res = grid.get_rows()
+            rows = self._from_cache("rows", grid.get_rows(), self._wrap_each)
+            return [list(row) for row in rows]
         elif isinstance(args[0], int):
             res = [grid.get_rows()[idx] for idx in args]  # type: ignore[index]
         elif isinstance(args[0], str):
@@ -469,8 +495,12 @@ class Labware(DeckItem):
 
         :return: Dictionary of Well lists keyed by row name
         """
-        row_dict = self._implementation.get_well_grid().get_row_dict()
-        return {k: [self._well_from_impl(w) for w in v] for k, v in row_dict.items()}
+        row_dict = self._from_cache(
+            "rows_by_name",
+            self._implementation.get_well_grid().get_row_dict(),
+            self._wrap_each_value,
+        )
+        return {k: list(v) for k, v in row_dict.items()}
 
     @requires_version(2, 0)
     def rows_by_index(self) -> Dict[str, List[Well]]:
@@ -501,7 +531,8 @@ class Labware(DeckItem):
         """
         grid = self._implementation.get_well_grid()
         if not args:
-            res = grid.get_columns()
+            columns = self._from_cache("columns", grid.get_columns(), self._wrap_each)
+            return [list(column) for column in columns]
         elif isinstance(args[0], int):
             res = [grid.get_columns()[idx] for idx in args]  # type: ignore[index]
         elif isinstance(args[0], str):
@@ -522,8 +553,12 @@ class Labware(DeckItem):
 
         :return: Dictionary of Well lists keyed by column name
         """
-        column_dict = self._implementation.get_well_grid().get_column_dict()
-        return {k: [self._well_from_impl(w) for w in v] for k, v in column_dict.items()}
+        column_dict = self._from_cache(
+            "columns_by_name",
+            self._implementation.get_well_grid().get_column_dict(),
+            self._wrap_each_value,
+        )
+        return {k: list(v) for k, v in column_dict.items()}
 
     @requires_version(2, 0)
     def columns_by_index(self) -> Dict[str, List[Well]]:
@@ -683,8 +718,62 @@ class Labware(DeckItem):
         if self._is_tiprack:
             self._implementation.reset_tips()
 
+    def _is_in_rows(self, well: Well, rows: slice) -> bool:
+        """
+        Whether a well is in some rows of this labware, compared the same way
+        as ``well in self.rows()[rows]``, without building any wells.
+        """
+        arrays = self._implementation.get_well_arrays()
+        return arrays.has_top_at(
+            arrays.rows[rows],
+            self._implementation.get_calibrated_offset(),
+            well.geometry.top(),
+        )
+
+    def _is_in_columns(self, well: Well, columns: slice) -> bool:
+        """
+        Whether a well is in some columns of this labware, compared the same
+        way as ``well in self.columns()[columns]``, without building any wells.
+        """
+        arrays = self._implementation.get_well_arrays()
+        return arrays.has_top_at(
+            arrays.columns[columns],
+            self._implementation.get_calibrated_offset(),
+            well.geometry.top(),
+        )
+
+    def _from_cache(
+        self, key: str, source: _WellsT, build: Callable[[_WellsT], Any]
+    ) -> Any:
+        """
+        Build a container of wells from one of the implementation's, or reuse
+        the one built before if the implementation's hasn't been rebuilt since.
+        """
+        cached = self._container_cache.get(key)
+        if cached is None or cached[0] is not source:
+            cached = self._container_cache[key] = (source, build(source))
+        return cached[1]
+
+    def _wrap(self, wells: Sequence[WellImplementation]) -> List[Well]:
+        return [self._well_from_impl(w) for w in wells]
+
+    def _wrap_each(
+        self, wells: Sequence[Sequence[WellImplementation]]
+    ) -> List[List[Well]]:
+        return [self._wrap(group) for group in wells]
+
+    def _wrap_each_value(
+        self, wells: Dict[str, Sequence[WellImplementation]]
+    ) -> Dict[str, List[Well]]:
+        return {k: self._wrap(v) for k, v in wells.items()}
+
     def _well_from_impl(self, well: WellImplementation) -> Well:
-        return Well(well_implementation=well, api_level=self._api_version)
+        cached = self._well_cache.get(well.get_name())
+        if cached is None or cached._impl is not well:
+            cached = self._well_cache[well.get_name()] = Well(
+                well_implementation=well, api_level=self._api_version
+            )
+        return cached
 
 
 def save_definition(
@@ -770,25 +859,25 @@ def select_tiprack_from_list(
     tip_racks: List[Labware], num_channels: int, starting_point: Optional[Well] = None
 ) -> Tuple[Labware, Well]:
 
-    try:
-        first, rest = split_tipracks(tip_racks)
-    except IndexError:
+    if not tip_racks:
         raise OutOfTipsError
 
+    first = tip_racks[0]
     if starting_point and starting_point.parent != first:
         raise TipSelectionError(
             "The starting tip you selected " f"does not exist in {first}"
         )
-    elif starting_point:
-        first_well = starting_point
-    else:
-        first_well = first.wells()[0]
 
-    next_tip = first.next_tip(num_channels, first_well)
-    if next_tip:
-        return first, next_tip
-    else:
-        return select_tiprack_from_list(rest, num_channels)
+    selected = select_next_tip(
+        [tip_rack._implementation.get_tip_tracker() for tip_rack in tip_racks],
+        num_tips=num_channels,
+        starting_tip=starting_point._impl if starting_point else None,
+    )
+    if not selected:
+        raise OutOfTipsError
+    rack_idx, well = selected
+    tip_rack = tip_racks[rack_idx]
+    return tip_rack, tip_rack._well_from_impl(well)
 
 
 def filter_tipracks_to_start(
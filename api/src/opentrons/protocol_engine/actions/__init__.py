@@ -14,6 +14,7 @@ from .actions import (
     FinishAction,
     HardwareStoppedAction,
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     AddLabwareOffsetAction,
@@ -36,6 +37,7 @@ __all__ = [
     "FinishAction",
     "HardwareStoppedAction",
     "QueueCommandAction",
+    "QueueCommandsAction",
     "UpdateCommandAction",
     "FailCommandAction",
     "AddLabwareOffsetAction",
@@ -1,5 +1,5 @@
 """Action pipeline module."""
-from typing import List
+from typing import List, Sequence
 
 from .action_handler import ActionHandler
 from .actions import Action
@@ -28,3 +28,14 @@ class ActionDispatcher:
             handler.handle_action(action)
 
         self._sink.handle_action(action)
+
+    def dispatch_all(self, actions: Sequence[Action]) -> None:
+        """Dispatch several actions into the pipeline as one batch.
+
+        Each handler, then the sink, gets all of the actions in order,
+        so the sink can apply them to its state in one go.
+        """
+        for handler in self._handlers:
+            handler.handle_actions(actions)
+
+        self._sink.handle_actions(actions)
@@ -6,7 +6,7 @@ reactions in objects that subscribe to the pipeline, like the StateStore.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control.types import DoorState
@@ -95,6 +95,13 @@ class QueueCommandAction:
     request: CommandCreate
 
 
+@dataclass(frozen=True)
+class QueueCommandsAction:
+    """Add several command requests to the queue, in order, all at once."""
+
+    commands: Sequence[QueueCommandAction]
+
+
 @dataclass(frozen=True)
 class UpdateCommandAction:
     """Update a given command."""
@@ -152,6 +159,7 @@ Action = Union[
     HardwareStoppedAction,
     DoorChangeAction,
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     AddLabwareOffsetAction,
@@ -1,4 +1,5 @@
 """Synchronous ProtocolEngine client module."""
+from concurrent.futures import Future
 from typing import cast, Optional
 
 from opentrons.types import MountType
@@ -16,17 +17,40 @@ from .transports import AbstractSyncTransport
 
 
 class SyncClient:
-    """Synchronous Protocol Engine client."""
+    """Synchronous Protocol Engine client.
 
-    def __init__(self, transport: AbstractSyncTransport) -> None:
-        """Initialize the client with a transport."""
+    Commands whose results are needed to continue, like loading labware,
+    block until they complete. The others return a future of their result.
+
+    By default, those futures are already complete when they're returned.
+    In pipelined mode, those commands are only queued, so the caller can go
+    on without waiting for them. Queued commands are waited for before the
+    next blocking command, whenever the engine's state is read, and by
+    `wait_for_queued`, which raise the error of the first one to fail.
+    """
+
+    def __init__(
+        self, transport: AbstractSyncTransport, pipelined: bool = False
+    ) -> None:
+        """Initialize the client with a transport.
+
+        Args:
+            transport: The transport to send commands through.
+            pipelined: Whether to queue commands whose results
+                aren't needed instead of waiting for each one.
+        """
         self._transport = transport
+        self._pipelined = pipelined
 
     @property
     def state(self) -> StateView:
-        """Get a view of the engine's state."""
+        """Get a view of the engine's state, once queued commands complete."""
         return self._transport.state
 
+    def wait_for_queued(self) -> None:
+        """Wait for queued commands to complete, raising the first failure."""
+        self._transport.wait_for_queued()
+
     def load_labware(
         self,
         location: LabwareLocation,
@@ -81,8 +105,8 @@ class SyncClient:
         pipette_id: str,
         labware_id: str,
         well_name: str,
-    ) -> commands.PickUpTipResult:
-        """Execute a PickUpTip command and return the result."""
+    ) -> "Future[commands.PickUpTipResult]":
+        """Queue a PickUpTip command."""
         request = commands.PickUpTipCreate(
             params=commands.PickUpTipParams(
                 pipetteId=pipette_id,
@@ -90,17 +114,17 @@ class SyncClient:
                 wellName=well_name,
             )
         )
-        result = self._transport.execute_command(request=request)
+        result = self._queue_command(request)
 
-        return cast(commands.PickUpTipResult, result)
+        return cast("Future[commands.PickUpTipResult]", result)
 
     def drop_tip(
         self,
         pipette_id: str,
         labware_id: str,
         well_name: str,
-    ) -> commands.DropTipResult:
-        """Execute a DropTip command and return the result."""
+    ) -> "Future[commands.DropTipResult]":
+        """Queue a DropTip command."""
         request = commands.DropTipCreate(
             params=commands.DropTipParams(
                 pipetteId=pipette_id,
@@ -108,8 +132,8 @@ class SyncClient:
                 wellName=well_name,
             )
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.DropTipResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.DropTipResult]", result)
 
     def aspirate(
         self,
@@ -118,8 +142,8 @@ class SyncClient:
         well_name: str,
         well_location: WellLocation,
         volume: float,
-    ) -> commands.AspirateResult:
-        """Execute an ``Aspirate`` command and return the result."""
+    ) -> "Future[commands.AspirateResult]":
+        """Queue an ``Aspirate`` command."""
         request = commands.AspirateCreate(
             params=commands.AspirateParams(
                 pipetteId=pipette_id,
@@ -132,9 +156,9 @@ class SyncClient:
                 flowRate=2.0,
             )
         )
-        result = self._transport.execute_command(request=request)
+        result = self._queue_command(request)
 
-        return cast(commands.AspirateResult, result)
+        return cast("Future[commands.AspirateResult]", result)
 
     def dispense(
         self,
@@ -143,8 +167,8 @@ class SyncClient:
         well_name: str,
         well_location: WellLocation,
         volume: float,
-    ) -> commands.DispenseResult:
-        """Execute a ``Dispense`` command and return the result."""
+    ) -> "Future[commands.DispenseResult]":
+        """Queue a ``Dispense`` command."""
         request = commands.DispenseCreate(
             params=commands.DispenseParams(
                 pipetteId=pipette_id,
@@ -157,8 +181,8 @@ class SyncClient:
                 flowRate=2.0,
             )
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.DispenseResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.DispenseResult]", result)
 
     def blow_out(
         self,
@@ -166,8 +190,8 @@ class SyncClient:
         labware_id: str,
         well_name: str,
         well_location: WellLocation,
-    ) -> commands.BlowOutResult:
-        """Execute a ``BlowOut`` command and return the result."""
+    ) -> "Future[commands.BlowOutResult]":
+        """Queue a ``BlowOut`` command."""
         request = commands.BlowOutCreate(
             params=commands.BlowOutParams(
                 pipetteId=pipette_id,
@@ -179,8 +203,8 @@ class SyncClient:
                 flowRate=2.0,
             )
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.BlowOutResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.BlowOutResult]", result)
 
     def touch_tip(
         self,
@@ -188,8 +212,8 @@ class SyncClient:
         labware_id: str,
         well_name: str,
         well_location: WellLocation,
-    ) -> commands.TouchTipResult:
-        """Execute a ``Touch Tip`` command and return the result."""
+    ) -> "Future[commands.TouchTipResult]":
+        """Queue a ``Touch Tip`` command."""
         request = commands.TouchTipCreate(
             params=commands.TouchTipParams(
                 pipetteId=pipette_id,
@@ -198,8 +222,8 @@ class SyncClient:
                 wellLocation=well_location,
             )
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.TouchTipResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.TouchTipResult]", result)
 
     def wait_for_resume(self, message: Optional[str]) -> commands.WaitForResumeResult:
         """Execute a `WaitForResume` command and return the result."""
@@ -209,62 +233,72 @@ class SyncClient:
         result = self._transport.execute_command(request=request)
         return cast(commands.WaitForResumeResult, result)
 
-    def set_rail_lights(self, on: bool) -> commands.SetRailLightsResult:
-        """Execute a ``setRailLights`` command and return the result."""
+    def set_rail_lights(self, on: bool) -> "Future[commands.SetRailLightsResult]":
+        """Queue a ``setRailLights`` command."""
         request = commands.SetRailLightsCreate(
             params=commands.SetRailLightsParams(on=on)
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.SetRailLightsResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.SetRailLightsResult]", result)
 
     def magnetic_module_engage(
         self, module_id: str, engage_height: float
-    ) -> commands.magnetic_module.EngageResult:
-        """Execute a ``MagneticModuleEngage`` command and return the result."""
+    ) -> "Future[commands.magnetic_module.EngageResult]":
+        """Queue a ``MagneticModuleEngage`` command."""
         request = commands.magnetic_module.EngageCreate(
             params=commands.magnetic_module.EngageParams(
                 moduleId=module_id, height=engage_height
             )
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.magnetic_module.EngageResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.magnetic_module.EngageResult]", result)
 
     def thermocycler_deactivate_block(
         self, module_id: str
-    ) -> commands.thermocycler.DeactivateBlockResult:
-        """Execute a `thermocycler/deactivateBlock` command and return the result."""
+    ) -> "Future[commands.thermocycler.DeactivateBlockResult]":
+        """Queue a `thermocycler/deactivateBlock` command."""
         request = commands.thermocycler.DeactivateBlockCreate(
             params=commands.thermocycler.DeactivateBlockParams(moduleId=module_id)
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.thermocycler.DeactivateBlockResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.thermocycler.DeactivateBlockResult]", result)
 
     def thermocycler_deactivate_lid(
         self, module_id: str
-    ) -> commands.thermocycler.DeactivateLidResult:
-        """Execute a `thermocycler/deactivateLid` command and return the result."""
+    ) -> "Future[commands.thermocycler.DeactivateLidResult]":
+        """Queue a `thermocycler/deactivateLid` command."""
         request = commands.thermocycler.DeactivateLidCreate(
             params=commands.thermocycler.DeactivateLidParams(moduleId=module_id)
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.thermocycler.DeactivateLidResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.thermocycler.DeactivateLidResult]", result)
 
     def thermocycler_open_lid(
         self, module_id: str
-    ) -> commands.thermocycler.OpenLidResult:
-        """Execute a `thermocycler/openLid` command and return the result."""
+    ) -> "Future[commands.thermocycler.OpenLidResult]":
+        """Queue a `thermocycler/openLid` command."""
         request = commands.thermocycler.OpenLidCreate(
             params=commands.thermocycler.OpenLidParams(moduleId=module_id)
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.thermocycler.OpenLidResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.thermocycler.OpenLidResult]", result)
 
     def thermocycler_close_lid(
         self, module_id: str
-    ) -> commands.thermocycler.CloseLidResult:
-        """Execute a `thermocycler/closeLid` command and return the result."""
+    ) -> "Future[commands.thermocycler.CloseLidResult]":
+        """Queue a `thermocycler/closeLid` command."""
         request = commands.thermocycler.CloseLidCreate(
             params=commands.thermocycler.CloseLidParams(moduleId=module_id)
         )
-        result = self._transport.execute_command(request=request)
-        return cast(commands.thermocycler.CloseLidResult, result)
+        result = self._queue_command(request)
+        return cast("Future[commands.thermocycler.CloseLidResult]", result)
+
+    def _queue_command(
+        self, request: commands.CommandCreate
+    ) -> "Future[commands.CommandResult]":
+        if self._pipelined:
+            return self._transport.queue_command(request=request)
+
+        future: "Future[commands.CommandResult]" = Future()
+        future.set_result(self._transport.execute_command(request=request))
+        return future
@@ -1,11 +1,16 @@
 """Base transport interfaces for communicating with a Protocol Engine."""
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop, run_coroutine_threadsafe
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import List, Optional
 
 from ..protocol_engine import ProtocolEngine
-from ..errors import ProtocolEngineError
+from ..errors import CommandRequestFailedError
 from ..state import StateView
-from ..commands import CommandCreate, CommandResult
+from ..commands import Command, CommandCreate, CommandResult, CommandStatus
+
+_NOT_EXECUTED_MESSAGE = "Command was not executed because an earlier command failed."
 
 
 class AbstractSyncTransport(ABC):
@@ -14,13 +19,22 @@ class AbstractSyncTransport(ABC):
     @property
     @abstractmethod
     def state(self) -> StateView:
-        """Get a view of the ProtocolEngine's state."""
+        """Get a view of the ProtocolEngine's state.
+
+        Waits for any queued commands to complete first, so that the state
+        reflects every command sent.
+
+        Raises:
+            CommandRequestFailedError: if a queued command failed.
+        """
         ...
 
     @abstractmethod
     def execute_command(self, request: CommandCreate) -> CommandResult:
         """Execute a ProtocolEngine command, blocking until the command completes.
 
+        Waits for any queued commands to complete first.
+
         Args:
             request: The ProtocolEngine command request
 
@@ -28,11 +42,46 @@ class AbstractSyncTransport(ABC):
             The command's result data.
 
         Raises:
-            ProtocolEngineError: if the command execution is not successful,
-                the specific error that cause the command to fail is raised.
+            CommandRequestFailedError: if the command execution is not successful,
+                or a queued command failed, the specific error that cause
+                the command to fail is raised, along with the failed command.
         """
         ...
 
+    @abstractmethod
+    def queue_command(self, request: CommandCreate) -> "Future[CommandResult]":
+        """Send a ProtocolEngine command without waiting for it to complete.
+
+        Queued commands run in the order they were sent. If one fails,
+        no command queued after it runs, and its error is raised by the next
+        call that waits for queued commands.
+
+        Args:
+            request: The ProtocolEngine command request
+
+        Returns:
+            A future of the command's result data.
+        """
+        ...
+
+    @abstractmethod
+    def wait_for_queued(self) -> None:
+        """Block until every queued command has completed.
+
+        Raises:
+            CommandRequestFailedError: the error of the first queued command
+                that failed, if any did, along with that command.
+        """
+        ...
+
+
+@dataclass
+class _QueuedBatch:
+    """Commands queued since the last wait, tracked in the engine's thread."""
+
+    last_command_id: Optional[str] = None
+    failed: bool = False
+
 
 class ChildThreadTransport(AbstractSyncTransport):
     """Concrete transport implementation using asyncio.run_coroutine_threadsafe."""
@@ -54,23 +103,83 @@ class ChildThreadTransport(AbstractSyncTransport):
         """
         self._engine = engine
         self._loop = loop
+        self._queued: List["Future[CommandResult]"] = []
+        self._batch = _QueuedBatch()
 
     @property
     def state(self) -> StateView:
         """Get a view of the Protocol Engine's state."""
+        self.wait_for_queued()
         return self._engine.state_view
 
     def execute_command(self, request: CommandCreate) -> CommandResult:
         """Execute a command synchronously on the main thread."""
+        self.wait_for_queued()
         command = run_coroutine_threadsafe(
             self._engine.add_and_execute_command(request=request),
             loop=self._loop,
         ).result()
 
-        if command.error is not None:
-            error = command.error
-            raise ProtocolEngineError(f"{error.errorType}: {error.detail}")
-
-        assert command.result is not None, f"Expected Command {command} to have result"
+        return _get_result(request, command)
 
-        return command.result
+    def queue_command(self, request: CommandCreate) -> "Future[CommandResult]":
+        """Send a command to the main thread without waiting for it."""
+        future = run_coroutine_threadsafe(
+            self._execute_queued(request, self._batch),
+            loop=self._loop,
+        )
+        self._queued.append(future)
+        return future
+
+    def wait_for_queued(self) -> None:
+        """Wait for the commands sent to the main thread to complete."""
+        queued = self._queued
+        self._queued = []
+        self._batch = _QueuedBatch()
+
+        # Every command after a failed one fails or is skipped, so raising
+        # the first error found, in order, raises the one that failed first
+        for future in queued:
+            future.result()
+
+    async def _execute_queued(
+        self, request: CommandCreate, batch: _QueuedBatch
+    ) -> CommandResult:
+        # This runs in the engine's thread, in the order commands were queued.
+        # A command queued before an earlier one failed is failed along with
+        # it by the engine, and one queued after is never added, so a failure
+        # stops the same commands no matter how far ahead the protocol got.
+        if batch.last_command_id is not None:
+            last_command = self._engine.state_view.commands.get(batch.last_command_id)
+            batch.failed = batch.failed or last_command.status == CommandStatus.FAILED
+
+        if batch.failed:
+            raise CommandRequestFailedError(_NOT_EXECUTED_MESSAGE, request=request)
+
+        try:
+            command = self._engine.add_command(request=request)
+        except Exception:
+            batch.failed = True
+            raise
+
+        batch.last_command_id = command.id
+        await self._engine.wait_for_command(command_id=command.id)
+
+        return _get_result(request, self._engine.state_view.commands.get(command.id))
+
+
+def _get_result(request: CommandCreate, command: Command) -> CommandResult:
+    if command.error is not None:
+        error = command.error
+        raise CommandRequestFailedError(
+            f"{error.errorType}: {error.detail}", request=request, command=command
+        )
+
+    if command.status == CommandStatus.FAILED:
+        raise CommandRequestFailedError(
+            _NOT_EXECUTED_MESSAGE, request=request, command=command
+        )
+
+    assert command.result is not None, f"Expected Command {command} to have result"
+
+    return command.result
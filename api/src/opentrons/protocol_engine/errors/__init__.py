@@ -37,6 +37,7 @@ from .exceptions import (
     CannotPerformModuleAction,
     PauseNotAllowedError,
     ProtocolCommandFailedError,
+    CommandRequestFailedError,
 )
 
 from .error_occurrence import ErrorOccurrence
@@ -79,6 +80,7 @@ __all__ = [
     "CannotPerformModuleAction",
     "PauseNotAllowedError",
     "ProtocolCommandFailedError",
+    "CommandRequestFailedError",
     # error occurrence models
     "ErrorOccurrence",
 ]
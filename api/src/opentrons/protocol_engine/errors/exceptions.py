@@ -1,4 +1,8 @@
 """Protocol engine exceptions."""
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..commands import Command, CommandCreate
 
 
 class ProtocolEngineError(RuntimeError):
@@ -171,3 +175,23 @@ class ProtocolCommandFailedError(ProtocolEngineError):
     def __init__(self, command_id: str) -> None:
         super().__init__(f"Command {command_id} failed to execute")
         self.command_id = command_id
+
+
+class CommandRequestFailedError(ProtocolEngineError):
+    """An error raised to a client when a command it sent failed or was not executed.
+
+    Args:
+        message: What went wrong.
+        request: The command request the client sent.
+        command: The command created from the request, if the engine added it.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        request: "CommandCreate",
+        command: Optional["Command"] = None,
+    ) -> None:
+        super().__init__(message)
+        self.request = request
+        self.command = command
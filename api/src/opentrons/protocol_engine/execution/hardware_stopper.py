@@ -81,6 +81,9 @@ class HardwareStopper:
 
     async def do_stop_and_recover(self, drop_tips_and_home: bool = False) -> None:
         """Stop and reset the HardwareAPI, optionally dropping tips and homing."""
+        # stopping the hardware discards moves that are still queued
+        await self._hardware_api.wait_for_motion()
+
         if drop_tips_and_home:
             await self._drop_tip()
 
@@ -1,7 +1,9 @@
 """Run control command side-effect logic."""
 import asyncio
 
-from ..state import StateStore
+from opentrons.hardware_control import HardwareControlAPI
+
+from ..state import StateStore, StateTopic
 from ..actions import ActionDispatcher, PauseAction, PauseSource
 
 
@@ -14,20 +16,25 @@ class RunControlHandler:
         self,
         state_store: StateStore,
         action_dispatcher: ActionDispatcher,
+        hardware_api: HardwareControlAPI,
     ) -> None:
         """Initialize a RunControlHandler instance."""
         self._state_store = state_store
         self._action_dispatcher = action_dispatcher
+        self._hardware_api = hardware_api
 
     async def wait_for_resume(self) -> None:
         """Issue a PauseAction to the store, pausing the run."""
         if not self._state_store.config.ignore_pause:
+            await self._hardware_api.wait_for_motion()
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
             await self._state_store.wait_for(
-                condition=self._state_store.commands.get_is_running
+                condition=self._state_store.commands.get_is_running,
+                topics=[StateTopic.COMMANDS],
             )
 
     async def wait_for_duration(self, seconds: float) -> None:
         """Delay protocol execution for a duration."""
         if not self._state_store.config.ignore_pause:
+            await self._hardware_api.wait_for_motion()
             await asyncio.sleep(seconds)
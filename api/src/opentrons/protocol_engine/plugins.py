@@ -1,7 +1,7 @@
 """Protocol engine plugin interface."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
 from typing_extensions import final
 
 from .actions import Action, ActionDispatcher, ActionHandler
@@ -36,6 +36,18 @@ class AbstractPlugin(ActionHandler, ABC):
         """
         return self._action_dispatcher.dispatch(action)
 
+    @final
+    def dispatch_all(self, actions: Sequence[Action]) -> None:
+        """Dispatch several actions into the action pipeline as one batch.
+
+        Arguments:
+            actions: New ProtocolEngine actions to send into the pipeline.
+                Other plugins will get all of them before the state
+                reflects any of them, and anything waiting for a state
+                change will be woken up once, after all of them.
+        """
+        return self._action_dispatcher.dispatch_all(actions)
+
     def setup(self) -> None:
         """Run any necessary setup steps prior to plugin usage."""
         ...
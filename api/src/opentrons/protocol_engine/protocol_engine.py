@@ -1,5 +1,5 @@
 """ProtocolEngine class definition."""
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control import HardwareControlAPI
@@ -15,7 +15,7 @@ from .execution import (
     DoorWatcher,
     HardwareStopper,
 )
-from .state import StateStore, StateView
+from .state import StateStore, StateView, StateTopic, CommandTopic
 from .plugins import AbstractPlugin, PluginStarter
 from .actions import (
     ActionDispatcher,
@@ -26,6 +26,7 @@ from .actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    QueueCommandsAction,
     AddLabwareOffsetAction,
     AddLabwareDefinitionAction,
     AddModuleAction,
@@ -149,11 +150,50 @@ class ProtocolEngine:
         self._action_dispatcher.dispatch(action)
         return self._state_store.commands.get(command_id)
 
+    def add_commands(self, requests: Sequence[CommandCreate]) -> List[Command]:
+        """Add several commands to the `ProtocolEngine`'s queue, in order.
+
+        This is equivalent to calling `add_command` for each request, but
+        validates the requests and updates state once for all of them, so
+        it's much faster for loading whole protocols.
+
+        Arguments:
+            requests: The command types and payload data used to construct
+                the commands in state.
+
+        Returns:
+            The full, newly queued commands.
+
+        Raises:
+            SetupCommandNotAllowed: a request specified a setup command,
+                but the engine was not idle or paused. No command is added.
+            RunStoppedError: the run has been stopped, so no new commands
+                may be added.
+        """
+        created_at = self._model_utils.get_timestamp()
+        command_ids = [self._model_utils.generate_id() for _ in requests]
+
+        action = self.state_view.commands.validate_action_allowed(
+            QueueCommandsAction(
+                commands=[
+                    QueueCommandAction(
+                        request=request,
+                        command_id=command_id,
+                        created_at=created_at,
+                    )
+                    for request, command_id in zip(requests, command_ids)
+                ]
+            )
+        )
+        self._action_dispatcher.dispatch(action)
+        return [self._state_store.commands.get(c_id) for c_id in command_ids]
+
     async def wait_for_command(self, command_id: str) -> None:
         """Wait for a command to be completed."""
         await self._state_store.wait_for(
             self._state_store.commands.get_is_complete,
             command_id=command_id,
+            topics=[CommandTopic(command_id)],
         )
 
     async def add_and_execute_command(self, request: CommandCreate) -> Command:
@@ -193,7 +233,8 @@ class ProtocolEngine:
             CommandExecutionFailedError: if any protocol command failed.
         """
         await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_complete
+            condition=self._state_store.commands.get_all_complete,
+            topics=[StateTopic.COMMANDS],
         )
 
     async def finish(
@@ -5,17 +5,29 @@ abstract away rough edges until we can improve those underlying interfaces.
 """
 import logging
 from anyio import to_thread
-from typing import Optional, cast
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple, cast
 
 from opentrons_shared_data.labware.dev_types import LabwareDefinition as LabwareDefDict
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocols.labware import get_labware_definition
+from opentrons.protocols.labware.registry import get_registry
 from opentrons.calibration_storage.get import load_tip_length_calibration
 from opentrons.calibration_storage.types import TipLengthCalNotFound
 
 
 log = logging.getLogger(__name__)
 
+# Dict forms of recently used definitions, by identity, for calibration
+# lookups. Definition models aren't modified once loaded, and holding the
+# model keeps its id from being reused.
+_DEFINITION_DICTS_SIZE = 16
+_definition_dicts: "OrderedDict[int, Tuple[LabwareDefinition, LabwareDefDict]]" = (
+    OrderedDict()
+)
+_definition_dicts_lock = Lock()
+
 
 class LabwareDataProvider:
     """Labware data provider."""
@@ -28,9 +40,14 @@ class LabwareDataProvider:
     ) -> LabwareDefinition:
         """Get a labware definition given the labware's identification.
 
-        Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        Definitions are parsed once and shared, so the returned model
+        must not be modified. Definitions that have not been loaded recently
+        are read from the filesystem on a worker thread.
         """
+        cached = get_registry().get_cached_model(load_name, namespace, version)
+        if cached is not None:
+            return cached
+
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
             load_name,
@@ -42,8 +59,13 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
-        return LabwareDefinition.parse_obj(
-            get_labware_definition(load_name, namespace, version)
+        return get_registry().get_model(
+            load_name,
+            namespace,
+            version,
+            load=lambda: LabwareDefinition.parse_obj(
+                get_labware_definition(load_name, namespace, version)
+            ),
         )
 
     @staticmethod
@@ -70,12 +92,29 @@ class LabwareDataProvider:
         try:
             return load_tip_length_calibration(
                 pip_id=pipette_serial,
-                definition=cast(
-                    LabwareDefDict,
-                    labware_definition.dict(exclude_none=True),
-                ),
+                definition=_get_definition_dict(labware_definition),
             ).tip_length
 
         except TipLengthCalNotFound as e:
             log.debug("No calibrated tip length found for {pipette_serial}", exc_info=e)
             return None
+
+
+def _get_definition_dict(labware_definition: LabwareDefinition) -> LabwareDefDict:
+    with _definition_dicts_lock:
+        cached = _definition_dicts.get(id(labware_definition))
+        if cached is not None:
+            _definition_dicts.move_to_end(id(labware_definition))
+            return cached[1]
+
+    definition_dict = cast(LabwareDefDict, labware_definition.dict(exclude_none=True))
+
+    with _definition_dicts_lock:
+        _definition_dicts[id(labware_definition)] = (
+            labware_definition,
+            definition_dict,
+        )
+        while len(_definition_dicts) > _DEFINITION_DICTS_SIZE:
+            _definition_dicts.popitem(last=False)
+
+    return definition_dict
@@ -1,6 +1,7 @@
 """Protocol engine state module."""
 
 from .state import State, StateStore, StateView
+from .change_notifier import CommandTopic, StateTopic
 from .state_summary import StateSummary
 from .config import Config
 from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
@@ -27,6 +28,9 @@ __all__ = [
     "StateStore",
     "StateView",
     "StateSummary",
+    # state change topics
+    "StateTopic",
+    "CommandTopic",
     # static engine configuration
     "Config",
     # command state and values
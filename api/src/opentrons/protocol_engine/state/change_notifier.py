@@ -1,19 +1,105 @@
 """Simple state change notification interface."""
 import asyncio
+from dataclasses import dataclass
+from enum import Enum
+from itertools import count
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional
+
+
+class StateTopic(str, Enum):
+    """A substore whose state may change in reaction to an action."""
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+    MODULES = "modules"
+
+
+@dataclass(frozen=True)
+class CommandTopic:
+    """A change to a single command, identified by its unique ID."""
+
+    command_id: str
+
+
+@dataclass(frozen=True)
+class _Waiter:
+    order: int
+    topics: Optional[FrozenSet[Hashable]]
+    future: "asyncio.Future[None]"
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications.
+
+    Subscribers may wait for any change, or only for changes to a set of topics.
+    Subscribers are always woken up in the order they subscribed.
+    """
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
-        self._event = asyncio.Event()
+        """Initialize the ChangeNotifier with no subscribers."""
+        self._order = count()
+        self._waiters: Dict[int, _Waiter] = {}
+        self._unfiltered_waiters: Dict[int, _Waiter] = {}
+        self._waiters_by_topic: Dict[Hashable, Dict[int, _Waiter]] = {}
+
+    def notify(self, topics: Optional[Iterable[Hashable]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            topics: The topics that changed. If omitted, every `wait`'er
+                is notified, regardless of the topics it is waiting for.
+        """
+        if topics is None:
+            to_wake = list(self._waiters.values())
+        else:
+            matching = dict(self._unfiltered_waiters)
+            for topic in topics:
+                matching.update(self._waiters_by_topic.get(topic, {}))
+            to_wake = [matching[order] for order in sorted(matching)]
+
+        for waiter in to_wake:
+            self._remove(waiter)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+
+    async def wait(self, topics: Optional[Iterable[Hashable]] = None) -> None:
+        """Wait until the next state change notification.
+
+        Arguments:
+            topics: Only wake up for notifications about these topics.
+                If omitted, wake up for every notification.
+        """
+        waiter = _Waiter(
+            order=next(self._order),
+            topics=frozenset(topics) if topics is not None else None,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._add(waiter)
+
+        try:
+            await waiter.future
+        finally:
+            self._remove(waiter)
+
+    def _add(self, waiter: _Waiter) -> None:
+        self._waiters[waiter.order] = waiter
+
+        if waiter.topics is None:
+            self._unfiltered_waiters[waiter.order] = waiter
+        else:
+            for topic in waiter.topics:
+                self._waiters_by_topic.setdefault(topic, {})[waiter.order] = waiter
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+    def _remove(self, waiter: _Waiter) -> None:
+        if self._waiters.pop(waiter.order, None) is None:
+            return
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        if waiter.topics is None:
+            self._unfiltered_waiters.pop(waiter.order, None)
+        else:
+            for topic in waiter.topics:
+                topic_waiters = self._waiters_by_topic.get(topic, {})
+                topic_waiters.pop(waiter.order, None)
+                if len(topic_waiters) == 0:
+                    self._waiters_by_topic.pop(topic, None)
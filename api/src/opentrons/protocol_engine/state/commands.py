@@ -13,6 +13,7 @@ from opentrons.hardware_control.types import DoorState
 from ..actions import (
     Action,
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     PlayAction,
@@ -147,6 +148,16 @@ class CommandState:
     are stored on the individual commands themselves.
     """
 
+    latest_completed_command_id: Optional[str]
+    """The ID of the completed command with the highest index, if any.
+
+    Maintained as commands complete so the "current" command
+    can be looked up without walking the command list.
+    """
+
+    failed_command_ids: OrderedSet[str]
+    """The IDs of non-setup commands that failed with an error, in failure order."""
+
 
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container."""
@@ -173,6 +184,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
             errors_by_id={},
             run_completed_at=None,
             run_started_at=None,
+            latest_completed_command_id=None,
+            failed_command_ids=OrderedSet(),
         )
 
     def handle_action(self, action: Action) -> None:  # noqa: C901
@@ -180,38 +193,11 @@ class CommandStore(HasState[CommandState], HandlesActions):
         errors_by_id: Mapping[str, ErrorOccurrence]
 
         if isinstance(action, QueueCommandAction):
-            assert action.command_id not in self._state.commands_by_id
-
-            # TODO(mc, 2021-06-22): mypy has trouble with this automatic
-            # request > command mapping, figure out how to type precisely
-            # (or wait for a future mypy version that can figure it out).
-            # For now, unit tests cover mapping every request type
-            queued_command = action.request._CommandCls.construct(
-                id=action.command_id,
-                key=(
-                    action.request.key
-                    if action.request.key is not None
-                    # TODO(mc, 2021-12-13): generate a command key from params and state
-                    # https://github.com/Opentrons/opentrons/issues/8986
-                    else action.command_id
-                ),
-                createdAt=action.created_at,
-                params=action.request.params,  # type: ignore[arg-type]
-                intent=action.request.intent,
-                status=CommandStatus.QUEUED,
-            )
-
-            next_index = len(self._state.all_command_ids)
-            self._state.all_command_ids.append(action.command_id)
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
-            )
+            self._queue_command(action)
 
-            if action.request.intent == CommandIntent.SETUP:
-                self._state.queued_setup_command_ids.add(queued_command.id)
-            else:
-                self._state.queued_command_ids.add(queued_command.id)
+        elif isinstance(action, QueueCommandsAction):
+            for queue_action in action.commands:
+                self._queue_command(queue_action)
 
         # TODO(mc, 2021-12-28): replace "UpdateCommandAction" with explicit
         # state change actions (e.g. RunCommandAction, SucceedCommandAction)
@@ -223,15 +209,10 @@ class CommandStore(HasState[CommandState], HandlesActions):
             if prev_entry is None:
                 index = len(self._state.all_command_ids)
                 self._state.all_command_ids.append(command.id)
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=index,
-                    command=command,
-                )
             else:
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=command,
-                )
+                index = prev_entry.index
+
+            self._set_command_entry(CommandEntry(index=index, command=command))
 
             self._state.queued_command_ids.discard(command.id)
             self._state.queued_setup_command_ids.discard(command.id)
@@ -250,18 +231,20 @@ class CommandStore(HasState[CommandState], HandlesActions):
             )
 
             prev_entry = self._state.commands_by_id[action.command_id]
-            self._state.commands_by_id[action.command_id] = CommandEntry(
-                index=prev_entry.index,
-                # TODO(mc, 2022-06-06): add new "cancelled" status or similar
-                # and don't set `completedAt` in commands other than the
-                # specific one that failed
-                command=prev_entry.command.copy(
-                    update={
-                        "error": error_occurrence,
-                        "completedAt": action.failed_at,
-                        "status": CommandStatus.FAILED,
-                    }
-                ),
+            self._set_command_entry(
+                CommandEntry(
+                    index=prev_entry.index,
+                    # TODO(mc, 2022-06-06): add new "cancelled" status or similar
+                    # and don't set `completedAt` in commands other than the
+                    # specific one that failed
+                    command=prev_entry.command.copy(
+                        update={
+                            "error": error_occurrence,
+                            "completedAt": action.failed_at,
+                            "status": CommandStatus.FAILED,
+                        }
+                    ),
+                )
             )
 
             if prev_entry.command.intent == CommandIntent.SETUP:
@@ -278,14 +261,16 @@ class CommandStore(HasState[CommandState], HandlesActions):
             for command_id in other_command_ids_to_fail:
                 prev_entry = self._state.commands_by_id[command_id]
 
-                self._state.commands_by_id[command_id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=prev_entry.command.copy(
-                        update={
-                            "completedAt": action.failed_at,
-                            "status": CommandStatus.FAILED,
-                        }
-                    ),
+                self._set_command_entry(
+                    CommandEntry(
+                        index=prev_entry.index,
+                        command=prev_entry.command.copy(
+                            update={
+                                "completedAt": action.failed_at,
+                                "status": CommandStatus.FAILED,
+                            }
+                        ),
+                    )
                 )
 
             if self._state.running_command_id == action.command_id:
@@ -351,6 +336,64 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 elif action.door_state == DoorState.CLOSED:
                     self._state.is_door_blocking = False
 
+    def _queue_command(self, action: QueueCommandAction) -> None:
+        """Add a queued command, built from its request, to the end of the queue."""
+        assert action.command_id not in self._state.commands_by_id
+
+        # TODO(mc, 2021-06-22): mypy has trouble with this automatic
+        # request > command mapping, figure out how to type precisely
+        # (or wait for a future mypy version that can figure it out).
+        # For now, unit tests cover mapping every request type
+        queued_command = action.request._CommandCls.construct(
+            id=action.command_id,
+            key=(
+                action.request.key
+                if action.request.key is not None
+                # TODO(mc, 2021-12-13): generate a command key from params and state
+                # https://github.com/Opentrons/opentrons/issues/8986
+                else action.command_id
+            ),
+            createdAt=action.created_at,
+            params=action.request.params,  # type: ignore[arg-type]
+            intent=action.request.intent,
+            status=CommandStatus.QUEUED,
+        )
+
+        next_index = len(self._state.all_command_ids)
+        self._state.all_command_ids.append(action.command_id)
+        self._state.commands_by_id[queued_command.id] = CommandEntry(
+            index=next_index,
+            command=queued_command,
+        )
+
+        if action.request.intent == CommandIntent.SETUP:
+            self._state.queued_setup_command_ids.add(queued_command.id)
+        else:
+            self._state.queued_command_ids.add(queued_command.id)
+
+    def _set_command_entry(self, entry: CommandEntry) -> None:
+        """Store a command entry and update the completed and failed command indices.
+
+        Commands never go back to a non-completed status,
+        so the latest completed command only ever moves forward.
+        """
+        command = entry.command
+        self._state.commands_by_id[command.id] = entry
+
+        if (
+            command.status == CommandStatus.SUCCEEDED
+            or command.status == CommandStatus.FAILED
+        ):
+            latest_id = self._state.latest_completed_command_id
+            if (
+                latest_id is None
+                or self._state.commands_by_id[latest_id].index <= entry.index
+            ):
+                self._state.latest_completed_command_id = command.id
+
+        if command.error is not None and command.intent != CommandIntent.SETUP:
+            self._state.failed_command_ids.add(command.id)
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -430,17 +473,14 @@ class CommandView(HasState[CommandState]):
                 index=entry.index,
             )
 
-        # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
-        # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_is_complete(cid):
-                entry = self._state.commands_by_id[cid]
-                return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
-                )
+        if self._state.latest_completed_command_id:
+            entry = self._state.commands_by_id[self._state.latest_completed_command_id]
+            return CurrentCommand(
+                command_id=entry.command.id,
+                command_key=entry.command.key,
+                created_at=entry.command.createdAt,
+                index=entry.index,
+            )
 
         return None
 
@@ -519,10 +559,14 @@ class CommandView(HasState[CommandState]):
         no_command_queued = len(self._state.queued_command_ids) == 0
 
         if no_command_running and no_command_queued:
-            for command_id in self._state.all_command_ids:
-                command = self._state.commands_by_id[command_id].command
-                if command.error and command.intent != CommandIntent.SETUP:
-                    raise ProtocolCommandFailedError(command_id=command_id)
+            if len(self._state.failed_command_ids) > 0:
+                # in practice, a run stops after its first failure,
+                # so this set holds at most a handful of entries
+                command_id = min(
+                    self._state.failed_command_ids,
+                    key=lambda cid: self._state.commands_by_id[cid].index,
+                )
+                raise ProtocolCommandFailedError(command_id=command_id)
             return True
         else:
             return False
@@ -544,8 +588,12 @@ class CommandView(HasState[CommandState]):
 
     def validate_action_allowed(
         self,
-        action: Union[PlayAction, PauseAction, StopAction, QueueCommandAction],
-    ) -> Union[PlayAction, PauseAction, StopAction, QueueCommandAction]:
+        action: Union[
+            PlayAction, PauseAction, StopAction, QueueCommandAction, QueueCommandsAction
+        ],
+    ) -> Union[
+        PlayAction, PauseAction, StopAction, QueueCommandAction, QueueCommandsAction
+    ]:
         """Validate whether a given control action is allowed.
 
         Returns:
@@ -572,6 +620,9 @@ class CommandView(HasState[CommandState]):
         elif (
             isinstance(action, QueueCommandAction)
             and action.request.intent == CommandIntent.SETUP
+        ) or (
+            isinstance(action, QueueCommandsAction)
+            and any(c.request.intent == CommandIntent.SETUP for c in action.commands)
         ):
             if self._state.queue_status != QueueStatus.SETUP:
                 raise SetupCommandNotAllowedError(
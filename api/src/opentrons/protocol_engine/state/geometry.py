@@ -1,9 +1,10 @@
 """Geometry state getters."""
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Tuple
 
 from opentrons.types import Point, DeckSlotName
 from opentrons.hardware_control.dev_types import PipetteDict
+from opentrons.protocols.models import WellDefinition
 
 from .. import errors
 from ..types import (
@@ -13,6 +14,7 @@ from ..types import (
     WellOffset,
     DeckSlotLocation,
     ModuleLocation,
+    ModuleDefinition,
 )
 from .labware import LabwareView
 from .modules import ModuleView
@@ -20,6 +22,9 @@ from .modules import ModuleView
 
 DEFAULT_TIP_DROP_HEIGHT_FACTOR = 0.5
 
+# The slot and definition of the module a labware is loaded on
+_ParentModule = Tuple[DeckSlotName, ModuleDefinition]
+
 
 @dataclass(frozen=True)
 class TipGeometry:
@@ -40,6 +45,22 @@ class TipGeometry:
     volume: int
 
 
+@dataclass
+class _LabwareGeometry:
+    """Geometry of a loaded labware, computed on first use.
+
+    It stays valid for as long as the labware's entry in state and the
+    module it sits on, if any, are unchanged, which the store ensures by
+    replacing those entries rather than modifying them.
+    """
+
+    labware_data: LoadedLabware
+    parent_module: Optional[_ParentModule]
+    position: Point
+    highest_z: Optional[float] = None
+    wells: Dict[Optional[str], WellDefinition] = field(default_factory=dict)
+
+
 # TODO(mc, 2021-06-03): continue evaluation of which selectors should go here
 # vs which selectors should be in LabwareView
 class GeometryView:
@@ -49,19 +70,18 @@ class GeometryView:
         """Initialize a GeometryView instance."""
         self._labware = labware_view
         self._modules = module_view
+        self._labware_geometry: Dict[str, _LabwareGeometry] = {}
 
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
-        labware_data = self._labware.get(labware_id)
-
-        return self._get_highest_z_from_labware_data(labware_data)
+        return self._get_highest_z(self._get_labware_geometry(labware_id))
 
     # TODO(mc, 2022-06-24): rename this method
     def get_all_labware_highest_z(self) -> float:
         """Get the highest Z-point across all labware."""
         return max(
             *(
-                self._get_highest_z_from_labware_data(lw_data)
+                self._get_highest_z(self._get_labware_geometry(lw_data.id))
                 for lw_data in self._labware.get_all()
             ),
             *(
@@ -106,6 +126,33 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
+        return self._get_labware_geometry(labware_id).position
+
+    def _get_labware_geometry(self, labware_id: str) -> _LabwareGeometry:
+        labware_data = self._labware.get(labware_id)
+        parent_module = None
+        if isinstance(labware_data.location, ModuleLocation):
+            module_id = labware_data.location.moduleId
+            parent_module = (
+                self._modules.get_location(module_id).slotName,
+                self._modules.get_definition(module_id),
+            )
+
+        geometry = self._labware_geometry.get(labware_id)
+        if (
+            geometry is None
+            or geometry.labware_data is not labware_data
+            or not _is_same_parent(geometry.parent_module, parent_module)
+        ):
+            geometry = _LabwareGeometry(
+                labware_data=labware_data,
+                parent_module=parent_module,
+                position=self._compute_labware_position(labware_id),
+            )
+            self._labware_geometry[labware_id] = geometry
+        return geometry
+
+    def _compute_labware_position(self, labware_id: str) -> Point:
         origin_pos = self.get_labware_origin_position(labware_id)
         cal_offset = self._labware.get_labware_offset_vector(labware_id)
 
@@ -122,8 +169,12 @@ class GeometryView:
         well_location: Optional[WellLocation] = None,
     ) -> Point:
         """Get the absolute position of a well in a labware."""
-        labware_pos = self.get_labware_position(labware_id)
-        well_def = self._labware.get_well_definition(labware_id, well_name)
+        geometry = self._get_labware_geometry(labware_id)
+        labware_pos = geometry.position
+        well_def = geometry.wells.get(well_name)
+        if well_def is None:
+            well_def = self._labware.get_well_definition(labware_id, well_name)
+            geometry.wells[well_name] = well_def
         well_depth = well_def.depth
 
         if well_location is not None:
@@ -174,8 +225,16 @@ class GeometryView:
             center + Point(x=0, y=-y_offset, z=0),  # down
         ]
 
-    def _get_highest_z_from_labware_data(self, lw_data: LoadedLabware) -> float:
-        labware_pos = self.get_labware_position(lw_data.id)
+    def _get_highest_z(self, geometry: _LabwareGeometry) -> float:
+        if geometry.highest_z is None:
+            geometry.highest_z = self._get_highest_z_from_labware_data(
+                geometry.labware_data, geometry.position
+            )
+        return geometry.highest_z
+
+    def _get_highest_z_from_labware_data(
+        self, lw_data: LoadedLabware, labware_pos: Point
+    ) -> float:
         definition = self._labware.get_definition(lw_data.id)
         z_dim = definition.dimensions.zDimension
         height_over_labware: float = 0
@@ -278,3 +337,12 @@ class GeometryView:
             module_id = labware.location.moduleId
             slot_name = self._modules.get_location(module_id).slotName
         return slot_name
+
+
+def _is_same_parent(
+    first: Optional[_ParentModule],
+    second: Optional[_ParentModule],
+) -> bool:
+    if first is None or second is None:
+        return first is second
+    return first[0] is second[0] and first[1] is second[1]
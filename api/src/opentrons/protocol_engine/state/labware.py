@@ -4,7 +4,8 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3, SlotDefV3
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -25,6 +26,7 @@ from ..types import (
     LabwareOffsetLocation,
     LabwareLocation,
     LoadedLabware,
+    ModuleModel,
 )
 from ..actions import (
     Action,
@@ -37,6 +39,9 @@ from .abstract_store import HasState, HandlesActions
 
 _TRASH_LOCATION = DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH)
 
+# The definition URI, slot and module model that a labware offset applies to
+_OffsetKey = Tuple[str, DeckSlotName, Optional[ModuleModel]]
+
 
 @dataclass
 class LabwareState:
@@ -167,6 +172,13 @@ class LabwareView(HasState[LabwareState]):
             state: Labware state dataclass used for all calculations.
         """
         self._state = state
+        # Lookup tables derived from state, rebuilt if the deck definition
+        # is replaced and extended as labware offsets are added
+        self._slot_definitions: Dict[str, SlotDefV3] = {}
+        self._slot_definitions_deck: Optional[DeckDefinitionV3] = None
+        self._offsets_by_key: Dict[_OffsetKey, LabwareOffset] = {}
+        self._offsets_source: Optional[Dict[str, LabwareOffset]] = None
+        self._offsets_indexed = 0
 
     def get(self, labware_id: str) -> LoadedLabware:
         """Get labware data by the labware's unique identifier."""
@@ -195,13 +207,19 @@ class LabwareView(HasState[LabwareState]):
         """Get the definition of a slot in the deck."""
         deck_def = self.get_deck_definition()
 
-        for slot_def in deck_def["locations"]["orderedSlots"]:
-            if slot_def["id"] == str(slot):
-                return slot_def
+        if self._slot_definitions_deck is not deck_def:
+            self._slot_definitions = {
+                slot_def["id"]: slot_def
+                for slot_def in reversed(deck_def["locations"]["orderedSlots"])
+            }
+            self._slot_definitions_deck = deck_def
 
-        raise errors.SlotDoesNotExistError(
-            f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
-        )
+        try:
+            return self._slot_definitions[str(slot)]
+        except KeyError as e:
+            raise errors.SlotDoesNotExistError(
+                f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
+            ) from e
 
     def get_slot_position(self, slot: DeckSlotName) -> Point:
         """Get the position of a deck slot."""
@@ -392,10 +410,23 @@ class LabwareView(HasState[LabwareState]):
         This implies that if the location involves a module,
         it will *not* match a module that's compatible but not identical.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
-        return None
+        offsets = self._state.labware_offsets_by_id
+
+        # Offsets are only ever added, so only index the ones that are new
+        # since the last call, unless this is a different set of offsets
+        if self._offsets_source is not offsets or self._offsets_indexed > len(offsets):
+            self._offsets_by_key = {}
+            self._offsets_source = offsets
+            self._offsets_indexed = 0
+
+        for offset in islice(offsets.values(), self._offsets_indexed, None):
+            self._offsets_by_key[
+                _get_offset_key(offset.definitionUri, offset.location)
+            ] = offset
+        self._offsets_indexed = len(offsets)
+
+        return self._offsets_by_key.get(_get_offset_key(definition_uri, location))
+
+
+def _get_offset_key(definition_uri: str, location: LabwareOffsetLocation) -> _OffsetKey:
+    return definition_uri, location.slotName, location.moduleModel
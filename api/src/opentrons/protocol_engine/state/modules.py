@@ -467,12 +467,16 @@ class ModuleView(HasState[ModuleState]):
 
     def get_location(self, module_id: str) -> DeckSlotLocation:
         """Get the slot location of the given module."""
-        location = self.get(module_id).location
-        if location is None:
+        try:
+            slot_name = self._state.slot_by_module_id[module_id]
+        except KeyError as e:
+            raise errors.ModuleNotLoadedError(f"Module {module_id} not found.") from e
+
+        if slot_name is None:
             raise errors.ModuleNotOnDeckError(
                 f"Module {module_id} is not loaded into a deck slot."
             )
-        return location
+        return DeckSlotLocation.construct(slotName=slot_name)
 
     def get_model(self, module_id: str) -> ModuleModel:
         """Get the model name of the given module."""
@@ -3,14 +3,36 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
 from ..resources import DeckFixedLabware
-from ..actions import Action, ActionHandler
+from ..actions import (
+    Action,
+    ActionHandler,
+    QueueCommandAction,
+    QueueCommandsAction,
+    UpdateCommandAction,
+    PlayAction,
+    PauseAction,
+    DoorChangeAction,
+    AddLabwareOffsetAction,
+    AddLabwareDefinitionAction,
+    AddModuleAction,
+)
 from .abstract_store import HasState, HandlesActions
-from .change_notifier import ChangeNotifier
+from .change_notifier import ChangeNotifier, CommandTopic, StateTopic
 from .commands import CommandState, CommandStore, CommandView
 from .labware import LabwareState, LabwareStore, LabwareView
 from .pipettes import PipetteState, PipetteStore, PipetteView
@@ -151,17 +173,50 @@ class StateStore(StateView, ActionHandler):
             substore.handle_action(action)
 
         self._update_state_views()
+        self._change_notifier.notify(_get_changed_topics(action))
+
+    def handle_actions(self, actions: Sequence[Action]) -> None:
+        """Modify State in reaction to several actions, in order.
+
+        The state views are only updated, and waiters only notified of
+        the changes, once all of the actions have been handled.
+
+        Arguments:
+            actions: Action objects representing state changes.
+        """
+        changed_topics: Optional[Set[Hashable]] = set()
+
+        for action in actions:
+            for substore in self._substores:
+                substore.handle_action(action)
+
+            action_topics = _get_changed_topics(action)
+            if changed_topics is None or action_topics is None:
+                changed_topics = None
+            else:
+                changed_topics.update(action_topics)
+
+        if len(actions) > 0:
+            self._update_state_views()
+            self._change_notifier.notify(changed_topics)
 
     async def wait_for(
         self,
         condition: Callable[..., Optional[ReturnT]],
         *args: Any,
+        topics: Optional[Collection[Hashable]] = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
 
         If the condition is already true, return immediately.
 
+        If `topics` are specified, the condition will only be re-checked when
+        an action changes one of those topics. Use `StateTopic` to watch a whole
+        substore and `CommandTopic` to watch a single command. The condition
+        must only depend on state covered by those topics, or it may never be
+        re-checked.
+
         !!! Warning:
             This will only return when `condition` is true right now.
             If you're not careful, this can cause you to miss updates,
@@ -194,6 +249,7 @@ class StateStore(StateView, ActionHandler):
             condition: A function that returns a truthy value when the `await`
                 should resolve.
             *args: Positional arguments to pass to `condition`.
+            topics: State change topics to watch. Watches all changes if omitted.
             **kwargs: Named arguments to pass to `condition`.
 
         Returns:
@@ -206,7 +262,7 @@ class StateStore(StateView, ActionHandler):
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(topics)
             is_done = predicate()
 
         return is_done
@@ -251,4 +307,42 @@ class StateStore(StateView, ActionHandler):
         self._labware._state = next_state.labware
         self._pipettes._state = next_state.pipettes
         self._modules._state = next_state.modules
-        self._change_notifier.notify()
+
+
+def _get_changed_topics(action: Action) -> Optional[List[Hashable]]:
+    """Get the state change topics that an action could have affected.
+
+    Returns `None`, meaning "everything changed," for any action that
+    may affect more than the topics listed here.
+    """
+    if isinstance(action, QueueCommandAction):
+        return [StateTopic.COMMANDS, CommandTopic(action.command_id)]
+
+    elif isinstance(action, QueueCommandsAction):
+        topics: List[Hashable] = [StateTopic.COMMANDS]
+        topics.extend(CommandTopic(queued.command_id) for queued in action.commands)
+        return topics
+
+    elif isinstance(action, UpdateCommandAction):
+        command = action.command
+        if command.result is None:
+            return [StateTopic.COMMANDS, CommandTopic(command.id)]
+        else:
+            return [
+                StateTopic.COMMANDS,
+                StateTopic.LABWARE,
+                StateTopic.PIPETTES,
+                StateTopic.MODULES,
+                CommandTopic(command.id),
+            ]
+
+    elif isinstance(action, (PlayAction, PauseAction, DoorChangeAction)):
+        return [StateTopic.COMMANDS]
+
+    elif isinstance(action, (AddLabwareOffsetAction, AddLabwareDefinitionAction)):
+        return [StateTopic.LABWARE]
+
+    elif isinstance(action, AddModuleAction):
+        return [StateTopic.MODULES]
+
+    return None
@@ -1,6 +1,6 @@
 """Translation of JSON protocol commands into ProtocolEngine commands."""
-from typing import cast, List
-from pydantic import parse_obj_as
+from typing import cast, Dict, List, Type
+from pydantic import parse_obj_as, ValidationError
 from opentrons_shared_data.protocol.models import ProtocolSchemaV6, protocol_schema_v6
 from opentrons.protocol_engine import (
     commands as pe_commands,
@@ -85,6 +85,7 @@ def _translate_pipette_command(
 
 def _translate_simple_command(
     command: protocol_schema_v6.Command,
+    create_types: Dict[str, Type[pe_commands.CommandCreate]],
 ) -> pe_commands.CommandCreate:
     dict_command = command.dict(exclude_none=True)
 
@@ -95,6 +96,17 @@ def _translate_simple_command(
         else:
             dict_command["commandType"] = "waitForDuration"
 
+    # Parsing against the whole CommandCreate union tries every member in
+    # turn, so parse straight into the type that matched this command type
+    # the last time, and only fall back to the union if that fails
+    command_type = dict_command["commandType"]
+    create_type = create_types.get(command_type)
+    if create_type is not None:
+        try:
+            return create_type.parse_obj(dict_command)
+        except ValidationError:
+            pass
+
     translated_obj = cast(
         pe_commands.CommandCreate,
         parse_obj_as(
@@ -103,12 +115,17 @@ def _translate_simple_command(
             dict_command,
         ),
     )
+    create_types[command_type] = type(translated_obj)
     return translated_obj
 
 
 class JsonCommandTranslator:
     """Class that translates commands from PD/JSON to ProtocolEngine."""
 
+    def __init__(self) -> None:
+        """Initialize the translator."""
+        self._create_types: Dict[str, Type[pe_commands.CommandCreate]] = {}
+
     def translate(
         self,
         protocol: ProtocolSchemaV6,
@@ -132,6 +149,6 @@ class JsonCommandTranslator:
             elif command.commandType == "loadLabware":
                 translated_obj = _translate_labware_command(protocol, command)
             else:
-                translated_obj = _translate_simple_command(command)
+                translated_obj = _translate_simple_command(command, self._create_types)
             commands_list.append(translated_obj)
         return commands_list
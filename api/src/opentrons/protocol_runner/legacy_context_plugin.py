@@ -131,8 +131,11 @@ class LegacyContextPlugin(AbstractPlugin):
     async def _dispatch_all_actions(self) -> None:
         """Dispatch all actions to the `ProtocolEngine`.
 
+        Actions reported while the event loop was busy are dispatched
+        together, so the engine's state is updated once for all of them.
+
         Exits only when `self._actions_to_dispatch` is closed
         (or an unexpected exception is raised).
         """
-        async for action in self._actions_to_dispatch.get_async_until_closed():
-            self.dispatch(action)
+        async for actions in self._actions_to_dispatch.get_batches_async_until_closed():
+            self.dispatch_all(actions)
@@ -159,17 +159,20 @@ class ProtocolRunner:
     def _load_json(self, protocol_source: ProtocolSource) -> None:
         protocol = self._json_file_reader.read(protocol_source)
         commands = self._json_command_translator.translate(protocol)
-        for command in commands:
-            self._protocol_engine.add_command(request=command)
+        self._protocol_engine.add_commands(requests=commands)
         self._task_queue.set_run_func(func=self._protocol_engine.wait_until_complete)
 
     def _load_python(self, protocol_source: ProtocolSource) -> None:
         protocol = self._python_file_reader.read(protocol_source)
-        context = self._python_context_creator.create(self._protocol_engine)
+        engine_client = self._python_context_creator.create_engine_client(
+            self._protocol_engine
+        )
+        context = self._python_context_creator.create(engine_client)
         self._task_queue.set_run_func(
             func=self._python_executor.execute,
             protocol=protocol,
             context=context,
+            engine_client=engine_client,
         )
 
     def _load_legacy(
@@ -9,10 +9,13 @@ class PythonContextCreator:
     """A factory to build Python ProtocolContext instances."""
 
     @staticmethod
-    def create(protocol_engine: ProtocolEngine) -> ProtocolContext:
-        """Create a fresh ProtocolContext wired to a ProtocolEngine."""
+    def create_engine_client(protocol_engine: ProtocolEngine) -> SyncClient:
+        """Create a client for a Python protocol's thread to use a ProtocolEngine."""
         loop = asyncio.get_running_loop()
         transport = ChildThreadTransport(engine=protocol_engine, loop=loop)
-        client = SyncClient(transport=transport)
+        return SyncClient(transport=transport, pipelined=True)
 
-        return ProtocolContext(engine_client=client)
+    @staticmethod
+    def create(engine_client: SyncClient) -> ProtocolContext:
+        """Create a fresh ProtocolContext wired to a ProtocolEngine's client."""
+        return ProtocolContext(engine_client=engine_client)
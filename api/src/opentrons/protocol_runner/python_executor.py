@@ -4,6 +4,7 @@ from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 from opentrons.protocol_api_experimental import ProtocolContext
+from opentrons.protocol_engine.clients import SyncClient
 from .python_file_reader import PythonProtocol
 
 
@@ -11,15 +12,32 @@ class PythonExecutor:
     """Execute a given PythonProtocol's run method with a ProtocolContext."""
 
     @staticmethod
-    async def execute(protocol: PythonProtocol, context: ProtocolContext) -> None:
+    async def execute(
+        protocol: PythonProtocol,
+        context: ProtocolContext,
+        engine_client: SyncClient,
+    ) -> None:
         """Execute a PythonProtocol using the given ProtocolContext.
 
-        Runs the protocol asynchronously in a child thread.
+        Runs the protocol asynchronously in a child thread. Commands the
+        protocol sent through `engine_client` without waiting are waited for
+        before this returns, even if the protocol raised.
         """
         loop = asyncio.get_running_loop()
 
         with ThreadPoolExecutor(max_workers=1) as executor:
             await loop.run_in_executor(
                 executor=executor,
-                func=partial(protocol.run, context),
+                func=partial(_run_protocol, protocol, context, engine_client),
             )
+
+
+def _run_protocol(
+    protocol: PythonProtocol, context: ProtocolContext, engine_client: SyncClient
+) -> None:
+    try:
+        protocol.run(context)
+    finally:
+        # Raise the error of any command the protocol left queued from its own
+        # thread, as a blocking command would have
+        engine_client.wait_for_queued()
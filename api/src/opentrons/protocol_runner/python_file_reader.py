@@ -4,6 +4,7 @@ from types import ModuleType
 
 from opentrons.protocol_api_experimental import ProtocolContext
 from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocols.parse import compile_python
 
 
 class PythonProtocol:
@@ -37,8 +38,14 @@ class PythonFileReader:
         # a well defined error accordingly
         assert spec is not None, "Unable to load module spec from file"
 
+        # Execute the module ourselves rather than with the spec's loader,
+        # so a protocol that has already been read isn't compiled again
+        _, code = compile_python(
+            protocol_source.main_file.read_text(encoding="utf-8"),
+            str(protocol_source.main_file),
+        )
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)  # type: ignore[union-attr]
+        exec(code, module.__dict__)
 
         # TODO(mc, 2021-06-30): actually check that this module shape is good
         return PythonProtocol(protocol_module=module)
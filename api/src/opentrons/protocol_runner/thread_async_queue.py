@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import deque
 from threading import Condition
-from typing import AsyncIterable, Deque, Generic, Iterable, TypeVar
+from typing import AsyncIterable, Deque, Generic, Iterable, List, Tuple, TypeVar
 
 from anyio.to_thread import run_sync
 
@@ -37,6 +38,9 @@ class ThreadAsyncQueue(Generic[_T]):
         self._is_closed = False
         self._deque: Deque[_T] = deque()
         self._condition = Condition()
+        self._async_waiters: List[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = []
 
     def put(self, value: _T) -> None:
         """Add a value to the back of the queue.
@@ -52,6 +56,7 @@ class ThreadAsyncQueue(Generic[_T]):
             else:
                 self._deque.append(value)
                 self._condition.notify()
+                self._wake_async_waiters()
 
     def get(self) -> _T:
         """Remove and return the value at the front of the queue.
@@ -125,6 +130,58 @@ class ThreadAsyncQueue(Generic[_T]):
             except QueueClosed:
                 break
 
+    async def get_batch_async(self) -> List[_T]:
+        """Remove and return all the values in the queue, waiting for at least one.
+
+        Unlike `get_async()`, this waits in the event loop itself, without
+        a helper thread. `put()` wakes it up with a callback scheduled on
+        its event loop, and values put while the event loop is busy are all
+        returned together, so the consumer can handle them as one batch.
+
+        Because it waits in the event loop, a waiting `get_batch_async()`
+        can be interrupted by an async cancellation.
+
+        Raises:
+            QueueClosed: If all values have been consumed
+                and the queue has been closed with `done_putting()`.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._condition:
+                if len(self._deque) > 0:
+                    batch = list(self._deque)
+                    self._deque.clear()
+                    return batch
+                elif self._is_closed:
+                    raise QueueClosed("Queue closed; no more items to get.")
+                else:
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+
+            try:
+                await waiter[1]
+            finally:
+                with self._condition:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    async def get_batches_async_until_closed(self) -> AsyncIterable[List[_T]]:
+        """Like `get_async_until_closed()`, except return values in batches.
+
+        See `get_batch_async()`.
+
+        Example:
+            async for batch in queue.get_batches_async_until_closed():
+                for value in batch:
+                    print(value)
+        """
+        while True:
+            try:
+                yield await self.get_batch_async()
+            except QueueClosed:
+                break
+
     def done_putting(self) -> None:
         """Close the queue, i.e. signal that no more values will be `put()`.
 
@@ -144,6 +201,7 @@ class ThreadAsyncQueue(Generic[_T]):
             else:
                 self._is_closed = True
                 self._condition.notify_all()
+                self._wake_async_waiters()
 
     def __enter__(self) -> ThreadAsyncQueue[_T]:
         """Use the queue as a context manager, closing the queue upon exit.
@@ -167,6 +225,26 @@ class ThreadAsyncQueue(Generic[_T]):
         """See `__enter__()`."""
         self.done_putting()
 
+    def _wake_async_waiters(self) -> None:
+        """Wake up every `get_batch_async()` waiting for the queue to change.
+
+        Must be called with `self._condition` held. Each waiter is only
+        woken up once, so putting many values before it gets to run
+        schedules a single callback in its event loop.
+        """
+        for loop, future in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(_set_future_done, future)
+            except RuntimeError:
+                # The event loop is closed, so nothing is waiting in it anymore
+                pass
+        self._async_waiters.clear()
+
+
+def _set_future_done(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 class QueueClosed(Exception):
     """See `ThreadAsyncQueue.done_putting()`."""
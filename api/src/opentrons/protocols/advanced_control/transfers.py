@@ -909,15 +909,13 @@ class TransferPlan:
         else:
             test_well = well
 
+        parent = test_well.parent
         if self._api_version < APIVersion(2, 2):
-            return test_well in test_well.parent.rows()[0]
+            return parent._is_in_rows(test_well, slice(0, 1))
         else:
             # Allow the first 2 rows to be accessible to 384-well plates;
             # otherwise, only the first row is accessible
-            if test_well.parent.parameters["format"] == "384Standard":
-                valid_wells = [
-                    well for row in test_well.parent.rows()[:2] for well in row
-                ]
-                return test_well in valid_wells
+            if parent.parameters["format"] == "384Standard":
+                return parent._is_in_rows(test_well, slice(0, 2))
             else:
-                return test_well in test_well.parent.rows()[0]
+                return parent._is_in_rows(test_well, slice(0, 1))
@@ -1,5 +1,5 @@
-from itertools import dropwhile, takewhile
-from typing import Optional, Sequence
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons.protocols.context.well import WellImplementation
 
@@ -8,9 +8,68 @@ Wells = Sequence[WellImplementation]
 WellColumns = Sequence[Wells]
 
 
+def _first_run(bits: int) -> Tuple[int, int]:
+    """The index and length of the lowest run of set bits."""
+    if not bits:
+        return 0, 0
+    start = (bits & -bits).bit_length() - 1
+    shifted = bits >> start
+    return start, (~shifted & (shifted + 1)).bit_length() - 1
+
+
+def _span(start: int, length: int) -> int:
+    """A mask of ``length`` set bits beginning at bit ``start``."""
+    return ((1 << length) - 1) << start
+
+
 class TipTracker:
+    """
+    Tracks which wells of a tiprack hold tips.
+
+    Each column keeps an occupancy bitmap, with bit ``n`` set if the ``n``th
+    well of the column has a tip, and the position and length of its first
+    run of tips. The wells report changes to their tip state back to the
+    tracker, so lookups never have to walk the wells themselves.
+    """
+
     def __init__(self, columns: WellColumns):
         self._columns = columns
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._occupancy: List[int] = []
+        self._tip_runs: List[Tuple[int, int]] = []
+        for column_idx, column in enumerate(columns):
+            occupancy = 0
+            for well_idx, well in enumerate(column):
+                self._positions[well.get_name()] = (column_idx, well_idx)
+                if well.has_tip():
+                    occupancy |= 1 << well_idx
+                well.set_tip_listener(
+                    partial(self._on_tip_change, column_idx, 1 << well_idx)
+                )
+            self._occupancy.append(occupancy)
+            self._tip_runs.append(_first_run(occupancy))
+
+    def _on_tip_change(self, column_idx: int, bit: int, has_tip: bool) -> None:
+        if has_tip:
+            occupancy = self._occupancy[column_idx] | bit
+        else:
+            occupancy = self._occupancy[column_idx] & ~bit
+        self._occupancy[column_idx] = occupancy
+        self._tip_runs[column_idx] = _first_run(occupancy)
+
+    def _empties(self, column_idx: int) -> int:
+        full = (1 << len(self._columns[column_idx])) - 1
+        return ~self._occupancy[column_idx] & full
+
+    def _target_wells(
+        self, start_well: WellImplementation, num_channels: int
+    ) -> Tuple[int, int, int]:
+        """The column, index and number of the wells a pipette with
+        ``num_channels`` channels would reach from ``start_well``"""
+        column_idx, well_idx = self._positions[start_well.get_name()]
+        # Multi-channel pipettes can't reach past the end of the column
+        num_wells = min(len(self._columns[column_idx]) - well_idx, num_channels)
+        return column_idx, well_idx, num_wells
 
     def next_tip(
         self, num_tips: int = 1, starting_tip: Optional[WellImplementation] = None
@@ -29,36 +88,23 @@ class TipTracker:
         :type starting_tip: :py:class:`.Well`
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
-        columns: WellColumns = self._columns
+        first_column = 0
         if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns)
+            # Skip the columns preceding the one with the pipette's starting
+            # tip, and the tips preceding the starting tip in that column
+            first_column, well_idx = self._positions[starting_tip.get_name()]
+            start, length = _first_run(
+                self._occupancy[first_column] & ~((1 << well_idx) - 1)
             )
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w, drop_undefined_columns[0])
-            )
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip(), column))
-            for column in drop_leading_empties
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[WellImplementation] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+            if length >= num_tips:
+                return self._columns[first_column][start]
+            first_column += 1
+
+        for column_idx in range(first_column, len(self._columns)):
+            start, length = self._tip_runs[column_idx]
+            if length >= num_tips:
+                return self._columns[column_idx][start]
+        return None
 
     def use_tips(
         self,
@@ -86,17 +132,13 @@ class TipTracker:
         :type num_channels: int
         :param fail_if_full: for backwards compatibility
         """
-        # Select the column of the labware that contains the target well
-        target_column = [col for col in self._columns if start_well in col][0]
-
-        well_idx = target_column.index(start_well)
         # Number of tips to pick up is the lesser of (1) the number of tips
         # from the starting well to the end of the column, and (2) the number
         # of channels of the pipette (so a 4-channel pipette would pick up a
         # max of 4 tips, and picking up from the 2nd-to-bottom well in a
         # column would get a maximum of 2 tips)
-        num_tips = min(len(target_column) - well_idx, num_channels)
-        target_wells = target_column[well_idx : well_idx + num_tips]
+        column_idx, well_idx, num_tips = self._target_wells(start_well, num_channels)
+        target_wells = self._columns[column_idx][well_idx : well_idx + num_tips]
 
         # In API version 2.2, we no longer reset the tip tracker when a tip
         # is dropped back into a tiprack well. This fixes a behavior where
@@ -107,8 +149,9 @@ class TipTracker:
         # dirty tips and non-present tips; but until then, we can avoid the
         # exception.
         if fail_if_full:
-            assert all(
-                well.has_tip() for well in target_wells
+            target_mask = _span(well_idx, num_tips)
+            assert (
+                self._occupancy[column_idx] & target_mask == target_mask
             ), "{} is out of tips".format(str(self))
 
         for well in target_wells:
@@ -126,21 +169,11 @@ class TipTracker:
         :type num_tips: int
         :return: The :py:class:`.Well` meeting the target criteria, or ``None``
         """
-        columns = self._columns
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip(), column))
-            for column in drop_leading_filled
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-        try:
-            return long_enough[0][0]
-        except IndexError:
-            return None
+        for column_idx, column in enumerate(self._columns):
+            start, length = _first_run(self._empties(column_idx))
+            if length >= num_tips:
+                return column[start]
+        return None
 
     def return_tips(self, start_well: WellImplementation, num_channels: int = 1):
         """
@@ -163,13 +196,38 @@ class TipTracker:
         :param num_channels: The number of channels for the current pipette
         :type num_channels: int
         """
-        # Select the column that contains the target_well
-        target_column = [col for col in self._columns if start_well in col][0]
-        well_idx = target_column.index(start_well)
-        end_idx = min(well_idx + num_channels, len(target_column))
-        drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip():
-                raise AssertionError(f"Well {repr(well)} has a tip")
+        column_idx, well_idx, num_tips = self._target_wells(start_well, num_channels)
+        drop_targets = self._columns[column_idx][well_idx : well_idx + num_tips]
+        if self._occupancy[column_idx] & _span(well_idx, num_tips):
+            for well in drop_targets:
+                if well.has_tip():
+                    raise AssertionError(f"Well {repr(well)} has a tip")
         for well in drop_targets:
             well.set_has_tip(True)
+
+
+def select_next_tip(
+    tip_trackers: Sequence[TipTracker],
+    num_tips: int = 1,
+    starting_tip: Optional[WellImplementation] = None,
+) -> Optional[Tuple[int, WellImplementation]]:
+    """
+    Find the next valid well for pick-up across several tipracks.
+
+    The tipracks are searched in order, starting from ``starting_tip`` in the
+    first one if it is specified.
+
+    :param tip_trackers: The tip trackers of the tipracks to search
+    :param num_tips: target number of sequential tips in the same column
+    :param starting_tip: A well of the first tiprack from which to start the
+                         search
+    :return: The index of the tiprack and the well meeting the target
+             criteria, or ``None``
+    """
+    for rack_idx, tip_tracker in enumerate(tip_trackers):
+        well = tip_tracker.next_tip(
+            num_tips=num_tips, starting_tip=starting_tip if rack_idx == 0 else None
+        )
+        if well:
+            return rack_idx, well
+    return None
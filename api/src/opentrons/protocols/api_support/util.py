@@ -80,10 +80,10 @@ def determine_edge_path(
 
     r_mount = top_types.Mount.RIGHT
     l_mount = top_types.Mount.LEFT
-    l_col = labware.columns()[0]
-    r_col = labware.columns()[-1]
-    right_pip_criteria = mount is r_mount and where in l_col
-    left_pip_criteria = mount is l_mount and where in r_col
+    right_pip_criteria = mount is r_mount and labware._is_in_columns(where, slice(0, 1))
+    left_pip_criteria = mount is l_mount and labware._is_in_columns(
+        where, slice(-1, None)
+    )
 
     next_to_mod = deck.is_edge_move_unsafe(mount, labware)
     if labware.parent in ["3", "6", "9"] and left_pip_criteria:
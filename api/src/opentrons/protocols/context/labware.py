@@ -5,6 +5,7 @@ from typing import List, Dict, Optional
 
 from opentrons.protocols.geometry.deck_item import DeckItem
 from opentrons.protocols.geometry.labware_geometry import AbstractLabwareGeometry
+from opentrons.protocols.geometry.well_arrays import WellArrays
 from opentrons.protocols.api_support.tip_tracker import TipTracker
 from opentrons.protocols.context.well import WellImplementation
 from opentrons.protocols.api_support.well_grid import WellGrid
@@ -87,6 +88,14 @@ class AbstractLabware(DeckItem):
     def get_wells_by_name(self) -> Dict[str, WellImplementation]:
         ...
 
+    @abstractmethod
+    def get_well(self, name: str) -> WellImplementation:
+        ...
+
+    @abstractmethod
+    def get_well_arrays(self) -> WellArrays:
+        ...
+
     @abstractmethod
     def get_geometry(self) -> AbstractLabwareGeometry:
         ...
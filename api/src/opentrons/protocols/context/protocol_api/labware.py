@@ -2,6 +2,7 @@ from typing import List, Dict, Optional
 
 from opentrons.calibration_storage import helpers
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
+from opentrons.protocols.geometry.well_arrays import WellArrays
 from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons.protocols.context.labware import AbstractLabware
 from opentrons.protocols.api_support.tip_tracker import TipTracker
@@ -50,14 +51,17 @@ class LabwareImplementation(AbstractLabware):
         self._definition = definition
 
         self._geometry = LabwareGeometry(definition, parent)
-        # flatten list of list of well names.
-        self._ordering = [well for col in definition["ordering"] for well in col]
-        self._wells: List[WellImplementation] = []
-        self._well_name_grid = WellGrid(wells=self._wells)
-        self._tip_tracker = TipTracker(columns=self._well_name_grid.get_columns())
+        self._well_arrays = WellArrays(definition)
+
+        # The wells are only built as they're asked for, and along with the
+        # containers of them, rebuilt if the labware is calibrated
+        self._wells: List[Optional[WellImplementation]] = []
+        self._all_wells: Optional[List[WellImplementation]] = None
+        self._wells_by_name: Optional[Dict[str, WellImplementation]] = None
+        self._well_name_grid: Optional[WellGrid] = None
+        self._tip_tracker: Optional[TipTracker] = None
 
         self._calibrated_offset = Point(0, 0, 0)
-        # Will cause building of the wells
         self.set_calibration(self._calibrated_offset)
 
     def get_uri(self) -> str:
@@ -91,9 +95,11 @@ class LabwareImplementation(AbstractLabware):
             z=self._geometry.offset.z + delta.z,
         )
         # The wells must be rebuilt
-        self._wells = self._build_wells()
-        self._well_name_grid = WellGrid(wells=self._wells)
-        self._tip_tracker = TipTracker(columns=self._well_name_grid.get_columns())
+        self._wells = [None] * len(self._well_arrays.names)
+        self._all_wells = None
+        self._wells_by_name = None
+        self._well_name_grid = None
+        self._tip_tracker = None
 
     def get_calibrated_offset(self) -> Point:
         return self._calibrated_offset
@@ -109,20 +115,36 @@ class LabwareImplementation(AbstractLabware):
 
     def reset_tips(self) -> None:
         if self.is_tiprack():
+            # Wells that haven't been built yet will start out with tips
             for well in self._wells:
-                well.set_has_tip(True)
+                if well:
+                    well.set_has_tip(True)
 
     def get_tip_tracker(self) -> TipTracker:
+        if self._tip_tracker is None:
+            self._tip_tracker = TipTracker(columns=self.get_well_grid().get_columns())
         return self._tip_tracker
 
     def get_well_grid(self) -> WellGrid:
+        if self._well_name_grid is None:
+            self._well_name_grid = WellGrid(wells=self.get_wells())
         return self._well_name_grid
 
     def get_wells(self) -> List[WellImplementation]:
-        return self._wells
+        if self._all_wells is None:
+            self._all_wells = [self._get_well(idx) for idx in range(len(self._wells))]
+        return self._all_wells
 
     def get_wells_by_name(self) -> Dict[str, WellImplementation]:
-        return {well.get_name(): well for well in self._wells}
+        if self._wells_by_name is None:
+            self._wells_by_name = {well.get_name(): well for well in self.get_wells()}
+        return self._wells_by_name
+
+    def get_well(self, name: str) -> WellImplementation:
+        return self._get_well(self._well_arrays.index(name))
+
+    def get_well_arrays(self) -> WellArrays:
+        return self._well_arrays
 
     def get_geometry(self) -> LabwareGeometry:
         return self._geometry
@@ -139,17 +161,18 @@ class LabwareImplementation(AbstractLabware):
     def load_name(self) -> str:
         return self._parameters["loadName"]
 
-    def _build_wells(self) -> List[WellImplementation]:
-        return [
-            WellImplementation(
+    def _get_well(self, idx: int) -> WellImplementation:
+        well = self._wells[idx]
+        if well is None:
+            name = self._well_arrays.names[idx]
+            well = self._wells[idx] = WellImplementation(
                 well_geometry=WellGeometry(
-                    well_props=self._well_definition[well],
+                    well_props=self._well_definition[name],
                     parent_point=self._calibrated_offset,
                     parent_object=self,
                 ),
-                display_name="{} of {}".format(well, self._display_name),
+                display_name="{} of {}".format(name, self._display_name),
                 has_tip=self.is_tiprack(),
-                name=well,
+                name=name,
             )
-            for well in self._ordering
-        ]
+        return well
@@ -222,6 +222,7 @@ class ProtocolContextImplementation(AbstractProtocol):
 
     def pause(self, msg: Optional[str]) -> None:
         """Pause the protocol."""
+        self._sync_hardware.wait_for_motion()
         self._sync_hardware.pause(PauseType.PAUSE)
 
     def resume(self) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from typing import Callable, Optional
 
 from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -28,6 +29,7 @@ class WellImplementation:
         """
         self._display_name = display_name
         self._has_tip = has_tip
+        self._tip_listener: Optional[Callable[[bool], None]] = None
         self._name = name
 
         match = WellImplementation.pattern.match(name)
@@ -44,6 +46,13 @@ class WellImplementation:
 
     def set_has_tip(self, value: bool) -> None:
         self._has_tip = value
+        if self._tip_listener:
+            self._tip_listener(value)
+
+    def set_tip_listener(self, listener: Optional[Callable[[bool], None]]) -> None:
+        """Set a callback to be called with the new value when the tip
+        presence of this well changes"""
+        self._tip_listener = listener
 
     def get_display_name(self) -> str:
         return self._display_name
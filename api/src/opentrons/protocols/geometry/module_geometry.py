@@ -33,6 +33,7 @@ from opentrons.hardware_control.modules.types import (
     ThermocyclerModuleModel,
     HeaterShakerModuleModel,
 )
+from opentrons.protocols import schema_validation
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.definitions import (
     MAX_SUPPORTED_VERSION,
@@ -602,9 +603,8 @@ def load_module_from_definition(
         return _load_from_v1(v1def, parent, api_level)
 
     if schema == "module/schemas/3":
-        schema_doc = module.load_schema("3")
         try:
-            jsonschema.validate(definition, schema_doc)
+            schema_validation.validate(definition, "module/schemas/3.json")
         except jsonschema.ValidationError:
             log.exception("Failed to validate module def schema")
             raise RuntimeError("The specified module definition is not valid.")
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+import numpy as np
+
+from opentrons.types import Point
+from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    DoubleArray = npt.NDArray[np.double]
+    IndexArray = npt.NDArray[np.intp]
+
+
+_WELL_NAME = re.compile(WELL_NAME_PATTERN, re.X)
+
+
+class WellArrays:
+    """
+    The geometry of every well of a labware definition, held in arrays.
+
+    Wells are indexed in the order of the definition's ``ordering`` field, so
+    that the geometry of a whole row or column, or of the whole labware, can be
+    computed at once rather than well by well. Positions are relative to the
+    labware's origin, so the arrays don't change when it is calibrated.
+    """
+
+    def __init__(self, definition: LabwareDefinition):
+        """
+        Construct the well arrays of a labware definition.
+
+        :param definition: The labware definition
+        """
+        self._names = [well for col in definition["ordering"] for well in col]
+        self._indices = {name: idx for idx, name in enumerate(self._names)}
+
+        wells = [definition["wells"][name] for name in self._names]
+        self._depths = np.array([w["depth"] for w in wells], dtype=float)
+        self._top_offsets = np.array(
+            [(w["x"], w["y"], w["z"] + w["depth"]) for w in wells], dtype=float
+        ).reshape(-1, 3)
+        # Rectangular wells have no diameter
+        self._diameters = np.array(
+            [w.get("diameter", np.nan) for w in wells], dtype=float
+        )
+
+        rows: Dict[str, List[int]] = defaultdict(list)
+        columns: Dict[str, List[int]] = defaultdict(list)
+        for idx, name in enumerate(self._names):
+            match = _WELL_NAME.match(name)
+            assert (
+                match
+            ), f"could not match '{name}' using pattern '{_WELL_NAME.pattern}'"
+            rows[match.group(1)].append(idx)
+            columns[match.group(2)].append(idx)
+        self._row_names = sorted(rows.keys())
+        self._column_names = sorted(columns.keys(), key=lambda k: int(k))
+        self._rows = [np.array(rows[h], dtype=np.intp) for h in self._row_names]
+        self._columns = [
+            np.array(columns[h], dtype=np.intp) for h in self._column_names
+        ]
+
+    @property
+    def names(self) -> List[str]:
+        """The well names, in order"""
+        return self._names
+
+    def index(self, name: str) -> int:
+        """
+        The index of the well with the given name.
+
+        :raises KeyError: If there is no well with that name
+        """
+        return self._indices[name]
+
+    @property
+    def row_names(self) -> List[str]:
+        """The row header names, in order"""
+        return self._row_names
+
+    @property
+    def column_names(self) -> List[str]:
+        """The column header names, in order"""
+        return self._column_names
+
+    @property
+    def rows(self) -> Sequence[IndexArray]:
+        """The indices of the wells in each row"""
+        return self._rows
+
+    @property
+    def columns(self) -> Sequence[IndexArray]:
+        """The indices of the wells in each column"""
+        return self._columns
+
+    @property
+    def top_offsets(self) -> DoubleArray:
+        """The top-center of each well relative to the labware, shape (n, 3)"""
+        return self._top_offsets
+
+    @property
+    def depths(self) -> DoubleArray:
+        return self._depths
+
+    @property
+    def diameters(self) -> DoubleArray:
+        """The diameter of each well, or NaN for rectangular wells"""
+        return self._diameters
+
+    def top_positions(self, indices: IndexArray, origin: Point) -> DoubleArray:
+        """
+        The absolute top-center of the wells at ``indices``.
+
+        :param indices: The indices of the wells
+        :param origin: The calibrated position of the labware
+        :return: The positions, one row per well
+        """
+        return self._top_offsets[indices] + np.array(origin, dtype=float)
+
+    def has_top_at(
+        self, groups: Sequence[IndexArray], origin: Point, point: Point
+    ) -> bool:
+        """
+        Whether any of the wells in some rows or columns has its top-center at
+        ``point``.
+
+        This is the same comparison as testing whether a well is in lists of
+        wells, which compares their positions, without building the lists.
+
+        :param groups: The indices of the wells of each row or column
+        :param origin: The calibrated position of the labware
+        :param point: The absolute position to look for
+        """
+        if not groups:
+            return False
+        positions = self.top_positions(np.concatenate(groups), origin)
+        return bool(np.any(np.all(positions == np.array(point, dtype=float), axis=1)))
@@ -1,20 +1,20 @@
 import logging
 import json
-import os
 import shutil
 from dataclasses import dataclass
 
 from pathlib import Path
 from typing import Any, AnyStr, List, Dict, Union
 
-import jsonschema  # type: ignore
 
+from opentrons.protocols import schema_validation
 from opentrons.protocols.api_support.util import ModifiedList
 from opentrons.calibration_storage import helpers, modify
 from opentrons.protocols.context.labware import AbstractLabware
 from opentrons.types import Point
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons_shared_data import get_shared_data_root
 from opentrons.protocols.geometry.deck_item import DeckItem
+from opentrons.protocols.labware.registry import get_registry
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
     CUSTOM_NAMESPACE,
@@ -72,22 +72,7 @@ def get_all_labware_definitions() -> List[str]:
     Return a list of standard and custom labware definitions with load_name +
         name_space + version existing on the robot
     """
-    labware_list = ModifiedList()
-
-    def _check_for_subdirectories(path):
-        with os.scandir(path) as top_path:
-            for sub_dir in top_path:
-                if sub_dir.is_dir():
-                    labware_list.append(sub_dir.name)
-
-    # check for standard labware
-    _check_for_subdirectories(get_shared_data_root() / STANDARD_DEFS_PATH)
-
-    # check for custom labware
-    for namespace in os.scandir(USER_DEFS_PATH):
-        _check_for_subdirectories(namespace)
-
-    return labware_list
+    return ModifiedList(get_registry().get_load_names())
 
 
 def save_definition(
@@ -130,6 +115,7 @@ def save_definition(
     Path(def_path).parent.mkdir(parents=True, exist_ok=True)
     with open(def_path, "w") as f:
         json.dump(labware_def, f)
+    get_registry().invalidate_custom()
 
 
 def verify_definition(
@@ -144,14 +130,11 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+    schema_validation.validate(to_return, schema_validation.LABWARE_SCHEMA_V2)
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
@@ -161,6 +144,7 @@ def delete_all_custom_labware() -> None:
     """Delete all custom labware"""
     if USER_DEFS_PATH.is_dir():
         shutil.rmtree(USER_DEFS_PATH)
+    get_registry().invalidate_custom()
 
 
 def save_calibration(labware: AbstractLabware, delta: Point) -> None:
@@ -0,0 +1,264 @@
+"""
+opentrons.protocols.labware.registry: an index of the standard and custom
+labware definitions on the robot, which keeps the definitions most recently
+used parsed in memory, and optionally on disk
+"""
+import logging
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Callable, List, Optional, Tuple
+
+from opentrons import __version__
+from opentrons.config.file_cache import FileSignature, file_signature
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocols.api_support.constants import (
+    OPENTRONS_NAMESPACE,
+    STANDARD_DEFS_PATH,
+    USER_DEFS_PATH,
+)
+from opentrons_shared_data import get_shared_data_root
+
+MODULE_LOG = logging.getLogger(__name__)
+
+#: A definition's namespace, load name and version
+DefinitionKey = Tuple[str, str, int]
+
+# A parsed definition, and the signature of its file when it was parsed
+_CachedModel = Tuple[FileSignature, LabwareDefinition]
+
+# The custom load names, and the signatures of the custom definitions directory
+# and its namespace subdirectories when they were listed
+_CustomListing = Tuple[List[Tuple[Path, FileSignature]], List[str]]
+
+# How many parsed definitions to keep in memory. Parsing a definition into a
+# model takes up to tens of milliseconds, and a model takes up to a few
+# hundred kilobytes.
+DEFAULT_MAX_SIZE = 64
+
+
+class LabwareDefinitionRegistry:
+    """
+    An index of the labware definitions on the robot.
+
+    The standard definitions, which ship with the software, are listed once
+    and parsed definitions of them are kept until they're evicted. Custom
+    definitions can change, including from other processes, so their
+    directory is listed again whenever it or one of its namespace directories
+    has changed, or after :py:meth:`invalidate_custom` is called, and a parsed
+    custom definition is parsed again if its file has changed since.
+
+    If a cache directory is set, parsed definitions are also saved there, so
+    that other processes, and later runs of this one, can load them without
+    parsing them again.
+    """
+
+    def __init__(
+        self,
+        standard_root: Path,
+        custom_root: Path,
+        max_size: int = DEFAULT_MAX_SIZE,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Construct a registry of labware definitions.
+
+        :param standard_root: The directory of the standard definitions
+        :param custom_root: The directory of the custom definitions, with a
+                            subdirectory for each namespace
+        :param max_size: How many parsed definitions to keep in memory
+        :param cache_dir: Where to save parsed definitions, if anywhere
+        """
+        self._standard_root = standard_root
+        self._custom_root = custom_root
+        self._max_size = max_size
+        self._cache_dir = cache_dir
+        self._lock = Lock()
+        self._standard_names: Optional[List[str]] = None
+        self._custom_listing: Optional[_CustomListing] = None
+        self._models: "OrderedDict[DefinitionKey, _CachedModel]" = OrderedDict()
+
+    def set_cache_dir(self, cache_dir: Optional[Path]) -> None:
+        """Set where to save parsed definitions, or None to not save them."""
+        self._cache_dir = cache_dir
+
+    def get_load_names(self) -> List[str]:
+        """
+        The load names of the standard definitions, followed by those of
+        the custom definitions in every namespace.
+        """
+        with self._lock:
+            if self._standard_names is None:
+                self._standard_names = _list_subdirectories(self._standard_root)
+            if self._custom_listing is None or any(
+                file_signature(directory) != signature
+                for directory, signature in self._custom_listing[0]
+            ):
+                self._custom_listing = self._list_custom()
+            return self._standard_names + self._custom_listing[1]
+
+    def get_path(self, load_name: str, namespace: str, version: int) -> Path:
+        """The path of a definition's file, whether or not it exists."""
+        if namespace == OPENTRONS_NAMESPACE:
+            return self._standard_root / load_name / f"{version}.json"
+        return self._custom_root / namespace / load_name / f"{version}.json"
+
+    def get_cached_model(
+        self, load_name: str, namespace: str, version: int
+    ) -> Optional[LabwareDefinition]:
+        """
+        Get a parsed definition if it's in memory and still current,
+        without reading anything but the custom definition's file status.
+
+        :returns: The definition, or None if it has to be loaded
+        """
+        key = (namespace.lower(), load_name.lower(), version)
+        signature = self._signature(key)
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is None or cached[0] != signature:
+                return None
+            self._models.move_to_end(key)
+            return cached[1]
+
+    def get_model(
+        self,
+        load_name: str,
+        namespace: str,
+        version: int,
+        load: Callable[[], LabwareDefinition],
+    ) -> LabwareDefinition:
+        """
+        Get a parsed definition, loading it if it isn't in memory.
+
+        The returned model is shared, and must not be modified.
+
+        :param load: Loads and parses the definition. Only called if the
+                     definition isn't in memory or in the cache directory.
+        """
+        key = (namespace.lower(), load_name.lower(), version)
+        # Take the signature before loading so that a write during the
+        # load causes a reload next time rather than a stale definition
+        signature = self._signature(key)
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is not None and cached[0] == signature:
+                self._models.move_to_end(key)
+                return cached[1]
+
+        model = self._read_cache_file(key, signature)
+        if model is None:
+            model = load()
+            self._write_cache_file(key, signature, model)
+
+        with self._lock:
+            self._models[key] = (signature, model)
+            self._models.move_to_end(key)
+            while len(self._models) > self._max_size:
+                self._models.popitem(last=False)
+        return model
+
+    def invalidate_custom(self) -> None:
+        """
+        Forget the custom definitions, so they're listed and parsed again.
+
+        Call this after adding, changing or removing custom definitions.
+        """
+        with self._lock:
+            self._custom_listing = None
+            for key in [k for k in self._models if k[0] != OPENTRONS_NAMESPACE]:
+                del self._models[key]
+
+    def _list_custom(self) -> _CustomListing:
+        # A directory's signature changes when entries are added to or removed
+        # from it, so these catch new and deleted namespaces and load names.
+        # Take them before listing, so a change made meanwhile isn't missed.
+        directories = [(self._custom_root, file_signature(self._custom_root))]
+        load_names = []
+        for namespace in _list_subdirectories(self._custom_root):
+            namespace_dir = self._custom_root / namespace
+            directories.append((namespace_dir, file_signature(namespace_dir)))
+            load_names.extend(_list_subdirectories(namespace_dir))
+        return directories, load_names
+
+    def _signature(self, key: DefinitionKey) -> FileSignature:
+        # The standard definitions only change when the software does
+        namespace, load_name, version = key
+        if namespace == OPENTRONS_NAMESPACE:
+            return None
+        return file_signature(self.get_path(load_name, namespace, version))
+
+    def _cache_file(self, key: DefinitionKey) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        namespace, load_name, version = key
+        return self._cache_dir / namespace / load_name / f"{version}.pickle"
+
+    def _read_cache_file(
+        self, key: DefinitionKey, signature: FileSignature
+    ) -> Optional[LabwareDefinition]:
+        cache_file = self._cache_file(key)
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file, "rb") as f:
+                software_version, cached_signature, model = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            MODULE_LOG.warning(f"Ignoring unreadable {cache_file}", exc_info=True)
+            return None
+        if software_version != __version__ or cached_signature != signature:
+            return None
+        return model
+
+    def _write_cache_file(
+        self, key: DefinitionKey, signature: FileSignature, model: LabwareDefinition
+    ) -> None:
+        cache_file = self._cache_file(key)
+        if cache_file is None:
+            return
+        # Write to a temporary file and move it into place so that another
+        # process never reads a partly written file
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_file.parent)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((__version__, signature, model), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_file)
+        except OSError:
+            MODULE_LOG.warning(f"Could not write {cache_file}", exc_info=True)
+
+
+def _list_subdirectories(path: Path) -> List[str]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+_registry: Optional[LabwareDefinitionRegistry] = None
+_registry_lock = Lock()
+
+
+def get_registry() -> LabwareDefinitionRegistry:
+    """Get the registry of the robot's labware definitions for this process."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = LabwareDefinitionRegistry(
+                standard_root=get_shared_data_root() / STANDARD_DEFS_PATH,
+                custom_root=USER_DEFS_PATH,
+            )
+        return _registry
+
+
+__all__ = [
+    "DefinitionKey",
+    "LabwareDefinitionRegistry",
+    "get_registry",
+]
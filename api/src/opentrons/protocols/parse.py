@@ -9,12 +9,13 @@ import json
 import logging
 import re
 from io import BytesIO
+from types import CodeType
 from zipfile import ZipFile
 from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
 import jsonschema  # type: ignore
 
-from opentrons_shared_data import load_shared_data, protocol
+from . import schema_validation
 from .api_support.types import APIVersion
 from .types import (
     Protocol,
@@ -87,6 +88,26 @@ def _parse_json(protocol_contents: str, filename: str = None) -> JsonProtocol:
     )
 
 
+@functools.lru_cache(maxsize=8)
+def compile_python(
+    protocol_contents: str, filename: str
+) -> Tuple[ast.Module, CodeType]:
+    """Parse and compile the source of a python protocol.
+
+    The results are kept for the most recently compiled sources, so that
+    analyzing and then running a protocol, or running it again, doesn't
+    compile it again. They are shared, so the returned ast must not be
+    modified.
+
+    :param protocol_contents: The source of the protocol
+    :param filename: The filename to compile the protocol with
+    :returns: The module's ast and compiled code
+    :raises SyntaxError: If the protocol is not valid python
+    """
+    parsed = ast.parse(protocol_contents, filename=filename)
+    return parsed, compile(parsed, filename=filename, mode="exec")
+
+
 def _parse_python(
     protocol_contents: str,
     filename: str = None,
@@ -102,10 +123,9 @@ def _parse_python(
     else:
         ast_filename = filename_checked
 
-    parsed = ast.parse(protocol_contents, filename=ast_filename)
+    parsed, protocol = compile_python(protocol_contents, ast_filename)
 
     metadata = extract_metadata(parsed)
-    protocol = compile(parsed, filename=ast_filename, mode="exec")
     version = get_version(metadata, parsed)
 
     if version >= APIVersion(2, 0):
@@ -373,8 +393,9 @@ def _get_protocol_schema_version(protocol_json: Dict[Any, Any]) -> int:
     )
 
 
-def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
-    """Retrieve the json schema for a protocol schema version"""
+def _get_schema_path_for_protocol(version_num: int) -> str:
+    """Find the path in shared-data of the json schema for a protocol schema
+    version"""
     # TODO(IL, 2020/03/05): use $otSharedSchema, but maybe wait until
     # deprecating v1/v2 JSON protocols?
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
@@ -382,25 +403,21 @@ def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
             f"JSON Protocol version {version_num} is not yet "
             + "supported in this version of the API"
         )
+    schema_path = f"protocol/schemas/{version_num}.json"
     try:
-        schema = load_shared_data(f"protocol/schemas/{version_num}.json")
+        schema_validation.load_schema(schema_path)
     except FileNotFoundError:
-        schema = None  # type: ignore
-    if not schema:
         raise RuntimeError(
             'JSON Protocol schema "{}" does not exist'.format(version_num)
         )
-    return json.loads(schema.decode("utf-8"))
+    return schema_path
 
 
 def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"]:
     """Validates a json protocol and returns its schema version"""
     # Check if this is actually a labware
-    labware_schema_v2 = json.loads(
-        load_shared_data("labware/schemas/2.json").decode("utf-8")
-    )
     try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
+        schema_validation.validate(protocol_json, schema_validation.LABWARE_SCHEMA_V2)
     except jsonschema.ValidationError:
         pass
     else:
@@ -428,18 +445,16 @@ def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"
             "version. Please update your OT-2 App and robot server to the "
             "latest version and try again."
         )
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get("$id", ""),
-        protocol_schema,
-        store={"opentronsLabwareSchemaV2": labware_schema_v2},
-    )
+    protocol_schema_path = _get_schema_path_for_protocol(version_num)
 
-    # do the validation
+    # do the validation, telling the validator how to resolve all $ref's used
+    # in protocol schemas
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        schema_validation.validate(
+            protocol_json,
+            protocol_schema_path,
+            {"opentronsLabwareSchemaV2": schema_validation.LABWARE_SCHEMA_V2},
+        )
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
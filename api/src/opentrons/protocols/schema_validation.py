@@ -0,0 +1,96 @@
+"""
+opentrons.protocols.schema_validation: validating documents against the JSON
+schemas in shared-data, which are loaded and checked once per process
+"""
+import functools
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple, Type
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data import load_shared_data
+
+#: The path in shared-data of the labware definition schema
+LABWARE_SCHEMA_V2 = "labware/schemas/2.json"
+
+# How many documents to remember having validated. Validating a document can
+# take tens of milliseconds, while hashing it to look it up takes a few.
+_VALID_DOCUMENTS_SIZE = 256
+
+_valid_documents: "OrderedDict[Hashable, None]" = OrderedDict()
+_valid_documents_lock = Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_checked_schema(schema_path: str) -> Tuple[Dict[str, Any], Type[Any]]:
+    schema = json.loads(load_shared_data(schema_path).decode("utf-8"))
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return schema, validator_cls
+
+
+def load_schema(schema_path: str) -> Dict[str, Any]:
+    """
+    Load a schema from shared-data, checking that it is a valid schema.
+
+    The schema is only loaded and checked the first time it is asked for,
+    so the returned schema is shared and must not be modified.
+
+    :param schema_path: The path of the schema in shared-data
+    :raises FileNotFoundError: If there is no such schema
+    :raises jsonschema.SchemaError: If the schema is not valid
+    """
+    return _load_checked_schema(schema_path)[0]
+
+
+def validate(
+    instance: Any,
+    schema_path: str,
+    referenced_schemas: Optional[Mapping[str, str]] = None,
+) -> None:
+    """
+    Validate a document against a schema from shared-data.
+
+    This is the same as :py:func:`jsonschema.validate`, except that the schema
+    is not loaded or checked again each time, and a document with the same
+    contents as one recently found to be valid is not validated again.
+
+    :param instance: The document to validate
+    :param schema_path: The path of the schema in shared-data
+    :param referenced_schemas: The paths in shared-data of other schemas that
+                               the schema refers to, by the URI it uses for them
+    :raises jsonschema.ValidationError: If the document is not valid
+    """
+    schema, validator_cls = _load_checked_schema(schema_path)
+    document = json.dumps(instance, sort_keys=True, separators=(",", ":"))
+    key = (
+        schema_path,
+        tuple(sorted((referenced_schemas or {}).items())),
+        hashlib.sha256(document.encode("utf-8")).digest(),
+    )
+    with _valid_documents_lock:
+        if key in _valid_documents:
+            _valid_documents.move_to_end(key)
+            return
+
+    # A resolver keeps track of where it is in the schemas while validating,
+    # so each validation gets its own
+    resolver = jsonschema.RefResolver.from_schema(
+        schema,
+        id_of=validator_cls.ID_OF,
+        store={
+            uri: load_schema(path) for uri, path in (referenced_schemas or {}).items()
+        },
+    )
+    validator = validator_cls(schema, resolver=resolver)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+    with _valid_documents_lock:
+        _valid_documents[key] = None
+        if len(_valid_documents) > _VALID_DOCUMENTS_SIZE:
+            _valid_documents.popitem(last=False)
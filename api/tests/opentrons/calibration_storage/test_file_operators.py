@@ -0,0 +1,23 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from opentrons.calibration_storage import file_operators as io
+
+
+def test_read_cal_file_cached(tmp_path: Path) -> None:
+    path = tmp_path / "cal.json"
+    last_modified = datetime.datetime(2022, 1, 1, 12, 0)
+    io.save_to_file(path, {"abc": {"tipLength": 1, "lastModified": last_modified}})
+
+    first = io.read_cal_file_cached(path)
+    assert first == {"abc": {"tipLength": 1, "lastModified": last_modified}}
+    assert io.read_cal_file_cached(str(path)) is first
+
+    io.save_to_file(path, {"abc": {"tipLength": 2, "lastModified": last_modified}})
+    assert io.read_cal_file_cached(path)["abc"]["tipLength"] == 2
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_file_cached(path)
@@ -0,0 +1,36 @@
+import copy
+
+from opentrons.calibration_storage import helpers
+from opentrons.protocols.labware import get_labware_definition
+
+
+def test_hash_labware_def_reused() -> None:
+    definition = get_labware_definition("opentrons_96_tiprack_300ul")
+    expected = helpers.hash_labware_def(copy.deepcopy(definition))
+
+    assert helpers.hash_labware_def(definition) == expected
+    assert helpers.hash_labware_def(definition) == expected
+
+    definition["metadata"]["displayName"] = "Renamed"
+    assert helpers.hash_labware_def(definition) == expected
+
+
+def test_hash_labware_def_changed() -> None:
+    definition = get_labware_definition("opentrons_96_tiprack_300ul")
+    original = helpers.hash_labware_def(definition)
+
+    definition["parameters"]["tipLength"] += 1
+    changed = helpers.hash_labware_def(definition)
+
+    assert changed != original
+    assert changed == helpers.hash_labware_def(copy.deepcopy(definition))
+
+
+def test_hash_labware_def_equal_values() -> None:
+    """Definitions that differ only in int vs float values hash differently."""
+    definition = get_labware_definition("opentrons_96_tiprack_300ul")
+    as_float = copy.deepcopy(definition)
+    as_float["version"] = float(definition["version"])  # type: ignore[typeddict-item]
+    assert as_float == definition
+
+    assert helpers.hash_labware_def(definition) != helpers.hash_labware_def(as_float)
@@ -1,3 +1,4 @@
+import json
 import pytest
 from typing import Any, Dict, Generator, Optional, Tuple
 from unittest.mock import MagicMock, patch
@@ -49,7 +50,7 @@ def restore_restart_required() -> Generator[None, None, None]:
 
 @pytest.fixture
 def clear_cache() -> None:
-    advanced_settings.get_all_adv_settings.cache_clear()
+    advanced_settings.clear_settings_cache()
 
 
 def test_get_advanced_setting_not_found(
@@ -143,6 +144,24 @@ async def test_get_all_adv_settings_lru_cache(
     mock_read_settings_file.assert_not_called()
 
 
+def test_get_all_adv_settings_does_not_touch_file(clear_cache: None) -> None:
+    settings_file = CONFIG["feature_flags_file"]
+    assert advanced_settings.get_adv_setting("shortFixedTrash").value is None  # type: ignore[union-attr]
+    # Written by something other than set_adv_setting
+    with open(settings_file, "w") as fd:
+        json.dump(
+            {"shortFixedTrash": True, "_version": len(advanced_settings._MIGRATIONS)},
+            fd,
+        )
+    with patch("os.stat") as mock_stat, patch("builtins.open") as mock_open:
+        assert advanced_settings.get_adv_setting("shortFixedTrash").value is None  # type: ignore[union-attr]
+    mock_stat.assert_not_called()
+    mock_open.assert_not_called()
+
+    advanced_settings.clear_settings_cache()
+    assert advanced_settings.get_adv_setting("shortFixedTrash").value is True  # type: ignore[union-attr]
+
+
 async def test_restart_required(
     restore_restart_required: None,
     mock_read_settings_file: MagicMock,
@@ -7,7 +7,7 @@ from opentrons.config.advanced_settings import _migrate, _ensure
 
 @pytest.fixture
 def migrated_file_version() -> int:
-    return 15
+    return 16
 
 
 @pytest.fixture
@@ -22,6 +22,7 @@ def default_file_settings() -> Dict[str, Any]:
         "disableFastProtocolUpload": None,
         "enableOT3HardwareController": None,
         "enableHeaterShakerPAPI": None,
+        "enableSmoothiePipelining": None,
     }
 
 
@@ -205,6 +206,18 @@ def v15_config(v14_config: Dict[str, Any]) -> Dict[str, Any]:
     return r
 
 
+@pytest.fixture
+def v16_config(v15_config: Dict[str, Any]) -> Dict[str, Any]:
+    r = v15_config.copy()
+    r.update(
+        {
+            "_version": 16,
+            "enableSmoothiePipelining": True,
+        }
+    )
+    return r
+
+
 @pytest.fixture(
     scope="session",
     params=[
@@ -225,6 +238,7 @@ def v15_config(v14_config: Dict[str, Any]) -> Dict[str, Any]:
         lazy_fixture("v13_config"),
         lazy_fixture("v14_config"),
         lazy_fixture("v15_config"),
+        lazy_fixture("v16_config"),
     ],
 )
 def old_settings(request: pytest.FixtureRequest) -> Dict[str, Any]:
@@ -306,4 +320,5 @@ def test_ensures_config() -> None:
         "disableFastProtocolUpload": None,
         "enableOT3HardwareController": None,
         "enableHeaterShakerPAPI": None,
+        "enableSmoothiePipelining": None,
     }
@@ -0,0 +1,57 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from opentrons.config.file_cache import FileCache, file_signature
+
+
+def test_file_signature(tmp_path: Path) -> None:
+    path = tmp_path / "settings.json"
+    assert file_signature(path) is None
+    path.write_text("{}")
+    signature = file_signature(path)
+    assert signature is not None
+    assert file_signature(path) == signature
+    path.write_text('{"a": 1}')
+    assert file_signature(path) != signature
+
+
+def test_file_cache_rebuilds_on_change(tmp_path: Path) -> None:
+    path = tmp_path / "settings.json"
+    build = MagicMock(side_effect=lambda: path.read_text() if path.exists() else "")
+    cache: FileCache[str] = FileCache()
+
+    assert cache.get("key", path, build) == ""
+    assert cache.get("key", path, build) == ""
+    assert build.call_count == 1
+
+    path.write_text("first")
+    assert cache.get("key", path, build) == "first"
+    assert cache.get("key", path, build) == "first"
+    assert build.call_count == 2
+
+    path.write_text("second write")
+    assert cache.get("key", path, build) == "second write"
+    assert build.call_count == 3
+
+    path.unlink()
+    assert cache.get("key", path, build) == ""
+    assert build.call_count == 4
+
+
+def test_file_cache_keys(tmp_path: Path) -> None:
+    cache: FileCache[int] = FileCache()
+    assert cache.get("one", None, lambda: 1) == 1
+    assert cache.get("two", None, lambda: 2) == 2
+    assert cache.get("one", None, lambda: 3) == 1
+
+
+def test_file_cache_clear(tmp_path: Path) -> None:
+    path = tmp_path / "settings.json"
+    path.write_text("{}")
+    build = MagicMock(return_value={})
+    cache: FileCache[object] = FileCache()
+
+    cache.get("key", path, build)
+    cache.clear()
+    cache.get("key", path, build)
+    assert build.call_count == 2
@@ -177,6 +177,27 @@ def test_override_save(ot_config_tempdir: Path) -> None:
     assert new_pconf.quirks == []
 
 
+def test_load_caches_until_overrides_change(ot_config_tempdir: Path) -> None:
+    cdir = CONFIG["pipette_config_overrides_dir"]
+    pipette_id = "cachedpipette123"
+    model = PipetteModel("p300_multi_v1.4")
+
+    # The first load writes out default overrides
+    pipette_config.load(model, pipette_id)
+    pconf = pipette_config.load(model, pipette_id)
+    with patch.object(
+        pipette_config, "load_overrides", wraps=pipette_config.load_overrides
+    ) as load_overrides:
+        assert pipette_config.load(model, pipette_id) is pconf
+        load_overrides.assert_not_called()
+
+        # Overrides written elsewhere are picked up
+        with (cdir / f"{pipette_id}.json").open("w") as ovf:
+            json.dump({"pickUpCurrent": {"value": 0.123}}, ovf)
+        assert pipette_config.load(model, pipette_id).pick_up_current == 0.123
+        load_overrides.assert_called_once_with(pipette_id)
+
+
 @pytest.fixture
 def new_id_for_save() -> Generator[str, None, None]:
     """Fixture to provide a pipette id then delete it's generated file."""
@@ -1,3 +1,4 @@
+import asyncio
 from copy import deepcopy
 from typing import Dict, cast
 
@@ -464,3 +465,179 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+@pytest.fixture
+def pipelined_smoothie(
+    mock_connection: AsyncMock, sim_gpio: SimulatingGPIOCharDev
+) -> driver_3_0.SmoothieDriver:
+    """A smoothie driver that streams moves without waiting for each."""
+    from opentrons.config import robot_configs
+
+    return driver_3_0.SmoothieDriver(
+        connection=mock_connection,
+        config=robot_configs.load_ot2(),
+        gpio_chardev=sim_gpio,
+        pipelined=True,
+    )
+
+
+async def test_pipelined_moves(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should only wait for moves to finish before other commands."""
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build().strip())
+        if constants.GCODE.CURRENT_POSITION in command:
+            return "ok MCS: X:30.0000 Y:0.0000 Z:0.0000 A:0.0000 B:0.0000 C:0.0000"
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await pipelined_smoothie.move({"X": 10})
+    await pipelined_smoothie.move({"X": 20})
+    await pipelined_smoothie.move({"X": 30}, speed=10)
+    await pipelined_smoothie.update_position()
+
+    assert cmd_list == [
+        # currents change, so they are sent along with the first move
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        # following moves with the same currents are streamed
+        "G0 X20",
+        "G0 F600 G0 X30 G0 F24000",
+        # wait for the moves to finish before reading the position
+        "M400",
+        "M114.2",
+        "M400",
+    ]
+    assert pipelined_smoothie.position["X"] == 30
+
+
+async def test_pipelined_current_change(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should wait for moves to finish before changing currents.
+
+    Idle gantry axes stay at their active current so they need no change.
+    """
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build().strip())
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await pipelined_smoothie.move({"X": 10})
+    await pipelined_smoothie.move({"Y": 10})
+
+    assert cmd_list == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 Y10",
+    ]
+
+
+async def test_pipelined_pause_with_queued_moves(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """Pausing should hold back new moves but leave queued moves running."""
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build().strip())
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await pipelined_smoothie.move({"X": 10})
+    await pipelined_smoothie.move({"X": 20})
+    pipelined_smoothie.pause()
+    paused_move = asyncio.get_running_loop().create_task(
+        pipelined_smoothie.move({"X": 30})
+    )
+    await asyncio.sleep(0.01)
+
+    # the queued moves are neither waited for nor interrupted
+    assert not paused_move.done()
+    assert cmd_list == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        "G0 X20",
+    ]
+
+    pipelined_smoothie.resume()
+    await paused_move
+
+    assert cmd_list[2:] == ["G0 X30"]
+    assert pipelined_smoothie.position["X"] == 30
+
+
+async def test_pipelined_wait_for_motion(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should send a single M400, and only if a move may be running."""
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build().strip())
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await pipelined_smoothie.wait_for_motion()
+    assert cmd_list == []
+
+    await pipelined_smoothie.move({"X": 10})
+    await pipelined_smoothie.wait_for_motion()
+    await pipelined_smoothie.wait_for_motion()
+
+    assert cmd_list == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        "M400",
+    ]
+
+
+async def test_pipelined_hard_halt_discards_motion(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """Moves discarded by a halt should not be waited for."""
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build().strip())
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await pipelined_smoothie.move({"X": 10})
+    with patch("asyncio.sleep"):
+        await pipelined_smoothie.hard_halt()
+    await pipelined_smoothie.wait_for_motion()
+
+    assert cmd_list == ["M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10"]
+
+
+async def test_pipelined_alarm_homes(
+    pipelined_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """An alarm from a streamed move should home, even if reported later."""
+
+    async def write_mock(command, retries, timeout):
+        if constants.GCODE.WAIT in command:
+            raise AlarmResponse(port="", response="ALARM: Hard limit +X")
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    with patch.object(pipelined_smoothie, "home"), patch.object(
+        pipelined_smoothie, "_reset_from_error"
+    ):
+        mocked_home = cast(AsyncMock, pipelined_smoothie.home)
+        await pipelined_smoothie.move({"X": 10})
+
+        with pytest.raises(SmoothieError):
+            await pipelined_smoothie.update_position()
+
+        mocked_home.assert_called_once_with("X")
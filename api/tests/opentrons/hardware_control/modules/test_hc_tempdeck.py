@@ -92,3 +92,31 @@ async def test_poll_error(usb_port: USBPort) -> None:
         await tempdeck.wait_next_poll()
 
     await tempdeck.cleanup()
+
+
+async def test_waits_for_motion(usb_port: USBPort) -> None:
+    """It should wait for the gantry to stop before sending a command."""
+    calls = []
+    mock_driver = AsyncMock(spec=AbstractTempDeckDriver)
+    mock_driver.get_temperature.return_value = {"current": 25, "target": None}
+    mock_driver.set_temperature.side_effect = lambda celsius: calls.append("set")
+
+    async def wait_for_motion() -> None:
+        calls.append("motion")
+
+    execution_manager = ExecutionManager()
+    execution_manager.register_motion_waiter(wait_for_motion)
+    tempdeck = modules.TempDeck(
+        port="",
+        usb_port=usb_port,
+        execution_manager=execution_manager,
+        driver=mock_driver,
+        device_info={},
+        loop=asyncio.get_running_loop(),
+        polling_frequency=1,
+    )
+    await tempdeck.start_set_temperature(40)
+
+    assert calls == ["motion", "set"]
+
+    await tempdeck.cleanup()
@@ -644,3 +644,40 @@ async def test_home_z_ignore_other_mount(decoy: Decoy) -> None:
 
     assert left_result == 100.0 + subject.critical_point_for(types.Mount.LEFT, None).z
     assert right_result == 45.6 + subject.critical_point_for(types.Mount.RIGHT, None).z
+
+
+async def test_delay_waits_for_motion(decoy: Decoy) -> None:
+    """It should wait for queued moves to finish before starting a delay."""
+    loop = asyncio.get_running_loop()
+    mock_config = decoy.mock(cls=config.types.RobotConfig)
+    mock_backend = decoy.mock(cls=hc.Controller)
+    calls = []
+
+    subject = hc.API(backend=mock_backend, config=mock_config, loop=loop)
+
+    decoy.when(await mock_backend.wait_for_motion()).then_do(
+        lambda: calls.append("motion")
+    )
+    with mock.patch.object(
+        subject, "pause", side_effect=lambda p: calls.append("pause")
+    ), mock.patch.object(
+        subject, "do_delay", side_effect=lambda s: calls.append("delay")
+    ), mock.patch.object(
+        subject, "resume", side_effect=lambda p: calls.append("resume")
+    ):
+        await subject.delay(1)
+
+    assert calls == ["motion", "pause", "delay", "resume"]
+
+
+async def test_modules_wait_for_motion(decoy: Decoy) -> None:
+    """Modules sharing the execution manager should wait for queued moves."""
+    loop = asyncio.get_running_loop()
+    mock_config = decoy.mock(cls=config.types.RobotConfig)
+    mock_backend = decoy.mock(cls=hc.Controller)
+
+    subject = hc.API(backend=mock_backend, config=mock_config, loop=loop)
+
+    await subject.execution_manager.wait_for_motion()
+
+    decoy.verify(await mock_backend.wait_for_motion())
@@ -19,6 +19,7 @@ from opentrons.hardware_control.types import (
     GripperNotAttachedError,
     InvalidMoveError,
     CriticalPoint,
+    ExecutionCancelledError,
 )
 from opentrons.hardware_control.ot3api import OT3API
 from opentrons.hardware_control import ThreadManager
@@ -482,3 +483,71 @@ async def test_gripper_move_to(
             OT3Axis.Y,
             OT3Axis.Z_G,
         ]
+
+
+async def test_move_trajectory(ot3_hardware: ThreadManager[OT3API]):
+    await ot3_hardware.home()
+    waypoints = [
+        Point(100, 100, 150),
+        Point(100, 100, 150),
+        Point(150, 100, 150),
+        Point(150, 100, 80),
+    ]
+    with patch.object(
+        ot3_hardware.managed_obj._backend,
+        "move_trajectory",
+        AsyncMock(
+            spec=ot3_hardware.managed_obj._backend.move_trajectory,
+            wraps=ot3_hardware.managed_obj._backend.move_trajectory,
+        ),
+    ) as mock_move_trajectory:
+        await ot3_hardware.move_trajectory(OT3Mount.LEFT, waypoints)
+
+    mock_move_trajectory.assert_called_once()
+    _, segments = mock_move_trajectory.call_args[0]
+    # The repeated waypoint is not a move of its own
+    assert sum(len(segment) for segment in segments) == 3
+    position = await ot3_hardware.gantry_position(OT3Mount.LEFT)
+    assert position == waypoints[-1]
+    position = await ot3_hardware.gantry_position(OT3Mount.LEFT, refresh=True)
+    assert position == waypoints[-1]
+
+
+async def test_move_trajectory_waits_for_running(ot3_hardware: ThreadManager[OT3API]):
+    await ot3_hardware.home()
+    hardware = ot3_hardware.managed_obj
+    with patch.object(hardware, "_em_simulate", False), patch.object(
+        hardware.execution_manager,
+        "wait_for_is_running",
+        AsyncMock(side_effect=ExecutionCancelledError),
+    ), patch.object(
+        hardware._backend, "move_trajectory", AsyncMock()
+    ) as mock_move_trajectory:
+        with pytest.raises(ExecutionCancelledError):
+            await ot3_hardware.move_trajectory(
+                OT3Mount.LEFT, [Point(100, 100, 150), Point(150, 100, 150)]
+            )
+
+    mock_move_trajectory.assert_not_called()
+
+
+async def test_move_trajectory_unblended_holds_lock(
+    ot3_hardware: ThreadManager[OT3API],
+):
+    await ot3_hardware.home()
+    hardware = ot3_hardware.managed_obj
+    waypoints = [Point(100, 100, 150), Point(150, 100, 150)]
+    locked = []
+
+    async def fake_move(*args, **kwargs) -> None:
+        locked.append(hardware._motion_lock.locked())
+
+    with patch.object(
+        hardware._move_manager, "plan_motion", return_value=(False, [])
+    ), patch.object(hardware, "_move", AsyncMock(side_effect=fake_move)) as mock_move:
+        await ot3_hardware.move_trajectory(OT3Mount.LEFT, waypoints)
+
+    # one move per waypoint, all made without letting go of the lock
+    assert locked == [True, True]
+    for call in mock_move.call_args_list:
+        assert call.kwargs["acquire_lock"] is False
@@ -3,7 +3,7 @@ from opentrons.types import Point
 
 def test_labware_init(min_lw_impl, minimal_labware_def):
     ordering = [well for col in minimal_labware_def["ordering"] for well in col]
-    assert min_lw_impl._ordering == ordering
+    assert min_lw_impl.get_well_arrays().names == ordering
     assert min_lw_impl._well_definition == minimal_labware_def["wells"]
     assert min_lw_impl.get_geometry()._offset == Point(x=10, y=10, z=5)
 
@@ -479,6 +479,57 @@ def test_return_tips(opentrons_96_tiprack_300ul) -> None:
     assert not tiprack.wells()[8].has_tip
 
 
+def test_tips_of_wells_built_before_tracker(opentrons_96_tiprack_300ul_def) -> None:
+    impl = LabwareImplementation(
+        opentrons_96_tiprack_300ul_def, Location(Point(0, 0, 0), "Test Slot")
+    )
+    tiprack = labware.Labware(implementation=impl)
+
+    # Wells are built as they're asked for, and the tip tracker along with
+    # the rest of them, picking up the tips of the wells already built
+    tiprack["A1"].has_tip = False
+    assert impl.get_well("A1") is impl.get_wells()[0]
+    assert tiprack.next_tip() == tiprack["B1"]
+
+    tiprack.reset()
+    assert tiprack.next_tip() == tiprack["A1"]
+
+
+def test_wells_reused(corning_96_wellplate_360ul_flat) -> None:
+    lw = corning_96_wellplate_360ul_flat
+    wells = lw.wells()
+    a1 = wells[0]
+    assert lw.wells()[0] is a1
+    assert lw["A1"] is a1
+    assert lw.rows()[0][0] is a1
+    assert lw.columns_by_name()["1"][0] is a1
+
+    # Callers get their own containers to change
+    wells.pop(0)
+    lw.rows()[0].pop(0)
+    lw.wells_by_name().pop("A1")
+    assert lw.wells()[0].well_name == "A1"
+    assert lw.rows()[0][0].well_name == "A1"
+    assert "A1" in lw.wells_by_name()
+
+    # But recalibrating the labware rebuilds its wells
+    lw.set_calibration(Point(1, 2, 3))
+    assert lw["A1"] is not a1
+    assert lw["A1"].top().point == lw.wells()[0].top().point
+    assert lw["A1"].top().point == a1.top().point + Point(1, 2, 3)
+
+
+def test_is_in_rows_and_columns(corning_96_wellplate_360ul_flat) -> None:
+    lw = corning_96_wellplate_360ul_flat
+    lw.set_calibration(Point(0.1, 0.2, 0.3))
+
+    for well in lw.wells():
+        assert lw._is_in_rows(well, slice(0, 2)) == (
+            well in lw.rows()[0] + lw.rows()[1]
+        )
+        assert lw._is_in_columns(well, slice(-1, None)) == (well in lw.columns()[-1])
+
+
 @pytest.mark.parametrize("v1_module_name", ["tempdeck", "magdeck", "thermocycler"])
 def test_module_load_v1(v1_module_name) -> None:
     module_defs = json.loads(load_shared_data("module/definitions/1.json"))
@@ -1,9 +1,14 @@
 """Tests for the protocol engine's ActionDispatcher."""
+from typing import List
+
 from decoy import Decoy
 
 from opentrons.protocol_engine.actions import (
+    Action,
     ActionDispatcher,
     ActionHandler,
+    PauseAction,
+    PauseSource,
     StopAction,
 )
 
@@ -38,3 +43,20 @@ def test_add_handler(decoy: Decoy) -> None:
         handler_2.handle_action(action),
         sink.handle_action(action),
     )
+
+
+def test_dispatch_all(decoy: Decoy) -> None:
+    """It should send batches of actions to handlers before the sink."""
+    actions: List[Action] = [PauseAction(source=PauseSource.CLIENT), StopAction()]
+
+    handler = decoy.mock(cls=ActionHandler)
+    sink = decoy.mock(cls=ActionHandler)
+
+    subject = ActionDispatcher(sink=sink)
+    subject.add_handler(handler)
+    subject.dispatch_all(actions)
+
+    decoy.verify(
+        handler.handle_actions(actions),
+        sink.handle_actions(actions),
+    )
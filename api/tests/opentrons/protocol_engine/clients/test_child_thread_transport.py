@@ -2,13 +2,15 @@
 
 import pytest
 from asyncio import get_running_loop
+from concurrent.futures import Future
 from datetime import datetime
 from decoy import Decoy
 from functools import partial
+from typing import Optional
 
 
 from opentrons.protocol_engine import ProtocolEngine, commands
-from opentrons.protocol_engine.errors import ErrorOccurrence, ProtocolEngineError
+from opentrons.protocol_engine.errors import CommandRequestFailedError, ErrorOccurrence
 from opentrons.protocol_engine.clients.transports import ChildThreadTransport
 
 
@@ -76,18 +78,131 @@ async def test_execute_command_failure(
         detail="Things are not looking good.",
     )
 
+    failed_command = commands.MoveToWell(
+        id="cmd-id",
+        key="cmd-key",
+        params=cmd_data,
+        status=commands.CommandStatus.FAILED,
+        error=error,
+        createdAt=datetime.now(),
+    )
+
     decoy.when(await engine.add_and_execute_command(request=cmd_request)).then_return(
-        commands.MoveToWell(
-            id="cmd-id",
-            key="cmd-key",
-            params=cmd_data,
-            status=commands.CommandStatus.FAILED,
-            error=error,
-            createdAt=datetime.now(),
-        )
+        failed_command
     )
 
     task = partial(subject.execute_command, request=cmd_request)
 
-    with pytest.raises(ProtocolEngineError, match="Things are not looking good"):
+    with pytest.raises(
+        CommandRequestFailedError, match="Things are not looking good"
+    ) as exc_info:
         await get_running_loop().run_in_executor(None, task)
+
+    assert exc_info.value.request == cmd_request
+    assert exc_info.value.command == failed_command
+
+
+def _move_to_well(
+    command_id: str,
+    status: commands.CommandStatus,
+    error: Optional[ErrorOccurrence] = None,
+) -> commands.MoveToWell:
+    return commands.MoveToWell(
+        id=command_id,
+        key=command_id,
+        status=status,
+        params=commands.MoveToWellParams(
+            pipetteId="pipette-id",
+            labwareId="labware-id",
+            wellName="A1",
+        ),
+        result=commands.MoveToWellResult() if error is None else None,
+        error=error,
+        createdAt=datetime.now(),
+    )
+
+
+async def test_queue_command(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: ChildThreadTransport,
+) -> None:
+    """It should queue commands without waiting for each to complete."""
+    cmd_request = commands.MoveToWellCreate(
+        params=commands.MoveToWellParams(
+            pipetteId="pipette-id",
+            labwareId="labware-id",
+            wellName="A1",
+        )
+    )
+    queued = _move_to_well("cmd-id", commands.CommandStatus.QUEUED)
+    succeeded = _move_to_well("cmd-id", commands.CommandStatus.SUCCEEDED)
+
+    decoy.when(engine.add_command(request=cmd_request)).then_return(queued)
+    decoy.when(engine.state_view.commands.get("cmd-id")).then_return(succeeded)
+
+    def _queue_and_wait() -> "Future[commands.CommandResult]":
+        future = subject.queue_command(request=cmd_request)
+        subject.wait_for_queued()
+        return future
+
+    result = await get_running_loop().run_in_executor(None, _queue_and_wait)
+
+    assert result.result() == commands.MoveToWellResult()
+    decoy.verify(await engine.wait_for_command(command_id="cmd-id"))
+
+
+async def test_queue_command_failure(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: ChildThreadTransport,
+) -> None:
+    """It should raise the first failure, and add no commands after it."""
+    failing_request = commands.MoveToWellCreate(
+        params=commands.MoveToWellParams(
+            pipetteId="pipette-id",
+            labwareId="labware-id",
+            wellName="A1",
+        )
+    )
+    later_request = commands.MoveToWellCreate(
+        params=commands.MoveToWellParams(
+            pipetteId="pipette-id",
+            labwareId="labware-id",
+            wellName="B1",
+        )
+    )
+    error = ErrorOccurrence(
+        id="error-id",
+        errorType="PrettyBadError",
+        createdAt=datetime(year=2021, month=1, day=1),
+        detail="Things are not looking good.",
+    )
+
+    decoy.when(engine.add_command(request=failing_request)).then_return(
+        _move_to_well("cmd-id", commands.CommandStatus.QUEUED)
+    )
+    failed_command = _move_to_well("cmd-id", commands.CommandStatus.FAILED, error=error)
+    decoy.when(engine.state_view.commands.get("cmd-id")).then_return(failed_command)
+
+    def _queue_and_wait() -> None:
+        subject.queue_command(request=failing_request)
+        skipped = subject.queue_command(request=later_request)
+        with pytest.raises(
+            CommandRequestFailedError, match="earlier command failed"
+        ) as skipped_info:
+            skipped.result()
+        assert skipped_info.value.request == later_request
+        assert skipped_info.value.command is None
+        subject.queue_command(request=later_request)
+        subject.wait_for_queued()
+
+    with pytest.raises(
+        CommandRequestFailedError, match="Things are not looking good"
+    ) as exc_info:
+        await get_running_loop().run_in_executor(None, _queue_and_wait)
+
+    assert exc_info.value.request == failing_request
+    assert exc_info.value.command == failed_command
+
+    decoy.verify(engine.add_command(request=later_request), times=0)
@@ -9,6 +9,7 @@ the subject's methods in a synchronous context in a child thread to ensure:
     loop, without blocking.
 """
 import pytest
+from concurrent.futures import Future
 from decoy import Decoy
 
 from opentrons.protocols.models import LabwareDefinition
@@ -151,7 +152,7 @@ def test_pick_up_tip(
 
     result = subject.pick_up_tip(pipette_id="123", labware_id="456", well_name="A2")
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_drop_tip(
@@ -169,7 +170,7 @@ def test_drop_tip(
 
     result = subject.drop_tip(pipette_id="123", labware_id="456", well_name="A2")
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_aspirate(
@@ -209,7 +210,7 @@ def test_aspirate(
         volume=123.45,
     )
 
-    assert result == result_from_transport
+    assert result.result() == result_from_transport
 
 
 def test_dispense(
@@ -246,7 +247,7 @@ def test_dispense(
         volume=10,
     )
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_touch_tip(
@@ -275,7 +276,7 @@ def test_touch_tip(
         well_location=WellLocation(),
     )
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_wait_for_resume(
@@ -309,7 +310,7 @@ def test_set_rail_lights(
 
     result = subject.set_rail_lights(on=True)
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_magnetic_module_engage(
@@ -327,7 +328,7 @@ def test_magnetic_module_engage(
 
     result = subject.magnetic_module_engage(module_id="module-id", engage_height=12.34)
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_thermocycler_deactivate_block(
@@ -343,7 +344,7 @@ def test_thermocycler_deactivate_block(
     decoy.when(transport.execute_command(request=request)).then_return(response)
     result = subject.thermocycler_deactivate_block(module_id="module-id")
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_thermocycler_deactivate_lid(
@@ -359,7 +360,7 @@ def test_thermocycler_deactivate_lid(
     decoy.when(transport.execute_command(request=request)).then_return(response)
     result = subject.thermocycler_deactivate_lid(module_id="module-id")
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_thermocycler_open_lid(
@@ -375,7 +376,7 @@ def test_thermocycler_open_lid(
     decoy.when(transport.execute_command(request=request)).then_return(response)
     result = subject.thermocycler_open_lid(module_id="module-id")
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_thermocycler_close_lid(
@@ -391,7 +392,7 @@ def test_thermocycler_close_lid(
     decoy.when(transport.execute_command(request=request)).then_return(response)
     result = subject.thermocycler_close_lid(module_id="module-id")
 
-    assert result == response
+    assert result.result() == response
 
 
 def test_blow_out(
@@ -421,4 +422,21 @@ def test_blow_out(
         well_location=WellLocation(),
     )
 
-    assert result == response
+    assert result.result() == response
+
+
+def test_pipelined(decoy: Decoy, transport: AbstractSyncTransport) -> None:
+    """It should queue commands whose results aren't needed in pipelined mode."""
+    subject = SyncClient(transport=transport, pipelined=True)
+    request = commands.PickUpTipCreate(
+        params=commands.PickUpTipParams(pipetteId="123", labwareId="456", wellName="A2")
+    )
+    future: "Future[commands.CommandResult]" = Future()
+
+    decoy.when(transport.queue_command(request=request)).then_return(future)
+
+    result = subject.pick_up_tip(pipette_id="123", labware_id="456", well_name="A2")
+    subject.wait_for_queued()
+
+    assert result is future
+    decoy.verify(transport.wait_for_queued())
@@ -80,6 +80,7 @@ async def test_hardware_stopping_sequence(
     await subject.do_stop_and_recover(drop_tips_and_home=True)
 
     decoy.verify(
+        await hardware_api.wait_for_motion(),
         await hardware_api.stop(home_after=False),
         await movement.home(
             axes=[MotorAxis.X, MotorAxis.Y, MotorAxis.LEFT_Z, MotorAxis.RIGHT_Z]
@@ -128,6 +129,7 @@ async def test_hardware_stopping_sequence_no_home(
     await subject.do_stop_and_recover(drop_tips_and_home=False)
 
     decoy.verify(
+        await hardware_api.wait_for_motion(),
         await hardware_api.stop(home_after=False),
     )
 
@@ -1,10 +1,12 @@
 """Run control side-effect handler."""
+import asyncio
 from time import monotonic as time_monotonic
 
 import pytest
 from decoy import Decoy, matchers
 
-from opentrons.protocol_engine.state import StateStore
+from opentrons.hardware_control import HardwareControlAPI
+from opentrons.protocol_engine.state import StateStore, StateTopic
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state import Config
@@ -22,15 +24,23 @@ def mock_action_dispatcher(decoy: Decoy) -> ActionDispatcher:
     return decoy.mock(cls=ActionDispatcher)
 
 
+@pytest.fixture
+def mock_hardware_api(decoy: Decoy) -> HardwareControlAPI:
+    """Get a mocked out HardwareControlAPI."""
+    return decoy.mock(cls=HardwareControlAPI)
+
+
 @pytest.fixture
 def subject(
     mock_state_store: StateStore,
     mock_action_dispatcher: ActionDispatcher,
+    mock_hardware_api: HardwareControlAPI,
 ) -> RunControlHandler:
     """Create a RunControlHandler with its dependencies mocked out."""
     return RunControlHandler(
         state_store=mock_state_store,
         action_dispatcher=mock_action_dispatcher,
+        hardware_api=mock_hardware_api,
     )
 
 
@@ -38,15 +48,18 @@ async def test_pause(
     decoy: Decoy,
     mock_state_store: StateStore,
     mock_action_dispatcher: ActionDispatcher,
+    mock_hardware_api: HardwareControlAPI,
     subject: RunControlHandler,
 ) -> None:
-    """It should be able to execute a pause."""
+    """It should wait for the gantry to stop, then execute a pause."""
     decoy.when(mock_state_store.config).then_return(Config(ignore_pause=False))
     await subject.wait_for_resume()
     decoy.verify(
+        await mock_hardware_api.wait_for_motion(),
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
         await mock_state_store.wait_for(
-            condition=mock_state_store.commands.get_is_running
+            condition=mock_state_store.commands.get_is_running,
+            topics=[StateTopic.COMMANDS],
         ),
     )
 
@@ -87,6 +100,27 @@ async def test_wait_for_duration(
     assert end - start >= 0.1
 
 
+async def test_wait_for_duration_waits_for_motion(
+    decoy: Decoy,
+    mock_state_store: StateStore,
+    mock_hardware_api: HardwareControlAPI,
+    subject: RunControlHandler,
+) -> None:
+    """It should not start the delay until the gantry has stopped."""
+    decoy.when(mock_state_store.config).then_return(Config(ignore_pause=False))
+    motion_done = asyncio.Event()
+
+    def _wait_for_motion() -> None:
+        motion_done.set()
+
+    decoy.when(await mock_hardware_api.wait_for_motion()).then_do(_wait_for_motion)
+    task = asyncio.create_task(subject.wait_for_duration(seconds=0.2))
+    await asyncio.sleep(0)
+    assert motion_done.is_set()
+    assert not task.done()
+    await task
+
+
 async def test_wait_for_duration_ignore_pause(
     decoy: Decoy,
     mock_state_store: StateStore,
@@ -42,3 +42,21 @@ async def test_labware_hash_match() -> None:
     labware_model_dict = cast(LabwareDefDict, labware_model.dict(exclude_none=True))
 
     assert hash_labware_def(labware_dict) == hash_labware_def(labware_model_dict)
+
+
+async def test_labware_data_reuses_definition() -> None:
+    """It should parse a definition once and reuse it."""
+    subject = LabwareDataProvider()
+
+    first = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+    second = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+
+    assert first is second
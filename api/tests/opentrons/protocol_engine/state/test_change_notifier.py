@@ -1,7 +1,11 @@
 """Tests for the ChangeNotifier interface."""
 import asyncio
 import pytest
-from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+from opentrons.protocol_engine.state.change_notifier import (
+    ChangeNotifier,
+    CommandTopic,
+    StateTopic,
+)
 
 
 async def test_single_subscriber() -> None:
@@ -54,3 +58,37 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_topic_subscribers() -> None:
+    """It should only wake subscribers waiting on a notified topic."""
+    subject = ChangeNotifier()
+    command_1 = asyncio.create_task(subject.wait([CommandTopic("command-id-1")]))
+    command_2 = asyncio.create_task(subject.wait([CommandTopic("command-id-2")]))
+    labware = asyncio.create_task(subject.wait([StateTopic.LABWARE]))
+    unfiltered = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    subject.notify([StateTopic.COMMANDS, CommandTopic("command-id-1")])
+    await asyncio.sleep(0)
+
+    assert command_1.done() is True
+    assert unfiltered.done() is True
+    assert command_2.done() is False
+    assert labware.done() is False
+
+    subject.notify()
+    await asyncio.gather(command_2, labware)
+
+
+async def test_cancelled_subscriber() -> None:
+    """It should forget about subscribers that stop waiting."""
+    subject = ChangeNotifier()
+    task = asyncio.create_task(subject.wait([StateTopic.MODULES]))
+    await asyncio.sleep(0)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    subject.notify([StateTopic.MODULES])
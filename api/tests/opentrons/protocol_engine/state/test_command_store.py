@@ -21,6 +21,7 @@ from opentrons.protocol_engine.state.commands import (
 
 from opentrons.protocol_engine.actions import (
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     PlayAction,
@@ -70,6 +71,8 @@ def test_initial_state(
         all_command_ids=[],
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -257,6 +260,52 @@ def test_command_queue_and_unqueue() -> None:
     assert subject.state.queued_command_ids == OrderedSet()
 
 
+def test_command_queue_many() -> None:
+    """It should queue several commands, in order, on QueueCommandsAction."""
+    created_at = datetime(year=2021, month=1, day=1)
+    queue_1 = QueueCommandAction(
+        request=commands.WaitForResumeCreate(params=commands.WaitForResumeParams()),
+        created_at=created_at,
+        command_id="command-id-1",
+    )
+    queue_2 = QueueCommandAction(
+        request=commands.HomeCreate(
+            params=commands.HomeParams(),
+            intent=commands.CommandIntent.SETUP,
+        ),
+        created_at=created_at,
+        command_id="command-id-2",
+    )
+    queue_3 = QueueCommandAction(
+        request=commands.WaitForResumeCreate(params=commands.WaitForResumeParams()),
+        created_at=created_at,
+        command_id="command-id-3",
+    )
+
+    subject = CommandStore(is_door_open=False, config=Config())
+    subject.handle_action(QueueCommandsAction(commands=[queue_1, queue_2, queue_3]))
+
+    assert subject.state.all_command_ids == [
+        "command-id-1",
+        "command-id-2",
+        "command-id-3",
+    ]
+    assert subject.state.queued_command_ids == OrderedSet(
+        ["command-id-1", "command-id-3"]
+    )
+    assert subject.state.queued_setup_command_ids == OrderedSet(["command-id-2"])
+    assert subject.state.commands_by_id["command-id-3"] == CommandEntry(
+        index=2,
+        command=commands.WaitForResume(
+            id="command-id-3",
+            key="command-id-3",
+            createdAt=created_at,
+            params=commands.WaitForResumeParams(),
+            status=commands.CommandStatus.QUEUED,
+        ),
+    )
+
+
 def test_setup_command_queue_and_unqueue() -> None:
     """It should queue and dequeue on setup commands."""
     queue_1 = QueueCommandAction(
@@ -446,6 +495,8 @@ def test_command_failure_clears_queues() -> None:
         "command-id-1": CommandEntry(index=0, command=expected_failed_1),
         "command-id-2": CommandEntry(index=1, command=expected_failed_2),
     }
+    assert subject.state.latest_completed_command_id == "command-id-2"
+    assert subject.state.failed_command_ids == OrderedSet(["command-id-1"])
 
 
 def test_setup_command_failure_only_clears_setup_command_queue() -> None:
@@ -584,6 +635,29 @@ def test_command_store_preserves_handle_order() -> None:
     }
 
 
+def test_command_store_tracks_latest_completed_command() -> None:
+    """It should track the completed command with the highest index."""
+    subject = CommandStore(is_door_open=False, config=Config())
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_queued_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-2"))
+    )
+    assert subject.state.latest_completed_command_id is None
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-2"))
+    )
+    assert subject.state.latest_completed_command_id == "command-id-2"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-1"))
+    )
+    assert subject.state.latest_completed_command_id == "command-id-2"
+
+
 @pytest.mark.parametrize("pause_source", PauseSource)
 def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
     """It should clear the running flag on pause."""
@@ -602,6 +676,8 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -623,6 +699,8 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -645,6 +723,8 @@ def test_command_store_handles_finish_action() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -677,6 +757,8 @@ def test_command_store_handles_stop_action() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -698,6 +780,8 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -763,6 +847,8 @@ def test_command_store_saves_unknown_finish_error() -> None:
             )
         },
         run_started_at=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -786,6 +872,8 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -809,6 +897,8 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -854,6 +944,8 @@ def test_command_store_handles_command_failed() -> None:
         },
         errors_by_id={},
         run_started_at=None,
+        latest_completed_command_id="command-id",
+        failed_command_ids=OrderedSet(["command-id"]),
     )
 
 
@@ -875,6 +967,8 @@ def test_handles_hardware_stopped() -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         run_started_at=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -13,6 +13,7 @@ from opentrons.protocol_engine.actions import (
     PauseSource,
     StopAction,
     QueueCommandAction,
+    QueueCommandsAction,
 )
 
 from opentrons.protocol_engine.state.commands import (
@@ -51,6 +52,16 @@ def get_command_view(
         command.id: CommandEntry(index=index, command=command)
         for index, command in enumerate(commands)
     }
+    completed_command_ids = [
+        command.id
+        for command in commands
+        if command.status in (cmd.CommandStatus.SUCCEEDED, cmd.CommandStatus.FAILED)
+    ]
+    failed_command_ids = [
+        command.id
+        for command in commands
+        if command.error is not None and command.intent != cmd.CommandIntent.SETUP
+    ]
 
     state = CommandState(
         queue_status=queue_status,
@@ -64,6 +75,10 @@ def get_command_view(
         all_command_ids=all_command_ids,
         commands_by_id=commands_by_id,
         run_started_at=run_started_at,
+        latest_completed_command_id=(
+            completed_command_ids[-1] if completed_command_ids else None
+        ),
+        failed_command_ids=OrderedSet(failed_command_ids),
     )
 
     return CommandView(state=state)
@@ -297,7 +312,9 @@ class ActionAllowedSpec(NamedTuple):
     """Spec data to test CommandView.validate_action_allowed."""
 
     subject: CommandView
-    action: Union[PlayAction, PauseAction, StopAction, QueueCommandAction]
+    action: Union[
+        PlayAction, PauseAction, StopAction, QueueCommandAction, QueueCommandsAction
+    ]
     expected_error: Optional[Type[errors.ProtocolEngineError]]
 
 
@@ -416,6 +433,42 @@ action_allowed_specs: List[ActionAllowedSpec] = [
         ),
         expected_error=errors.SetupCommandNotAllowedError,
     ),
+    # queue commands is allowed while running if none are setup commands
+    ActionAllowedSpec(
+        subject=get_command_view(queue_status=QueueStatus.RUNNING),
+        action=QueueCommandsAction(
+            commands=[
+                QueueCommandAction(
+                    request=cmd.HomeCreate(params=cmd.HomeParams()),
+                    command_id="command-id",
+                    created_at=datetime(year=2021, month=1, day=1),
+                ),
+            ]
+        ),
+        expected_error=None,
+    ),
+    # queue commands is disallowed while running if any is a setup command
+    ActionAllowedSpec(
+        subject=get_command_view(queue_status=QueueStatus.RUNNING),
+        action=QueueCommandsAction(
+            commands=[
+                QueueCommandAction(
+                    request=cmd.HomeCreate(params=cmd.HomeParams()),
+                    command_id="command-id-1",
+                    created_at=datetime(year=2021, month=1, day=1),
+                ),
+                QueueCommandAction(
+                    request=cmd.HomeCreate(
+                        params=cmd.HomeParams(),
+                        intent=cmd.CommandIntent.SETUP,
+                    ),
+                    command_id="command-id-2",
+                    created_at=datetime(year=2021, month=1, day=1),
+                ),
+            ]
+        ),
+        expected_error=errors.SetupCommandNotAllowedError,
+    ),
 ]
 
 
@@ -136,6 +136,48 @@ def test_get_labware_origin_position(
     assert result == expected_point
 
 
+def test_get_labware_position_after_reload(
+    decoy: Decoy,
+    well_plate_def: LabwareDefinition,
+    labware_view: LabwareView,
+    subject: GeometryView,
+) -> None:
+    """It should recompute a labware's position if its state entry is replaced."""
+    labware_data = LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="definition-uri",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_3),
+        offsetId=None,
+    )
+    decoy.when(labware_view.get("labware-id")).then_return(labware_data)
+    decoy.when(labware_view.get_definition("labware-id")).then_return(well_plate_def)
+    decoy.when(labware_view.get_labware_offset_vector("labware-id")).then_return(
+        LabwareOffsetVector(x=0, y=0, z=0)
+    )
+    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
+        Point(1, 2, 3)
+    )
+    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_4)).then_return(
+        Point(4, 5, 6)
+    )
+    corner_offset = Point(
+        x=well_plate_def.cornerOffsetFromSlot.x,
+        y=well_plate_def.cornerOffsetFromSlot.y,
+        z=well_plate_def.cornerOffsetFromSlot.z,
+    )
+
+    assert subject.get_labware_position("labware-id") == Point(1, 2, 3) + corner_offset
+
+    decoy.when(labware_view.get("labware-id")).then_return(
+        labware_data.copy(
+            update={"location": DeckSlotLocation(slotName=DeckSlotName.SLOT_4)}
+        )
+    )
+
+    assert subject.get_labware_position("labware-id") == Point(4, 5, 6) + corner_offset
+
+
 def test_get_labware_highest_z(
     decoy: Decoy,
     standard_deck_def: DeckDefinitionV3,
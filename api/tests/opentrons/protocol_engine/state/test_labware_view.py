@@ -593,3 +593,42 @@ def test_find_applicable_labware_offset() -> None:
         )
         is None
     )
+
+
+def test_find_applicable_labware_offset_added_later() -> None:
+    """It should find offsets added to state after a previous lookup."""
+    location = LabwareOffsetLocation(slotName=DeckSlotName.SLOT_1)
+    labware_offsets_by_id = {
+        "other-id": LabwareOffset(
+            id="other-id",
+            createdAt=datetime(year=2021, month=1, day=1),
+            definitionUri="other-definition-uri",
+            location=location,
+            vector=LabwareOffsetVector(x=1, y=1, z=1),
+        )
+    }
+    subject = get_labware_view(labware_offsets_by_id=labware_offsets_by_id)
+
+    assert (
+        subject.find_applicable_labware_offset(
+            definition_uri="definition-uri", location=location
+        )
+        is None
+    )
+
+    for i in range(2):
+        offset = LabwareOffset(
+            id=f"id-{i}",
+            createdAt=datetime(year=2021, month=1, day=1),
+            definitionUri="definition-uri",
+            location=location,
+            vector=LabwareOffsetVector(x=i, y=i, z=i),
+        )
+        labware_offsets_by_id[offset.id] = offset
+
+        assert (
+            subject.find_applicable_labware_offset(
+                definition_uri="definition-uri", location=location
+            )
+            == offset
+        )
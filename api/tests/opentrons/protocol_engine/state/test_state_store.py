@@ -6,8 +6,21 @@ import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
-from opentrons.protocol_engine.state import State, StateStore, Config
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.state import (
+    State,
+    StateStore,
+    StateTopic,
+    CommandTopic,
+    Config,
+)
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    QueueCommandAction,
+    QueueCommandsAction,
+    StopAction,
+    UpdateCommandAction,
+)
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
 
@@ -61,9 +74,106 @@ def test_notify_on_state_change(
     subject: StateStore,
 ) -> None:
     """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    decoy.verify(change_notifier.notify([StateTopic.COMMANDS]), times=0)
     subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify([StateTopic.COMMANDS]), times=1)
+
+
+def test_notify_command_topic(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should notify the changed command's topic when a command is updated."""
+    command = commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=commands.WaitForResumeParams(),
+        status=commands.CommandStatus.RUNNING,
+    )
+    subject.handle_action(UpdateCommandAction(command=command))
+
+    decoy.verify(
+        change_notifier.notify([StateTopic.COMMANDS, CommandTopic("command-id")]),
+        times=1,
+    )
+
+
+def test_notify_queued_command_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should notify the topic of every command queued at once."""
+    subject.handle_action(
+        QueueCommandsAction(
+            commands=[
+                QueueCommandAction(
+                    command_id=command_id,
+                    created_at=datetime(year=2021, month=1, day=1),
+                    request=commands.WaitForResumeCreate(
+                        params=commands.WaitForResumeParams()
+                    ),
+                )
+                for command_id in ("command-1", "command-2")
+            ]
+        )
+    )
+
+    assert [c.id for c in subject.commands.get_all()] == ["command-1", "command-2"]
+    decoy.verify(
+        change_notifier.notify(
+            [StateTopic.COMMANDS, CommandTopic("command-1"), CommandTopic("command-2")]
+        ),
+        times=1,
+    )
+
+
+def test_notify_all_on_stop(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should notify every topic for actions that can affect everything."""
+    subject.handle_action(StopAction())
+    decoy.verify(change_notifier.notify(None), times=1)
+
+
+def test_handle_actions(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should handle a batch of actions with one update and notification."""
+    created_at = datetime(year=2021, month=1, day=1)
+    actions = [
+        UpdateCommandAction(
+            command=commands.WaitForResume(
+                id=command_id,
+                key=command_id,
+                createdAt=created_at,
+                params=commands.WaitForResumeParams(),
+                status=commands.CommandStatus.RUNNING,
+            )
+        )
+        for command_id in ("command-1", "command-2")
+    ]
+    state_before = subject.state
+
+    subject.handle_actions(actions)
+
+    assert subject.state is not state_before
+    assert [c.id for c in subject.commands.get_all()] == ["command-1", "command-2"]
+    decoy.verify(
+        change_notifier.notify(
+            {StateTopic.COMMANDS, CommandTopic("command-1"), CommandTopic("command-2")}
+        ),
+        times=1,
+    )
+
+    subject.handle_actions([PlayAction(requested_at=created_at), StopAction()])
+    decoy.verify(change_notifier.notify(None), times=1)
 
 
 async def test_wait_for_state(
@@ -83,7 +193,30 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(None), times=2)
+
+
+async def test_wait_for_state_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the given topics, if specified."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition(command_id="command-id")).then_return(
+        None,
+        "hello world",
+    )
+
+    result = await subject.wait_for(
+        check_condition,
+        command_id="command-id",
+        topics=[CommandTopic("command-id")],
+    )
+    assert result == "hello world"
+
+    decoy.verify(await change_notifier.wait([CommandTopic("command-id")]), times=1)
 
 
 async def test_wait_for_state_short_circuit(
@@ -99,7 +232,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
@@ -28,7 +28,7 @@ from opentrons.protocol_engine.execution import (
     DoorWatcher,
 )
 from opentrons.protocol_engine.resources import ModelUtils, ModuleDataProvider
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, StateTopic, CommandTopic
 from opentrons.protocol_engine.plugins import AbstractPlugin, PluginStarter
 
 from opentrons.protocol_engine.actions import (
@@ -43,6 +43,7 @@ from opentrons.protocol_engine.actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    QueueCommandsAction,
     HardwareStoppedAction,
 )
 
@@ -194,6 +195,64 @@ def test_add_command(
     assert result == queued
 
 
+def test_add_commands(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+) -> None:
+    """It should add several commands to the state at once."""
+    created_at = datetime(year=2021, month=1, day=1)
+    home_request = commands.HomeCreate(params=commands.HomeParams())
+    pause_request = commands.WaitForResumeCreate(params=commands.WaitForResumeParams())
+    queue_action = QueueCommandsAction(
+        commands=[
+            QueueCommandAction(
+                command_id="command-id-1",
+                created_at=created_at,
+                request=home_request,
+            ),
+            QueueCommandAction(
+                command_id="command-id-2",
+                created_at=created_at,
+                request=pause_request,
+            ),
+        ]
+    )
+    validated_action = QueueCommandsAction(commands=[])
+    queued_1 = commands.Home(
+        id="command-id-1",
+        key="command-id-1",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=home_request.params,
+    )
+    queued_2 = commands.WaitForResume(
+        id="command-id-2",
+        key="command-id-2",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=pause_request.params,
+    )
+
+    decoy.when(model_utils.generate_id()).then_return("command-id-1", "command-id-2")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+
+    def _stub_queued(*_a: object, **_k: object) -> None:
+        decoy.when(state_store.commands.get("command-id-1")).then_return(queued_1)
+        decoy.when(state_store.commands.get("command-id-2")).then_return(queued_2)
+
+    decoy.when(state_store.commands.validate_action_allowed(queue_action)).then_return(
+        validated_action
+    )
+    decoy.when(action_dispatcher.dispatch(validated_action)).then_do(_stub_queued)
+
+    result = subject.add_commands([home_request, pause_request])
+
+    assert result == [queued_1, queued_2]
+
+
 async def test_add_and_execute_command(
     decoy: Decoy,
     state_store: StateStore,
@@ -261,6 +320,7 @@ async def test_add_and_execute_command(
         await state_store.wait_for(
             condition=state_store.commands.get_is_complete,
             command_id="command-id",
+            topics=[CommandTopic("command-id")],
         ),
     ).then_do(_stub_completed)
 
@@ -480,7 +540,10 @@ async def test_wait_until_complete(
     await subject.wait_until_complete()
 
     decoy.verify(
-        await state_store.wait_for(condition=state_store.commands.get_all_complete)
+        await state_store.wait_for(
+            condition=state_store.commands.get_all_complete,
+            topics=[StateTopic.COMMANDS],
+        )
     )
 
 
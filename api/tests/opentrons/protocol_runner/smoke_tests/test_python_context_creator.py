@@ -9,10 +9,12 @@ from opentrons.hardware_control import API as HardwareAPI
 from opentrons.protocol_api_experimental import ProtocolContext, DeckSlotName
 from opentrons.protocol_engine import (
     create_protocol_engine,
+    commands,
     ProtocolEngine,
     DeckSlotLocation,
     Config as EngineConfig,
 )
+from opentrons.protocol_engine.errors import CommandRequestFailedError
 
 
 @pytest.fixture
@@ -27,7 +29,8 @@ async def protocol_engine(hardware: HardwareAPI) -> AsyncIterable[ProtocolEngine
 async def test_creates_protocol_context(protocol_engine: ProtocolEngine) -> None:
     """It should return a ProtocolContext."""
     subject = PythonContextCreator()
-    result = subject.create(protocol_engine=protocol_engine)
+    engine_client = subject.create_engine_client(protocol_engine=protocol_engine)
+    result = subject.create(engine_client=engine_client)
 
     assert isinstance(result, ProtocolContext)
 
@@ -37,7 +40,8 @@ async def test_wires_protocol_context_to_engine(
 ) -> None:
     """Smoke test the returned ProtocolContext by running a command."""
     subject = PythonContextCreator()
-    context = subject.create(protocol_engine=protocol_engine)
+    engine_client = subject.create_engine_client(protocol_engine=protocol_engine)
+    context = subject.create(engine_client=engine_client)
 
     # run a ProtocolContext command in a ThreadPoolExecutor to validate
     # commands are going to the engine across the thread boundary
@@ -55,3 +59,55 @@ async def test_wires_protocol_context_to_engine(
     )
 
     assert labware_location == DeckSlotLocation(slotName=DeckSlotName.SLOT_1)
+
+
+async def test_queued_command_failure(
+    hardware: HardwareAPI,
+    protocol_engine: ProtocolEngine,
+) -> None:
+    """It should raise a queued command's failure, and run nothing after it."""
+    await hardware.home()
+    subject = PythonContextCreator()
+    engine_client = subject.create_engine_client(protocol_engine=protocol_engine)
+    context = subject.create(engine_client=engine_client)
+
+    def _run(ctx: ProtocolContext) -> None:
+        tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+        plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+        pipette = ctx.load_pipette("p300_single", "left")
+        tip_well = tip_rack.wells()[0]
+        plate_well = plate.wells()[0]
+
+        pipette.pick_up_tip(tip_well)
+        pipette.drop_tip(tip_well)
+        pipette.pick_up_tip(plate_well)
+        for _ in range(10):
+            pipette.pick_up_tip(tip_well)
+            pipette.drop_tip(tip_well)
+
+        engine_client.wait_for_queued()
+
+    with pytest.raises(
+        CommandRequestFailedError, match="LabwareIsNotTipRackError"
+    ) as exc_info:
+        await asyncio.get_running_loop().run_in_executor(None, _run, context)
+
+    failed_command = exc_info.value.command
+    assert isinstance(failed_command, commands.PickUpTip)
+    assert failed_command.params.wellName == "A1"
+    assert failed_command.status == commands.CommandStatus.FAILED
+    assert exc_info.value.request == commands.PickUpTipCreate(
+        params=failed_command.params
+    )
+
+    statuses = [
+        (c.commandType, c.status)
+        for c in protocol_engine.state_view.commands.get_all()
+        if c.commandType in ("pickUpTip", "dropTip")
+    ]
+    assert statuses[:3] == [
+        ("pickUpTip", commands.CommandStatus.SUCCEEDED),
+        ("dropTip", commands.CommandStatus.SUCCEEDED),
+        ("pickUpTip", commands.CommandStatus.FAILED),
+    ]
+    assert all(status == commands.CommandStatus.FAILED for _, status in statuses[3:])
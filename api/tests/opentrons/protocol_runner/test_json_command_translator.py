@@ -411,3 +411,7 @@ def test_load_command(
     """Test translating v6 commands to protocol engine commands."""
     output = subject.translate(_make_json_protocol(commands=[test_input]))
     assert output == [expected_output]
+
+    # translating a command type the translator has seen before
+    output = subject.translate(_make_json_protocol(commands=[test_input]))
+    assert output == [expected_output]
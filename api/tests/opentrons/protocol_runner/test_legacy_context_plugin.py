@@ -147,7 +147,7 @@ async def test_command_broker_messages(
     await subject.teardown()
 
     decoy.verify(
-        action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        action_dispatcher.dispatch_all([pe_actions.UpdateCommandAction(engine_command)])
     )
 
 
@@ -203,5 +203,5 @@ async def test_equipment_broker_messages(
     await subject.teardown()
 
     decoy.verify(
-        action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        action_dispatcher.dispatch_all([pe_actions.UpdateCommandAction(engine_command)])
     )
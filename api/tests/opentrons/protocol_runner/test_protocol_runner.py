@@ -14,6 +14,7 @@ from opentrons_shared_data.protocol.models.protocol_schema_v6 import ProtocolSch
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons.protocol_api_experimental import ProtocolContext
 from opentrons.protocol_engine import ProtocolEngine, commands as pe_commands
+from opentrons.protocol_engine.clients import SyncClient
 from opentrons.protocol_reader import (
     ProtocolSource,
     JsonProtocolConfig,
@@ -251,15 +252,15 @@ def test_load_json(
     subject.load(json_protocol_source)
 
     decoy.verify(
-        protocol_engine.add_command(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="hello")
-            )
-        ),
-        protocol_engine.add_command(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="goodbye")
-            )
+        protocol_engine.add_commands(
+            requests=[
+                pe_commands.WaitForResumeCreate(
+                    params=pe_commands.WaitForResumeParams(message="hello")
+                ),
+                pe_commands.WaitForResumeCreate(
+                    params=pe_commands.WaitForResumeParams(message="goodbye")
+                ),
+            ]
         ),
         task_queue.set_run_func(func=protocol_engine.wait_until_complete),
     )
@@ -285,12 +286,16 @@ def test_load_python(
     )
 
     python_protocol = decoy.mock(cls=PythonProtocol)
+    engine_client = decoy.mock(cls=SyncClient)
     protocol_context = decoy.mock(cls=ProtocolContext)
 
     decoy.when(python_file_reader.read(python_protocol_source)).then_return(
         python_protocol
     )
-    decoy.when(python_context_creator.create(protocol_engine)).then_return(
+    decoy.when(
+        python_context_creator.create_engine_client(protocol_engine)
+    ).then_return(engine_client)
+    decoy.when(python_context_creator.create(engine_client)).then_return(
         protocol_context
     )
 
@@ -301,6 +306,7 @@ def test_load_python(
             func=python_executor.execute,
             protocol=python_protocol,
             context=protocol_context,
+            engine_client=engine_client,
         ),
     )
 
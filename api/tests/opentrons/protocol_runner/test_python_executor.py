@@ -0,0 +1,60 @@
+"""Tests for the PythonExecutor."""
+import pytest
+from decoy import Decoy
+
+from opentrons.protocol_api_experimental import ProtocolContext
+from opentrons.protocol_engine.clients import SyncClient
+from opentrons.protocol_runner.python_executor import PythonExecutor
+from opentrons.protocol_runner.python_file_reader import PythonProtocol
+
+
+@pytest.fixture
+def protocol(decoy: Decoy) -> PythonProtocol:
+    """Get a mocked out PythonProtocol."""
+    return decoy.mock(cls=PythonProtocol)
+
+
+@pytest.fixture
+def context(decoy: Decoy) -> ProtocolContext:
+    """Get a mocked out ProtocolContext."""
+    return decoy.mock(cls=ProtocolContext)
+
+
+@pytest.fixture
+def engine_client(decoy: Decoy) -> SyncClient:
+    """Get a mocked out SyncClient."""
+    return decoy.mock(cls=SyncClient)
+
+
+async def test_execute(
+    decoy: Decoy,
+    protocol: PythonProtocol,
+    context: ProtocolContext,
+    engine_client: SyncClient,
+) -> None:
+    """It should run the protocol, then wait for the commands it queued."""
+    await PythonExecutor.execute(
+        protocol=protocol, context=context, engine_client=engine_client
+    )
+
+    decoy.verify(
+        protocol.run(context),
+        engine_client.wait_for_queued(),
+    )
+
+
+async def test_execute_waits_after_protocol_error(
+    decoy: Decoy,
+    protocol: PythonProtocol,
+    context: ProtocolContext,
+    engine_client: SyncClient,
+) -> None:
+    """It should wait for queued commands even if the protocol raised."""
+    decoy.when(protocol.run(context)).then_raise(RuntimeError("oh no"))
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await PythonExecutor.execute(
+            protocol=protocol, context=context, engine_client=engine_client
+        )
+
+    decoy.verify(engine_client.wait_for_queued(), times=1)
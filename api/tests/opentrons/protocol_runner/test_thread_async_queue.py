@@ -153,6 +153,53 @@ async def test_async() -> None:
     assert consumed == [_ProducedValue(producer_id=0, value=v) for v in expected_values]
 
 
+async def test_async_batches() -> None:
+    """Values should pass from a producer thread to an async consumer in batches."""
+    expected_values = list(range(1000))
+
+    subject = ThreadAsyncQueue[_ProducedValue]()
+
+    consumer = asyncio.create_task(_consume_batches_async(queue=subject))
+    try:
+        with subject:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await asyncio.get_running_loop().run_in_executor(
+                    executor, _produce, subject, expected_values, 0
+                )
+    finally:
+        batches = await consumer
+
+    assert list(chain.from_iterable(batches)) == [
+        _ProducedValue(producer_id=0, value=v) for v in expected_values
+    ]
+    assert all(len(batch) > 0 for batch in batches)
+
+
+async def test_get_batch_async() -> None:
+    """It should return every value put so far, and be cancellable."""
+    subject = ThreadAsyncQueue[int]()
+    subject.put(1)
+    subject.put(2)
+    assert await subject.get_batch_async() == [1, 2]
+
+    waiting = asyncio.create_task(subject.get_batch_async())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    waiting = asyncio.create_task(subject.get_batch_async())
+    await asyncio.sleep(0)
+    subject.put(3)
+    assert await asyncio.wait_for(waiting, timeout=1) == [3]
+
+    waiting = asyncio.create_task(subject.get_batch_async())
+    await asyncio.sleep(0)
+    subject.done_putting()
+    with pytest.raises(QueueClosed):
+        await asyncio.wait_for(waiting, timeout=1)
+
+
 class _ProducedValue(NamedTuple):
     producer_id: int
     value: int
@@ -198,3 +245,13 @@ async def _consume_async(
     async for value in queue.get_async_until_closed():
         result.append(value)
     return result
+
+
+async def _consume_batches_async(
+    queue: ThreadAsyncQueue[_ProducedValue],
+) -> List[List[_ProducedValue]]:
+    """Like _consume_async()`, except return the batches as they were consumed."""
+    result = []
+    async for batch in queue.get_batches_async_until_closed():
+        result.append(batch)
+    return result
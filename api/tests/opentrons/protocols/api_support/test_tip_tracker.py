@@ -1,7 +1,9 @@
-from typing import List
+import random
+from itertools import dropwhile, takewhile
+from typing import List, Optional
 
 import pytest
-from opentrons.protocols.api_support.tip_tracker import TipTracker
+from opentrons.protocols.api_support.tip_tracker import TipTracker, select_next_tip
 from opentrons.protocols.context.well import WellImplementation
 from opentrons.protocols.api_support.well_grid import WellGrid
 
@@ -157,3 +159,103 @@ def test_return_tips(wells, tiptracker):
     assert wells[7].has_tip()
     # But we won't wrap around
     assert not wells[8].has_tip()
+
+
+def test_tracks_tips_set_on_wells(wells, tiptracker):
+    # Tips changed on the wells directly are seen by the tracker
+    for well in wells[:12]:
+        well.set_has_tip(False)
+    assert tiptracker.next_tip() is wells[12]
+    assert tiptracker.next_tip(8) is wells[16]
+    assert tiptracker.previous_tip(8) is wells[0]
+    for well in wells:
+        well.set_has_tip(True)
+    assert tiptracker.next_tip(8) is wells[0]
+    assert tiptracker.previous_tip() is None
+
+
+def test_select_next_tip_across_racks(names_96_well):
+    racks = [
+        [
+            WellImplementation(well_geometry=None, display_name=n, has_tip=True, name=n)
+            for n in names_96_well
+        ]
+        for _ in range(3)
+    ]
+    trackers = [TipTracker(WellGrid(rack).get_columns()) for rack in racks]
+
+    assert select_next_tip(trackers, 8) == (0, racks[0][0])
+    assert select_next_tip(trackers, 8, racks[0][88]) == (0, racks[0][88])
+    # The starting tip only applies to the first rack
+    assert select_next_tip(trackers, 8, racks[0][89]) == (1, racks[1][0])
+
+    for well in racks[0] + racks[1][:88]:
+        well.set_has_tip(False)
+    assert select_next_tip(trackers, 8) == (1, racks[1][88])
+    racks[1][90].set_has_tip(False)
+    assert select_next_tip(trackers, 8) == (2, racks[2][0])
+    assert select_next_tip(trackers, 1) == (1, racks[1][88])
+    assert select_next_tip(trackers[:2], 8) is None
+    assert select_next_tip([], 1) is None
+
+
+def _expected_next_tip(
+    columns, num_tips: int, starting_tip: Optional[WellImplementation]
+) -> Optional[WellImplementation]:
+    if starting_tip:
+        columns = list(dropwhile(lambda x: starting_tip not in x, columns))
+        columns[0] = list(dropwhile(lambda w: starting_tip is not w, columns[0]))
+    for column in columns:
+        run = list(
+            takewhile(
+                lambda x: x.has_tip(), dropwhile(lambda x: not x.has_tip(), column)
+            )
+        )
+        if len(run) >= num_tips:
+            return run[0]
+    return None
+
+
+def _expected_previous_tip(columns, num_tips: int) -> Optional[WellImplementation]:
+    for column in columns:
+        run = list(
+            takewhile(
+                lambda x: not x.has_tip(), dropwhile(lambda x: x.has_tip(), column)
+            )
+        )
+        if len(run) >= num_tips:
+            return run[0]
+    return None
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_well_scan(seed, wells, well_grid, tiptracker):
+    """The bitmaps should find the same wells as scanning the wells would."""
+    rng = random.Random(seed)
+    columns = well_grid.get_columns()
+    for _ in range(200):
+        num_tips = rng.choice([1, 1, 2, 4, 8])
+        starting_tip = rng.choice([None, rng.choice(wells)])
+        assert tiptracker.next_tip(num_tips, starting_tip) is _expected_next_tip(
+            columns, num_tips, starting_tip
+        )
+        assert tiptracker.previous_tip(num_tips) is _expected_previous_tip(
+            columns, num_tips
+        )
+
+        well = rng.choice(wells)
+        action = rng.choice(["use", "return", "set"])
+        if action == "use":
+            tiptracker.use_tips(well, num_tips)
+        elif action == "return":
+            column = next(c for c in columns if well in c)
+            start = column.index(well)
+            expect_error = any(w.has_tip() for w in column[start : start + num_tips])
+            try:
+                tiptracker.return_tips(well, num_tips)
+            except AssertionError:
+                assert expect_error
+            else:
+                assert not expect_error
+        else:
+            well.set_has_tip(rng.random() < 0.3)
@@ -0,0 +1,87 @@
+import math
+
+import pytest
+
+from opentrons.protocol_api import labware
+from opentrons.protocols.api_support.well_grid import WellGrid
+from opentrons.protocols.context.protocol_api.labware import LabwareImplementation
+from opentrons.protocols.geometry.well_arrays import WellArrays
+from opentrons.types import Location, Point
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+
+@pytest.fixture
+def plate_def() -> LabwareDefinition:
+    return labware.get_labware_definition("corning_384_wellplate_112ul_flat")
+
+
+@pytest.fixture
+def circular_plate_def() -> LabwareDefinition:
+    return labware.get_labware_definition("corning_96_wellplate_360ul_flat")
+
+
+@pytest.fixture
+def reservoir_def() -> LabwareDefinition:
+    return labware.get_labware_definition("nest_12_reservoir_15ml")
+
+
+def test_names_and_geometry(circular_plate_def: LabwareDefinition) -> None:
+    subject = WellArrays(circular_plate_def)
+
+    assert subject.names == [
+        well for col in circular_plate_def["ordering"] for well in col
+    ]
+    assert subject.index("B1") == 1
+    with pytest.raises(KeyError):
+        subject.index("Z99")
+
+    b1 = circular_plate_def["wells"]["B1"]
+    assert tuple(subject.top_offsets[1]) == (b1["x"], b1["y"], b1["z"] + b1["depth"])
+    assert subject.depths[1] == b1["depth"]
+    assert subject.diameters[1] == b1["diameter"]  # type: ignore[typeddict-item]
+
+
+def test_rectangular_wells_have_no_diameter(reservoir_def: LabwareDefinition) -> None:
+    subject = WellArrays(reservoir_def)
+    assert all(math.isnan(diameter) for diameter in subject.diameters)
+
+
+def test_rows_and_columns_match_well_grid(plate_def: LabwareDefinition) -> None:
+    impl = LabwareImplementation(plate_def, Location(Point(0, 0, 0), "Test Slot"))
+    grid = WellGrid(impl.get_wells())
+    subject = WellArrays(plate_def)
+
+    assert subject.row_names == grid.row_headers()
+    assert subject.column_names == grid.column_headers()
+    assert [[subject.names[i] for i in row] for row in subject.rows] == [
+        [well.get_name() for well in row] for row in grid.get_rows()
+    ]
+    assert [[subject.names[i] for i in column] for column in subject.columns] == [
+        [well.get_name() for well in column] for column in grid.get_columns()
+    ]
+
+
+def test_top_positions_match_well_geometry(plate_def: LabwareDefinition) -> None:
+    origin = Point(10.1, 20.2, 30.3)
+    impl = LabwareImplementation(plate_def, Location(Point(0, 0, 0), "Test Slot"))
+    impl.set_calibration(origin)
+    subject = WellArrays(plate_def)
+
+    positions = subject.top_positions(
+        subject.rows[1], impl.get_calibrated_offset()
+    ).tolist()
+    assert [Point(*position) for position in positions] == [
+        well.get_geometry().top() for well in impl.get_well_grid().get_rows()[1]
+    ]
+
+
+def test_has_top_at(plate_def: LabwareDefinition) -> None:
+    origin = Point(1, 2, 3)
+    subject = WellArrays(plate_def)
+    b2 = Point(*subject.top_positions(subject.columns[1], origin)[1])
+
+    assert subject.has_top_at(subject.rows[:2], origin, b2)
+    assert not subject.has_top_at(subject.rows[:1], origin, b2)
+    assert subject.has_top_at(subject.columns[1:2], origin, b2)
+    assert not subject.has_top_at(subject.columns[1:2], Point(0, 0, 0), b2)
+    assert not subject.has_top_at([], origin, b2)
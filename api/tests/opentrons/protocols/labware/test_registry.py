@@ -0,0 +1,158 @@
+import json
+import os
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from opentrons.protocols.api_support.constants import STANDARD_DEFS_PATH
+from opentrons.protocols.labware import get_labware_definition
+from opentrons.protocols.labware.registry import LabwareDefinitionRegistry
+from opentrons.protocols.models import LabwareDefinition
+from opentrons_shared_data import get_shared_data_root
+
+PLATE = "corning_96_wellplate_360ul_flat"
+TIPRACK = "opentrons_96_tiprack_300ul"
+
+
+@pytest.fixture
+def custom_root(tmp_path: Path) -> Path:
+    custom_def = get_labware_definition(PLATE)
+    custom_def["namespace"] = "custom_beta"
+    custom_def["parameters"]["loadName"] = "custom_plate"
+    custom_dir = tmp_path / "custom" / "custom_beta" / "custom_plate"
+    custom_dir.mkdir(parents=True)
+    (custom_dir / "1.json").write_text(json.dumps(custom_def))
+    return tmp_path / "custom"
+
+
+def _counting_loader(
+    loads: List[str], load_name: str
+) -> Callable[[], LabwareDefinition]:
+    def _load() -> LabwareDefinition:
+        loads.append(load_name)
+        return LabwareDefinition.parse_obj(get_labware_definition(load_name))
+
+    return _load
+
+
+def _make_subject(custom_root: Path, **kwargs) -> LabwareDefinitionRegistry:
+    return LabwareDefinitionRegistry(
+        standard_root=get_shared_data_root() / STANDARD_DEFS_PATH,
+        custom_root=custom_root,
+        **kwargs,
+    )
+
+
+def test_get_model_parses_once(custom_root: Path) -> None:
+    subject = _make_subject(custom_root)
+    loads: List[str] = []
+
+    assert subject.get_cached_model(PLATE, "opentrons", 1) is None
+    first = subject.get_model(PLATE, "opentrons", 1, _counting_loader(loads, PLATE))
+    second = subject.get_model(
+        PLATE.upper(), "Opentrons", 1, _counting_loader(loads, PLATE)
+    )
+
+    assert first is second
+    assert subject.get_cached_model(PLATE, "opentrons", 1) is first
+    assert first == LabwareDefinition.parse_obj(get_labware_definition(PLATE))
+    assert loads == [PLATE]
+
+
+def test_evicts_least_recently_used(custom_root: Path) -> None:
+    subject = _make_subject(custom_root, max_size=1)
+    loads: List[str] = []
+
+    subject.get_model(PLATE, "opentrons", 1, _counting_loader(loads, PLATE))
+    subject.get_model(TIPRACK, "opentrons", 1, _counting_loader(loads, TIPRACK))
+    subject.get_model(TIPRACK, "opentrons", 1, _counting_loader(loads, TIPRACK))
+
+    assert subject.get_cached_model(PLATE, "opentrons", 1) is None
+    assert loads == [PLATE, TIPRACK]
+
+
+def test_custom_definition_reloaded_when_changed(custom_root: Path) -> None:
+    subject = _make_subject(custom_root)
+    loads: List[str] = []
+    path = subject.get_path("custom_plate", "custom_beta", 1)
+
+    def _load() -> LabwareDefinition:
+        loads.append("custom_plate")
+        return LabwareDefinition.parse_obj(json.loads(path.read_text()))
+
+    def _get() -> LabwareDefinition:
+        return subject.get_model("custom_plate", "custom_beta", 1, _load)
+
+    original = _get()
+    assert _get() is original
+
+    changed_def = json.loads(path.read_text())
+    changed_def["metadata"]["displayName"] = "Changed Plate"
+    path.write_text(json.dumps(changed_def))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert subject.get_cached_model("custom_plate", "custom_beta", 1) is None
+    assert _get().metadata.displayName == "Changed Plate"
+    assert loads == ["custom_plate", "custom_plate"]
+
+
+def test_invalidate_custom(custom_root: Path) -> None:
+    subject = _make_subject(custom_root)
+    loads: List[str] = []
+    subject.get_model(PLATE, "opentrons", 1, _counting_loader(loads, PLATE))
+
+    load_names = subject.get_load_names()
+    assert PLATE in load_names
+    assert "custom_plate" in load_names
+
+    subject.invalidate_custom()
+    assert "custom_plate" in subject.get_load_names()
+    assert subject.get_cached_model(PLATE, "opentrons", 1) is not None
+
+
+def test_custom_load_names_follow_directory_changes(custom_root: Path) -> None:
+    subject = _make_subject(custom_root)
+    assert "custom_plate" in subject.get_load_names()
+
+    # as if another process had added and removed definitions
+    (custom_root / "custom_beta" / "other_plate").mkdir()
+    assert "other_plate" in subject.get_load_names()
+
+    (custom_root / "my_namespace" / "my_plate").mkdir(parents=True)
+    assert "my_plate" in subject.get_load_names()
+
+    (custom_root / "custom_beta" / "other_plate").rmdir()
+    assert "other_plate" not in subject.get_load_names()
+
+
+def test_cache_dir(custom_root: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    loads: List[str] = []
+
+    _make_subject(custom_root, cache_dir=cache_dir).get_model(
+        PLATE, "opentrons", 1, _counting_loader(loads, PLATE)
+    )
+    assert (cache_dir / "opentrons" / PLATE / "1.pickle").is_file()
+
+    result = _make_subject(custom_root, cache_dir=cache_dir).get_model(
+        PLATE, "opentrons", 1, _counting_loader(loads, PLATE)
+    )
+    assert result == LabwareDefinition.parse_obj(get_labware_definition(PLATE))
+    assert loads == [PLATE]
+
+
+def test_cache_dir_ignores_bad_files(custom_root: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache_file = cache_dir / "opentrons" / PLATE / "1.pickle"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_bytes(b"not a pickle")
+    loads: List[str] = []
+
+    _make_subject(custom_root, cache_dir=cache_dir).get_model(
+        PLATE, "opentrons", 1, _counting_loader(loads, PLATE)
+    )
+
+    assert loads == [PLATE]
+    assert cache_file.read_bytes() != b"not a pickle"
@@ -1,10 +1,11 @@
 import ast
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import pytest
 
 from opentrons.protocols.parse import (
+    compile_python,
     extract_metadata,
     _get_protocol_schema_version,
     validate_json,
@@ -351,3 +352,15 @@ def run(blahblah):
 def test_bad_structure(bad_protocol):
     with pytest.raises(MalformedProtocolError):
         parse(bad_protocol)
+
+
+def test_compile_python_reuses_code():
+    source = 'metadata = {"apiLevel": "2.0"}\n\ndef run(ctx):\n    pass\n'
+    parsed, code = compile_python(source, "protocol.py")
+    assert compile_python(source, "protocol.py")[1] is code
+    assert compile_python(source, "other.py")[1] is not code
+
+    namespace: Dict[str, Any] = {}
+    exec(code, namespace)
+    assert namespace["metadata"] == {"apiLevel": "2.0"}
+    assert isinstance(parsed, ast.Module)
@@ -0,0 +1,72 @@
+import json
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons_shared_data import load_shared_data
+
+from opentrons.protocols import schema_validation
+
+
+@pytest.fixture
+def labware_definition():
+    return json.loads(
+        load_shared_data("labware/definitions/2/corning_96_wellplate_360ul_flat/1.json")
+    )
+
+
+def test_load_schema():
+    schema = schema_validation.load_schema(schema_validation.LABWARE_SCHEMA_V2)
+    assert schema["$id"] == "opentronsLabwareSchemaV2"
+    assert schema_validation.load_schema(schema_validation.LABWARE_SCHEMA_V2) is schema
+
+    with pytest.raises(FileNotFoundError):
+        schema_validation.load_schema("labware/schemas/1000.json")
+
+
+def test_validate(labware_definition):
+    schema_validation.validate(labware_definition, schema_validation.LABWARE_SCHEMA_V2)
+
+    del labware_definition["wells"]["A1"]["depth"]
+    with pytest.raises(jsonschema.ValidationError):
+        schema_validation.validate(
+            labware_definition, schema_validation.LABWARE_SCHEMA_V2
+        )
+
+
+def test_validate_same_as_jsonschema(labware_definition):
+    labware_definition["parameters"]["format"] = "not-a-format"
+    schema = schema_validation.load_schema(schema_validation.LABWARE_SCHEMA_V2)
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(labware_definition, schema)
+    with pytest.raises(jsonschema.ValidationError) as error:
+        schema_validation.validate(
+            labware_definition, schema_validation.LABWARE_SCHEMA_V2
+        )
+
+    assert error.value.message == expected.value.message
+    assert list(error.value.path) == list(expected.value.path)
+
+
+def test_validate_remembers_valid_documents(labware_definition, monkeypatch):
+    schema_validation.validate(labware_definition, schema_validation.LABWARE_SCHEMA_V2)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not validate again")
+
+    monkeypatch.setattr(jsonschema.exceptions, "best_match", fail)
+    schema_validation.validate(
+        json.loads(json.dumps(labware_definition)),
+        schema_validation.LABWARE_SCHEMA_V2,
+    )
+
+    # but not documents that are different, or that were checked against a
+    # different schema
+    labware_definition["metadata"]["displayName"] = "Another plate"
+    with pytest.raises(AssertionError):
+        schema_validation.validate(
+            labware_definition, schema_validation.LABWARE_SCHEMA_V2
+        )
+    with pytest.raises(AssertionError):
+        schema_validation.validate(labware_definition, "protocol/schemas/5.json")
@@ -0,0 +1,52 @@
+"""Benchmark serializing and building every message payload.
+
+Builds each BinarySerializable payload class in the firmware bindings from
+a zeroed buffer and serializes it back, the way every CAN message going to
+and coming from the bus is encoded and decoded.
+"""
+import inspect
+import time
+from typing import Callable, List, Type
+
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.utils import BinarySerializable
+
+REPETITIONS = 10000
+
+
+def _payload_classes() -> List[Type[BinarySerializable]]:
+    return [
+        cls
+        for _, cls in inspect.getmembers(payloads, inspect.isclass)
+        if issubclass(cls, BinarySerializable) and cls.__module__ == payloads.__name__
+    ]
+
+
+def _time_us(description: str, func: Callable[[], object], count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        func()
+    elapsed = (time.perf_counter() - start) / (REPETITIONS * count)
+    print(f"binary serializable: {description}: {elapsed * 1e6:.2f} us")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    classes = _payload_classes()
+    buffers = [bytes(cls.get_size()) for cls in classes]
+    objects = [cls.build(data) for cls, data in zip(classes, buffers)]
+
+    _time_us(
+        f"build each of {len(classes)} payloads",
+        lambda: [cls.build(data) for cls, data in zip(classes, buffers)],
+        len(classes),
+    )
+    _time_us(
+        f"serialize each of {len(classes)} payloads",
+        lambda: [obj.serialize() for obj in objects],
+        len(classes),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Benchmark CanMessenger dispatch of incoming messages at bus saturation.
+
+Feeds a burst of move completed messages from a few nodes through a
+CanMessenger with many listeners registered, most of them waiting on other
+messages or other nodes, like the WaitableCallbacks of concurrent tasks.
+Listeners are either registered with a filter function, which is checked for
+every message, or routed on message id and originating node.
+"""
+import asyncio
+import time
+from typing import List
+
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    MessageListenerCallback,
+    MessageListenerCallbackFilter,
+)
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
+from opentrons_hardware.firmware_bindings.constants import MessageId, NodeId
+from opentrons_hardware.firmware_bindings.message import CanMessage
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    MoveCompletedPayload,
+)
+from opentrons_hardware.firmware_bindings.utils import (
+    Int32Field,
+    UInt8Field,
+    UInt32Field,
+)
+
+MESSAGE_COUNT = 20000
+LISTENER_COUNTS = [1, 10, 100]
+NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head_l, NodeId.head_r]
+OTHER_MESSAGE_IDS = [
+    MessageId.read_sensor_response,
+    MessageId.fw_update_data_ack,
+    MessageId.encoder_position_response,
+]
+
+
+class _FakeDriver(AbstractCanDriver):
+    """A driver that has received a burst of messages."""
+
+    def __init__(self, messages: List[CanMessage]) -> None:
+        self._messages = messages
+        self._index = 0
+        self.drained = asyncio.Event()
+
+    async def send(self, message: CanMessage) -> None:
+        pass
+
+    async def read(self) -> CanMessage:
+        if self._index == len(self._messages):
+            self.drained.set()
+            await asyncio.Event().wait()
+        message = self._messages[self._index]
+        self._index += 1
+        return message
+
+    def read_buffered(self) -> List[CanMessage]:
+        messages = self._messages[self._index :]
+        self._index = len(self._messages)
+        return messages
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _build_messages() -> List[CanMessage]:
+    data = MoveCompletedPayload(
+        group_id=UInt8Field(0),
+        seq_id=UInt8Field(0),
+        current_position_um=UInt32Field(0),
+        encoder_position_um=Int32Field(0),
+        ack_id=UInt8Field(0),
+    ).serialize()
+    return [
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.move_completed,
+                    node_id=NodeId.host,
+                    function_code=0,
+                    originating_node_id=NODES[i % len(NODES)],
+                )
+            ),
+            data=data,
+        )
+        for i in range(MESSAGE_COUNT)
+    ]
+
+
+def _make_listener() -> MessageListenerCallback:
+    def _listener(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+        pass
+
+    return _listener
+
+
+def _make_filter(message_id: int, node_id: int) -> MessageListenerCallbackFilter:
+    def _filter(arbitration_id: ArbitrationId) -> bool:
+        return bool(
+            arbitration_id.parts.message_id == message_id
+            and arbitration_id.parts.originating_node_id == node_id
+        )
+
+    return _filter
+
+
+def _add_listeners(messenger: CanMessenger, count: int, routed: bool) -> None:
+    # One listener wants the move completed messages of the gantry's X node,
+    # the rest want other messages
+    for i in range(count):
+        if i == 0:
+            message_id, node_id = MessageId.move_completed, NodeId.gantry_x
+        else:
+            message_id = OTHER_MESSAGE_IDS[i % len(OTHER_MESSAGE_IDS)]
+            node_id = NODES[i % len(NODES)]
+
+        if routed:
+            messenger.add_listener(
+                _make_listener(),
+                message_ids=[message_id],
+                originating_node_ids=[node_id],
+            )
+        else:
+            messenger.add_listener(_make_listener(), _make_filter(message_id, node_id))
+
+
+async def _time_dispatch(listener_count: int, routed: bool) -> None:
+    driver = _FakeDriver(_build_messages())
+    messenger = CanMessenger(driver=driver)
+    _add_listeners(messenger, listener_count, routed)
+
+    start = time.perf_counter()
+    messenger.start()
+    await driver.drained.wait()
+    elapsed = time.perf_counter() - start
+    await messenger.stop()
+
+    description = "routed" if routed else "filtered"
+    print(
+        f"can messenger: {listener_count} {description} listeners: "
+        f"{MESSAGE_COUNT / elapsed:.0f} messages/s"
+    )
+
+
+async def _main() -> None:
+    for listener_count in LISTENER_COUNTS:
+        for routed in (False, True):
+            await _time_dispatch(listener_count, routed)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark planning long trajectories with each move manager.
+
+Plans a 1000 segment trajectory of arcs between wells, which blends in a
+single iteration, and a 1000 segment trajectory between random points,
+which takes every iteration, with the MoveManager and the
+VectorizedMoveManager.
+"""
+import random
+import time
+from typing import List
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+    VectorizedMoveManager,
+)
+
+SEGMENTS = 1000
+AXES = ["X", "Y", "Z", "A"]
+ORIGIN = {"X": 0.0, "Y": 0.0, "Z": 0.0, "A": 0.0}
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=np.float64(1000),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=np.float64(1000),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=np.float64(100),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+    ),
+    "A": AxisConstraints.build(
+        max_acceleration=np.float64(100),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+    ),
+}
+
+
+def _arcs() -> List[MoveTarget[str]]:
+    targets = []
+    x, y = ORIGIN["X"], ORIGIN["Y"]
+    for i in range(SEGMENTS // 3):
+        # up out of the last well, over to the next one and down into it
+        targets.append(MoveTarget.build({"X": x, "Y": y, "Z": 100}, 500))
+        x, y = 10 + 9 * (i % 12), 10 + 9 * (i // 12 % 8)
+        targets.append(MoveTarget.build({"X": x, "Y": y, "Z": 100}, 500))
+        targets.append(MoveTarget.build({"X": x, "Y": y, "Z": 20}, 500))
+    return targets
+
+
+def _random_points() -> List[MoveTarget[str]]:
+    rng = random.Random(0)
+    return [
+        MoveTarget.build({k: rng.uniform(0, 300) for k in AXES}, 500)
+        for _ in range(SEGMENTS)
+    ]
+
+
+def _time(description: str, targets: List[MoveTarget[str]]) -> None:
+    for manager in (MoveManager(CONSTRAINTS), VectorizedMoveManager(CONSTRAINTS)):
+        start = time.perf_counter()
+        blended, blend_log = manager.plan_motion(ORIGIN, targets)
+        elapsed = time.perf_counter() - start
+        print(
+            f"motion planning: {len(targets)} segment {description} with "
+            f"{type(manager).__name__}: {elapsed * 1000:.1f} ms "
+            f"({len(blend_log)} iteration(s), blended: {blended})"
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    _time("arcs", _arcs())
+    _time("random points", _random_points())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark capturing a burst of sensor readings during a move.
+
+Delivers read sensor responses to the listener of the sensor scheduler's
+queue based capture, then to that of its ring buffer stream, the way the
+CanMessenger does while a capacitive pass is moving, and prints the time
+taken to capture the readings and to get their values out afterwards.
+"""
+import asyncio
+import time
+from typing import Any, Callable, cast, List, Tuple
+
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.can_messenger import MessageListenerCallback
+from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
+from opentrons_hardware.firmware_bindings.constants import (
+    NodeId,
+    SensorId,
+    SensorType,
+)
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    SensorIdField,
+    SensorTypeField,
+)
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    ReadFromSensorResponsePayload,
+)
+from opentrons_hardware.firmware_bindings.utils import Int32Field
+from opentrons_hardware.sensors.scheduler import SensorScheduler
+from opentrons_hardware.sensors.sensor_stream import SensorStream
+from opentrons_hardware.sensors.utils import SensorInformation
+
+SAMPLE_COUNT = 10000
+SENSOR = SensorInformation(
+    sensor_type=SensorType.capacitive,
+    sensor_id=SensorId.S0,
+    node_id=NodeId.pipette_left,
+)
+
+
+class _FakeMessenger:
+    """Just enough of a CanMessenger to hold the capture's listener."""
+
+    def __init__(self) -> None:
+        self.listeners: List[MessageListenerCallback] = []
+
+    def add_listener(self, listener: MessageListenerCallback, **kwargs: Any) -> None:
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: MessageListenerCallback) -> None:
+        self.listeners.remove(listener)
+
+    async def send(self, node_id: NodeId, message: Any) -> None:
+        pass
+
+
+def _build_responses() -> List[Tuple[ReadFromSensorResponse, ArbitrationId]]:
+    arbitration_id = ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=ReadFromSensorResponse.message_id,
+            node_id=NodeId.host,
+            originating_node_id=NodeId.pipette_left,
+            function_code=0,
+        )
+    )
+    return [
+        (
+            ReadFromSensorResponse(
+                payload=ReadFromSensorResponsePayload(
+                    sensor=SensorTypeField(SensorType.capacitive.value),
+                    sensor_id=SensorIdField(SensorId.S0),
+                    sensor_data=Int32Field(i << 8),
+                )
+            ),
+            arbitration_id,
+        )
+        for i in range(SAMPLE_COUNT)
+    ]
+
+
+def _deliver(
+    messenger: _FakeMessenger,
+    responses: List[Tuple[ReadFromSensorResponse, ArbitrationId]],
+) -> None:
+    for message, arbitration_id in responses:
+        for listener in messenger.listeners:
+            listener(message, arbitration_id)
+
+
+def _time(description: str, func: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(
+        f"sensor capture: {description}: {SAMPLE_COUNT} readings: "
+        f"{elapsed * 1000:.2f} ms"
+    )
+
+
+async def _capture_queue(
+    responses: List[Tuple[ReadFromSensorResponse, ArbitrationId]]
+) -> None:
+    messenger = _FakeMessenger()
+    capture = SensorScheduler().capture_output(SENSOR, cast(CanMessenger, messenger))
+    async with capture as output_queue:
+        _time("capture into a queue", lambda: _deliver(messenger, responses))
+
+    def _drain() -> List[float]:
+        values = []
+        while not output_queue.empty():
+            values.append(output_queue.get_nowait())
+        return values
+
+    _time("drain the queue", _drain)
+
+
+async def _capture_stream(
+    responses: List[Tuple[ReadFromSensorResponse, ArbitrationId]]
+) -> None:
+    messenger = _FakeMessenger()
+    capture = SensorScheduler().stream_output(
+        SENSOR, cast(CanMessenger, messenger), SensorStream(capacity=SAMPLE_COUNT)
+    )
+    async with capture as stream:
+        _time("capture into a stream", lambda: _deliver(messenger, responses))
+
+    _time("export the stream", lambda: stream.samples()["value"])
+    _time("export the stream as a list", lambda: stream.samples()["value"].tolist())
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    responses = _build_responses()
+    asyncio.run(_capture_queue(responses))
+    asyncio.run(_capture_stream(responses))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """The can bus transport."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import List
 from opentrons_hardware.firmware_bindings import CanMessage
 
 
@@ -31,6 +32,17 @@ class AbstractCanDriver(ABC):
         """
         ...
 
+    def read_buffered(self) -> List[CanMessage]:
+        """Read the messages that were already received, without waiting.
+
+        Drivers that buffer incoming messages should override this so that
+        readers can handle a burst of messages in one go.
+
+        Returns:
+            The buffered can messages, possibly none.
+        """
+        return []
+
     def __aiter__(self) -> AbstractCanDriver:
         """Enter iterator.
 
@@ -2,7 +2,17 @@
 from __future__ import annotations
 import asyncio
 from inspect import Traceback
-from typing import Optional, Callable, Tuple, Dict
+from itertools import count
+from typing import (
+    Optional,
+    Callable,
+    Tuple,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Type,
+)
 import logging
 
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -30,12 +40,27 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+_RouteKey = Tuple[Optional[int], Optional[int]]
+"""A message id and originating node id to route on. None matches any."""
+
+
+class _Registration(NamedTuple):
+    order: int
+    listener: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    routes: Tuple[_RouteKey, ...]
+
+
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
     The background task can be controlled with start/stop methods.
 
     To receive message notifications add a listener using add_listener
+
+    Listeners are routed on the message id and originating node id of incoming
+    messages, so a message is only checked against the listeners registered for
+    it. A message's payload is only built if at least one listener accepts it.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -45,10 +70,9 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
-        ] = {}
+        self._order = count()
+        self._listeners: Dict[MessageListenerCallback, _Registration] = {}
+        self._routes: Dict[_RouteKey, Dict[MessageListenerCallback, _Registration]] = {}
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
@@ -104,14 +128,51 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: The callback to call with accepted messages.
+            filter: Optional function to accept or reject each message.
+            message_ids: Only call the listener with messages of these ids.
+                If omitted, messages of any id are passed on.
+            originating_node_ids: Only call the listener with messages sent
+                by these nodes. If omitted, messages from any node are passed on.
+        """
+        self.remove_listener(listener)
+
+        message_keys: List[Optional[int]] = (
+            [None] if message_ids is None else [int(m) for m in message_ids]
+        )
+        node_keys: List[Optional[int]] = (
+            [None]
+            if originating_node_ids is None
+            else [int(n) for n in originating_node_ids]
+        )
+        registration = _Registration(
+            order=next(self._order),
+            listener=listener,
+            filter=filter,
+            routes=tuple((m, n) for m in message_keys for n in node_keys),
+        )
+
+        self._listeners[listener] = registration
+        for route in registration.routes:
+            self._routes.setdefault(route, {})[listener] = registration
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
-        if listener in self._listeners:
-            del self._listeners[listener]
+        registration = self._listeners.pop(listener, None)
+        if registration is None:
+            return
+
+        for route in registration.routes:
+            route_listeners = self._routes[route]
+            del route_listeners[listener]
+            if not route_listeners:
+                del self._routes[route]
 
     async def _read_task_shield(self) -> None:
         try:
@@ -125,24 +186,73 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
+            self._handle_message(message)
+            # Handle every message the driver has already received
+            # before waiting on the driver again.
+            for buffered in self._drive.read_buffered():
+                self._handle_message(buffered)
+
+    def _handle_message(self, message: CanMessage) -> None:
+        """Pass an incoming message on to the listeners that accept it."""
+        arbitration_id = message.arbitration_id
+        message_id = arbitration_id.parts.message_id
+        message_definition = _get_definition(message_id)
+        if message_definition is None:
+            log.error(f"Message {message} is not recognized.")
+            return
+
+        listeners = [
+            registration
+            for registration in self._route(
+                message_id, arbitration_id.parts.originating_node_id
+            )
+            if not registration.filter or registration.filter(arbitration_id)
+        ]
+        if not listeners:
+            return
+
+        try:
+            build = message_definition.payload_type.build(message.data)
+        except BinarySerializableException:
+            log.exception(f"Failed to build from {message}")
+            return
+
+        log.debug(
+            "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            build,
+        )
+        for registration in listeners:
+            registration.listener(
+                message_definition(payload=build), arbitration_id  # type: ignore[arg-type]
+            )
+
+    def _route(self, message_id: int, originating_node_id: int) -> List[_Registration]:
+        """Get the listeners registered for a message, in registration order."""
+        matches = [
+            route_listeners
+            for route_listeners in (
+                self._routes.get((message_id, originating_node_id)),
+                self._routes.get((message_id, None)),
+                self._routes.get((None, originating_node_id)),
+                self._routes.get((None, None)),
             )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+            if route_listeners
+        ]
+        if len(matches) == 1:
+            return list(matches[0].values())
+        return sorted(
+            (r for route_listeners in matches for r in route_listeners.values()),
+            key=lambda r: r.order,
+        )
+
+
+def _get_definition(message_id: int) -> Optional[Type[MessageDefinition]]:
+    """Get the message definition of a raw message id, if it is known."""
+    try:
+        return get_definition(MessageId(message_id))
+    except ValueError:
+        return None
 
 
 class WaitableCallback:
@@ -152,15 +262,23 @@ class WaitableCallback:
         self,
         messenger: CanMessenger,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Constructor.
 
         Args:
             messenger: Messenger to listen on.
             filter: Optional message filtering function
+            message_ids: Optional message ids to listen for
+            originating_node_ids: Optional nodes to listen to
         """
         self._messenger = messenger
         self._filter = filter
+        self._message_ids = None if message_ids is None else tuple(message_ids)
+        self._originating_node_ids = (
+            None if originating_node_ids is None else tuple(originating_node_ids)
+        )
         self._queue: asyncio.Queue[
             Tuple[MessageDefinition, ArbitrationId]
         ] = asyncio.Queue()
@@ -173,7 +291,12 @@ class WaitableCallback:
 
     def __enter__(self) -> WaitableCallback:
         """Enter context manager."""
-        self._messenger.add_listener(self, self._filter)
+        self._messenger.add_listener(
+            self,
+            self._filter,
+            message_ids=self._message_ids,
+            originating_node_ids=self._originating_node_ids,
+        )
         return self
 
     def __exit__(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import asyncio
 import platform
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, List
 
 from can import Notifier, Bus, AsyncBufferedReader, Message
 
@@ -48,6 +48,7 @@ class CanDriver(AbstractCanDriver):
         self._bus = bus
         self._loop = loop
         self._reader = AsyncBufferedReader(loop=loop)
+        self._error_frame: Optional[Message] = None
         self._notifier = Notifier(bus=self._bus, listeners=[self._reader], loop=loop)
 
     @classmethod
@@ -124,7 +125,10 @@ class CanDriver(AbstractCanDriver):
         Raises:
             ErrorFrameCanError
         """
-        m: Message = await self._reader.get_message()
+        if self._error_frame is not None:
+            m, self._error_frame = self._error_frame, None
+        else:
+            m = await self._reader.get_message()
         if m.is_error_frame:
             log.error("Error frame encountered")
             raise ErrorFrameCanError(message=repr(m))
@@ -132,3 +136,25 @@ class CanDriver(AbstractCanDriver):
         return CanMessage(
             arbitration_id=ArbitrationId(id=m.arbitration_id), data=m.data
         )
+
+    def read_buffered(self) -> List[CanMessage]:
+        """Read the messages that were already received, without waiting.
+
+        An error frame ends the batch, and is raised by the next read.
+
+        Returns:
+            The buffered can messages, possibly none.
+        """
+        messages = []
+        buffer = self._reader.buffer
+        while self._error_frame is None and not buffer.empty():
+            m: Message = buffer.get_nowait()
+            if m.is_error_frame:
+                self._error_frame = m
+            else:
+                messages.append(
+                    CanMessage(
+                        arbitration_id=ArbitrationId(id=m.arbitration_id), data=m.data
+                    )
+                )
+        return messages
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type
+from dataclasses import dataclass, fields
+from typing import TypeVar, Generic, Type, Tuple, Callable, Sequence, Any, ClassVar
 
 
 class BinarySerializableException(BaseException):
@@ -34,6 +34,8 @@ class BinaryFieldBase(Generic[T]):
     FORMAT = ""
     """The struct format string for this field."""
 
+    __slots__ = ("_t",)
+
     def __init__(self, t: T) -> None:
         """Constructor."""
         self._t = t
@@ -84,6 +86,8 @@ class BinaryFieldBase(Generic[T]):
 class IntFieldBase(BinaryFieldBase[int]):
     """Base class of integer fields."""
 
+    __slots__ = ()
+
     @classmethod
     def from_string(cls, t: str) -> IntFieldBase:
         """Create from string."""
@@ -95,48 +99,64 @@ class UInt64Field(IntFieldBase):
 
     FORMAT = "Q"
 
+    __slots__ = ()
+
 
 class Int64Field(IntFieldBase):
     """Signed 64-bit integer field."""
 
     FORMAT = "q"
 
+    __slots__ = ()
+
 
 class UInt32Field(IntFieldBase):
     """Unsigned 32-bit integer field."""
 
     FORMAT = "L"
 
+    __slots__ = ()
+
 
 class Int32Field(IntFieldBase):
     """Signed 32-bit integer field."""
 
     FORMAT = "l"
 
+    __slots__ = ()
+
 
 class UInt16Field(IntFieldBase):
     """Unsigned 16-bit integer field."""
 
     FORMAT = "H"
 
+    __slots__ = ()
+
 
 class Int16Field(IntFieldBase):
     """Signed 16-bit integer field."""
 
     FORMAT = "h"
 
+    __slots__ = ()
+
 
 class UInt8Field(IntFieldBase):
     """Unsigned 8-bit integer field."""
 
     FORMAT = "B"
 
+    __slots__ = ()
+
 
 class Int8Field(IntFieldBase):
     """Signed 8-bit integer field."""
 
     FORMAT = "b"
 
+    __slots__ = ()
+
 
 @dataclass
 class BinarySerializable:
@@ -151,16 +171,18 @@ class BinarySerializable:
     ENDIAN = ">"
     """The big endian format string"""
 
+    _codec: ClassVar[_Codec]
+    """The compiled codec of this class. Use _get_codec to access."""
+
     def serialize(self) -> bytes:
         """Serialize into a byte buffer.
 
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(*(f.value for f in codec.get_fields(self)))
         except struct.error as e:
             raise SerializationException(str(e))
 
@@ -181,16 +203,25 @@ class BinarySerializable:
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
-            # Mypy is not liking constructing the derived types.
-            return cls(**args)  # type: ignore[call-arg]
+            b = codec.struct.unpack_from(data)
         except struct.error as e:
             raise InvalidFieldException(str(e))
+        # Fields are passed positionally, in the order the dataclass declares them.
+        return cls(*(t(v) for t, v in zip(codec.field_types, b)))
+
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the compiled codec of this class, compiling it on first use."""
+        # Look in this class's own namespace so a subclass never uses the
+        # codec of its base class.
+        codec = cls.__dict__.get("_codec")
+        if codec is None:
+            codec = _Codec.compile(cls)
+            cls._codec = codec
+        return codec
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -212,7 +243,51 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().struct.size
+
+
+class _Codec:
+    """The precompiled packing and unpacking of a BinarySerializable class."""
+
+    def __init__(
+        self,
+        compiled: struct.Struct,
+        field_types: Sequence[Callable[[Any], BinaryFieldBase[Any]]],
+        get_fields: Callable[[BinarySerializable], Tuple[BinaryFieldBase[Any], ...]],
+    ) -> None:
+        self.struct = compiled
+        self.field_types = field_types
+        self.get_fields = get_fields
+
+    @classmethod
+    def compile(cls, serializable: Type[BinarySerializable]) -> _Codec:
+        """Compile the codec of a BinarySerializable class."""
+        dataclass_fields = fields(serializable)
+        names = tuple(f.name for f in dataclass_fields)
+        field_types = tuple(f.type for f in dataclass_fields)
+        if not all(
+            isinstance(t, type) and issubclass(t, BinaryFieldBase) for t in field_types
+        ):
+            raise InvalidFieldException(f"All fields must be of type {BinaryFieldBase}")
+
+        def _get_fields(obj: BinarySerializable) -> Tuple[BinaryFieldBase[Any], ...]:
+            return tuple(getattr(obj, name) for name in names)
+
+        return cls(
+            compiled=struct.Struct(serializable._get_format_string()),
+            # Calling the field type directly skips the build factory method,
+            # unless a field type overrides it.
+            field_types=tuple(
+                t if _inherits_build(t) else t.build for t in field_types
+            ),
+            get_fields=_get_fields,
+        )
+
+
+def _inherits_build(field_type: Type[BinaryFieldBase[Any]]) -> bool:
+    """Whether a field type builds its instances by calling its constructor."""
+    defining_class = next(c for c in field_type.__mro__ if "build" in vars(c))
+    return defining_class is BinaryFieldBase
 
 
 class LittleEndianMixIn:
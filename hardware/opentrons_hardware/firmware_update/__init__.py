@@ -6,7 +6,7 @@ from .initiator import (
 from .downloader import FirmwareUpdateDownloader
 from .hex_file import from_hex_file_path, from_hex_file, HexRecordProcessor
 from .eraser import FirmwareUpdateEraser
-from .run import run_update
+from .run import run_update, run_updates
 
 __all__ = [
     "FirmwareUpdateDownloader",
@@ -16,4 +16,5 @@ __all__ = [
     "from_hex_file",
     "HexRecordProcessor",
     "run_update",
+    "run_updates",
 ]
@@ -2,9 +2,11 @@
 import asyncio
 import binascii
 import logging
+from dataclasses import dataclass
+from typing import Dict
 
 from opentrons_hardware.firmware_bindings import NodeId
-from opentrons_hardware.firmware_bindings.constants import ErrorCode
+from opentrons_hardware.firmware_bindings.constants import ErrorCode, MessageId
 from opentrons_hardware.firmware_bindings.utils import UInt32Field
 
 from opentrons_hardware.drivers.can_bus.can_messenger import (
@@ -22,6 +24,22 @@ from opentrons_hardware.firmware_bindings.messages import (
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_WINDOW_SIZE = 4
+"""Default number of data chunks that may wait for an ACK at once."""
+
+DEFAULT_CHUNK_RETRY_COUNT = 3
+"""Default number of times to resend a data chunk that was not ACKed."""
+
+
+@dataclass
+class _PendingChunk:
+    """A data message that has not been ACKed yet."""
+
+    message: message_definitions.FirmwareUpdateData
+    deadline: float
+    retries: int = 0
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -34,23 +52,52 @@ class FirmwareUpdateDownloader:
         node_id: NodeId,
         hex_processor: HexRecordProcessor,
         ack_wait_seconds: float,
+        window_size: int = 1,
+        retry_count: int = 0,
     ) -> None:
         """Download hex record chunks to node.
 
+        Up to window_size data chunks are sent before waiting for an ACK, so
+        the download is not held up by a full round trip per chunk. ACKs are
+        matched to chunks by address, and a chunk that is not ACKed in time
+        is sent again, up to retry_count times. Once a chunk is ACKed, any
+        further ACKs of it are ignored, including errors that the node may
+        report for receiving it twice.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK
+            window_size: Number of data chunks that may wait for an ACK at once.
+            retry_count: Number of times to resend a data chunk that was not ACKed.
 
         Returns:
             None
         """
-        with WaitableCallback(self._messenger) as reader:
+        with WaitableCallback(
+            self._messenger,
+            message_ids=[
+                MessageId.fw_update_data_ack,
+                MessageId.fw_update_complete_ack,
+            ],
+            originating_node_ids=[node_id],
+        ) as reader:
+            loop = asyncio.get_running_loop()
+            pending: Dict[int, _PendingChunk] = {}
             num_messages = 0
             crc32 = 0
             for chunk in hex_processor.process(
                 fields.FirmwareUpdateDataField.NUM_BYTES
             ):
+                # Wait for room in the window.
+                await self._wait_data_message_acks(
+                    node_id=node_id,
+                    reader=reader,
+                    pending=pending,
+                    max_pending=window_size - 1,
+                    ack_wait_seconds=ack_wait_seconds,
+                    retry_count=retry_count,
+                )
                 logger.debug(
                     f"Sending chunk {num_messages} to address {chunk.address:x}."
                 )
@@ -62,17 +109,23 @@ class FirmwareUpdateDownloader:
                     )
                 )
                 await self._messenger.send(node_id=node_id, message=data_message)
-                try:
-                    # Wait for ack.
-                    await asyncio.wait_for(
-                        self._wait_data_message_ack(node_id, reader), ack_wait_seconds
-                    )
-                except asyncio.TimeoutError:
-                    raise TimeoutResponse(data_message)
+                pending[chunk.address] = _PendingChunk(
+                    message=data_message, deadline=loop.time() + ack_wait_seconds
+                )
 
                 crc32 = binascii.crc32(data, crc32)
                 num_messages += 1
 
+            # Wait for the rest of the data to be ACKed.
+            await self._wait_data_message_acks(
+                node_id=node_id,
+                reader=reader,
+                pending=pending,
+                max_pending=0,
+                ack_wait_seconds=ack_wait_seconds,
+                retry_count=retry_count,
+            )
+
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
                 payload=payloads.FirmwareUpdateComplete(
@@ -88,17 +141,54 @@ class FirmwareUpdateDownloader:
             except asyncio.TimeoutError:
                 raise TimeoutResponse(complete_message)
 
+    async def _wait_data_message_acks(
+        self,
+        node_id: NodeId,
+        reader: WaitableCallback,
+        pending: Dict[int, _PendingChunk],
+        max_pending: int,
+        ack_wait_seconds: float,
+        retry_count: int,
+    ) -> None:
+        """Wait until no more than max_pending data chunks are not ACKed."""
+        loop = asyncio.get_running_loop()
+        while len(pending) > max(max_pending, 0):
+            address, oldest = min(pending.items(), key=lambda p: p[1].deadline)
+            try:
+                ack = await asyncio.wait_for(
+                    self._wait_data_message_ack(node_id, reader),
+                    oldest.deadline - loop.time(),
+                )
+            except asyncio.TimeoutError:
+                if oldest.retries >= retry_count:
+                    raise TimeoutResponse(oldest.message)
+                logger.warning(f"Resending chunk to address {address:x}.")
+                await self._messenger.send(node_id=node_id, message=oldest.message)
+                oldest.deadline = loop.time() + ack_wait_seconds
+                oldest.retries += 1
+            else:
+                acked_address = ack.payload.address.value
+                # A chunk that was resent may be ACKed twice, so an ACK of a
+                # chunk that is no longer pending answers the duplicate.
+                if acked_address not in pending:
+                    logger.debug(f"Ignoring duplicate ACK of {acked_address:x}.")
+                    continue
+                if ack.payload.error_code.value != ErrorCode.ok:
+                    raise ErrorResponse(ack)
+                del pending[acked_address]
+
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
+    async def _wait_data_message_ack(
+        node_id: NodeId, reader: WaitableCallback
+    ) -> message_definitions.FirmwareUpdateDataAcknowledge:
         """Wait for response to data."""
-        async for response, arbitration_id in reader:
+        while True:
+            response, arbitration_id = await reader.read()
             if arbitration_id.parts.originating_node_id == node_id:
                 if isinstance(
                     response, message_definitions.FirmwareUpdateDataAcknowledge
                 ):
-                    if response.payload.error_code.value != ErrorCode.ok:
-                        raise ErrorResponse(response)
-                    break
+                    return response
 
     @staticmethod
     async def _wait_update_complete_ack(
@@ -1,6 +1,7 @@
 """Complete FW updater."""
+import asyncio
 import logging
-from typing import Optional, TextIO
+from typing import Dict, Optional, TextIO
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
 from opentrons_hardware.firmware_bindings import NodeId
@@ -13,6 +14,10 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateEraser,
     HexRecordProcessor,
 )
+from opentrons_hardware.firmware_update.downloader import (
+    DEFAULT_CHUNK_RETRY_COUNT,
+    DEFAULT_WINDOW_SIZE,
+)
 from opentrons_hardware.firmware_update.target import Target
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,8 @@ async def run_update(
     retry_count: int,
     timeout_seconds: float,
     erase: Optional[bool] = True,
+    window_size: int = 1,
+    chunk_retry_count: int = 0,
 ) -> None:
     """Perform a firmware update on a node target.
 
@@ -32,9 +39,12 @@ async def run_update(
         messenger: The can messenger to use.
         node_id: The node being updated.
         hex_file: File containing firmware.
-        retry_count: Number of times to retry.
+        retry_count: Number of times to retry starting the bootloader.
         timeout_seconds: How much to wait for responses.
         erase: Whether to erase flash before updating.
+        window_size: Number of data chunks that may wait for an ACK at once.
+        chunk_retry_count: Number of times to resend a data chunk that was
+            not ACKed.
 
     Returns:
         None
@@ -68,6 +78,8 @@ async def run_update(
         node_id=target.bootloader_node,
         hex_processor=hex_processor,
         ack_wait_seconds=timeout_seconds,
+        window_size=window_size,
+        retry_count=chunk_retry_count,
     )
 
     logger.info(f"Restarting FW on {target.system_node}.")
@@ -75,3 +87,59 @@ async def run_update(
         node_id=target.bootloader_node,
         message=FirmwareUpdateStartApp(),
     )
+
+
+async def run_updates(
+    messenger: CanMessenger,
+    hex_files: Dict[NodeId, TextIO],
+    retry_count: int,
+    timeout_seconds: float,
+    erase: Optional[bool] = True,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    chunk_retry_count: int = DEFAULT_CHUNK_RETRY_COUNT,
+) -> None:
+    """Perform firmware updates on several node targets at once.
+
+    The nodes are all on the bus of the one can messenger, and their updates
+    run concurrently through it, sharing its bandwidth. An update that fails
+    does not interrupt the others; once all of them are done, the first
+    failure is raised.
+
+    Args:
+        messenger: The can messenger to use.
+        hex_files: File containing firmware of each node being updated.
+        retry_count: Number of times to retry starting each bootloader.
+        timeout_seconds: How much to wait for responses.
+        erase: Whether to erase flash before updating.
+        window_size: Number of data chunks per node that may wait for an ACK
+            at once.
+        chunk_retry_count: Number of times to resend a data chunk that was
+            not ACKed.
+
+    Returns:
+        None
+    """
+    results = await asyncio.gather(
+        *(
+            run_update(
+                messenger=messenger,
+                node_id=node_id,
+                hex_file=hex_file,
+                retry_count=retry_count,
+                timeout_seconds=timeout_seconds,
+                erase=erase,
+                window_size=window_size,
+                chunk_retry_count=chunk_retry_count,
+            )
+            for node_id, hex_file in hex_files.items()
+        ),
+        return_exceptions=True,
+    )
+
+    errors = []
+    for node_id, result in zip(hex_files, results):
+        if isinstance(result, BaseException):
+            logger.error(f"FW Update on {node_id} failed: {result}")
+            errors.append(result)
+    if errors:
+        raise errors[0]
@@ -1,6 +1,7 @@
 """Motion planning package."""
 
 from .move_manager import MoveManager
+from .vectorized_manager import VectorizedMoveManager
 from .types import (
     Coordinates,
     Block,
@@ -15,6 +16,7 @@ from .move_utils import unit_vector_multiplication
 
 __all__ = [
     "MoveManager",
+    "VectorizedMoveManager",
     "Coordinates",
     "Block",
     "Move",
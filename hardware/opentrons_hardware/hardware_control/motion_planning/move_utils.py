@@ -492,6 +492,42 @@ def all_blended(
             return True
 
 
+def stoppable(
+    constraints: SystemConstraints[AxisKey], first: Move[AxisKey], second: Move[AxisKey]
+) -> bool:
+    """Check if the motors can stop at the junction of two moves."""
+    for axis in first.unit_vector.keys():
+        discont_limit = constraints[axis].max_speed_discont
+        final_speed = first.final_speed * first.unit_vector[axis]
+        initial_speed = second.initial_speed * second.unit_vector[axis]
+        if not (
+            check_less_or_close(discont_limit, final_speed)
+            and check_less_or_close(discont_limit, initial_speed)
+        ):
+            return False
+    return True
+
+
+def split_at_stops(
+    constraints: SystemConstraints[AxisKey], moves: List[Move[AxisKey]]
+) -> List[List[Move[AxisKey]]]:
+    """Split blended moves into segments that can each be run on their own.
+
+    A segment only ends where the motors can stop at the junction of
+    two moves, so that running each segment to completion before starting
+    the next does not break the speed discontinuity constraints.
+    """
+    if not moves:
+        return []
+    segments = [[moves[0]]]
+    for prev, current in zip(moves, moves[1:]):
+        if stoppable(constraints, prev, current):
+            segments.append([current])
+        else:
+            segments[-1].append(current)
+    return segments
+
+
 def unit_vector_multiplication(
     unit_vector: Coordinates[AxisKey, np.float64], value: np.float64
 ) -> Coordinates[AxisKey, np.float64]:
@@ -0,0 +1,509 @@
+"""Move manager that blends every move of a plan at once."""
+import dataclasses
+import logging
+from typing import Dict, Generic, List, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_manager import (
+    MoveManager,
+)
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+log = logging.getLogger(__name__)
+
+
+def _final_speed(
+    initial_speed: "NDArray[np.float64]",
+    acceleration: "NDArray[np.float64]",
+    distance: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get the final speeds of blocks, the same way as Block does."""
+    return np.sqrt(initial_speed**2 + acceleration * distance * 2)  # type: ignore[no-any-return]
+
+
+def _from_prev(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Get the values of the row before each row, or zeros for the first."""
+    shifted = np.zeros_like(values)
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _from_next(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Get the values of the row after each row, or zeros for the last."""
+    shifted = np.zeros_like(values)
+    shifted[:-1] = values[1:]
+    return shifted
+
+
+def _less_or_close(
+    constraint: "NDArray[np.float64]", input: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    """Evaluate whether each input is equal to or less than its constraint."""
+    return (np.abs(input) <= constraint) | np.isclose(input, constraint)  # type: ignore[no-any-return]
+
+
+@dataclasses.dataclass
+class _Blocks:
+    """The blocks of every move of a plan, a row per move.
+
+    Like build_blocks, a move whose acceleration and deceleration run past
+    its distance has its first and final block distances trimmed after
+    they are built, so the final speeds of those blocks are the speeds
+    before trimming.
+    """
+
+    initial_speed: "NDArray[np.float64]"
+    acceleration: "NDArray[np.float64]"
+    first_distance: "NDArray[np.float64]"
+    final_distance: "NDArray[np.float64]"
+    first_built_distance: "NDArray[np.float64]"
+    final_built_distance: "NDArray[np.float64]"
+    first_final_speed: "NDArray[np.float64]"
+    final_final_speed: "NDArray[np.float64]"
+    coast_distance: "NDArray[np.float64]"
+    coast_final_speed: "NDArray[np.float64]"
+    has_coast: "NDArray[np.bool_]"
+
+    @property
+    def move_initial_speed(self) -> "NDArray[np.float64]":
+        """The initial speed of each move, from its first block that moves."""
+        # the coast and final blocks both start at the first block's final speed
+        speed: "NDArray[np.float64]" = np.where(
+            self.first_distance != 0,
+            self.initial_speed,
+            np.where(
+                (self.coast_distance != 0) | (self.final_distance != 0),
+                self.first_final_speed,
+                0.0,
+            ),
+        )
+        return speed
+
+    @property
+    def move_final_speed(self) -> "NDArray[np.float64]":
+        """The final speed of each move, from its last block that moves."""
+        speed: "NDArray[np.float64]" = np.where(
+            self.final_distance != 0,
+            self.final_final_speed,
+            np.where(
+                self.coast_distance != 0,
+                self.coast_final_speed,
+                np.where(self.first_distance != 0, self.first_final_speed, 0.0),
+            ),
+        )
+        return speed
+
+    @property
+    def distance(self) -> "NDArray[np.float64]":
+        """The sum of the block distances of each move."""
+        return self.first_distance + self.coast_distance + self.final_distance
+
+
+class VectorizedMoveManager(MoveManager[AxisKey]):
+    """A move manager that blends every move of a plan at once.
+
+    The unit vectors, constraints and block parameters of the moves are
+    kept as arrays with a row for each move and a column for each axis,
+    so a blending iteration is a fixed number of array operations instead
+    of a loop over every axis of every move. It plans the same moves as
+    MoveManager, and only builds Move objects for the blend log once
+    blending is done.
+    """
+
+    def plan_motion(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int = 10,
+    ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+        """Create and blend moves from targets."""
+        self._clear_blend_log()
+        assert target_list, "Check target list"
+        plan = _Plan.build(origin, target_list, self._constraints)
+        move_initial_speed = plan.max_speed
+        move_final_speed = _final_speed(
+            plan.max_speed, np.zeros_like(plan.max_speed), plan.distance / 3
+        )
+        iterations: List[_Blocks] = []
+        for i in range(iteration_limit):
+            log.debug(f"Motion blending iteration: {i}")
+            blocks = plan.blend(move_initial_speed, move_final_speed)
+            iterations.append(blocks)
+            if plan.all_blended(blocks):
+                self._blend_log = [
+                    plan.to_moves(b, wrap=b is not blocks) for b in iterations
+                ]
+                log.info(
+                    f"built {len(plan.distance)} moves with "
+                    f"{sum(m.nonzero_blocks for m in self._blend_log[-1])} "
+                    f"non-zero blocks after {i+1} iteration(s)"
+                )
+                return True, self._blend_log
+            move_initial_speed = blocks.move_initial_speed
+            move_final_speed = blocks.move_final_speed
+        self._blend_log = [plan.to_moves(b, wrap=True) for b in iterations]
+        log.error("Could not converge!")
+        return False, self._blend_log
+
+
+@dataclasses.dataclass
+class _Plan(Generic[AxisKey]):
+    """The parts of the moves of a plan that blending does not change."""
+
+    axes: List[AxisKey]
+    unit_vector: "NDArray[np.float64]"
+    distance: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+    prev_component: "NDArray[np.float64]"
+    next_component: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+    max_acceleration: "NDArray[np.float64]"
+    acceleration: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        constraints: SystemConstraints[AxisKey],
+    ) -> "_Plan[AxisKey]":
+        """Build the moves between the targets, like targets_to_moves."""
+        all_axes: Set[AxisKey] = set()
+        for target in target_list:
+            all_axes.update(set(target.position.keys()))
+        axes = list(all_axes)
+
+        positions = np.array(
+            [[np.float64(origin.get(k, 0)) for k in axes]]
+            + [
+                [np.float64(target.position.get(k, 0)) for k in axes]
+                for target in target_list
+            ],
+            dtype=np.float64,
+        ).reshape(len(target_list) + 1, len(axes))
+        displacement = positions[1:] - positions[:-1]
+        distance = np.linalg.norm(displacement, axis=1)  # type: ignore[no-untyped-call]
+        zero_length = (distance == 0) | np.all(displacement == 0, axis=1)
+        if np.any(zero_length):
+            index = int(np.argmax(zero_length))
+            raise ZeroLengthMoveError(
+                dict(zip(axes, positions[index])), dict(zip(axes, positions[index + 1]))
+            )
+        unit_vector = displacement / distance[:, np.newaxis]
+
+        # a move too short to move along shows no direction to its neighbors
+        component = np.where(
+            (distance > FLOAT_THRESHOLD)[:, np.newaxis], unit_vector, 0.0
+        )
+
+        max_acceleration = np.array([constraints[k].max_acceleration for k in axes])
+        # like build_blocks, find the largest acceleration along each move
+        # that keeps each axis within its own acceleration limit
+        axis_max_acceleration = np.where(unit_vector != 0, max_acceleration, 0.0)
+        magnitude = np.linalg.norm(axis_max_acceleration, axis=1)  # type: ignore[no-untyped-call]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(
+                unit_vector != 0,
+                axis_max_acceleration / np.abs(magnitude[:, np.newaxis] * unit_vector),
+                np.inf,
+            )
+        scale = np.minimum(scale.min(axis=1), 1.0)
+        acceleration = np.linalg.norm(  # type: ignore[no-untyped-call]
+            (magnitude * scale)[:, np.newaxis] * unit_vector, axis=1
+        )
+
+        return cls(
+            axes=axes,
+            unit_vector=unit_vector,
+            distance=distance,
+            max_speed=np.array([t.max_speed for t in target_list], dtype=np.float64),
+            prev_component=_from_prev(component),
+            next_component=_from_next(component),
+            max_speed_discont=np.array(
+                [constraints[k].max_speed_discont for k in axes]
+            ),
+            max_direction_change_speed_discont=np.array(
+                [constraints[k].max_direction_change_speed_discont for k in axes]
+            ),
+            max_acceleration=max_acceleration,
+            acceleration=acceleration,
+        )
+
+    def blend(
+        self,
+        move_initial_speed: "NDArray[np.float64]",
+        move_final_speed: "NDArray[np.float64]",
+    ) -> _Blocks:
+        """Build every move from the speeds of the moves around it."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            initial_speed = self._initial_speed(move_initial_speed, move_final_speed)
+            final_speed = self._final_speed(move_initial_speed, move_final_speed)
+            final_speed = self._achievable_final(initial_speed, final_speed)
+            return self._build_blocks(initial_speed, final_speed)
+
+    def _initial_speed(
+        self,
+        move_initial_speed: "NDArray[np.float64]",
+        move_final_speed: "NDArray[np.float64]",
+    ) -> "NDArray[np.float64]":
+        """Get the initial speeds of the moves, like find_initial_speed."""
+        prev_final_speed = _from_prev(move_final_speed)
+        initial_speed = move_initial_speed
+        # each axis is checked against the speed the axes before it allowed
+        for i in range(len(self.axes)):
+            axis_component = self.unit_vector[:, i]
+            prev_component = self.prev_component[:, i]
+            stopped = (prev_component == 0) | (prev_final_speed == 0)
+            same_direction = prev_component * axis_component > 0
+            axis_constrained_speed = np.abs(
+                np.where(
+                    stopped,
+                    self.max_speed_discont[i],
+                    np.where(
+                        same_direction,
+                        np.maximum(
+                            np.abs(prev_final_speed * prev_component),
+                            self.max_speed_discont[i],
+                        ),
+                        self.max_direction_change_speed_discont[i],
+                    ),
+                )
+                / axis_component
+            )
+            initial_speed = np.where(
+                np.abs(axis_component * initial_speed) < FLOAT_THRESHOLD,
+                initial_speed,
+                np.minimum(axis_constrained_speed, initial_speed),
+            )
+        return initial_speed
+
+    def _final_speed(
+        self,
+        move_initial_speed: "NDArray[np.float64]",
+        move_final_speed: "NDArray[np.float64]",
+    ) -> "NDArray[np.float64]":
+        """Get the final speeds of the moves, like find_final_speed."""
+        next_initial_speed = _from_next(move_initial_speed)
+        final_speed = move_final_speed
+        for i in range(len(self.axes)):
+            axis_component = self.unit_vector[:, i]
+            next_component = self.next_component[:, i]
+            stopping = (next_component == 0) | (next_initial_speed == 0)
+            same_direction = next_component * axis_component > 0
+            axis_speed_limit = np.abs(
+                np.where(
+                    stopping,
+                    self.max_speed_discont[i],
+                    np.where(
+                        same_direction,
+                        np.maximum(
+                            self.max_speed_discont[i],
+                            np.abs(next_initial_speed * next_component),
+                        ),
+                        self.max_direction_change_speed_discont[i],
+                    ),
+                )
+                / axis_component
+            )
+            final_speed = np.where(
+                np.abs(axis_component * final_speed) < FLOAT_THRESHOLD,
+                final_speed,
+                np.minimum(axis_speed_limit, final_speed),
+            )
+        return final_speed
+
+    def _achievable_final(
+        self,
+        initial_speed: "NDArray[np.float64]",
+        final_speed: "NDArray[np.float64]",
+    ) -> "NDArray[np.float64]":
+        """Cap the final speeds of the moves, like achievable_final."""
+        for i in range(len(self.axes)):
+            axis_component = self.unit_vector[:, i]
+            # using the equation v_f^2  = v_i^2 + 2as
+            max_axis_final_velocity_sq = (
+                initial_speed * axis_component
+            ) ** 2 + 2 * self.max_acceleration[i] * self.distance
+            max_axis_final_velocity = (
+                np.copysign(
+                    np.sqrt(max_axis_final_velocity_sq) / axis_component,
+                    final_speed - initial_speed,
+                )
+                + initial_speed
+            )
+            final_speed = np.where(
+                axis_component != 0,
+                np.copysign(
+                    np.minimum(np.abs(max_axis_final_velocity), np.abs(final_speed)),
+                    final_speed,
+                ),
+                final_speed,
+            )
+        return final_speed
+
+    def _build_blocks(
+        self,
+        initial_speed: "NDArray[np.float64]",
+        final_speed: "NDArray[np.float64]",
+    ) -> _Blocks:
+        """Build the blocks of the moves, like build_blocks."""
+        for speed, name in ((initial_speed, "initial"), (final_speed, "final")):
+            too_fast = ~(
+                (np.abs(speed) <= self.max_speed)
+                | np.isclose(np.abs(speed), self.max_speed)
+            )
+            if np.any(too_fast):
+                index = int(np.argmax(too_fast))
+                raise AssertionError(
+                    f"{name} speed {speed[index]} exceeds max speed "
+                    f"{self.max_speed[index]}"
+                )
+
+        acceleration = self.acceleration
+        initial_speed_sq: "NDArray[np.float64]" = initial_speed**2
+        final_speed_sq: "NDArray[np.float64]" = final_speed**2
+        max_achievable_speed = np.sqrt(
+            0.5 * (2 * acceleration * self.distance + initial_speed_sq + final_speed_sq)
+        )
+        max_speed_sq = np.minimum(max_achievable_speed, self.max_speed) ** 2
+
+        first_distance = np.abs(max_speed_sq - initial_speed_sq) / (2 * acceleration)
+        first_final_speed = _final_speed(initial_speed, acceleration, first_distance)
+        final_distance = np.abs(max_speed_sq - final_speed_sq) / (2 * acceleration)
+        final_final_speed = _final_speed(
+            first_final_speed, -acceleration, final_distance
+        )
+
+        # trim the top speed of triangle moves that overran their distance
+        trimmed = first_distance + final_distance > (self.distance + FLOAT_THRESHOLD)
+        trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+        trimmed_first_distance = np.where(
+            trimmed,
+            np.abs(trimmed_speed_sq - initial_speed_sq) / (2 * acceleration),
+            first_distance,
+        )
+        trimmed_final_distance = np.where(
+            trimmed,
+            np.abs(trimmed_speed_sq - final_speed_sq) / (2 * acceleration),
+            final_distance,
+        )
+
+        has_coast = trimmed_first_distance + trimmed_final_distance < (
+            self.distance - FLOAT_THRESHOLD
+        )
+        coast_distance = np.where(
+            has_coast,
+            self.distance - trimmed_first_distance - trimmed_final_distance,
+            0.0,
+        )
+        coast_final_speed = np.where(
+            has_coast,
+            _final_speed(
+                first_final_speed, np.zeros_like(acceleration), coast_distance
+            ),
+            0.0,
+        )
+        return _Blocks(
+            initial_speed=initial_speed,
+            acceleration=acceleration,
+            first_distance=trimmed_first_distance,
+            final_distance=trimmed_final_distance,
+            first_built_distance=first_distance,
+            final_built_distance=final_distance,
+            first_final_speed=first_final_speed,
+            final_final_speed=final_final_speed,
+            coast_distance=coast_distance,
+            coast_final_speed=coast_final_speed,
+            has_coast=has_coast,
+        )
+
+    def all_blended(self, blocks: _Blocks) -> bool:
+        """Check if the moves are all blended, like all_blended."""
+        if len(self.distance) < 2:
+            return True
+        block_distance = blocks.distance
+        if np.any(
+            (np.abs(block_distance - self.distance) > FLOAT_THRESHOLD)
+            | ~np.isclose(block_distance, self.distance)
+        ):
+            return False
+
+        first = self.unit_vector[:-1]
+        second = self.unit_vector[1:]
+        final_speed = blocks.final_final_speed[:-1, np.newaxis] * first
+        initial_speed = blocks.initial_speed[1:, np.newaxis] * second
+        same_direction_blended = (
+            (np.abs(initial_speed - final_speed) < FLOAT_THRESHOLD)
+            | _less_or_close(self.max_speed_discont, final_speed)
+            | _less_or_close(self.max_speed_discont, initial_speed)
+        )
+        direction_change_blended: "NDArray[np.bool_]" = _less_or_close(
+            self.max_direction_change_speed_discont, final_speed
+        ) | _less_or_close(self.max_direction_change_speed_discont, initial_speed)
+        return bool(
+            np.all(
+                np.where(
+                    first * second > 0,
+                    same_direction_blended,
+                    direction_change_blended,
+                )
+            )
+        )
+
+    def to_moves(self, blocks: _Blocks, wrap: bool) -> List[Move[AxisKey]]:
+        """Build the Moves of an iteration, optionally between dummy moves."""
+        unit_vectors: List[Dict[AxisKey, np.float64]] = [
+            dict(zip(self.axes, row)) for row in self.unit_vector
+        ]
+        moves = []
+        for i, unit_vector in enumerate(unit_vectors):
+            acceleration = blocks.acceleration[i]
+            first = Block(
+                distance=blocks.first_built_distance[i],
+                initial_speed=blocks.initial_speed[i],
+                acceleration=acceleration,
+            )
+            final = Block(
+                distance=blocks.final_built_distance[i],
+                initial_speed=first.final_speed,
+                acceleration=-acceleration,
+            )
+            # trimming only changes the distances, as in build_blocks
+            first.distance = blocks.first_distance[i]
+            final.distance = blocks.final_distance[i]
+            if blocks.has_coast[i]:
+                coast = Block(
+                    initial_speed=final.initial_speed,
+                    acceleration=np.float64(0),
+                    distance=blocks.coast_distance[i],
+                )
+            else:
+                coast = Block(np.float64(0), np.float64(0), np.float64(0))
+            moves.append(
+                Move(
+                    unit_vector=unit_vector,
+                    distance=self.distance[i],
+                    max_speed=self.max_speed[i],
+                    blocks=(first, coast, final),
+                )
+            )
+        if wrap:
+            return [Move.build_dummy(self.axes)] + moves + [Move.build_dummy(self.axes)]
+        return moves
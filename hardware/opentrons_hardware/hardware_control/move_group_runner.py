@@ -2,11 +2,11 @@
 import asyncio
 from collections import defaultdict
 import logging
-from typing import List, Set, Tuple, Iterator, Union
+from typing import Awaitable, Callable, List, Optional, Set, Tuple, Iterator, Union
 import numpy as np
 
 from opentrons_hardware.firmware_bindings import ArbitrationId
-from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.firmware_bindings.constants import NodeId, MessageId
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
@@ -60,15 +60,20 @@ _Completions = List[_CompletionPacket]
 class MoveGroupRunner:
     """A move command scheduler."""
 
-    def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
+    def __init__(
+        self, move_groups: MoveGroups, start_at_index: int = 0, prefetch: bool = False
+    ) -> None:
         """Constructor.
 
         Args:
             move_groups: The move groups to run.
             start_at_index: The index the MoveGroupManager will start at
+            prefetch: Only send the first group before execution starts, and
+                send each following group while the one before it executes.
         """
         self._move_groups = move_groups
         self._start_at_index = start_at_index
+        self._prefetch = prefetch
         self._is_prepped: bool = False
 
     @staticmethod
@@ -90,7 +95,10 @@ class MoveGroupRunner:
             log.debug("No moves. Nothing to do.")
             return
         await self._clear_groups(can_messenger)
-        await self._send_groups(can_messenger)
+        if self._prefetch:
+            await self._send_group(can_messenger, 0)
+        else:
+            await self._send_groups(can_messenger)
         self._is_prepped = True
 
     async def execute(
@@ -173,15 +181,24 @@ class MoveGroupRunner:
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=self._get_message_type(
-                            step, group_i + self._start_at_index, seq_i
-                        ),
-                    )
+        for group_i in range(len(self._move_groups)):
+            await self._send_group(can_messenger, group_i)
+
+    async def _send_group(self, can_messenger: CanMessenger, group_i: int) -> None:
+        """Send commands to set up a single message group."""
+        for seq_i, sequence in enumerate(self._move_groups[group_i]):
+            for node, step in sequence.items():
+                await can_messenger.send(
+                    node_id=node,
+                    message=self._get_message_type(
+                        step, group_i + self._start_at_index, seq_i
+                    ),
+                )
+
+    async def _send_next_group(self, can_messenger: CanMessenger, group_i: int) -> None:
+        """Send the group after group_i, if there is one."""
+        if group_i + 1 < len(self._move_groups):
+            await self._send_group(can_messenger, group_i + 1)
 
     def _convert_velocity(
         self, velocity: Union[float, np.float64], interrupts: int
@@ -276,8 +293,20 @@ class MoveGroupRunner:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups)
         try:
-            can_messenger.add_listener(scheduler)
-            completions = await scheduler.run(can_messenger)
+            can_messenger.add_listener(
+                scheduler,
+                message_ids=[
+                    MessageId.move_completed,
+                    MessageId.do_self_contained_tip_action_response,
+                ],
+            )
+            if self._prefetch:
+                completions = await scheduler.run(
+                    can_messenger,
+                    lambda group_i: self._send_next_group(can_messenger, group_i),
+                )
+            else:
+                completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
         return completions
@@ -371,8 +400,18 @@ class MoveScheduler:
             self._remove_move_group(message, arbitration_id)
             self._handle_tip_action(message)
 
-    async def run(self, can_messenger: CanMessenger) -> _Completions:
-        """Start each move group after the prior has completed."""
+    async def run(
+        self,
+        can_messenger: CanMessenger,
+        after_execute: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> _Completions:
+        """Start each move group after the prior has completed.
+
+        Args:
+            can_messenger: a can messenger
+            after_execute: Optionally called with the id of each group once
+                it is executing, before waiting for it to complete.
+        """
         for group_id in range(len(self._moves)):
             self._event.clear()
 
@@ -389,6 +428,8 @@ class MoveScheduler:
                     )
                 ),
             )
+            if after_execute:
+                await after_execute(group_id)
 
             try:
                 # TODO: The max here can be removed once can_driver.send() no longer
@@ -1,6 +1,5 @@
 """Functions for commanding motion limited by tool sensors."""
-import asyncio
-from typing import Union, List, Iterator, Tuple
+from typing import Optional, Union, List, Tuple
 from logging import getLogger
 from numpy import float64
 from math import copysign
@@ -12,6 +11,7 @@ from opentrons_hardware.firmware_bindings.constants import (
     SensorThresholdMode,
 )
 from opentrons_hardware.sensors.scheduler import SensorScheduler
+from opentrons_hardware.sensors.sensor_stream import SensorStream
 from opentrons_hardware.sensors.utils import (
     SensorInformation,
     SensorThresholdInformation,
@@ -48,6 +48,7 @@ async def capacitive_probe(
     speed: float,
     relative_threshold_pf: float = 1.0,
     log_sensor_values: bool = False,
+    stream: Optional[SensorStream] = None,
 ) -> Tuple[float, float]:
     """Move the specified tool down until its capacitive sensor triggers.
 
@@ -56,6 +57,9 @@ async def capacitive_probe(
 
     The direction is sgn(distance)*sgn(speed), so you can set the direction
     either by negating speed or negating distance.
+
+    If a stream is given, the sensor's readings are captured into it during
+    the move, and it is closed once the move is done.
     """
     sensor_scheduler = SensorScheduler()
     threshold = await sensor_scheduler.send_threshold(
@@ -79,6 +83,7 @@ async def capacitive_probe(
         ),
         messenger,
         log=log_sensor_values,
+        stream=stream,
     ):
         position = await runner.run(can_messenger=messenger)
         return position[mover]
@@ -90,8 +95,15 @@ async def capacitive_pass(
     mover: NodeId,
     distance: float,
     speed: float,
+    stream: Optional[SensorStream] = None,
 ) -> List[float]:
-    """Move the specified axis while capturing capacitive sensor readings."""
+    """Move the specified axis while capturing capacitive sensor readings.
+
+    The readings are captured into the given stream, or a new growable one
+    that keeps every reading however long the pass is. The stream can be
+    iterated over during the move and is closed once the move is done.
+    Returns the values of the readings left in the stream.
+    """
     sensor_scheduler = SensorScheduler()
     sensor = SensorInformation(
         sensor_type=SensorType.capacitive, sensor_id=SensorId.S0, node_id=tool
@@ -99,14 +111,13 @@ async def capacitive_pass(
     pass_group = _build_pass_step(mover, distance, speed)
     runner = MoveGroupRunner(move_groups=[[pass_group]])
     await runner.prep(messenger)
-    async with sensor_scheduler.capture_output(sensor, messenger) as output_queue:
+    if stream is None:
+        stream = SensorStream(growable=True)
+    async with sensor_scheduler.stream_output(sensor, messenger, stream) as output:
         await runner.execute(messenger)
 
-    def _drain() -> Iterator[float]:
-        while True:
-            try:
-                yield output_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-    return list(_drain())
+    if output.overwritten:
+        LOG.warning(
+            f"capacitive pass overwrote the first {output.overwritten} readings"
+        )
+    return output.samples()["value"].tolist()  # type: ignore[no-any-return]
@@ -0,0 +1,100 @@
+"""Firmware update script for several subsystems at once."""
+import argparse
+import asyncio
+import logging
+from logging.config import dictConfig
+
+from opentrons_hardware.drivers.can_bus import build
+from opentrons_hardware.firmware_update.downloader import (
+    DEFAULT_CHUNK_RETRY_COUNT,
+    DEFAULT_WINDOW_SIZE,
+)
+from opentrons_hardware.firmware_update.run import run_updates
+from .can_args import add_can_args, build_settings
+from .update_fw import LOG_CONFIG, TARGETS
+
+
+logger = logging.getLogger(__name__)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Entry point for script."""
+    hex_files = {TARGETS[target]: hex_file for target, hex_file in args.update}
+
+    async with build.can_messenger(build_settings(args)) as messenger:
+        await run_updates(
+            messenger=messenger,
+            hex_files=hex_files,
+            retry_count=args.retry_count,
+            timeout_seconds=args.timeout_seconds,
+            erase=not args.no_erase,
+            window_size=args.window_size,
+            chunk_retry_count=args.chunk_retry_count,
+        )
+
+    logger.info("Done")
+
+
+def main() -> None:
+    """Entry point."""
+    dictConfig(LOG_CONFIG)
+
+    parser = argparse.ArgumentParser(description="FW Update of several subsystems.")
+    add_can_args(parser)
+
+    parser.add_argument(
+        "--update",
+        help="A FW subsystem to be updated and the path to the hex file "
+        "containing its FW executable. May be repeated.",
+        nargs=2,
+        metavar=("TARGET", "FILE"),
+        action="append",
+        required=True,
+    )
+    parser.add_argument(
+        "--retry-count",
+        help="Number of times to retry bootloader detection.",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
+    )
+    parser.add_argument(
+        "--window-size",
+        help="Number of data chunks per subsystem that may wait for an ACK.",
+        type=int,
+        default=DEFAULT_WINDOW_SIZE,
+    )
+    parser.add_argument(
+        "--chunk-retry-count",
+        help="Number of times to resend a data chunk that was not ACKed.",
+        type=int,
+        default=DEFAULT_CHUNK_RETRY_COUNT,
+    )
+    parser.add_argument(
+        "--no-erase",
+        help="Don't erase existing application from flash.",
+        action="store_true",
+        default=False,
+    )
+
+    args = parser.parse_args()
+    updates = []
+    for target, path in args.update:
+        if target not in TARGETS:
+            parser.error(
+                f"argument --update: invalid target '{target}' "
+                f"(choose from {', '.join(TARGETS)})"
+            )
+        try:
+            updates.append((target, argparse.FileType("r")(path)))
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"argument --update: {e}")
+    args.update = updates
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Sensor driver message scheduler."""
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
 from typing import Optional, Type, TypeVar, Callable, AsyncIterator, cast
@@ -16,6 +17,7 @@ from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 
 from opentrons_hardware.drivers.can_bus.can_messenger import (
     CanMessenger,
+    MessageListenerCallback,
     WaitableCallback,
 )
 
@@ -53,7 +55,9 @@ from opentrons_hardware.sensors.utils import (
     PollSensorInformation,
     SensorThresholdInformation,
     SensorInformation,
+    sensor_fixed_point_conversion,
 )
+from opentrons_hardware.sensors.sensor_stream import SensorStream
 from opentrons_hardware.firmware_bindings.utils import (
     UInt8Field,
     UInt16Field,
@@ -274,6 +278,20 @@ class SensorScheduler:
                 f"{SensorDataType.build(message.payload.sensor_data).to_float()}"
             )
 
+    @staticmethod
+    def _stream_listener(stream: SensorStream) -> MessageListenerCallback:
+        def _listener(message: MessageDefinition, arb_id: ArbitrationId) -> None:
+            payload = cast(ReadFromSensorResponse, message).payload
+            # Convert the fixed point value directly, rather than through
+            # SensorDataType, since this runs for every sample
+            stream.push(
+                time.monotonic(),
+                arb_id.parts.originating_node_id,
+                payload.sensor_data.value / sensor_fixed_point_conversion,
+            )
+
+        return _listener
+
     @asynccontextmanager
     async def bind_sync(
         self,
@@ -281,11 +299,24 @@ class SensorScheduler:
         can_messenger: CanMessenger,
         timeout: float = 0.5,
         log: bool = False,
+        stream: Optional[SensorStream] = None,
     ) -> AsyncIterator[None]:
-        """While acquired, bind the specified sensor to control sync."""
+        """While acquired, bind the specified sensor to control sync.
+
+        If a stream is given, the sensor's output is also captured into it,
+        and the stream is closed on release.
+        """
         flags = [SensorOutputBinding.sync]
-        if log:
+        if log or stream is not None:
             flags.append(SensorOutputBinding.report)
+        stream_listener: Optional[MessageListenerCallback] = None
+        if stream is not None:
+            stream_listener = self._stream_listener(stream)
+            can_messenger.add_listener(
+                stream_listener,
+                message_ids=[MessageId.read_sensor_response],
+                originating_node_ids=[target_sensor.node_id],
+            )
         await can_messenger.send(
             node_id=target_sensor.node_id,
             message=BindSensorOutputRequest(
@@ -303,6 +334,57 @@ class SensorScheduler:
         finally:
             if log:
                 can_messenger.remove_listener(self._log_sensor_output)
+            if stream is not None and stream_listener is not None:
+                can_messenger.remove_listener(stream_listener)
+                stream.close()
+            await can_messenger.send(
+                node_id=target_sensor.node_id,
+                message=BindSensorOutputRequest(
+                    payload=BindSensorOutputRequestPayload(
+                        sensor=SensorTypeField(target_sensor.sensor_type),
+                        sensor_id=SensorIdField(target_sensor.sensor_id),
+                        binding=SensorOutputBindingField(
+                            SensorOutputBinding.none.value
+                        ),
+                    )
+                ),
+            )
+
+    @asynccontextmanager
+    async def stream_output(
+        self,
+        target_sensor: SensorInformation,
+        can_messenger: CanMessenger,
+        stream: Optional[SensorStream] = None,
+    ) -> AsyncIterator[SensorStream]:
+        """While acquired, capture the sensor's logging output into a stream.
+
+        The samples can be iterated over while the stream is acquired, and
+        the stream is closed on release.
+        """
+        if stream is None:
+            stream = SensorStream()
+        stream_listener = self._stream_listener(stream)
+        can_messenger.add_listener(
+            stream_listener,
+            message_ids=[MessageId.read_sensor_response],
+            originating_node_ids=[target_sensor.node_id],
+        )
+        await can_messenger.send(
+            node_id=target_sensor.node_id,
+            message=BindSensorOutputRequest(
+                payload=BindSensorOutputRequestPayload(
+                    sensor=SensorTypeField(target_sensor.sensor_type),
+                    sensor_id=SensorIdField(target_sensor.sensor_id),
+                    binding=SensorOutputBindingField(SensorOutputBinding.report.value),
+                )
+            ),
+        )
+        try:
+            yield stream
+        finally:
+            can_messenger.remove_listener(stream_listener)
+            stream.close()
             await can_messenger.send(
                 node_id=target_sensor.node_id,
                 message=BindSensorOutputRequest(
@@ -333,16 +415,11 @@ class SensorScheduler:
                 SensorDataType.build(payload.sensor_data).to_float()
             )
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-            )
-
-        can_messenger.add_listener(_logging_listener, _filter)
+        can_messenger.add_listener(
+            _logging_listener,
+            message_ids=[MessageId.read_sensor_response],
+            originating_node_ids=[target_sensor.node_id],
+        )
         await can_messenger.send(
             node_id=target_sensor.node_id,
             message=BindSensorOutputRequest(
@@ -0,0 +1,204 @@
+"""Streaming capture of sensor output into a preallocated ring buffer."""
+import asyncio
+from typing import AsyncIterator, Dict, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+SAMPLE_DTYPE = np.dtype(
+    [("timestamp", np.float64), ("node", np.uint8), ("value", np.float64)]
+)
+"""A captured sample: when it arrived, the node that sent it and its value."""
+
+DEFAULT_CAPACITY = 2**14
+
+
+class SensorStream:
+    """Sensor samples captured into a ring buffer.
+
+    The buffer is allocated up front, with a row of SAMPLE_DTYPE per sample.
+    Once it is full, each new sample overwrites the oldest one, unless the
+    stream is growable, in which case the buffer is reallocated at twice
+    its size instead.
+
+    Samples can be read all at once with samples(), or in batches as they
+    arrive by iterating over the stream with `async for`. Both return
+    read-only views into the buffer rather than copies wherever the samples
+    are contiguous, so a view is only valid until its rows are overwritten.
+    Copy a view to keep it longer than that.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        decimation: int = 1,
+        smoothing: float = 1.0,
+        growable: bool = False,
+    ) -> None:
+        """Build a stream.
+
+        Args:
+            capacity: How many samples the buffer holds at first.
+            decimation: Keep only every this many samples received.
+            smoothing: The weight of each new value in an exponential moving
+                average of each node's values, which is applied to every
+                sample received, before decimation. 1.0 disables smoothing.
+            growable: Whether to grow the buffer once it is full rather than
+                overwrite the oldest samples, for captures whose length is
+                not known up front.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if decimation < 1:
+            raise ValueError("decimation must be at least 1")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be greater than 0 and at most 1")
+        self._set_buffer(np.zeros(capacity, dtype=SAMPLE_DTYPE))
+        self._growable = growable
+        self._decimation = decimation
+        self._smoothing = smoothing
+        self._averages: Dict[int, float] = {}
+        self._received = 0
+        self._written = 0
+        self._read = 0
+        self._missed = 0
+        self._closed = False
+        self._new_samples: Optional[asyncio.Event] = None
+
+    @property
+    def capacity(self) -> int:
+        """How many samples the buffer currently holds."""
+        return self._capacity
+
+    @property
+    def received(self) -> int:
+        """How many samples have been pushed, before decimation."""
+        return self._received
+
+    @property
+    def written(self) -> int:
+        """How many samples have been written to the buffer."""
+        return self._written
+
+    @property
+    def overwritten(self) -> int:
+        """How many samples were overwritten by newer ones."""
+        return max(0, self._written - self._capacity)
+
+    @property
+    def missed(self) -> int:
+        """How many samples were overwritten before they could be iterated over."""
+        return self._missed
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream has stopped taking samples."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """Get how many samples are in the buffer."""
+        return min(self._written, self._capacity)
+
+    def push(self, timestamp: float, node: int, value: float) -> None:
+        """Add a sample to the stream, unless it's closed."""
+        if self._closed:
+            return
+
+        if self._smoothing < 1.0:
+            average = self._averages.get(node)
+            if average is not None:
+                value = average + self._smoothing * (value - average)
+            self._averages[node] = value
+
+        received = self._received
+        self._received += 1
+        if received % self._decimation:
+            return
+
+        if self._growable and self._written == self._capacity:
+            self._grow()
+
+        row = self._written % self._capacity
+        self._timestamps[row] = timestamp
+        self._nodes[row] = node
+        self._values[row] = value
+        self._written += 1
+        if self._new_samples is not None:
+            self._new_samples.set()
+
+    def close(self) -> None:
+        """Stop taking samples, and end iteration once every sample is read.
+
+        Samples pushed after this are ignored, so that a response arriving
+        after the capture ended can't disturb the samples.
+        """
+        self._closed = True
+        if self._new_samples is not None:
+            self._new_samples.set()
+
+    def samples(self) -> "NDArray[np.void]":
+        """Get the samples in the buffer, oldest first.
+
+        This is a view into the buffer unless the buffer has wrapped
+        around, in which case its two halves are copied into a new array.
+        """
+        start = self._written % self._capacity
+        if self._written <= self._capacity or start == 0:
+            samples = self._buffer[: len(self)]
+        else:
+            samples = np.empty_like(self._buffer)
+            samples[: self._capacity - start] = self._buffer[start:]
+            samples[self._capacity - start :] = self._buffer[:start]
+        return _read_only(samples)
+
+    def __aiter__(self) -> AsyncIterator["NDArray[np.void]"]:
+        """Iterate over batches of samples as they arrive.
+
+        Each batch is a view of the samples that arrived since the last one,
+        up to the end of the buffer. Samples overwritten before they could be
+        iterated over are skipped and counted in `missed`. Iteration ends
+        once the stream is closed and every sample has been read. Only one
+        iteration should run at a time.
+        """
+        return self._batches()
+
+    async def _batches(self) -> AsyncIterator["NDArray[np.void]"]:
+        if self._new_samples is None:
+            self._new_samples = asyncio.Event()
+
+        while True:
+            if self._read < self._written:
+                start = max(self._read, self._written - self._capacity)
+                self._missed += start - self._read
+                start_row = start % self._capacity
+                end_row = min(start_row + self._written - start, self._capacity)
+                self._read = start + end_row - start_row
+                yield _read_only(self._buffer[start_row:end_row])
+            elif self._closed:
+                return
+            else:
+                self._new_samples.clear()
+                await self._new_samples.wait()
+
+    def _set_buffer(self, buffer: "NDArray[np.void]") -> None:
+        self._buffer = buffer
+        # Writing through a view of each field is faster than writing rows
+        self._timestamps = buffer["timestamp"]
+        self._nodes = buffer["node"]
+        self._values = buffer["value"]
+        self._capacity = len(buffer)
+
+    def _grow(self) -> None:
+        # A growable buffer never wraps around, so its rows are in order.
+        # Views of the old buffer stay valid, since it is never written again.
+        buffer = np.zeros(2 * self._capacity, dtype=SAMPLE_DTYPE)
+        buffer[: self._capacity] = self._buffer
+        self._set_buffer(buffer)
+
+
+def _read_only(samples: "NDArray[np.void]") -> "NDArray[np.void]":
+    view = samples.view()
+    view.flags.writeable = False
+    return view
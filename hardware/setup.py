@@ -82,6 +82,7 @@ if __name__ == "__main__":
         entry_points={
             "console_scripts": [
                 "opentrons_update_fw = opentrons_hardware.scripts.update_fw:main",
+                "opentrons_update_fws = opentrons_hardware.scripts.update_fws:main",
                 "opentrons_can_comm = opentrons_hardware.scripts.can_comm:main",
                 "opentrons_can_mon = opentrons_hardware.scripts.can_mon:main",
                 "opentrons_sim_can_bus = opentrons_hardware.scripts.sim_socket_can:main",
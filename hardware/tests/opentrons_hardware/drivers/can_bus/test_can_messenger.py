@@ -1,7 +1,9 @@
 """Tests for the can messaging class."""
 from __future__ import annotations
 import asyncio
+import logging
 from asyncio import Queue
+from typing import List
 
 import pytest
 from mock import AsyncMock, Mock
@@ -50,6 +52,14 @@ def mock_driver(incoming_messages: Queue[CanMessage]) -> AsyncMock:
     m = AsyncMock()
     m.__aiter__.side_effect = lambda: m
     m.__anext__.side_effect = incoming_messages.get
+
+    def _read_buffered() -> List[CanMessage]:
+        buffered = []
+        while not incoming_messages.empty():
+            buffered.append(incoming_messages.get_nowait())
+        return buffered
+
+    m.read_buffered = Mock(side_effect=_read_buffered)
     return m
 
 
@@ -204,7 +214,9 @@ async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
     with WaitableCallback(mock_messenger) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, None)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, None, message_ids=None, originating_node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
 
 
@@ -216,5 +228,131 @@ async def test_waitable_callback_context_with_filter() -> None:
         return False
 
     with WaitableCallback(mock_messenger, some_func) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, some_func)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, some_func, message_ids=None, originating_node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _incoming(
+    message_id: int, originating_node_id: NodeId, data: bytes = b"\1"
+) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=0,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=data,
+    )
+
+
+async def _drain(subject: CanMessenger, incoming_messages: Queue[CanMessage]) -> None:
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+
+async def test_route_messages(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners routed to a message's id and node."""
+    incoming_messages.put_nowait(
+        _incoming(MessageId.get_move_group_request, NodeId.gantry_x)
+    )
+
+    by_message_id = Mock(spec=MessageListenerCallback)
+    by_other_message_id = Mock(spec=MessageListenerCallback)
+    by_node = Mock(spec=MessageListenerCallback)
+    by_other_node = Mock(spec=MessageListenerCallback)
+    subject.add_listener(by_message_id, message_ids=[MessageId.get_move_group_request])
+    subject.add_listener(by_other_message_id, message_ids=[MessageId.heartbeat_request])
+    subject.add_listener(by_node, originating_node_ids=[NodeId.gantry_x])
+    subject.add_listener(by_other_node, originating_node_ids=[NodeId.head])
+
+    await _drain(subject, incoming_messages)
+
+    by_message_id.assert_called_once()
+    by_node.assert_called_once()
+    by_other_message_id.assert_not_called()
+    by_other_node.assert_not_called()
+
+
+async def test_route_messages_in_order(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should call listeners of every route in the order they were added."""
+    incoming_messages.put_nowait(
+        _incoming(MessageId.get_move_group_request, NodeId.gantry_x)
+    )
+    calls = []
+
+    def _listener(name: str) -> MessageListenerCallback:
+        return lambda message, arbitration_id: calls.append(name)
+
+    subject.add_listener(_listener("any"))
+    subject.add_listener(
+        _listener("message"), message_ids=[MessageId.get_move_group_request]
+    )
+    subject.add_listener(_listener("node"), originating_node_ids=[NodeId.gantry_x])
+    subject.add_listener(
+        _listener("both"),
+        message_ids=[MessageId.get_move_group_request],
+        originating_node_ids=[NodeId.gantry_x],
+    )
+
+    await _drain(subject, incoming_messages)
+
+    assert calls == ["any", "message", "node", "both"]
+
+
+async def test_remove_routed_listener(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should stop calling a routed listener once removed."""
+    incoming_messages.put_nowait(
+        _incoming(MessageId.get_move_group_request, NodeId.gantry_x)
+    )
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        listener,
+        message_ids=[MessageId.get_move_group_request],
+        originating_node_ids=[NodeId.gantry_x, NodeId.gantry_y],
+    )
+    subject.remove_listener(listener)
+
+    await _drain(subject, incoming_messages)
+
+    listener.assert_not_called()
+    assert subject._routes == {}
+
+
+async def test_skip_unwanted_messages(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """It should not build payloads, or choke on messages, nobody listens for."""
+    # Not enough data to build a payload from
+    incoming_messages.put_nowait(
+        _incoming(MessageId.get_move_group_request, NodeId.gantry_x, data=b"")
+    )
+    # Not a known message id
+    incoming_messages.put_nowait(_incoming(0x7FF, NodeId.gantry_x))
+    incoming_messages.put_nowait(_incoming(MessageId.heartbeat_request, NodeId.head))
+
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.heartbeat_request])
+
+    with caplog.at_level(logging.ERROR):
+        await _drain(subject, incoming_messages)
+
+    assert "Failed to build" not in caplog.text
+    listener.assert_called_once_with(
+        HeartbeatRequest(),
+        _incoming(MessageId.heartbeat_request, NodeId.head).arbitration_id,
+    )
@@ -1,4 +1,5 @@
 """Can Driver tests."""
+import asyncio
 from typing import AsyncGenerator
 
 import pytest
@@ -101,3 +102,30 @@ async def test_raise_error_frame_error(subject: CanDriver, can_bus: Bus) -> None
     can_bus.send(m)
     with pytest.raises(ErrorFrameCanError):
         await subject.read()
+
+
+async def test_read_buffered(subject: CanDriver, can_bus: Bus) -> None:
+    """It should read already received messages, up to an error frame."""
+    for i in range(3):
+        can_bus.send(
+            Message(
+                arbitration_id=i,
+                is_extended_id=True,
+                is_error_frame=(i == 2),
+                is_fd=True,
+                data=bytearray([i]),
+            )
+        )
+
+    # Wait for the bus notifier to hand every message to the driver
+    while subject._reader.buffer.qsize() < 3:
+        await asyncio.sleep(0.01)
+
+    first = await subject.read()
+    buffered = subject.read_buffered()
+
+    assert first.arbitration_id.id == 0
+    assert [m.arbitration_id.id for m in buffered] == [1]
+    assert subject.read_buffered() == []
+    with pytest.raises(ErrorFrameCanError):
+        await subject.read()
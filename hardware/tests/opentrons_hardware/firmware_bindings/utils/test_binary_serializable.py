@@ -0,0 +1,92 @@
+"""Tests for binary serializable."""
+from dataclasses import dataclass
+from typing import Type
+
+import pytest
+
+from opentrons_hardware.firmware_bindings.utils import (
+    BinarySerializable,
+    LittleEndianBinarySerializable,
+    UInt8Field,
+    UInt16Field,
+    Int32Field,
+)
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    InvalidFieldException,
+    SerializationException,
+)
+
+
+@dataclass
+class _BigEndian(BinarySerializable):
+    first: UInt8Field
+    second: UInt16Field
+    third: Int32Field
+
+
+@dataclass
+class _LittleEndian(LittleEndianBinarySerializable, _BigEndian):
+    pass
+
+
+@dataclass
+class _Extended(_BigEndian):
+    fourth: UInt8Field
+
+
+@dataclass
+class _Invalid(BinarySerializable):
+    first: int
+
+
+@pytest.mark.parametrize(
+    argnames=["cls", "expected"],
+    argvalues=[
+        [_BigEndian, b"\x01\x02\x03\xff\xff\xff\xfc"],
+        [_LittleEndian, b"\x01\x03\x02\xfc\xff\xff\xff"],
+    ],
+)
+def test_serialize_and_build(cls: Type[_BigEndian], expected: bytes) -> None:
+    """It should serialize into bytes and build back from them."""
+    obj = cls(first=UInt8Field(1), second=UInt16Field(0x0203), third=Int32Field(-4))
+    assert obj.serialize() == expected
+    assert cls.build(expected) == obj
+    assert cls.get_size() == len(expected)
+
+
+def test_build_ignores_extra_bytes() -> None:
+    """It should ignore bytes beyond the size of the class."""
+    assert _BigEndian.build(b"\x01\x02\x03\xff\xff\xff\xfc\x00\x00") == _BigEndian(
+        first=UInt8Field(1), second=UInt16Field(0x0203), third=Int32Field(-4)
+    )
+
+
+def test_build_too_few_bytes() -> None:
+    """It should raise if there are not enough bytes to build from."""
+    with pytest.raises(InvalidFieldException):
+        _BigEndian.build(b"\x01\x02")
+
+
+def test_subclass_has_own_codec() -> None:
+    """A subclass should not use the codec of its base class."""
+    assert _BigEndian.get_size() == 7
+    assert _Extended.get_size() == 8
+    assert _Extended.build(b"\x01\x02\x03\xff\xff\xff\xfc\x05") == _Extended(
+        first=UInt8Field(1),
+        second=UInt16Field(0x0203),
+        third=Int32Field(-4),
+        fourth=UInt8Field(5),
+    )
+
+
+def test_serialize_out_of_range() -> None:
+    """It should raise if a field value does not fit its format."""
+    obj = _BigEndian(first=UInt8Field(256), second=UInt16Field(0), third=Int32Field(0))
+    with pytest.raises(SerializationException):
+        obj.serialize()
+
+
+def test_invalid_field_type() -> None:
+    """It should reject fields that are not binary fields."""
+    with pytest.raises(InvalidFieldException):
+        _Invalid.get_size()
@@ -1,6 +1,7 @@
 """Tests for the firmware downloader."""
+import asyncio
 import binascii
-from typing import List
+from typing import Dict, List, Optional
 
 import pytest
 from mock import AsyncMock, MagicMock, call
@@ -275,3 +276,237 @@ async def test_messaging_complete_no_response(
 
     with pytest.raises(TimeoutResponse):
         await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 0.5)
+
+
+class SimulatedBootloader:
+    """A bootloader node that ACKs data messages after a delay."""
+
+    def __init__(
+        self,
+        can_message_notifier: MockCanMessageNotifier,
+        ack_delay: float = 0.01,
+        dropped_acks: Optional[Dict[int, int]] = None,
+        slow_acks: Optional[Dict[int, float]] = None,
+        reject_duplicates: bool = False,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            can_message_notifier: Notifier of the messenger's listeners.
+            ack_delay: Seconds it takes to ACK a data message.
+            dropped_acks: Number of ACKs to drop per address.
+            slow_acks: Seconds it takes to ACK the first data message
+                to an address, if not ack_delay.
+            reject_duplicates: Whether to ACK data sent to an address more
+                than once with an error.
+        """
+        self._notifier = can_message_notifier
+        self._ack_delay = ack_delay
+        self._dropped_acks = dropped_acks or {}
+        self._slow_acks = slow_acks or {}
+        self._reject_duplicates = reject_duplicates
+        self.unacked = 0
+        self.max_unacked = 0
+        self.received: List[int] = []
+        self._last_ack_time = 0.0
+
+    def __call__(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Handle a message sent to the node."""
+        if isinstance(message, FirmwareUpdateData):
+            address = message.payload.address.value
+            duplicate = address in self.received
+            error_code = (
+                ErrorCode.invalid_input
+                if duplicate and self._reject_duplicates
+                else ErrorCode.ok
+            )
+            self.received.append(address)
+            self.unacked += 1
+            self.max_unacked = max(self.max_unacked, self.unacked)
+            # ACKs are sent in the order the data was received.
+            loop = asyncio.get_running_loop()
+            delay = (
+                self._ack_delay
+                if duplicate
+                else self._slow_acks.get(address, self._ack_delay)
+            )
+            self._last_ack_time = max(loop.time() + delay, self._last_ack_time)
+            loop.call_at(
+                self._last_ack_time,
+                self._ack,
+                node_id,
+                message.payload.address,
+                error_code,
+            )
+        elif isinstance(message, FirmwareUpdateComplete):
+            self._notify(
+                node_id,
+                FirmwareUpdateCompleteAcknowledge(
+                    payload=payloads.FirmwareUpdateAcknowledge(
+                        error_code=ErrorCodeField(ErrorCode.ok)
+                    )
+                ),
+            )
+
+    def _ack(
+        self, node_id: NodeId, address: utils.UInt32Field, error_code: ErrorCode
+    ) -> None:
+        self.unacked -= 1
+        if self._dropped_acks.get(address.value, 0) > 0:
+            self._dropped_acks[address.value] -= 1
+            return
+        self._notify(
+            node_id,
+            FirmwareUpdateDataAcknowledge(
+                payload=payloads.FirmwareUpdateDataAcknowledge(
+                    address=address,
+                    error_code=ErrorCodeField(error_code),
+                )
+            ),
+        )
+
+    def _notify(self, node_id: NodeId, message: MessageDefinition) -> None:
+        self._notifier.notify(
+            message,
+            ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=message.message_id,
+                    node_id=NodeId.host,
+                    function_code=0,
+                    originating_node_id=node_id,
+                )
+            ),
+        )
+
+
+@pytest.fixture
+def many_chunks() -> List[Chunk]:
+    """Data chunks of a larger firmware."""
+    return [Chunk(address=0x100 * i, data=[i] * 56) for i in range(10)]
+
+
+async def test_messaging_windowed(
+    subject: downloader.FirmwareUpdateDownloader,
+    many_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should keep up to window size chunks waiting for an ACK."""
+    bootloader = SimulatedBootloader(can_message_notifier)
+    mock_messenger.send.side_effect = bootloader
+    mock_hex_processor.process.return_value = iter(many_chunks)
+
+    await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 1, window_size=4)
+
+    assert bootloader.max_unacked == 4
+    assert bootloader.received == [chunk.address for chunk in many_chunks]
+    assert isinstance(
+        mock_messenger.send.call_args.kwargs["message"], FirmwareUpdateComplete
+    )
+
+
+async def test_messaging_windowed_resend(
+    subject: downloader.FirmwareUpdateDownloader,
+    many_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should resend chunks that were not ACKed in time."""
+    bootloader = SimulatedBootloader(can_message_notifier, dropped_acks={0x300: 2})
+    mock_messenger.send.side_effect = bootloader
+    mock_hex_processor.process.return_value = iter(many_chunks)
+
+    await subject.run(
+        NodeId.gantry_y_bootloader,
+        mock_hex_processor,
+        0.1,
+        window_size=4,
+        retry_count=2,
+    )
+
+    assert bootloader.received.count(0x300) == 3
+    assert set(bootloader.received) == {chunk.address for chunk in many_chunks}
+
+
+async def test_messaging_windowed_resend_exhausted(
+    subject: downloader.FirmwareUpdateDownloader,
+    many_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should fail once a chunk has been resent retry count times."""
+    bootloader = SimulatedBootloader(can_message_notifier, dropped_acks={0x300: 3})
+    mock_messenger.send.side_effect = bootloader
+    mock_hex_processor.process.return_value = iter(many_chunks)
+
+    with pytest.raises(TimeoutResponse) as exc_info:
+        await subject.run(
+            NodeId.gantry_y_bootloader,
+            mock_hex_processor,
+            0.1,
+            window_size=4,
+            retry_count=2,
+        )
+
+    message = exc_info.value.message
+    assert isinstance(message, FirmwareUpdateData)
+    assert message.payload.address == utils.UInt32Field(0x300)
+
+
+async def test_messaging_windowed_duplicate_error_ack(
+    subject: downloader.FirmwareUpdateDownloader,
+    many_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should ignore an error ACK of a resent chunk that was already ACKed."""
+    bootloader = SimulatedBootloader(
+        can_message_notifier,
+        slow_acks={0x300: 0.15},
+        reject_duplicates=True,
+    )
+    mock_messenger.send.side_effect = bootloader
+    mock_hex_processor.process.return_value = iter(many_chunks)
+
+    await subject.run(
+        NodeId.gantry_y_bootloader,
+        mock_hex_processor,
+        0.1,
+        window_size=1,
+        retry_count=2,
+    )
+
+    assert bootloader.received.count(0x300) == 2
+    assert isinstance(
+        mock_messenger.send.call_args.kwargs["message"], FirmwareUpdateComplete
+    )
+
+
+async def test_messaging_windowed_resend_error_ack(
+    subject: downloader.FirmwareUpdateDownloader,
+    many_chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should fail if the only ACK of a resent chunk is an error."""
+    bootloader = SimulatedBootloader(
+        can_message_notifier,
+        dropped_acks={0x300: 1},
+        reject_duplicates=True,
+    )
+    mock_messenger.send.side_effect = bootloader
+    mock_hex_processor.process.return_value = iter(many_chunks)
+
+    with pytest.raises(ErrorResponse):
+        await subject.run(
+            NodeId.gantry_y_bootloader,
+            mock_hex_processor,
+            0.1,
+            window_size=4,
+            retry_count=2,
+        )
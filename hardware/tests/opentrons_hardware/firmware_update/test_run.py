@@ -1,5 +1,6 @@
 """Tests for run module."""
-from typing import Iterator
+import asyncio
+from typing import Dict, Iterator, TextIO
 
 import mock
 import pytest
@@ -14,8 +15,10 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
     run_update,
+    run_updates,
     HexRecordProcessor,
 )
+from opentrons_hardware.firmware_update.errors import BootloaderNotReady
 from opentrons_hardware.firmware_update.target import Target
 
 
@@ -70,6 +73,7 @@ async def test_run_update(
         retry_count=12,
         timeout_seconds=11,
         erase=should_erase,
+        chunk_retry_count=5,
     )
     mock_initiator_run.assert_called_once_with(
         target=target, retry_count=12, ready_wait_time_sec=11
@@ -84,8 +88,88 @@ async def test_run_update(
         node_id=target.bootloader_node,
         hex_processor=mock_hex_record_processor,
         ack_wait_seconds=11,
+        window_size=1,
+        retry_count=5,
     )
     mock_messenger.send.assert_called_once_with(
         node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
     )
     mock_hex_record_builder.assert_called_once_with(mock_hex_file)
+
+
+@pytest.fixture
+def mock_run_update() -> Iterator[AsyncMock]:
+    """Mock run_update function."""
+    with mock.patch("opentrons_hardware.firmware_update.run.run_update") as p:
+        yield p
+
+
+async def test_run_updates(mock_run_update: AsyncMock) -> None:
+    """It should update every node concurrently."""
+    mock_messenger = AsyncMock()
+    hex_files: Dict[NodeId, TextIO] = {
+        NodeId.head: MagicMock(),
+        NodeId.gantry_x: MagicMock(),
+    }
+    started = []
+
+    async def _run_update(node_id: NodeId, **kwargs: object) -> None:
+        started.append(node_id)
+        await asyncio.sleep(0)
+        # Every update has started before any of them finishes.
+        assert len(started) == len(hex_files)
+
+    mock_run_update.side_effect = _run_update
+
+    await run_updates(
+        messenger=mock_messenger,
+        hex_files=hex_files,
+        retry_count=12,
+        timeout_seconds=11,
+        erase=True,
+        window_size=8,
+        chunk_retry_count=5,
+    )
+
+    mock_run_update.assert_has_calls(
+        [
+            mock.call(
+                messenger=mock_messenger,
+                node_id=node_id,
+                hex_file=hex_file,
+                retry_count=12,
+                timeout_seconds=11,
+                erase=True,
+                window_size=8,
+                chunk_retry_count=5,
+            )
+            for node_id, hex_file in hex_files.items()
+        ]
+    )
+
+
+async def test_run_updates_failure(mock_run_update: AsyncMock) -> None:
+    """It should finish the other updates before raising a failed update's error."""
+    hex_files: Dict[NodeId, TextIO] = {
+        NodeId.head: MagicMock(),
+        NodeId.gantry_x: MagicMock(),
+    }
+    finished = []
+
+    async def _run_update(node_id: NodeId, **kwargs: object) -> None:
+        if node_id == NodeId.head:
+            raise BootloaderNotReady()
+        await asyncio.sleep(0.01)
+        finished.append(node_id)
+
+    mock_run_update.side_effect = _run_update
+
+    with pytest.raises(BootloaderNotReady):
+        await run_updates(
+            messenger=AsyncMock(),
+            hex_files=hex_files,
+            retry_count=12,
+            timeout_seconds=11,
+        )
+
+    assert finished == [NodeId.gantry_x]
@@ -449,6 +449,51 @@ async def test_multi_group_move(
     assert position[4][1].payload.current_position_um.value == 12000
 
 
+async def test_prefetch_sends_next_group_while_executing(
+    move_group_multiple: MoveGroups,
+) -> None:
+    """It should send each group after the one before it starts executing."""
+    subject = MoveGroupRunner(move_groups=move_group_multiple, prefetch=True)
+    mock_can_messenger = MagicMock()
+    mock_can_messenger.send = AsyncMock()
+
+    def _add_listener(listener: MessageListenerCallback, **kwargs: Any) -> None:
+        mock_sender = MockSendMoveCompleter(move_group_multiple, listener)
+        mock_can_messenger.send.side_effect = mock_sender.mock_send
+
+    mock_can_messenger.add_listener.side_effect = _add_listener
+
+    await subject.prep(can_messenger=mock_can_messenger)
+    sent_in_prep = [c.kwargs["message"] for c in mock_can_messenger.send.call_args_list]
+    assert [type(m) for m in sent_in_prep] == [
+        md.ClearAllMoveGroupsRequest,
+        AddLinearMoveRequest,
+    ]
+
+    position = await subject.execute(can_messenger=mock_can_messenger)
+    sent = [
+        (type(m), m.payload.group_id.value)
+        for m in (c.kwargs["message"] for c in mock_can_messenger.send.call_args_list)
+        if not isinstance(m, md.ClearAllMoveGroupsRequest)
+    ]
+    assert sent == [
+        (AddLinearMoveRequest, 0),
+        (md.ExecuteMoveGroupRequest, 0),
+        (AddLinearMoveRequest, 1),
+        (AddLinearMoveRequest, 1),
+        (md.ExecuteMoveGroupRequest, 1),
+        (AddLinearMoveRequest, 2),
+        (AddLinearMoveRequest, 2),
+        (md.ExecuteMoveGroupRequest, 2),
+    ]
+    assert position == {
+        NodeId.head: (229, 916),
+        NodeId.gantry_x: (522, 2088),
+        NodeId.gantry_y: (25, 100),
+        NodeId.pipette_left: (12, 48),
+    }
+
+
 def _build_arb(from_node: NodeId) -> ArbitrationId:
     return ArbitrationId(ArbitrationIdParts(originating_node_id=from_node))
 
@@ -11,6 +11,8 @@ from opentrons_hardware.hardware_control.motion_planning.move_utils import (
     targets_to_moves,
     all_blended,
     get_unit_vector,
+    split_at_stops,
+    stoppable,
     FLOAT_THRESHOLD,
 )
 from opentrons_hardware.hardware_control.motion_planning.types import (
@@ -448,6 +450,77 @@ def test_blend_motion() -> None:
     assert all_blended(CONSTRAINTS, blend_log[-1])
 
 
+def _x_move(speed: float) -> Move[str]:
+    return Move.build(
+        unit_vector={"X": np.float64(1), "Y": np.float64(0)},
+        distance=np.float64(30),
+        max_speed=np.float64(speed),
+        blocks=(
+            Block(
+                distance=np.float64(10),
+                initial_speed=np.float64(speed),
+                acceleration=np.float64(0),
+            ),
+            Block(
+                distance=np.float64(10),
+                initial_speed=np.float64(speed),
+                acceleration=np.float64(0),
+            ),
+            Block(
+                distance=np.float64(10),
+                initial_speed=np.float64(speed),
+                acceleration=np.float64(0),
+            ),
+        ),
+    )
+
+
+def test_split_at_stops() -> None:
+    """Moves should only be split where the motors can stop between them."""
+    slow, fast = _x_move(10), _x_move(20)
+    assert stoppable(CONSTRAINTS, slow, slow)
+    assert not stoppable(CONSTRAINTS, slow, fast)
+    assert not stoppable(CONSTRAINTS, fast, slow)
+
+    moves = [slow, slow, fast, fast, slow, slow]
+    assert split_at_stops(CONSTRAINTS, moves) == [
+        [slow],
+        [slow, fast, fast, slow],
+        [slow],
+    ]
+    assert split_at_stops(CONSTRAINTS, []) == []
+
+
+def test_split_blended_motion_at_stops() -> None:
+    """Splitting blended moves should keep every move in order."""
+    manager = MoveManager(CONSTRAINTS)
+    origin = {"X": np.float64(0), "Y": np.float64(0), "Z": np.float64(0)}
+    target_list = [
+        MoveTarget.build(
+            position={"X": np.float64(0), "Y": np.float64(0), "Z": np.float64(20)},
+            max_speed=np.float64(50),
+        ),
+        MoveTarget.build(
+            position={"X": np.float64(40), "Y": np.float64(0), "Z": np.float64(20)},
+            max_speed=np.float64(50),
+        ),
+        MoveTarget.build(
+            position={"X": np.float64(40), "Y": np.float64(0), "Z": np.float64(0)},
+            max_speed=np.float64(50),
+        ),
+    ]
+    success, blend_log = manager.plan_motion(origin, target_list)
+    assert success
+    moves = blend_log[-1]
+
+    segments = split_at_stops(CONSTRAINTS, moves)
+    assert [move for segment in segments for move in segment] == moves
+    for prev, current in zip(segments, segments[1:]):
+        assert stoppable(CONSTRAINTS, prev[-1], current[0])
+    # the corners of an arc are slow enough to stop at
+    assert len(segments) == 3
+
+
 coords = st.lists(st.floats(min_value=0, max_value=1e64), min_size=4, max_size=4)
 
 
@@ -1,4 +1,5 @@
 """Test the tool-sensor coordination code."""
+import asyncio
 import logging
 from mock import patch, AsyncMock, ANY
 import pytest
@@ -40,6 +41,7 @@ from opentrons_hardware.firmware_bindings.constants import (
     SensorThresholdMode,
 )
 from opentrons_hardware.sensors.scheduler import SensorScheduler
+from opentrons_hardware.sensors.sensor_stream import SensorStream
 from opentrons_hardware.sensors.utils import (
     SensorThresholdInformation,
     SensorInformation,
@@ -155,6 +157,7 @@ async def test_capacitive_probe(
         ),
         ANY,
         log=ANY,
+        stream=None,
     )
 
 
@@ -224,3 +227,21 @@ async def test_capacitive_sweep(
         mock_messenger, target_node, motor_node, distance, speed
     )
     assert result == list(range(10))
+
+    # the readings can also be consumed in batches during the move
+    stream = SensorStream(capacity=16)
+    batches: List[List[float]] = []
+
+    async def _consume() -> None:
+        async for batch in stream:
+            batches.append(batch["value"].tolist())
+
+    consumer = asyncio.get_running_loop().create_task(_consume())
+    result = await capacitive_pass(
+        mock_messenger, target_node, motor_node, distance, speed, stream=stream
+    )
+    await consumer
+
+    assert result == list(range(10))
+    assert [value for batch in batches for value in batch] == list(range(10))
+    assert stream.missed == 0
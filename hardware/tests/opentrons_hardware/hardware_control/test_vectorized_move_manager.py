@@ -0,0 +1,138 @@
+"""Tests for the vectorized move manager."""
+import pytest
+import numpy as np
+from typing import List, Tuple
+from hypothesis import given, settings, strategies as st
+
+from opentrons_hardware.hardware_control.motion_planning.move_manager import MoveManager
+from opentrons_hardware.hardware_control.motion_planning.vectorized_manager import (
+    VectorizedMoveManager,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+AXES = ["X", "Y", "Z", "A"]
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=np.float64(10),
+        max_speed_discont=np.float64(15),
+        max_direction_change_speed_discont=np.float64(500),
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=np.float64(10),
+        max_speed_discont=np.float64(15),
+        max_direction_change_speed_discont=np.float64(500),
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=np.float64(100),
+        max_speed_discont=np.float64(100),
+        max_direction_change_speed_discont=np.float64(500),
+    ),
+    "A": AxisConstraints.build(
+        max_acceleration=np.float64(100),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+    ),
+}
+BLOCK_FIELDS = ["distance", "initial_speed", "acceleration", "final_speed", "time"]
+
+
+def assert_moves_close(moves: List[Move[str]], expected: List[Move[str]]) -> None:
+    """Moves should have the same axes and close values."""
+    assert len(moves) == len(expected)
+    for move, expected_move in zip(moves, expected):
+        assert list(move.unit_vector.keys()) == list(expected_move.unit_vector.keys())
+        assert np.allclose(
+            list(move.unit_vector.values()), list(expected_move.unit_vector.values())
+        )
+        assert np.isclose(move.distance, expected_move.distance)
+        assert np.isclose(move.max_speed, expected_move.max_speed)
+        for block, expected_block in zip(move.blocks, expected_move.blocks):
+            for field in BLOCK_FIELDS:
+                assert np.isclose(
+                    getattr(block, field),
+                    getattr(expected_block, field),
+                    equal_nan=True,
+                ), field
+
+
+def plan_both(
+    targets: List[MoveTarget[str]],
+) -> Tuple[Tuple[bool, List[List[Move[str]]]], Tuple[bool, List[List[Move[str]]]]]:
+    """Plan the targets with both move managers."""
+    origin = dict.fromkeys(AXES, 0)
+    return (
+        VectorizedMoveManager(CONSTRAINTS).plan_motion(origin, targets),
+        MoveManager(CONSTRAINTS).plan_motion(origin, targets),
+    )
+
+
+def test_blend_motion() -> None:
+    """It should plan the same blended moves as the move manager."""
+    targets = [
+        MoveTarget.build(position={"X": 0, "Y": 0, "Z": 20, "A": 0}, max_speed=50),
+        MoveTarget.build(position={"X": 40, "Y": 10, "Z": 20, "A": 0}, max_speed=50),
+        MoveTarget.build(position={"X": 40, "Y": 10, "Z": 0, "A": 5}, max_speed=10),
+    ]
+    (success, blend_log), (expected_success, expected_blend_log) = plan_both(targets)
+    assert success and expected_success
+    assert len(blend_log) == len(expected_blend_log)
+    for moves, expected_moves in zip(blend_log, expected_blend_log):
+        assert_moves_close(moves, expected_moves)
+
+
+def test_zero_length_move() -> None:
+    """It should not plan a move that ends where it starts."""
+    targets = [
+        MoveTarget.build(position={"X": 10, "Y": 0}, max_speed=50),
+        MoveTarget.build(position={"X": 10, "Y": 0}, max_speed=50),
+    ]
+    with pytest.raises(ZeroLengthMoveError):
+        VectorizedMoveManager(CONSTRAINTS).plan_motion({"X": 0, "Y": 0}, targets)
+
+
+positions = st.lists(
+    st.sampled_from([0, 10, 20]) | st.floats(min_value=0, max_value=300),
+    min_size=len(AXES),
+    max_size=len(AXES),
+)
+targets = st.lists(
+    st.builds(
+        lambda position, max_speed: MoveTarget.build(
+            position=dict(zip(AXES, position)), max_speed=max_speed
+        ),
+        positions,
+        st.sampled_from([5, 20, 100, 500]),
+    ),
+    min_size=1,
+    max_size=10,
+)
+
+
+@settings(deadline=None)
+@given(targets)
+def test_matches_move_manager(targets: List[MoveTarget[str]]) -> None:
+    """It should plan the same moves as the move manager, or fail the same way."""
+    try:
+        expected = MoveManager(CONSTRAINTS).plan_motion(dict.fromkeys(AXES, 0), targets)
+    except (ZeroLengthMoveError, AssertionError) as e:
+        with pytest.raises(type(e)):
+            VectorizedMoveManager(CONSTRAINTS).plan_motion(
+                dict.fromkeys(AXES, 0), targets
+            )
+        return
+
+    success, blend_log = VectorizedMoveManager(CONSTRAINTS).plan_motion(
+        dict.fromkeys(AXES, 0), targets
+    )
+    expected_success, expected_blend_log = expected
+    assert success == expected_success
+    assert len(blend_log) == len(expected_blend_log)
+    for moves, expected_moves in zip(blend_log, expected_blend_log):
+        assert_moves_close(moves, expected_moves)
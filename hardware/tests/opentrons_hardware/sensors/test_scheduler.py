@@ -2,8 +2,9 @@
 
 import mock
 import asyncio
-from typing import Iterator
+from typing import Iterator, Tuple
 from opentrons_hardware.sensors import scheduler, utils
+from opentrons_hardware.sensors.sensor_stream import SensorStream
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
     SensorId,
@@ -97,3 +98,108 @@ async def test_capture_output(
 
     for index, value in enumerate(_drain()):
         assert value == index
+
+
+def _sensor_response(
+    value: int, node: NodeId
+) -> Tuple[ReadFromSensorResponse, ArbitrationId]:
+    return (
+        ReadFromSensorResponse(
+            payload=ReadFromSensorResponsePayload(
+                sensor=SensorTypeField(SensorType.capacitive.value),
+                sensor_id=SensorIdField(SensorId.S0),
+                sensor_data=Int32Field(value << 16),
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=ReadFromSensorResponse.message_id,
+                node_id=NodeId.host,
+                originating_node_id=node,
+                function_code=0,
+            )
+        ),
+    )
+
+
+async def test_stream_output(
+    mock_messenger: mock.AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """Test that sensor output is streamed into a ring buffer."""
+    subject = scheduler.SensorScheduler()
+    stim_message = BindSensorOutputRequest(
+        payload=BindSensorOutputRequestPayload(
+            sensor=SensorTypeField(SensorType.capacitive),
+            sensor_id=SensorIdField(SensorId.S0),
+            binding=SensorOutputBindingField(SensorOutputBinding.report.value),
+        )
+    )
+    reset_message = BindSensorOutputRequest(
+        payload=BindSensorOutputRequestPayload(
+            sensor=SensorTypeField(SensorType.capacitive),
+            sensor_id=SensorIdField(SensorId.S0),
+            binding=SensorOutputBindingField(SensorOutputBinding.none.value),
+        )
+    )
+    async with subject.stream_output(
+        utils.SensorInformation(
+            sensor_type=SensorType.capacitive,
+            sensor_id=SensorId.S0,
+            node_id=NodeId.pipette_left,
+        ),
+        mock_messenger,
+        SensorStream(capacity=16, decimation=2),
+    ) as stream:
+        mock_messenger.send.assert_called_with(
+            node_id=NodeId.pipette_left, message=stim_message
+        )
+        for i in range(10):
+            can_message_notifier.notify(*_sensor_response(i, NodeId.pipette_left))
+            can_message_notifier.notify(*_sensor_response(100, NodeId.pipette_right))
+        assert not stream.closed
+    mock_messenger.send.assert_called_with(
+        node_id=NodeId.pipette_left, message=reset_message
+    )
+
+    assert stream.closed
+    samples = stream.samples()
+    assert samples["value"].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert samples["node"].tolist() == [NodeId.pipette_left.value] * 5
+    timestamps = samples["timestamp"].tolist()
+    assert timestamps == sorted(timestamps)
+
+
+async def test_bind_sync_stream(
+    mock_messenger: mock.AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """Test that sensor output can be streamed while bound to sync."""
+    subject = scheduler.SensorScheduler()
+    stream = SensorStream()
+    async with subject.bind_sync(
+        utils.SensorInformation(
+            sensor_type=SensorType.capacitive,
+            sensor_id=SensorId.S0,
+            node_id=NodeId.pipette_left,
+        ),
+        mock_messenger,
+        stream=stream,
+    ):
+        mock_messenger.send.assert_called_with(
+            node_id=NodeId.pipette_left,
+            message=BindSensorOutputRequest(
+                payload=BindSensorOutputRequestPayload(
+                    sensor=SensorTypeField(SensorType.capacitive),
+                    sensor_id=SensorIdField(SensorId.S0),
+                    binding=SensorOutputBindingField.from_flags(
+                        [SensorOutputBinding.sync, SensorOutputBinding.report]
+                    ),
+                )
+            ),
+        )
+        for i in range(3):
+            can_message_notifier.notify(*_sensor_response(i, NodeId.pipette_left))
+
+    assert stream.closed
+    assert stream.samples()["value"].tolist() == [0.0, 1.0, 2.0]
@@ -0,0 +1,150 @@
+"""Tests for the sensor stream ring buffer."""
+import asyncio
+from typing import List
+
+import numpy as np
+import pytest
+
+from opentrons_hardware.sensors.sensor_stream import SensorStream
+
+
+def test_samples_in_order() -> None:
+    """It should keep the latest samples, oldest first."""
+    subject = SensorStream(capacity=4)
+    for i in range(3):
+        subject.push(float(i), 1, i * 10.0)
+
+    samples = subject.samples()
+    assert samples["timestamp"].tolist() == [0.0, 1.0, 2.0]
+    assert samples["node"].tolist() == [1, 1, 1]
+    assert samples["value"].tolist() == [0.0, 10.0, 20.0]
+
+    for i in range(3, 6):
+        subject.push(float(i), 1, i * 10.0)
+
+    assert len(subject) == 4
+    assert subject.overwritten == 2
+    assert subject.samples()["value"].tolist() == [20.0, 30.0, 40.0, 50.0]
+
+
+def test_samples_are_read_only_views() -> None:
+    """It should export samples without copying them where it can."""
+    subject = SensorStream(capacity=4)
+    for i in range(4):
+        subject.push(float(i), 1, float(i))
+
+    samples = subject.samples()
+    assert np.shares_memory(samples, subject.samples())  # type: ignore[no-untyped-call]
+    with pytest.raises(ValueError):
+        samples["value"][0] = 42.0
+
+
+def test_decimation() -> None:
+    """It should keep only every nth sample."""
+    subject = SensorStream(capacity=8, decimation=3)
+    for i in range(7):
+        subject.push(float(i), 1, float(i))
+
+    assert subject.received == 7
+    assert subject.written == 3
+    assert subject.samples()["value"].tolist() == [0.0, 3.0, 6.0]
+
+
+def test_smoothing() -> None:
+    """It should keep a moving average of each node's values."""
+    subject = SensorStream(capacity=8, smoothing=0.5)
+    subject.push(0.0, 1, 10.0)
+    subject.push(0.0, 2, 100.0)
+    subject.push(1.0, 1, 20.0)
+    subject.push(1.0, 2, 200.0)
+
+    assert subject.samples()["value"].tolist() == [10.0, 100.0, 15.0, 150.0]
+
+
+def test_growable() -> None:
+    """It should grow the buffer rather than overwrite samples."""
+    subject = SensorStream(capacity=2, growable=True)
+    for i in range(2):
+        subject.push(float(i), 1, float(i))
+    before_growing = subject.samples()
+    for i in range(2, 5):
+        subject.push(float(i), 1, float(i))
+
+    assert subject.capacity == 8
+    assert subject.overwritten == 0
+    assert subject.samples()["value"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert before_growing["value"].tolist() == [0.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"capacity": 0}, {"decimation": 0}, {"smoothing": 0.0}, {"smoothing": 1.5}],
+)
+def test_invalid_settings(kwargs: dict) -> None:  # type: ignore[type-arg]
+    """It should reject settings that make no sense."""
+    with pytest.raises(ValueError):
+        SensorStream(**kwargs)
+
+
+async def test_batches() -> None:
+    """It should yield samples in batches as they arrive until closed."""
+    subject = SensorStream(capacity=4)
+    batches: List[List[float]] = []
+
+    async def _consume() -> None:
+        async for batch in subject:
+            batches.append(batch["value"].tolist())
+
+    consumer = asyncio.get_running_loop().create_task(_consume())
+    await asyncio.sleep(0)
+
+    subject.push(0.0, 1, 0.0)
+    subject.push(1.0, 1, 1.0)
+    await asyncio.sleep(0)
+    for i in range(2, 5):
+        subject.push(float(i), 1, float(i))
+    await asyncio.sleep(0)
+    subject.close()
+    await consumer
+
+    # the last batch wraps around the end of the buffer, so it comes in two
+    assert batches == [[0.0, 1.0], [2.0, 3.0], [4.0]]
+    assert subject.missed == 0
+
+    subject.push(5.0, 1, 5.0)
+    assert subject.written == 5
+
+
+async def test_batches_while_growing() -> None:
+    """It should yield every sample of a growable stream in batches."""
+    subject = SensorStream(capacity=2, growable=True)
+    batches: List[List[float]] = []
+
+    async def _consume() -> None:
+        async for batch in subject:
+            batches.append(batch["value"].tolist())
+
+    consumer = asyncio.get_running_loop().create_task(_consume())
+    await asyncio.sleep(0)
+
+    subject.push(0.0, 1, 0.0)
+    await asyncio.sleep(0)
+    for i in range(1, 5):
+        subject.push(float(i), 1, float(i))
+    subject.close()
+    await consumer
+
+    assert batches == [[0.0], [1.0, 2.0, 3.0, 4.0]]
+    assert subject.missed == 0
+
+
+async def test_batches_skip_overwritten() -> None:
+    """It should skip samples overwritten before they were read."""
+    subject = SensorStream(capacity=2)
+    for i in range(5):
+        subject.push(float(i), 1, float(i))
+    subject.close()
+
+    values = [value async for batch in subject for value in batch["value"].tolist()]
+    assert values == [3.0, 4.0]
+    assert subject.missed == 3
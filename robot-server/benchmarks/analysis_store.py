@@ -0,0 +1,97 @@
+"""Benchmark reading a large completed analysis from the AnalysisStore.
+
+Stores an analysis with thousands of commands, then times reading it back
+as parsed models, the way it used to be served, and as the stored JSON
+document that the analyses endpoints now send as-is.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Awaitable, Callable, List
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_reader import JsonProtocolConfig, ProtocolSource
+
+from robot_server.persistence.database import create_sql_engine
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.protocol_store import ProtocolResource, ProtocolStore
+
+COMMAND_COUNT = 5000
+REPETITIONS = 10
+CREATED_AT = datetime(year=2022, month=1, day=1, tzinfo=timezone.utc)
+
+
+def _build_commands(command_count: int) -> List[commands.Command]:
+    return [
+        commands.WaitForResume(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=CREATED_AT,
+            completedAt=CREATED_AT,
+            params=commands.WaitForResumeParams(message=f"message {i}"),
+            result=commands.WaitForResumeResult(),
+        )
+        for i in range(command_count)
+    ]
+
+
+async def _time_ms(description: str, func: Callable[[], Awaitable[object]]) -> None:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        await func()
+    elapsed = (time.perf_counter() - start) / REPETITIONS
+    print(f"analysis store: {description}: {elapsed * 1e3:.2f} ms")
+
+
+async def _main() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        sql_engine = create_sql_engine(Path(tmp_dir) / "benchmark.db")
+        protocol_store = ProtocolStore.create_empty(sql_engine=sql_engine)
+        subject = AnalysisStore(sql_engine=sql_engine)
+
+        protocol_store.insert(
+            ProtocolResource(
+                protocol_id="protocol-id",
+                created_at=CREATED_AT,
+                source=ProtocolSource(
+                    directory=Path("/dev/null"),
+                    main_file=Path("/dev/null"),
+                    config=JsonProtocolConfig(schema_version=6),
+                    files=[],
+                    metadata={},
+                    labware_definitions=[],
+                ),
+                protocol_key=None,
+            )
+        )
+        subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+        await subject.update(
+            analysis_id="analysis-id",
+            commands=_build_commands(COMMAND_COUNT),
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+
+        await _time_ms(
+            f"parse analysis of {COMMAND_COUNT} commands",
+            lambda: subject.get_by_protocol("protocol-id"),
+        )
+        await _time_ms(
+            f"read analysis document of {COMMAND_COUNT} commands",
+            lambda: subject.get_by_protocol_as_document("protocol-id"),
+        )
+
+        sql_engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark reading commands of a large historical run from the RunStore.
+
+Stores a run with tens of thousands of commands, then times fetching
+a single page of commands and a single command by ID. Both should
+scale with the size of the page, not the size of the run.
+
+Also times storing the same commands incrementally, in the batches
+a run streams them in while it progresses. The slowest batch should
+not grow with the number of commands already stored.
+"""
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, List
+
+from opentrons.protocol_engine import EngineStatus, StateSummary, commands
+
+from robot_server.persistence.database import create_sql_engine
+from robot_server.runs.run_store import RunStore
+
+COMMAND_COUNT = 20000
+PAGE_LENGTH = 20
+BATCH_SIZE = 50
+REPETITIONS = 100
+CREATED_AT = datetime(year=2022, month=1, day=1, tzinfo=timezone.utc)
+
+
+def _build_commands(command_count: int) -> List[commands.Command]:
+    return [
+        commands.WaitForResume(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=CREATED_AT,
+            completedAt=CREATED_AT,
+            params=commands.WaitForResumeParams(message=f"message {i}"),
+            result=commands.WaitForResumeResult(),
+        )
+        for i in range(command_count)
+    ]
+
+
+def _time_ms(description: str, func: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        func()
+    elapsed = (time.perf_counter() - start) / REPETITIONS
+    print(f"run store: {description}: {elapsed * 1e3:.2f} ms")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with TemporaryDirectory() as tmp_dir:
+        sql_engine = create_sql_engine(Path(tmp_dir) / "benchmark.db")
+        subject = RunStore(sql_engine=sql_engine)
+        run_commands = _build_commands(COMMAND_COUNT)
+        summary = StateSummary.construct(
+            status=EngineStatus.SUCCEEDED,
+            errors=[],
+            labware=[],
+            pipettes=[],
+            modules=[],
+            labwareOffsets=[],
+        )
+
+        subject.insert(run_id="run-id", created_at=CREATED_AT, protocol_id=None)
+        start = time.perf_counter()
+        subject.update_run_state(
+            run_id="run-id",
+            summary=summary,
+            commands=run_commands,
+        )
+        print(
+            f"run store: store {COMMAND_COUNT} commands: "
+            f"{(time.perf_counter() - start) * 1e3:.2f} ms"
+        )
+
+        subject.insert(
+            run_id="streamed-run-id", created_at=CREATED_AT, protocol_id=None
+        )
+        batch_times = []
+        for start_index in range(0, COMMAND_COUNT, BATCH_SIZE):
+            start = time.perf_counter()
+            subject.insert_commands(
+                run_id="streamed-run-id",
+                commands=run_commands[start_index : start_index + BATCH_SIZE],
+                start_index=start_index,
+            )
+            batch_times.append(time.perf_counter() - start)
+        print(
+            f"run store: stream {COMMAND_COUNT} commands "
+            f"in batches of {BATCH_SIZE}: {sum(batch_times) * 1e3:.2f} ms total, "
+            f"{batch_times[0] * 1e3:.2f} ms first batch, "
+            f"{max(batch_times) * 1e3:.2f} ms slowest batch"
+        )
+
+        _time_ms(
+            f"first page of {PAGE_LENGTH} of {COMMAND_COUNT} commands",
+            lambda: subject.get_commands_slice(
+                run_id="run-id", cursor=0, length=PAGE_LENGTH
+            ),
+        )
+        _time_ms(
+            f"last page of {PAGE_LENGTH} of {COMMAND_COUNT} commands",
+            lambda: subject.get_commands_slice(
+                run_id="run-id", cursor=None, length=PAGE_LENGTH
+            ),
+        )
+        # bypass the RunStore's cache to measure the database read itself
+        _time_ms(
+            f"one command by ID of {COMMAND_COUNT} commands",
+            lambda: subject.get_command.__wrapped__(
+                subject, run_id="run-id", command_id=f"command-{COMMAND_COUNT // 2}"
+            ),
+        )
+
+        sql_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -23,17 +23,30 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added
+    - Commands are moved from `run_table.commands` into `run_command_table`
+- Version 3
+    - `analysis_table.summary` column added
+    - `analysis_table.completed_analysis` changed from a pickled dict
+      to zlib-compressed JSON
+- Version 4
+    - `analysis_table.content_hash` column and index added
 """
+import json
 import logging
+import pickle
+import zlib
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 from typing_extensions import Final
 
 import sqlalchemy
+from pydantic.json import pydantic_encoder
 
-from .tables import migration_table, run_table
+from .tables import migration_table, run_table, run_command_table, analysis_table
 
-_LATEST_SCHEMA_VERSION: Final = 1
+_LATEST_SCHEMA_VERSION: Final = 4
 
 _log = logging.getLogger(__name__)
 
@@ -53,6 +66,12 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
+            if version < 4:
+                _migrate_3_to_4(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -130,3 +149,100 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    This migration copies each run's pickled `commands` list into
+    `run_command_table`, one row per command. The `run_command` table itself
+    is created by SQLAlchemy. The old `commands` column is left in place so
+    that a downgraded robot-server can still read the runs it knew about.
+
+    Commands are copied as they were stored, without validating them, so that
+    a command that no longer parses only fails the run it belongs to when
+    that run is read, rather than the migration.
+    """
+    select_run_commands = sqlalchemy.select(run_table.c.id, run_table.c.commands)
+
+    for run_row in transaction.execute(select_run_commands).all():
+        if run_row.commands:
+            transaction.execute(
+                sqlalchemy.insert(run_command_table),
+                [
+                    {
+                        "run_id": run_row.id,
+                        "index_in_run": index,
+                        "command_id": command["id"],
+                        "command": json.dumps(command, default=pydantic_encoder),
+                    }
+                    for index, command in enumerate(run_row.commands)
+                ],
+            )
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration adds the following nullable column to the analysis table:
+
+    - Column("summary", sqlalchemy.String, nullable=True)
+
+    It also converts each stored analysis from a pickled dict into
+    zlib-compressed JSON, and fills in its summary.
+    """
+    add_summary_column = sqlalchemy.text("ALTER TABLE analysis ADD summary VARCHAR")
+    transaction.execute(add_summary_column)
+
+    select_analyses = sqlalchemy.select(
+        analysis_table.c.id, analysis_table.c.completed_analysis
+    )
+
+    for analysis_row in transaction.execute(select_analyses).all():
+        analysis = _remove_none(pickle.loads(analysis_row.completed_analysis))
+        summary = {
+            "result": analysis["result"],
+            "errors": analysis["errors"],
+            "labware": analysis["labware"],
+            "pipettes": analysis["pipettes"],
+            "commandCount": len(analysis["commands"]),
+        }
+        transaction.execute(
+            sqlalchemy.update(analysis_table)
+            .where(analysis_table.c.id == analysis_row.id)
+            .values(
+                completed_analysis=zlib.compress(
+                    json.dumps(analysis, default=pydantic_encoder).encode("utf-8")
+                ),
+                summary=json.dumps(summary, default=pydantic_encoder),
+            )
+        )
+
+
+def _migrate_3_to_4(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 4.
+
+    This migration adds the following nullable, indexed column to the analysis table:
+
+    - Column("content_hash", sqlalchemy.String, index=True, nullable=True)
+
+    Existing analyses are left without a hash, so they're never reused.
+    """
+    add_content_hash_column = sqlalchemy.text(
+        "ALTER TABLE analysis ADD content_hash VARCHAR"
+    )
+    add_content_hash_index = sqlalchemy.text(
+        "CREATE INDEX ix_analysis_content_hash ON analysis (content_hash)"
+    )
+    transaction.execute(add_content_hash_column)
+    transaction.execute(add_content_hash_index)
+
+
+def _remove_none(value: Any) -> Any:
+    """Drop `None` values from dicts, to match `BaseModel.json(exclude_none=True)`."""
+    if isinstance(value, dict):
+        return {k: _remove_none(v) for k, v in value.items() if v is not None}
+    elif isinstance(value, list):
+        return [_remove_none(v) for v in value]
+    else:
+        return value
@@ -53,11 +53,17 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.String,
         nullable=False,
     ),
+    # column format changed in schema v3, from a pickled dict
+    # to the analysis document as zlib-compressed JSON
     sqlalchemy.Column(
         "completed_analysis",
         sqlalchemy.LargeBinary,
         nullable=False,
     ),
+    # column added in schema v3
+    sqlalchemy.Column("summary", sqlalchemy.String, nullable=True),
+    # column added in schema v4
+    sqlalchemy.Column("content_hash", sqlalchemy.String, index=True, nullable=True),
 )
 
 
@@ -82,7 +88,7 @@ run_table = sqlalchemy.Table(
     ),
     # column added in schema v1
     sqlalchemy.Column("state_summary", sqlalchemy.PickleType, nullable=True),
-    # column added in schema v1
+    # column added in schema v1, superseded by run_command_table in schema v2
     sqlalchemy.Column("commands", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
     sqlalchemy.Column("engine_status", sqlalchemy.String, nullable=True),
@@ -108,6 +114,34 @@ action_table = sqlalchemy.Table(
     ),
 )
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column("row_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("index_in_run", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("command_id", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("command", sqlalchemy.String, nullable=False),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_command_id",  # An arbitrary name for the index.
+        "run_id",
+        "command_id",
+        unique=True,
+    ),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_index_in_run",  # An arbitrary name for the index.
+        "run_id",
+        "index_in_run",
+        unique=True,
+    ),
+)
+
 
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
@@ -0,0 +1,339 @@
+"""Run protocol analyses in worker processes."""
+import asyncio
+import multiprocessing
+import os
+import resource
+from dataclasses import dataclass
+from logging import getLogger
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+
+from opentrons.config import IS_ROBOT
+from opentrons.config.feature_flags import enable_ot3_hardware_controller
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocols.labware.registry import get_registry
+from opentrons.protocol_runner import ProtocolRunResult, create_simulating_runner
+
+
+_log = getLogger(__name__)
+
+# Generous enough for any reasonable protocol, but stops one that loops forever.
+DEFAULT_TIME_LIMIT = 10 * 60
+
+# The share of the memory available at startup that analyses may use between them,
+# leaving the rest for the server and the robot's other services.
+_ANALYSIS_MEMORY_FRACTION = 0.5
+
+# A worker needs this much to import the protocol runner and analyze
+# a typical protocol, so don't start more workers than can each have it.
+_MIN_WORKER_MEMORY = 256 * 1024**2
+
+_MEMINFO_PATH = Path("/proc/meminfo")
+
+
+class AnalysisCancelledError(Exception):
+    """Exception raised if an analysis was cancelled before it finished."""
+
+    def __init__(self, protocol_id: str) -> None:
+        """Initialize the error's message."""
+        super().__init__(f'Analysis of protocol "{protocol_id}" was cancelled.')
+
+
+class AnalysisWorkerError(RuntimeError):
+    """Exception raised if a worker process could not finish an analysis."""
+
+
+class AnalysisTimeLimitError(AnalysisWorkerError):
+    """Exception raised if an analysis took longer than its time limit."""
+
+
+class AnalysisMemoryLimitError(AnalysisWorkerError):
+    """Exception raised if an analysis needed more than its memory limit."""
+
+
+@dataclass(frozen=True)
+class _WorkerFailure:
+    """An error raised in a worker process, sent back in place of a result."""
+
+    error_type: str
+    detail: str
+
+
+_WorkerResult = Union[ProtocolRunResult, _WorkerFailure]
+
+
+def get_available_memory(meminfo_path: Path = _MEMINFO_PATH) -> Optional[int]:
+    """Get the bytes of memory available to new processes, if the OS reports it."""
+    try:
+        with meminfo_path.open() as meminfo:
+            for line in meminfo:
+                name, _, value = line.partition(":")
+                if name == "MemAvailable":
+                    return int(value.split()[0]) * 1024
+    except (OSError, ValueError, IndexError) as e:
+        _log.warning("Could not read available memory", exc_info=e)
+
+    return None
+
+
+def get_default_max_workers(
+    available_memory: Optional[int],
+    cpu_count: Optional[int],
+    is_ot2: bool,
+) -> int:
+    """Choose how many analyses to run at once.
+
+    An OT-2 has little more memory than its server needs to run a protocol,
+    so it analyzes one protocol at a time. Otherwise, leave a core for the
+    server itself, and only start as many workers as there's memory for.
+    """
+    if is_ot2:
+        return 1
+
+    max_workers = max(1, min(4, (cpu_count or 1) - 1))
+
+    if available_memory is not None:
+        analysis_memory = int(available_memory * _ANALYSIS_MEMORY_FRACTION)
+        max_workers = max(1, min(max_workers, analysis_memory // _MIN_WORKER_MEMORY))
+
+    return max_workers
+
+
+def get_default_memory_limit(
+    available_memory: Optional[int], max_workers: int
+) -> Optional[int]:
+    """Split the memory set aside for analyses evenly between the workers.
+
+    Returns `None`, for no limit, if the available memory isn't known.
+    """
+    if available_memory is None:
+        return None
+
+    analysis_memory = int(available_memory * _ANALYSIS_MEMORY_FRACTION)
+    return max(_MIN_WORKER_MEMORY, analysis_memory // max_workers)
+
+
+def _is_ot2() -> bool:
+    return IS_ROBOT and not enable_ot3_hardware_controller()
+
+
+class AnalysisExecutor:
+    """Analyze protocols in a bounded number of worker processes.
+
+    Each analysis runs in its own process, on its own simulating hardware API,
+    so that a slow or misbehaving protocol can't stall the server's event loop
+    and can be stopped by killing its process. Analyses beyond the maximum
+    number of workers wait for a worker to become free.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        time_limit: float = DEFAULT_TIME_LIMIT,
+        memory_limit: Optional[int] = None,
+        labware_cache_dir: Optional[Path] = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: The maximum number of analyses to run at once,
+                or `None` to choose from the robot type, cores, and memory.
+            time_limit: Seconds an analysis may run for before it's stopped.
+            memory_limit: Bytes of data a worker process may allocate,
+                or `None` to split the available memory between the workers.
+            labware_cache_dir: Where workers save the labware definitions
+                they parse, so that later workers can load them pre-parsed,
+                or `None` to parse them in every worker.
+        """
+        available_memory = get_available_memory()
+
+        if max_workers is None:
+            max_workers = get_default_max_workers(
+                available_memory=available_memory,
+                cpu_count=os.cpu_count(),
+                is_ot2=_is_ot2(),
+            )
+
+        if memory_limit is None:
+            memory_limit = get_default_memory_limit(
+                available_memory=available_memory, max_workers=max_workers
+            )
+
+        _log.info(
+            f"Analyzing up to {max_workers} protocols at once,"
+            f" with a memory limit of {memory_limit} bytes each."
+        )
+
+        self._time_limit = time_limit
+        self._memory_limit = memory_limit
+        self._labware_cache_dir = labware_cache_dir
+        self._worker_slots = asyncio.Semaphore(max_workers)
+        self._jobs: Dict[str, "asyncio.Task[ProtocolRunResult]"] = {}
+        self._cancelled: Set[str] = set()
+
+        # Start workers from a server process that has already imported the
+        # protocol runner, rather than re-importing it for every analysis,
+        # and without forking the robot server's own threads.
+        self._context: BaseContext
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context("forkserver")
+            self._context.set_forkserver_preload([__name__])
+        else:
+            self._context = multiprocessing.get_context("spawn")
+
+    async def analyze(
+        self, protocol_id: str, protocol_source: ProtocolSource
+    ) -> ProtocolRunResult:
+        """Analyze a protocol in a worker process.
+
+        Args:
+            protocol_id: The protocol being analyzed, so its analysis
+                can be cancelled. It must not already be being analyzed.
+            protocol_source: The protocol's files.
+
+        Raises:
+            AnalysisCancelledError: `cancel` was called for the protocol.
+            AnalysisWorkerError: the worker process failed or was stopped
+                for exceeding a limit.
+        """
+        assert protocol_id not in self._jobs, "Protocol is already being analyzed."
+
+        job = asyncio.get_running_loop().create_task(
+            self._run_in_worker(protocol_source)
+        )
+        self._jobs[protocol_id] = job
+
+        try:
+            return await job
+        except asyncio.CancelledError:
+            if protocol_id in self._cancelled:
+                raise AnalysisCancelledError(protocol_id) from None
+            raise
+        finally:
+            del self._jobs[protocol_id]
+            self._cancelled.discard(protocol_id)
+
+    def cancel(self, protocol_id: str) -> None:
+        """Stop analyzing a protocol, if it's being analyzed or waiting to be."""
+        job = self._jobs.get(protocol_id)
+
+        if job is not None and not job.done():
+            _log.info(f'Cancelling analysis of protocol "{protocol_id}".')
+            self._cancelled.add(protocol_id)
+            job.cancel()
+
+    async def close(self) -> None:
+        """Stop all analyses, waiting for their worker processes to exit.
+
+        Intended to be called once, when the server shuts down.
+        """
+        jobs = list(self._jobs.values())
+
+        for job in jobs:
+            job.cancel()
+
+        await asyncio.gather(*jobs, return_exceptions=True)
+
+    async def _run_in_worker(
+        self, protocol_source: ProtocolSource
+    ) -> ProtocolRunResult:
+        async with self._worker_slots:
+            loop = asyncio.get_running_loop()
+            receiver, sender = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_analyze_in_worker,
+                args=(
+                    protocol_source,
+                    sender,
+                    self._memory_limit,
+                    self._labware_cache_dir,
+                ),
+                daemon=True,
+            )
+
+            try:
+                await _start_worker(process, sender)
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(None, _receive, receiver),
+                    timeout=self._time_limit,
+                )
+            except asyncio.TimeoutError:
+                raise AnalysisTimeLimitError(
+                    f"Analysis did not finish within {self._time_limit} seconds."
+                ) from None
+            except EOFError:
+                process.join()
+                raise AnalysisWorkerError(
+                    f"Analysis worker exited with code {process.exitcode}."
+                ) from None
+            finally:
+                # Killing the worker also ends a receive still waiting on it.
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+
+        if isinstance(result, _WorkerFailure):
+            if result.error_type == MemoryError.__name__:
+                raise AnalysisMemoryLimitError(
+                    f"Analysis needed more than {self._memory_limit} bytes of memory."
+                )
+            raise AnalysisWorkerError(f"{result.error_type}: {result.detail}")
+
+        return result
+
+
+async def _start_worker(process: BaseProcess, sender: Connection) -> None:
+    # Starting the first worker waits for the fork server to import the
+    # protocol runner, so keep it off of the event loop. Finish starting
+    # even if cancelled, so that the caller can stop the worker.
+    starting = asyncio.get_running_loop().run_in_executor(None, process.start)
+    try:
+        await asyncio.shield(starting)
+    except asyncio.CancelledError:
+        await starting
+        raise
+    finally:
+        # Only the worker should hold this end, so that receiving ends if it exits.
+        sender.close()
+
+
+def _receive(receiver: Connection) -> _WorkerResult:
+    with receiver:
+        result: _WorkerResult = receiver.recv()
+        return result
+
+
+def _analyze_in_worker(
+    protocol_source: ProtocolSource,
+    sender: Connection,
+    memory_limit: Optional[int],
+    labware_cache_dir: Optional[Path],
+) -> None:
+    # Every worker is a new process, with nothing parsed in memory yet.
+    get_registry().set_cache_dir(labware_cache_dir)
+
+    # Limit the data a worker allocates, rather than its address space,
+    # which counts every shared library mapped in whether or not it's used.
+    if memory_limit is not None:
+        try:
+            resource.setrlimit(resource.RLIMIT_DATA, (memory_limit, memory_limit))
+        except (ValueError, OSError) as e:
+            _log.warning("Could not limit analysis worker memory", exc_info=e)
+
+    result: _WorkerResult
+
+    try:
+        result = asyncio.run(_analyze(protocol_source))
+    except Exception as e:
+        result = _WorkerFailure(error_type=type(e).__name__, detail=str(e))
+
+    with sender:
+        sender.send(result)
+
+
+async def _analyze(protocol_source: ProtocolSource) -> ProtocolRunResult:
+    protocol_runner = await create_simulating_runner()
+    return await protocol_runner.run(protocol_source)
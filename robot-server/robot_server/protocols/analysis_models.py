@@ -2,7 +2,7 @@
 # TODO(mc, 2021-08-25): add modules to simulation result
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Union
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from opentrons.protocol_engine import (
@@ -36,10 +36,34 @@ class AnalysisResult(str, Enum):
 
 
 class AnalysisSummary(BaseModel):
-    """Base model for an analysis of a protocol."""
+    """Base model for an analysis of a protocol.
+
+    The result, equipment, errors and command count are only present
+    once the analysis is completed.
+    """
 
     id: str = Field(..., description="Unique identifier of this analysis resource")
     status: AnalysisStatus = Field(..., description="Status of the analysis")
+    result: Optional[AnalysisResult] = Field(
+        None,
+        description="Whether the protocol is expected to run successfully",
+    )
+    pipettes: Optional[List[LoadedPipette]] = Field(
+        None,
+        description="Pipettes used by the protocol",
+    )
+    labware: Optional[List[LoadedLabware]] = Field(
+        None,
+        description="Labware used by the protocol",
+    )
+    errors: Optional[List[ErrorOccurrence]] = Field(
+        None,
+        description="Any errors the protocol run produced",
+    )
+    commandCount: Optional[int] = Field(
+        None,
+        description="The number of commands the run is expected to produce",
+    )
 
 
 class PendingAnalysis(BaseModel):
@@ -1,13 +1,15 @@
 """Protocol analysis storage."""
 from __future__ import annotations
 
-import pickle
+import json
+import zlib
 from dataclasses import dataclass
 from logging import getLogger
 from typing import Dict, List, Optional
 
 import anyio
 import sqlalchemy
+from pydantic.json import pydantic_encoder
 
 from opentrons.protocol_engine import (
     Command,
@@ -110,6 +112,7 @@ class AnalysisStore:
         labware: List[LoadedLabware],
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
+        content_hash: Optional[str] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -121,6 +124,9 @@ class AnalysisStore:
             pipettes: See `CompletedAnalysis.pipettes`.
             errors: See `CompletedAnalysis.errors`. Also used to infer whether
                 the completed analysis result is `OK` or `NOT_OK`.
+            content_hash: A hash of everything the analysis depends on,
+                so that it can be reused by `reuse_matching()`. If `None`,
+                the analysis will never be reused.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -147,6 +153,7 @@ class AnalysisStore:
             protocol_id=protocol_id,
             analyzer_version=_CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
+            content_hash=content_hash,
         )
         await self._completed_store.add(
             completed_analysis_resource=completed_analysis_resource
@@ -154,6 +161,39 @@ class AnalysisStore:
 
         self._pending_store.remove(analysis_id=analysis_id)
 
+    async def reuse_matching(self, analysis_id: str, content_hash: str) -> bool:
+        """Complete a pending analysis with a copy of a matching completed one.
+
+        An analysis matches if it was stored with the same content hash by this
+        version of the analyzer. The most recent match is copied, so the pending
+        analysis is completed without re-running the protocol.
+
+        Args:
+            analysis_id: The ID of the analysis to complete.
+                Must point to a valid pending analysis.
+            content_hash: The hash of everything the analysis depends on.
+
+        Returns:
+            Whether a matching analysis was found and copied.
+        """
+        protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
+
+        assert (
+            protocol_id is not None
+        ), "Analysis ID to reuse must be for a valid pending analysis."
+
+        reused = await self._completed_store.add_copy_of_matching(
+            analysis_id=analysis_id,
+            protocol_id=protocol_id,
+            analyzer_version=_CURRENT_ANALYZER_VERSION,
+            content_hash=content_hash,
+        )
+
+        if reused:
+            self._pending_store.remove(analysis_id=analysis_id)
+
+        return reused
+
     async def get(self, analysis_id: str) -> ProtocolAnalysis:
         """Get a single protocol analysis by its ID.
 
@@ -172,18 +212,40 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
+    async def get_as_document(self, analysis_id: str) -> str:
+        """Like `get()`, but return the analysis as a JSON document.
+
+        Completed analyses are returned as stored, without being parsed
+        into a `CompletedAnalysis` and serialized again.
+
+        Raises:
+            AnalysisNotFoundError
+        """
+        pending_analysis = self._pending_store.get(analysis_id=analysis_id)
+
+        if pending_analysis is not None:
+            return pending_analysis.json()
+
+        completed_analysis_document = await self._completed_store.get_document_by_id(
+            analysis_id=analysis_id
+        )
+
+        if completed_analysis_document is not None:
+            return completed_analysis_document
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
     def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
+        Completed analyses are summarized from their stored summaries,
+        without reading their commands.
+
         If `protocol_id` doesn't point to a valid protocol, returns an empty list.
         """
-        completed_analysis_ids = self._completed_store.get_ids_by_protocol(
+        completed_analysis_summaries = self._completed_store.get_summaries_by_protocol(
             protocol_id=protocol_id
         )
-        completed_analysis_summaries = [
-            AnalysisSummary.construct(id=analysis_id, status=AnalysisStatus.COMPLETED)
-            for analysis_id in completed_analysis_ids
-        ]
 
         pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
         if pending_analysis is None:
@@ -210,6 +272,22 @@ class AnalysisStore:
         else:
             return completed_analyses + [pending_analysis]
 
+    async def get_by_protocol_as_document(self, protocol_id: str) -> List[str]:
+        """Like `get_by_protocol()`, but return each analysis as a JSON document.
+
+        Completed analyses are returned as stored, without being parsed
+        into `CompletedAnalysis` models and serialized again.
+        """
+        analysis_documents = await self._completed_store.get_documents_by_protocol(
+            protocol_id=protocol_id
+        )
+        pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
+
+        if pending_analysis is None:
+            return analysis_documents
+        else:
+            return analysis_documents + [pending_analysis.json()]
+
 
 class _PendingAnalysisStore:
     """An in-memory store of protocol analyses that are pending.
@@ -278,6 +356,7 @@ class _CompletedAnalysisResource:
     protocol_id: str
     analyzer_version: str
     completed_analysis: CompletedAnalysis
+    content_hash: Optional[str] = None
 
     async def to_sql_values(self) -> Dict[str, object]:
         """Return this data as a dict that can be passed to a SQLALchemy insert.
@@ -290,8 +369,20 @@ class _CompletedAnalysisResource:
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
 
-        def serialize_completed_analysis() -> bytes:
-            return pickle.dumps(self.completed_analysis.dict())
+        def serialize_completed_analysis() -> Dict[str, object]:
+            completed_analysis = self.completed_analysis
+            summary = completed_analysis.dict(
+                include={"result", "errors", "labware", "pipettes"},
+                exclude_none=True,
+            )
+            summary["commandCount"] = len(completed_analysis.commands)
+
+            return {
+                "completed_analysis": _compress_document(
+                    completed_analysis.json(exclude_none=True)
+                ),
+                "summary": json.dumps(summary, default=pydantic_encoder),
+            }
 
         serialized_completed_analysis = await anyio.to_thread.run_sync(
             serialize_completed_analysis,
@@ -304,7 +395,8 @@ class _CompletedAnalysisResource:
             "id": self.id,
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
-            "completed_analysis": serialized_completed_analysis,
+            "content_hash": self.content_hash,
+            **serialized_completed_analysis,
         }
 
     @classmethod
@@ -332,8 +424,13 @@ class _CompletedAnalysisResource:
         protocol_id = sql_row.protocol_id
         assert isinstance(protocol_id, str)
 
+        content_hash = sql_row.content_hash
+        assert content_hash is None or isinstance(content_hash, str)
+
         def parse_completed_analysis() -> CompletedAnalysis:
-            return CompletedAnalysis.parse_obj(pickle.loads(sql_row.completed_analysis))
+            return CompletedAnalysis.parse_raw(
+                _decompress_document(sql_row.completed_analysis)
+            )
 
         completed_analysis = await anyio.to_thread.run_sync(
             parse_completed_analysis,
@@ -347,6 +444,7 @@ class _CompletedAnalysisResource:
             protocol_id=protocol_id,
             analyzer_version=analyzer_version,
             completed_analysis=completed_analysis,
+            content_hash=content_hash,
         )
 
 
@@ -385,22 +483,69 @@ class _CompletedAnalysisStore:
             results = transaction.execute(statement).all()
         return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
 
-    def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
-        """Like `get_by_protocol()`, but return only the ID of each analysis."""
+    async def get_document_by_id(self, analysis_id: str) -> Optional[str]:
+        """Like `get_by_id()`, but return only the stored JSON document."""
+        statement = sqlalchemy.select(analysis_table.c.completed_analysis).where(
+            analysis_table.c.id == analysis_id
+        )
+        with self._sql_engine.begin() as transaction:
+            result = transaction.execute(statement).first()
+
+        if result is None:
+            return None
+
+        return await anyio.to_thread.run_sync(
+            _decompress_document,
+            result.completed_analysis,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+    async def get_documents_by_protocol(self, protocol_id: str) -> List[str]:
+        """Like `get_by_protocol()`, but return only each stored JSON document."""
         statement = (
-            sqlalchemy.select(analysis_table.c.id)
+            sqlalchemy.select(analysis_table.c.completed_analysis)
             .where(analysis_table.c.protocol_id == protocol_id)
             .order_by(sqlite_rowid)
         )
         with self._sql_engine.begin() as transaction:
             results = transaction.execute(statement).all()
 
-        result_ids: List[str] = []
+        def decompress_documents() -> List[str]:
+            return [_decompress_document(r.completed_analysis) for r in results]
+
+        return await anyio.to_thread.run_sync(
+            decompress_documents,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+    def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
+        """Like `get_by_protocol()`, but return only the summary of each analysis.
+
+        This reads the summary column, not the stored analysis itself.
+        """
+        statement = (
+            sqlalchemy.select(analysis_table.c.id, analysis_table.c.summary)
+            .where(analysis_table.c.protocol_id == protocol_id)
+            .order_by(sqlite_rowid)
+        )
+        with self._sql_engine.begin() as transaction:
+            results = transaction.execute(statement).all()
+
+        summaries: List[AnalysisSummary] = []
         for row in results:
             assert isinstance(row.id, str)
-            result_ids.append(row.id)
+            summary = json.loads(row.summary) if row.summary is not None else {}
+            summaries.append(
+                AnalysisSummary.parse_obj(
+                    {"id": row.id, "status": AnalysisStatus.COMPLETED, **summary}
+                )
+            )
 
-        return result_ids
+        return summaries
 
     async def add(
         self, completed_analysis_resource: _CompletedAnalysisResource
@@ -411,6 +556,70 @@ class _CompletedAnalysisStore:
         with self._sql_engine.begin() as transaction:
             transaction.execute(statement)
 
+    async def add_copy_of_matching(
+        self,
+        analysis_id: str,
+        protocol_id: str,
+        analyzer_version: str,
+        content_hash: str,
+    ) -> bool:
+        """Copy the newest analysis with the given hash and analyzer version.
+
+        The copy is given the new ID and protocol. Returns whether there was
+        an analysis to copy.
+        """
+        select_matching = (
+            sqlalchemy.select(
+                analysis_table.c.completed_analysis, analysis_table.c.summary
+            )
+            .where(
+                analysis_table.c.content_hash == content_hash,
+                analysis_table.c.analyzer_version == analyzer_version,
+            )
+            .order_by(sqlite_rowid.desc())
+            .limit(1)
+        )
+        with self._sql_engine.begin() as transaction:
+            match = transaction.execute(select_matching).first()
+
+        if match is None:
+            return False
+
+        matching_document = match.completed_analysis
+
+        def copy_completed_analysis() -> bytes:
+            document = json.loads(_decompress_document(matching_document))
+            document["id"] = analysis_id
+            return _compress_document(json.dumps(document))
+
+        completed_analysis = await anyio.to_thread.run_sync(
+            copy_completed_analysis,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+        statement = analysis_table.insert().values(
+            id=analysis_id,
+            protocol_id=protocol_id,
+            analyzer_version=analyzer_version,
+            completed_analysis=completed_analysis,
+            summary=match.summary,
+            content_hash=content_hash,
+        )
+        with self._sql_engine.begin() as transaction:
+            transaction.execute(statement)
+
+        return True
+
 
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
+
+
+def _compress_document(document: str) -> bytes:
+    return zlib.compress(document.encode("utf-8"))
+
+
+def _decompress_document(compressed_document: bytes) -> str:
+    return zlib.decompress(compressed_document).decode("utf-8")
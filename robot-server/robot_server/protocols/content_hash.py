@@ -0,0 +1,61 @@
+"""Hash everything that a protocol's analysis depends on."""
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+from opentrons import __version__ as opentrons_version
+from opentrons.config.advanced_settings import get_all_adv_settings
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocols.api_support.constants import USER_DEFS_PATH
+
+
+def compute_content_hash(
+    protocol_source: ProtocolSource,
+    custom_labware_dir: Optional[Path] = None,
+) -> str:
+    """Compute a hash identifying the analysis of a protocol.
+
+    Two protocols with the same hash have the same analysis. The hash covers
+    the names, roles and contents of the protocol's files, which include any
+    custom labware definitions uploaded with it, along with the software
+    version and feature flags that simulation depends on.
+
+    It also covers the paths and contents of the custom labware definitions
+    installed on the robot, in `custom_labware_dir` or USER_DEFS_PATH by
+    default, since Python protocols can load those by name.
+
+    This reads every protocol file and custom labware definition, so avoid
+    calling it on the event loop.
+    """
+    content_hash = hashlib.sha256()
+
+    def add(value: object) -> None:
+        data = str(value).encode("utf-8")
+        content_hash.update(len(data).to_bytes(8, "big"))
+        content_hash.update(data)
+
+    add(opentrons_version)
+
+    for setting_id, setting in sorted(get_all_adv_settings().items()):
+        add(setting_id)
+        add(setting.value)
+
+    def add_file(path: Path) -> None:
+        file_contents = path.read_bytes()
+        content_hash.update(len(file_contents).to_bytes(8, "big"))
+        content_hash.update(file_contents)
+
+    for source_file in sorted(protocol_source.files, key=lambda f: f.path.name):
+        add(source_file.path.name)
+        add(source_file.role.value)
+        add_file(source_file.path)
+
+    if custom_labware_dir is None:
+        custom_labware_dir = USER_DEFS_PATH
+
+    if custom_labware_dir.is_dir():
+        for definition_path in sorted(custom_labware_dir.rglob("*.json")):
+            add(definition_path.relative_to(custom_labware_dir).as_posix())
+            add_file(definition_path)
+
+    return content_hash.hexdigest()
@@ -10,7 +10,6 @@ from pathlib import Path
 from anyio import Path as AsyncPath
 
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
 
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.deletion_planner import ProtocolDeletionPlanner
@@ -21,16 +20,19 @@ from .protocol_store import (
     ProtocolStore,
 )
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_executor import AnalysisExecutor
 from .analysis_store import AnalysisStore
 
 
 _PROTOCOL_FILES_SUBDIRECTORY: Final = "protocols"
+_LABWARE_CACHE_SUBDIRECTORY: Final = "labware_cache"
 
 _log = logging.getLogger(__name__)
 
 _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
+_analysis_executor_accessor = AppStateAccessor[AnalysisExecutor]("analysis_executor")
 
 
 def get_protocol_reader() -> ProtocolReader:
@@ -87,23 +89,48 @@ def get_analysis_store(
     return analysis_store
 
 
+async def get_analysis_executor(
+    app_state: AppState = Depends(get_app_state),
+    persistence_directory: Path = Depends(get_persistence_directory),
+) -> AnalysisExecutor:
+    """Get a singleton AnalysisExecutor to run analyses in worker processes."""
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is None:
+        analysis_executor = AnalysisExecutor(
+            labware_cache_dir=persistence_directory / _LABWARE_CACHE_SUBDIRECTORY
+        )
+        _analysis_executor_accessor.set_on(app_state, analysis_executor)
+
+    return analysis_executor
+
+
+async def clean_up_analysis_executor(app_state: AppState) -> None:
+    """Stop any analyses still running when the server shuts down."""
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is not None:
+        await analysis_executor.close()
+
+
 async def get_protocol_analyzer(
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_executor=analysis_executor,
         analysis_store=analysis_store,
     )
 
 
 async def get_protocol_auto_deleter(
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> ProtocolAutoDeleter:
     """Get a `ProtocolAutoDeleter` to delete old protocols."""
     return ProtocolAutoDeleter(
         protocol_store=protocol_store,
         deletion_planner=ProtocolDeletionPlanner(),
+        analysis_executor=analysis_executor,
     )
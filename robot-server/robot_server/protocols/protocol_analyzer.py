@@ -1,10 +1,20 @@
 """Protocol analysis module."""
 import logging
+from datetime import datetime, timezone
+from uuid import uuid4
 
-from opentrons.protocol_runner import ProtocolRunner
+import anyio
+
+from opentrons.protocol_engine import ErrorOccurrence
 
 from .protocol_store import ProtocolResource
 from .analysis_store import AnalysisStore
+from .analysis_executor import (
+    AnalysisCancelledError,
+    AnalysisExecutor,
+    AnalysisWorkerError,
+)
+from .content_hash import compute_content_hash
 
 
 log = logging.getLogger(__name__)
@@ -15,11 +25,11 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        analysis_executor: AnalysisExecutor,
         analysis_store: AnalysisStore,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._analysis_executor = analysis_executor
         self._analysis_store = analysis_store
 
     async def analyze(
@@ -27,8 +37,50 @@ class ProtocolAnalyzer:
         protocol_resource: ProtocolResource,
         analysis_id: str,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource.source)
+        """Analyze a given protocol, storing the analysis when complete.
+
+        If an identical protocol has already been analyzed by this software,
+        with the same settings, a copy of that analysis is stored instead.
+
+        If the analysis can't be completed, because it exceeded its limits or its
+        worker failed, the analysis is stored with the error. If it's cancelled,
+        because its protocol was deleted, nothing is stored.
+        """
+        content_hash = await anyio.to_thread.run_sync(
+            compute_content_hash, protocol_resource.source
+        )
+
+        if await self._analysis_store.reuse_matching(
+            analysis_id=analysis_id, content_hash=content_hash
+        ):
+            log.info(f'Completed analysis "{analysis_id}" from a matching analysis.')
+            return
+
+        try:
+            result = await self._analysis_executor.analyze(
+                protocol_id=protocol_resource.protocol_id,
+                protocol_source=protocol_resource.source,
+            )
+        except AnalysisCancelledError:
+            log.info(f'Cancelled analysis "{analysis_id}".')
+            return
+        except AnalysisWorkerError as e:
+            log.warning(f'Analysis "{analysis_id}" failed.', exc_info=e)
+            await self._analysis_store.update(
+                analysis_id=analysis_id,
+                commands=[],
+                labware=[],
+                pipettes=[],
+                errors=[
+                    ErrorOccurrence(
+                        id=str(uuid4()),
+                        createdAt=datetime.now(tz=timezone.utc),
+                        errorType=type(e).__name__,
+                        detail=str(e),
+                    )
+                ],
+            )
+            return
 
         log.info(f'Completed analysis "{analysis_id}".')
 
@@ -38,4 +90,5 @@ class ProtocolAnalyzer:
             labware=result.state_summary.labware,
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
+            content_hash=content_hash,
         )
@@ -5,6 +5,7 @@ from logging import getLogger
 
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from .protocol_store import ProtocolStore
+from .analysis_executor import AnalysisExecutor
 
 
 _log = getLogger(__name__)
@@ -15,9 +16,11 @@ class ProtocolAutoDeleter:  # noqa: D101
         self,
         protocol_store: ProtocolStore,
         deletion_planner: ProtocolDeletionPlanner,
+        analysis_executor: AnalysisExecutor,
     ) -> None:
         self._protocol_store = protocol_store
         self._deletion_planner = deletion_planner
+        self._analysis_executor = analysis_executor
 
     def make_room_for_new_protocol(self) -> None:  # noqa: D102
         protocol_run_usage_info = self._protocol_store.get_usage_info()
@@ -33,3 +36,4 @@ class ProtocolAutoDeleter:  # noqa: D101
             )
         for protocol_id in protocol_ids_to_delete:
             self._protocol_store.remove(protocol_id=protocol_id)
+            self._analysis_executor.cancel(protocol_id=protocol_id)
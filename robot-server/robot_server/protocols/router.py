@@ -19,11 +19,13 @@ from robot_server.service.json_api import (
     SimpleEmptyBody,
     MultiBodyMeta,
     PydanticResponse,
+    PreSerializedResponse,
 )
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_models import Protocol, ProtocolFile, Metadata
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_executor import AnalysisExecutor
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
 from .analysis_models import ProtocolAnalysis
 from .protocol_store import (
@@ -39,6 +41,7 @@ from .dependencies import (
     get_analysis_store,
     get_protocol_analyzer,
     get_protocol_directory,
+    get_analysis_executor,
 )
 
 
@@ -274,12 +277,14 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_executor: Worker processes that analyze protocols.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
@@ -290,6 +295,8 @@ async def delete_protocol_by_id(
     except ProtocolUsedByRunError as e:
         raise ProtocolUsedByRun(detail=str(e)).as_error(status.HTTP_409_CONFLICT) from e
 
+    analysis_executor.cancel(protocol_id=protocolId)
+
     return await PydanticResponse.create(
         content=SimpleEmptyBody.construct(),
         status_code=status.HTTP_200_OK,
@@ -308,10 +315,11 @@ async def get_protocol_analyses(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleMultiBody[ProtocolAnalysis]]:
+) -> PreSerializedResponse:
     """Get a protocol's full analyses list.
 
     Analyses are returned in order from least-recently started to most-recently started.
+    Stored analyses are sent as-is, without being parsed into response models.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
@@ -323,13 +331,11 @@ async def get_protocol_analyses(
             status.HTTP_404_NOT_FOUND
         )
 
-    analyses = await analysis_store.get_by_protocol(protocolId)
+    analyses = await analysis_store.get_by_protocol_as_document(protocolId)
 
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=analyses,
-            meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
-        )
+    return PreSerializedResponse.simple_multi_body(
+        data=analyses,
+        meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
     )
 
 
@@ -348,7 +354,7 @@ async def get_protocol_analysis_by_id(
     analysisId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleBody[ProtocolAnalysis]]:
+) -> PreSerializedResponse:
     """Get a protocol analysis by analysis ID.
 
     Arguments:
@@ -365,10 +371,10 @@ async def get_protocol_analysis_by_id(
     try:
         # TODO(mm, 2022-04-28): This will erroneously return an analysis even if
         # this analysis isn't owned by this protocol. This should be an error.
-        analysis = await analysis_store.get(analysisId)
+        analysis = await analysis_store.get_as_document(analysisId)
     except AnalysisNotFoundError as error:
         raise AnalysisNotFound(detail=str(error)).as_error(
             status.HTTP_404_NOT_FOUND
         ) from error
 
-    return await PydanticResponse.create(content=SimpleBody.construct(data=analysis))
+    return PreSerializedResponse.simple_body(data=analysis)
@@ -0,0 +1,178 @@
+"""Incrementally persist a run's commands while the run progresses."""
+import asyncio
+import logging
+from contextlib import suppress
+from functools import partial
+from itertools import takewhile
+from typing import Optional
+
+import anyio
+
+from opentrons.protocol_engine import AbstractPlugin, actions as pe_actions
+from opentrons.protocol_engine.commands import Command, CommandStatus
+
+from .run_store import RunStore
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class RunCommandPersister(AbstractPlugin):
+    """A ProtocolEngine plugin to stream a run's commands into the RunStore.
+
+    Rather than writing a run's whole command list to the database
+    when the run is cleared, completed commands are flushed in batches
+    while the run progresses: as soon as `batch_size` command updates
+    are waiting, or every `flush_interval` seconds otherwise.
+
+    Commands are flushed in order, so the database always holds an unbroken
+    prefix of the run's commands. If the robot goes down mid-run, every
+    command up to the last flush is still available afterwards.
+
+    When the engine is finished, any remaining commands, including
+    ones that never completed, are flushed before the plugin is torn down.
+
+    Commands are written to the database in a worker thread, so that a
+    flush doesn't hold up the event loop, and with it the run.
+
+    This doesn't bound the memory used by a long run: the engine's command
+    state still holds every command until the run is cleared, since the engine
+    and the run endpoints look commands up there, not in the database.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        run_store: RunStore,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize the plugin with its dependencies.
+
+        Args:
+            run_id: The run whose commands to persist.
+            run_store: Where to persist the run's commands.
+            batch_size: How many command updates may pile up
+                before a flush is triggered early.
+            flush_interval: Maximum time, in seconds, between flushes.
+        """
+        self._run_id = run_id
+        self._run_store = run_store
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+        self._persisted_count = 0
+        self._pending_updates = 0
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._flush_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def persisted_count(self) -> int:
+        """The number of commands, from the start of the run, already persisted."""
+        return self._persisted_count
+
+    def setup(self) -> None:
+        """Kick off a background task to flush completed commands."""
+        self._batch_ready = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def teardown(self) -> None:
+        """Stop flushing in the background and persist all remaining commands."""
+        if self._flush_task is not None and self._batch_ready is not None:
+            # Rather than cancel the task, which would leave a worker thread
+            # writing concurrently with the final flush, let it finish its
+            # current flush and wake it up to stop.
+            self._stopping = True
+            self._batch_ready.set()
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush(include_incomplete=True)
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        """Trigger an early flush once enough commands have been updated."""
+        if isinstance(
+            action, (pe_actions.UpdateCommandAction, pe_actions.FailCommandAction)
+        ):
+            self._pending_updates += 1
+
+            if (
+                self._pending_updates >= self._batch_size
+                and self._batch_ready is not None
+            ):
+                self._batch_ready.set()
+
+    async def flush(self, include_incomplete: bool = False) -> None:
+        """Persist commands that have not been persisted yet.
+
+        Args:
+            include_incomplete: Also persist commands that are still queued
+                or running. Otherwise, stop at the first incomplete command,
+                so a command is never persisted before it has its final result.
+        """
+        self._pending_updates = 0
+
+        while True:
+            # get_slice clamps its cursor to the last command, so a mismatched
+            # cursor means there are no more commands past the persisted ones
+            command_slice = self.state.commands.get_slice(
+                cursor=self._persisted_count,
+                length=self._batch_size,
+            )
+
+            if command_slice.cursor != self._persisted_count:
+                break
+
+            commands = (
+                command_slice.commands
+                if include_incomplete
+                else list(takewhile(_is_complete, command_slice.commands))
+            )
+
+            if len(commands) == 0:
+                break
+
+            try:
+                # If this is cancelled, the worker thread may still be writing.
+                # insert_commands replaces any commands already stored from
+                # start_index on, so writing the same commands again is safe.
+                await anyio.to_thread.run_sync(
+                    partial(
+                        self._run_store.insert_commands,
+                        run_id=self._run_id,
+                        commands=commands,
+                        start_index=self._persisted_count,
+                    )
+                )
+            except Exception:
+                # Leave the cursor in place so the commands are retried next flush
+                log.exception(f"Unable to persist commands of run {self._run_id}")
+                break
+
+            self._persisted_count += len(commands)
+
+            if len(commands) < len(command_slice.commands):
+                break
+
+    async def _flush_periodically(self) -> None:
+        assert self._batch_ready is not None
+
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._batch_ready.wait(), timeout=self._flush_interval
+                )
+
+            if self._stopping:
+                return
+
+            self._batch_ready.clear()
+            await self.flush()
+
+
+def _is_complete(command: Command) -> bool:
+    return command.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED)
@@ -16,6 +16,7 @@ from robot_server.service.task_runner import TaskRunner
 
 from .engine_store import EngineStore
 from .run_store import RunResource, RunStore
+from .run_command_persister import RunCommandPersister
 from .run_models import Run
 
 
@@ -61,6 +62,9 @@ class RunDataManager:
     Provides a facade to both an EngineStore (current run) and a RunStore
     (historical runs). Returns `Run` response models to the router.
 
+    The current run's commands are streamed into the RunStore as they
+    complete, so they do not need to be written out when the run is archived.
+
     Args:
         engine_store: In-memory store of the current run's ProtocolEngine.
         run_store: Persistent database of current and historical run data.
@@ -105,7 +109,7 @@ class RunDataManager:
             self._run_store.update_run_state(
                 run_id=prev_run_id,
                 summary=prev_run_result.state_summary,
-                commands=prev_run_result.commands,
+                commands=None,
             )
 
         state_summary = await self._engine_store.create(
@@ -118,6 +122,9 @@ class RunDataManager:
             created_at=created_at,
             protocol_id=protocol.protocol_id if protocol is not None else None,
         )
+        self._engine_store.engine.add_plugin(
+            RunCommandPersister(run_id=run_id, run_store=self._run_store)
+        )
 
         return _build_run(
             run_resource=run_resource,
@@ -198,11 +205,11 @@ class RunDataManager:
         next_current = current if current is False else True
 
         if next_current is False:
-            commands, state_summary = await self._engine_store.clear()
+            state_summary = (await self._engine_store.clear()).state_summary
             run_resource = self._run_store.update_run_state(
                 run_id=run_id,
                 summary=state_summary,
-                commands=commands,
+                commands=None,
             )
         else:
             state_summary = self._engine_store.engine.state_view.get_summary()
@@ -3,16 +3,16 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from typing import Dict, List, Optional, Sequence
 
 import sqlalchemy
-from pydantic import parse_obj_as
+from pydantic import parse_raw_as
 
 from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table
+from robot_server.persistence import run_table, run_command_table, action_table
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
@@ -62,14 +62,18 @@ class RunStore:
         self,
         run_id: str,
         summary: StateSummary,
-        commands: List[Command],
+        commands: Optional[List[Command]],
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
+        Any commands previously stored for the run are replaced.
+
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
-            commands: The run's commands.
+            commands: The run's commands. If `None`, the run's commands
+                have already been stored with `insert_commands`,
+                and are left as they are.
 
         Returns:
             The run resource.
@@ -82,13 +86,14 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
                 )
             )
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         select_run_resource = sqlalchemy.select(_run_columns).where(
             run_table.c.id == run_id
         )
@@ -107,9 +112,67 @@ class RunStore:
 
             action_rows = transaction.execute(select_actions).all()
 
+            if commands is not None:
+                transaction.execute(delete_commands)
+
+                if len(commands) > 0:
+                    transaction.execute(
+                        sqlalchemy.insert(run_command_table),
+                        _convert_commands_to_sql_values(
+                            run_id=run_id, commands=commands
+                        ),
+                    )
+
         self._clear_caches()
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
+    def insert_commands(
+        self,
+        run_id: str,
+        commands: Sequence[Command],
+        start_index: int,
+    ) -> None:
+        """Store a contiguous batch of a run's commands.
+
+        Used to persist a run's commands incrementally, while the run progresses.
+        Any commands previously stored for the run at or after `start_index`
+        are replaced.
+
+        Args:
+            run_id: The run the commands belong to.
+            commands: The commands to store, in order.
+            start_index: The index in the run of the first command in `commands`.
+
+        Raises:
+            RunNotFoundError: Run ID was not found in the database.
+            sqlalchemy.exc.IntegrityError: The commands could not be stored
+                for any other reason, like a duplicate command ID.
+        """
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.index_in_run >= start_index,
+        )
+
+        with self._sql_engine.begin() as transaction:
+            transaction.execute(delete_commands)
+
+            if len(commands) > 0:
+                try:
+                    transaction.execute(
+                        sqlalchemy.insert(run_command_table),
+                        _convert_commands_to_sql_values(
+                            run_id=run_id,
+                            commands=commands,
+                            start_index=start_index,
+                        ),
+                    )
+                except sqlalchemy.exc.IntegrityError as e:
+                    if _is_foreign_key_error(e):
+                        raise RunNotFoundError(run_id=run_id) from e
+                    raise
+
+        self._clear_caches()
+
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
 
@@ -258,22 +321,6 @@ class RunStore:
             else None
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
-
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
-        )
-
     def get_commands_slice(
         self,
         run_id: str,
@@ -294,18 +341,36 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        command_intent_dicts = self._get_all_unparsed_commands(run_id)
-        commands_length = len(command_intent_dicts)
-        if cursor is None:
-            cursor = commands_length - length
-
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
-        sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_intent_dicts[actual_cursor:stop]
-        ]
+        select_run = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        select_count = (
+            sqlalchemy.select(sqlalchemy.func.count())
+            .select_from(run_command_table)
+            .where(run_command_table.c.run_id == run_id)
+        )
+
+        with self._sql_engine.begin() as transaction:
+            if transaction.execute(select_run).first() is None:
+                raise RunNotFoundError(run_id=run_id)
+
+            commands_length: int = transaction.execute(select_count).scalar_one()
+            if cursor is None:
+                cursor = commands_length - length
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            slice_rows = transaction.execute(select_slice).all()
+
+        sliced_commands = [_parse_command(row.command) for row in slice_rows]
 
         return CommandSlice(
             cursor=actual_cursor,
@@ -328,21 +393,22 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        select_run = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
         )
+
         with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
+            if transaction.execute(select_run).first() is None:
+                raise RunNotFoundError(run_id=run_id)
 
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
+            row = transaction.execute(select_command).first()
 
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
+        if row is None:
+            raise CommandNotFoundError(command_id=command_id)
+
+        return _parse_command(row.command)
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -357,8 +423,12 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
         if result.rowcount < 1:
@@ -372,7 +442,6 @@ class RunStore:
         self.get_all.cache_clear()
         self.get_state_summary.cache_clear()
         self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
 
 
 # The columns that must be present in a row passed to _convert_row_to_run().
@@ -425,14 +494,37 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
 ) -> Dict[str, object]:
     return {
         "state_summary": state_summary.dict(),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
         "_updated_at": utc_now(),
     }
+
+
+def _convert_commands_to_sql_values(
+    run_id: str,
+    commands: Sequence[Command],
+    start_index: int = 0,
+) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": index,
+            "command_id": command.id,
+            "command": command.json(),
+        }
+        for index, command in enumerate(commands, start=start_index)
+    ]
+
+
+def _parse_command(command_json: str) -> Command:
+    return parse_raw_as(Command, command_json)  # type: ignore[arg-type]
+
+
+def _is_foreign_key_error(error: sqlalchemy.exc.IntegrityError) -> bool:
+    # SQLite reports every kind of constraint failure as an IntegrityError,
+    # distinguished only by its message.
+    return "FOREIGN KEY constraint failed" in str(error.orig)
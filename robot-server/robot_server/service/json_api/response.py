@@ -1,9 +1,9 @@
 from __future__ import annotations
 from anyio import to_thread
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
 
 
@@ -140,6 +140,36 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         return content.json().encode(self.charset)
 
 
+class PreSerializedResponse(Response):
+    """A JSON response built around resources that are already serialized.
+
+    Endpoints that read JSON documents out of storage can use this class
+    to send those documents as-is, rather than parsing them into models
+    only to serialize them again. The body is rendered in the same form
+    as the equivalent `PydanticResponse`.
+    """
+
+    media_type = "application/json"
+
+    @classmethod
+    def simple_body(cls, data: str, status_code: int = 200) -> PreSerializedResponse:
+        """Create a `SimpleBody` response from a serialized resource."""
+        return cls(content=f'{{"data": {data}}}', status_code=status_code)
+
+    @classmethod
+    def simple_multi_body(
+        cls,
+        data: Sequence[str],
+        meta: MultiBodyMeta,
+        status_code: int = 200,
+    ) -> PreSerializedResponse:
+        """Create a `SimpleMultiBody` response from serialized resources."""
+        return cls(
+            content=f'{{"data": [{", ".join(data)}], "meta": {meta.json()}}}',
+            status_code=status_code,
+        )
+
+
 # TODO(mc, 2021-12-09): remove this model
 class DeprecatedResponseDataModel(BaseModel):
     """A model representing an identifiable resource of the server.
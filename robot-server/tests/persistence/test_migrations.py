@@ -1,22 +1,54 @@
 """Test SQL database migrations."""
+import json
+import pickle
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 import sqlalchemy
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import]
 
+from opentrons.protocol_engine import commands as pe_commands, types as pe_types
+from opentrons.types import DeckSlotName, MountType
+
 from robot_server.persistence.database import create_sql_engine
+from robot_server.protocols.analysis_models import (
+    AnalysisResult,
+    AnalysisStatus,
+    AnalysisSummary,
+    CompletedAnalysis,
+)
+from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.persistence.tables import (
     migration_table,
     run_table,
+    run_command_table,
     action_table,
     protocol_table,
     analysis_table,
 )
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+TABLES = [run_table, run_command_table, action_table, protocol_table, analysis_table]
+
+
+def _drop_analysis_summary(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Recreate the analysis table as it was before schema version 3."""
+    sql_engine.execute("DROP TABLE analysis")
+    sql_engine.execute(
+        """
+        CREATE TABLE analysis (
+            id VARCHAR NOT NULL,
+            protocol_id VARCHAR NOT NULL,
+            analyzer_version VARCHAR NOT NULL,
+            completed_analysis BLOB NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(protocol_id) REFERENCES protocol (id)
+        )
+        """
+    )
 
 
 @pytest.fixture
@@ -26,6 +58,7 @@ def database_v0(tmp_path: Path) -> Path:
     sql_engine = create_sql_engine(db_path)
     sql_engine.execute("DROP TABLE migration")
     sql_engine.execute("DROP TABLE run")
+    _drop_analysis_summary(sql_engine)
     sql_engine.execute(
         """
         CREATE TABLE run (
@@ -46,6 +79,53 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP TABLE run_command")
+    _drop_analysis_summary(sql_engine)
+    sql_engine.execute("UPDATE migration SET version = 1")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    _drop_analysis_summary(sql_engine)
+    sql_engine.execute("UPDATE migration SET version = 2")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP TABLE analysis")
+    sql_engine.execute(
+        """
+        CREATE TABLE analysis (
+            id VARCHAR NOT NULL,
+            protocol_id VARCHAR NOT NULL,
+            analyzer_version VARCHAR NOT NULL,
+            completed_analysis BLOB NOT NULL,
+            summary VARCHAR,
+            PRIMARY KEY (id),
+            FOREIGN KEY(protocol_id) REFERENCES protocol (id)
+        )
+        """
+    )
+    sql_engine.execute("UPDATE migration SET version = 3")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v4(tmp_path: Path) -> Path:
+    """Create a database matching schema version 4."""
+    db_path = tmp_path / "migration-test-v4.db"
+    sql_engine = create_sql_engine(db_path)
     sql_engine.dispose()
     return db_path
 
@@ -64,19 +144,193 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
 
 
 @pytest.mark.parametrize(
-    "database_path",
+    ("database_path", "expected_versions"),
     [
-        lazy_fixture("database_v0"),
-        lazy_fixture("database_v1"),
+        (lazy_fixture("database_v0"), [4]),
+        (lazy_fixture("database_v1"), [1, 4]),
+        (lazy_fixture("database_v2"), [2, 4]),
+        (lazy_fixture("database_v3"), [3, 4]),
+        (lazy_fixture("database_v4"), [4]),
     ],
 )
-def test_migration(subject: sqlalchemy.engine.Engine) -> None:
+def test_migration(
+    subject: sqlalchemy.engine.Engine,
+    expected_versions: List[int],
+) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert [m.version for m in migrations] == expected_versions
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migrate_run_commands_1_to_2(database_v1: Path) -> None:
+    """It should move pickled run commands into the run_command table."""
+    command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+
+    sql_engine = create_sql_engine(database_v1)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            commands=[command.dict()],
+        )
+    )
+    _drop_analysis_summary(sql_engine)
+    sql_engine.execute("UPDATE migration SET version = 1")
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    rows = subject.execute(sqlalchemy.select(run_command_table)).all()
+    subject.dispose()
+
+    assert [(r.run_id, r.index_in_run, r.command_id) for r in rows] == [
+        ("run-id", 0, "command-id")
+    ]
+    assert pe_commands.WaitForResume.parse_raw(rows[0].command) == command
+
+
+def test_migrate_invalid_run_commands_1_to_2(database_v1: Path) -> None:
+    """It should move run commands that no longer validate without failing."""
+    command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+    invalid_command = {
+        "id": "invalid-command-id",
+        "commandType": "notARealCommand",
+        "createdAt": datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    }
+
+    sql_engine = create_sql_engine(database_v1)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            commands=[invalid_command, command.dict()],
+        )
+    )
+    _drop_analysis_summary(sql_engine)
+    sql_engine.execute("UPDATE migration SET version = 1")
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    rows = subject.execute(sqlalchemy.select(run_command_table)).all()
+    subject.dispose()
+
+    assert [(r.run_id, r.index_in_run, r.command_id) for r in rows] == [
+        ("run-id", 0, "invalid-command-id"),
+        ("run-id", 1, "command-id"),
+    ]
+    assert json.loads(rows[0].command) == {
+        "id": "invalid-command-id",
+        "commandType": "notARealCommand",
+        "createdAt": "2021-01-01T00:00:00+00:00",
+    }
+    assert pe_commands.WaitForResume.parse_raw(rows[1].command) == command
+
+
+def test_migrate_analyses_2_to_3(database_v2: Path) -> None:
+    """It should convert pickled analyses to compressed JSON with a summary."""
+    labware = pe_types.LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="namespace/load-name/42",
+        location=pe_types.DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+    )
+    pipette = pe_types.LoadedPipette(
+        id="pipette-id",
+        pipetteName=pe_types.PipetteName.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+    analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        labware=[labware],
+        pipettes=[pipette],
+        commands=[
+            pe_commands.WaitForResume(
+                id="command-id",
+                key="command-key",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+                params=pe_commands.WaitForResumeParams(message="hello world"),
+                result=pe_commands.WaitForResumeResult(),
+            )
+        ],
+        errors=[],
+    )
+
+    # Insert the old data without running migrations
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v2}")
+    sql_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        )
+    )
+    sql_engine.execute(
+        "INSERT INTO analysis VALUES (?, ?, ?, ?)",
+        ("analysis-id", "protocol-id", "initial", pickle.dumps(analysis.dict())),
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v2)
+    row = subject.execute(sqlalchemy.select(analysis_table)).one()
+    summaries = AnalysisStore(sql_engine=subject).get_summaries_by_protocol(
+        "protocol-id"
+    )
+    subject.dispose()
+
+    assert CompletedAnalysis.parse_raw(zlib.decompress(row.completed_analysis)) == (
+        analysis
+    )
+    assert json.loads(row.summary) == {
+        "result": "ok",
+        "errors": [],
+        "labware": [json.loads(labware.json(exclude_none=True))],
+        "pipettes": [json.loads(pipette.json())],
+        "commandCount": 1,
+    }
+    assert summaries == [
+        AnalysisSummary(
+            id="analysis-id",
+            status=AnalysisStatus.COMPLETED,
+            result=AnalysisResult.OK,
+            labware=[labware],
+            pipettes=[pipette],
+            errors=[],
+            commandCount=1,
+        )
+    ]
+
+
+def test_migrate_analyses_3_to_4(database_v3: Path) -> None:
+    """It should add an indexed content hash column to the analysis table."""
+    subject = create_sql_engine(database_v3)
+    inspector = sqlalchemy.inspect(subject)
+    columns = [c["name"] for c in inspector.get_columns("analysis")]
+    indexes = inspector.get_indexes("analysis")
+    subject.dispose()
+
+    assert "content_hash" in columns
+    assert {"name": "ix_analysis_content_hash", "column_names": ["content_hash"]} in [
+        {"name": i["name"], "column_names": i["column_names"]} for i in indexes
+    ]
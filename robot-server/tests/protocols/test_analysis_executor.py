@@ -0,0 +1,164 @@
+"""Tests for the AnalysisExecutor."""
+import asyncio
+from pathlib import Path
+from textwrap import dedent
+from typing import Optional
+
+import pytest
+
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_executor import (
+    AnalysisCancelledError,
+    AnalysisExecutor,
+    AnalysisTimeLimitError,
+    get_available_memory,
+    get_default_max_workers,
+    get_default_memory_limit,
+)
+
+_MIB = 1024**2
+
+
+async def _read_python_protocol(tmp_path: Path, run_body: str) -> ProtocolSource:
+    protocol_file = tmp_path / "protocol.py"
+    protocol_file.write_text(
+        dedent(
+            """
+            import time
+
+            metadata = {"apiLevel": "2.12"}
+
+            def run(ctx):
+            """
+        )
+        + f"    {run_body}\n"
+    )
+    return await ProtocolReader().read_saved(files=[protocol_file], directory=None)
+
+
+def test_get_available_memory(tmp_path: Path) -> None:
+    """It should read the available memory from meminfo, if it can."""
+    meminfo_path = tmp_path / "meminfo"
+    meminfo_path.write_text(
+        "MemTotal:         948304 kB\n"
+        "MemFree:          301124 kB\n"
+        "MemAvailable:     612340 kB\n"
+    )
+
+    assert get_available_memory(meminfo_path) == 612340 * 1024
+    assert get_available_memory(tmp_path / "does-not-exist") is None
+
+
+@pytest.mark.parametrize(
+    argnames=["available_memory", "cpu_count", "is_ot2", "expected"],
+    argvalues=[
+        (600 * _MIB, 4, True, 1),
+        (16 * 1024 * _MIB, 4, True, 1),
+        (16 * 1024 * _MIB, 4, False, 3),
+        (16 * 1024 * _MIB, 16, False, 4),
+        (600 * _MIB, 4, False, 1),
+        (1200 * _MIB, 4, False, 2),
+        (100 * _MIB, 4, False, 1),
+        (None, 4, False, 3),
+        (None, None, False, 1),
+    ],
+)
+def test_get_default_max_workers(
+    available_memory: Optional[int],
+    cpu_count: Optional[int],
+    is_ot2: bool,
+    expected: int,
+) -> None:
+    """It should run one analysis at a time on an OT-2, or as many as fit."""
+    result = get_default_max_workers(
+        available_memory=available_memory, cpu_count=cpu_count, is_ot2=is_ot2
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    argnames=["available_memory", "max_workers", "expected"],
+    argvalues=[
+        (1200 * _MIB, 1, 600 * _MIB),
+        (1200 * _MIB, 2, 300 * _MIB),
+        (600 * _MIB, 2, 256 * _MIB),
+        (None, 1, None),
+    ],
+)
+def test_get_default_memory_limit(
+    available_memory: Optional[int], max_workers: int, expected: Optional[int]
+) -> None:
+    """It should split half of the available memory between the workers."""
+    result = get_default_memory_limit(
+        available_memory=available_memory, max_workers=max_workers
+    )
+    assert result == expected
+
+
+async def test_analyze(tmp_path: Path) -> None:
+    """It should analyze a protocol in a worker process."""
+    protocol_source = await _read_python_protocol(
+        tmp_path, 'ctx.comment("hello world")'
+    )
+    subject = AnalysisExecutor(max_workers=1)
+
+    result = await subject.analyze(
+        protocol_id="protocol-id", protocol_source=protocol_source
+    )
+
+    assert result.state_summary.errors == []
+    assert [c.commandType for c in result.commands] == ["custom"]
+
+
+async def test_analyze_time_limit(tmp_path: Path) -> None:
+    """It should stop an analysis that takes too long."""
+    protocol_source = await _read_python_protocol(tmp_path, "time.sleep(60)")
+    subject = AnalysisExecutor(max_workers=1, time_limit=1)
+
+    with pytest.raises(AnalysisTimeLimitError):
+        await subject.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_source
+        )
+
+
+async def test_cancel(tmp_path: Path) -> None:
+    """It should stop analyzing a protocol that's cancelled, or waiting to be."""
+    protocol_source = await _read_python_protocol(tmp_path, "time.sleep(60)")
+    subject = AnalysisExecutor(max_workers=1)
+
+    running = asyncio.ensure_future(
+        subject.analyze(protocol_id="protocol-1", protocol_source=protocol_source)
+    )
+    waiting = asyncio.ensure_future(
+        subject.analyze(protocol_id="protocol-2", protocol_source=protocol_source)
+    )
+    await asyncio.sleep(1)
+
+    subject.cancel(protocol_id="protocol-2")
+    subject.cancel(protocol_id="protocol-1")
+
+    with pytest.raises(AnalysisCancelledError):
+        await asyncio.wait_for(waiting, timeout=10)
+    with pytest.raises(AnalysisCancelledError):
+        await asyncio.wait_for(running, timeout=10)
+
+
+async def test_close(tmp_path: Path) -> None:
+    """It should stop every analysis when closed."""
+    protocol_source = await _read_python_protocol(tmp_path, "time.sleep(60)")
+    subject = AnalysisExecutor(max_workers=1)
+
+    running = asyncio.ensure_future(
+        subject.analyze(protocol_id="protocol-1", protocol_source=protocol_source)
+    )
+    waiting = asyncio.ensure_future(
+        subject.analyze(protocol_id="protocol-2", protocol_source=protocol_source)
+    )
+    await asyncio.sleep(1)
+
+    await asyncio.wait_for(subject.close(), timeout=10)
+    await asyncio.gather(running, waiting, return_exceptions=True)
+
+    assert running.cancelled()
+    assert waiting.cancelled()
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, NamedTuple
 
+import sqlalchemy
 from sqlalchemy.engine import Engine as SQLEngine
 
 from opentrons.types import MountType, DeckSlotName
@@ -18,6 +19,7 @@ from opentrons.protocol_reader import (
     JsonProtocolConfig,
 )
 
+from robot_server.persistence import analysis_table
 from robot_server.protocols.analysis_models import (
     AnalysisResult,
     AnalysisStatus,
@@ -198,6 +200,140 @@ async def test_add_analysis_equipment(
     assert await subject.get_by_protocol("protocol-id") == [result]
 
 
+async def test_get_summaries_from_summary_column(
+    subject: AnalysisStore,
+    protocol_store: ProtocolStore,
+    sql_engine: SQLEngine,
+) -> None:
+    """It should summarize completed analyses without reading their commands."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    pipette = pe_types.LoadedPipette(
+        id="pipette-id",
+        pipetteName=pe_types.PipetteName.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+    command = pe_commands.WaitForResume(
+        id="pause-1",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    await subject.update(
+        analysis_id="analysis-id",
+        labware=[],
+        pipettes=[pipette],
+        commands=[command, command],
+        errors=[],
+    )
+
+    # summaries must not need the stored analysis
+    sql_engine.execute(
+        sqlalchemy.update(analysis_table).values(completed_analysis=b"not-zlib")
+    )
+
+    assert subject.get_summaries_by_protocol("protocol-id") == [
+        AnalysisSummary(
+            id="analysis-id",
+            status=AnalysisStatus.COMPLETED,
+            result=AnalysisResult.OK,
+            labware=[],
+            pipettes=[pipette],
+            errors=[],
+            commandCount=2,
+        )
+    ]
+
+
+async def test_get_as_document(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return pending and completed analyses as JSON documents."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        labware=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+    )
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
+
+    completed_analysis = await subject.get("analysis-id-1")
+    pending_analysis = await subject.get("analysis-id-2")
+
+    assert await subject.get_as_document("analysis-id-1") == (
+        completed_analysis.json(exclude_none=True)
+    )
+    assert await subject.get_as_document("analysis-id-2") == pending_analysis.json()
+    assert await subject.get_by_protocol_as_document("protocol-id") == [
+        completed_analysis.json(exclude_none=True),
+        pending_analysis.json(),
+    ]
+
+    with pytest.raises(AnalysisNotFoundError):
+        await subject.get_as_document("analysis-id-3")
+
+
+async def test_reuse_matching(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should complete a pending analysis by copying one with the same hash."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-1"))
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-2"))
+    command = pe_commands.WaitForResume(
+        id="pause-1",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+
+    subject.add_pending(protocol_id="protocol-id-1", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        labware=[],
+        pipettes=[],
+        commands=[command],
+        errors=[],
+        content_hash="abc123",
+    )
+    subject.add_pending(protocol_id="protocol-id-2", analysis_id="analysis-id-2")
+
+    assert await subject.reuse_matching("analysis-id-2", content_hash="def456") is False
+    assert subject.get_summaries_by_protocol("protocol-id-2") == [
+        AnalysisSummary(id="analysis-id-2", status=AnalysisStatus.PENDING)
+    ]
+
+    assert await subject.reuse_matching("analysis-id-2", content_hash="abc123") is True
+    assert await subject.get("analysis-id-2") == CompletedAnalysis(
+        id="analysis-id-2",
+        result=AnalysisResult.OK,
+        labware=[],
+        pipettes=[],
+        commands=[command],
+        errors=[],
+    )
+    assert subject.get_summaries_by_protocol("protocol-id-2") == [
+        AnalysisSummary(
+            id="analysis-id-2",
+            status=AnalysisStatus.COMPLETED,
+            result=AnalysisResult.OK,
+            labware=[],
+            pipettes=[],
+            errors=[],
+            commandCount=1,
+        )
+    ]
+
+
 class AnalysisResultSpec(NamedTuple):
     """Spec data for analysis result tests."""
 
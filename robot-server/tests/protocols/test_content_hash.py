@@ -0,0 +1,47 @@
+"""Tests for hashing protocols for analysis."""
+from pathlib import Path
+
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.content_hash import compute_content_hash
+
+
+async def _read_protocol(directory: Path, contents: str) -> ProtocolSource:
+    directory.mkdir()
+    protocol_file = directory / "protocol.py"
+    protocol_file.write_text(contents)
+    return await ProtocolReader().read_saved(files=[protocol_file], directory=None)
+
+
+async def test_compute_content_hash(tmp_path: Path) -> None:
+    """It should hash protocols by the contents of their files."""
+    contents = 'metadata = {"apiLevel": "2.12"}\ndef run(ctx): pass\n'
+    other_contents = 'metadata = {"apiLevel": "2.12"}\ndef run(ctx): ctx.home()\n'
+
+    protocol_1 = await _read_protocol(tmp_path / "1", contents)
+    protocol_2 = await _read_protocol(tmp_path / "2", contents)
+    protocol_3 = await _read_protocol(tmp_path / "3", other_contents)
+
+    assert compute_content_hash(protocol_1) == compute_content_hash(protocol_2)
+    assert compute_content_hash(protocol_1) != compute_content_hash(protocol_3)
+
+
+async def test_compute_content_hash_custom_labware(tmp_path: Path) -> None:
+    """It should change the hash when the robot's custom labware changes."""
+    contents = 'metadata = {"apiLevel": "2.12"}\ndef run(ctx): pass\n'
+    protocol = await _read_protocol(tmp_path / "protocol", contents)
+    custom_labware_dir = tmp_path / "labware"
+
+    no_labware_hash = compute_content_hash(protocol, custom_labware_dir)
+
+    definition_path = custom_labware_dir / "custom_beta" / "my_plate" / "1.json"
+    definition_path.parent.mkdir(parents=True)
+    definition_path.write_text('{"version": 1}')
+    labware_hash = compute_content_hash(protocol, custom_labware_dir)
+
+    definition_path.write_text('{"version": 1, "changed": true}')
+    changed_labware_hash = compute_content_hash(protocol, custom_labware_dir)
+
+    assert no_labware_hash != labware_hash
+    assert labware_hash != changed_labware_hash
+    assert changed_labware_hash == compute_content_hash(protocol, custom_labware_dir)
@@ -1,6 +1,6 @@
 """Tests for the ProtocolAnalyzer."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
@@ -11,18 +11,24 @@ from opentrons.protocol_engine import (
     types as pe_types,
 )
 from opentrons.protocol_engine import StateSummary, EngineStatus
-from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
+from opentrons.protocol_runner import ProtocolRunResult
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 
+from robot_server.protocols.analysis_executor import (
+    AnalysisCancelledError,
+    AnalysisExecutor,
+    AnalysisTimeLimitError,
+)
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.content_hash import compute_content_hash
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
 
 
 @pytest.fixture
@@ -33,24 +39,20 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
 
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    analysis_executor: AnalysisExecutor,
     analysis_store: AnalysisStore,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_executor=analysis_executor,
         analysis_store=analysis_store,
     )
 
 
-async def test_analyze(
-    decoy: Decoy,
-    protocol_runner: ProtocolRunner,
-    analysis_store: AnalysisStore,
-    subject: ProtocolAnalyzer,
-) -> None:
-    """It should be able to analyze a protocol."""
-    protocol_resource = ProtocolResource(
+@pytest.fixture
+def protocol_resource() -> ProtocolResource:
+    """Get a ProtocolResource to analyze."""
+    return ProtocolResource(
         protocol_id="protocol-id",
         created_at=datetime(year=2021, month=1, day=1),
         source=ProtocolSource(
@@ -64,6 +66,15 @@ async def test_analyze(
         protocol_key="dummy-data-111",
     )
 
+
+async def test_analyze(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should be able to analyze a protocol."""
     analysis_command = pe_commands.WaitForResume(
         id="command-id",
         key="command-key",
@@ -93,7 +104,11 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        )
+    ).then_return(
         ProtocolRunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -120,5 +135,100 @@ async def test_analyze(
             labware=[analysis_labware],
             pipettes=[analysis_pipette],
             errors=[analysis_error],
+            content_hash=matchers.IsA(str),
+        ),
+    )
+
+
+async def test_analyze_worker_error(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should store an analysis that could not be completed with its error."""
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        )
+    ).then_raise(AnalysisTimeLimitError("too slow"))
+    errors = matchers.Captor()
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=errors,
+        ),
+    )
+    assert [(e.errorType, e.detail) for e in errors.value] == [
+        ("AnalysisTimeLimitError", "too slow")
+    ]
+
+
+async def test_analyze_cancelled(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should not store an analysis that was cancelled."""
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        )
+    ).then_raise(AnalysisCancelledError("protocol-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_analyze_reuses_matching(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should not analyze a protocol that matches one already analyzed."""
+    decoy.when(
+        await analysis_store.reuse_matching(
+            analysis_id="analysis-id",
+            content_hash=compute_content_hash(protocol_resource.source),
+        )
+    ).then_return(True)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_executor.analyze(
+            protocol_id=matchers.Anything(),
+            protocol_source=matchers.Anything(),
         ),
+        times=0,
     )
@@ -7,6 +7,7 @@ import pytest
 from decoy import Decoy
 
 from robot_server.deletion_planner import ProtocolDeletionPlanner
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.protocol_store import (
     ProtocolStore,
@@ -20,10 +21,12 @@ def test_make_room_for_new_protocol(
     """It should get a deletion plan and enact it on the store."""
     mock_protocol_store = decoy.mock(cls=ProtocolStore)
     mock_deletion_planner = decoy.mock(cls=ProtocolDeletionPlanner)
+    mock_analysis_executor = decoy.mock(cls=AnalysisExecutor)
 
     subject = ProtocolAutoDeleter(
         protocol_store=mock_protocol_store,
         deletion_planner=mock_deletion_planner,
+        analysis_executor=mock_analysis_executor,
     )
 
     usage_info = [
@@ -43,8 +46,14 @@ def test_make_room_for_new_protocol(
     with caplog.at_level(logging.INFO):
         subject.make_room_for_new_protocol()
 
-    decoy.verify(mock_protocol_store.remove(protocol_id="protocol-id-4"))
-    decoy.verify(mock_protocol_store.remove(protocol_id="protocol-id-5"))
+    decoy.verify(
+        mock_protocol_store.remove(protocol_id="protocol-id-4"),
+        mock_analysis_executor.cancel(protocol_id="protocol-id-4"),
+    )
+    decoy.verify(
+        mock_protocol_store.remove(protocol_id="protocol-id-5"),
+        mock_analysis_executor.cancel(protocol_id="protocol-id-5"),
+    )
 
     # It should log the protocols that it deleted.
     assert "protocol-id-4" in caplog.text
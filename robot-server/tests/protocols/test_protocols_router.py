@@ -18,10 +18,16 @@ from opentrons.protocol_reader import (
 )
 
 from robot_server.errors import ApiError
-from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
+from robot_server.service.json_api import (
+    SimpleBody,
+    SimpleEmptyBody,
+    SimpleMultiBody,
+    MultiBodyMeta,
+)
 from robot_server.service.task_runner import TaskRunner
 from robot_server.protocols.analysis_store import AnalysisStore, AnalysisNotFoundError
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.analysis_models import (
     AnalysisStatus,
@@ -29,6 +35,7 @@ from robot_server.protocols.analysis_models import (
     CompletedAnalysis,
     PendingAnalysis,
     AnalysisResult,
+    ProtocolAnalysis,
 )
 
 from robot_server.protocols.protocol_models import (
@@ -78,6 +85,12 @@ def protocol_analyzer(decoy: Decoy) -> ProtocolAnalyzer:
     return decoy.mock(cls=ProtocolAnalyzer)
 
 
+@pytest.fixture
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
+
+
 @pytest.fixture
 def task_runner(decoy: Decoy) -> TaskRunner:
     """Get a mocked out TaskRunner."""
@@ -363,11 +376,19 @@ async def test_create_protocol_not_readable(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and cancel its analysis."""
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_executor=analysis_executor,
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_executor.cancel(protocol_id="protocol-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -376,6 +397,7 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
@@ -385,7 +407,11 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_executor=analysis_executor,
+        )
 
     assert exc_info.value.status_code == 404
 
@@ -393,6 +419,7 @@ async def test_delete_protocol_not_found(
 async def test_delete_protocol_run_exists(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     run_exists_error = ProtocolUsedByRunError("protocol-id")
@@ -402,9 +429,14 @@ async def test_delete_protocol_run_exists(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_executor=analysis_executor,
+        )
 
     assert exc_info.value.status_code == 409
+    decoy.verify(analysis_executor.cancel(protocol_id="protocol-id"), times=0)
 
 
 async def test_get_protocol_analyses(
@@ -423,9 +455,9 @@ async def test_get_protocol_analyses(
     )
 
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get_by_protocol("protocol-id")).then_return(
-        [analysis]
-    )
+    decoy.when(
+        await analysis_store.get_by_protocol_as_document("protocol-id")
+    ).then_return([analysis.json(exclude_none=True)])
 
     result = await get_protocol_analyses(
         protocolId="protocol-id",
@@ -434,7 +466,15 @@ async def test_get_protocol_analyses(
     )
 
     assert result.status_code == 200
-    assert result.content.data == [analysis]
+    assert result.body == (
+        SimpleMultiBody[ProtocolAnalysis]
+        .construct(
+            data=[analysis],
+            meta=MultiBodyMeta(cursor=0, totalLength=1),
+        )
+        .json()
+        .encode("utf-8")
+    )
 
 
 async def test_get_protocol_analyses_not_found(
@@ -465,7 +505,9 @@ async def test_get_protocol_analysis_by_id(
     analysis = PendingAnalysis(id="analysis-id")
 
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get("analysis-id")).then_return(analysis)
+    decoy.when(await analysis_store.get_as_document("analysis-id")).then_return(
+        analysis.json()
+    )
 
     result = await get_protocol_analysis_by_id(
         protocolId="protocol-id",
@@ -475,7 +517,9 @@ async def test_get_protocol_analysis_by_id(
     )
 
     assert result.status_code == 200
-    assert result.content.data == analysis
+    assert result.body == (
+        SimpleBody[ProtocolAnalysis].construct(data=analysis).json().encode("utf-8")
+    )
 
 
 async def test_get_protocol_analysis_by_id_protocol_not_found(
@@ -505,7 +549,7 @@ async def test_get_protocol_analysis_by_id_analysis_not_found(
 ) -> None:
     """It should get a single full analysis by ID."""
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get("analysis-id")).then_raise(
+    decoy.when(await analysis_store.get_as_document("analysis-id")).then_raise(
         AnalysisNotFoundError("oh no")
     )
 
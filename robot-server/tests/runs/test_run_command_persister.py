@@ -0,0 +1,294 @@
+"""Tests for robot_server.runs.run_command_persister."""
+import asyncio
+import threading
+from datetime import datetime
+from typing import List
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_engine import (
+    CommandSlice,
+    StateView,
+    actions as pe_actions,
+    commands as pe_commands,
+)
+
+from robot_server.runs.run_command_persister import RunCommandPersister
+from robot_server.runs.run_store import RunStore
+
+
+def _make_command(
+    command_id: str, status: pe_commands.CommandStatus
+) -> pe_commands.Command:
+    return pe_commands.WaitForResume(
+        id=command_id,
+        key="command-key",
+        status=status,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+
+
+@pytest.fixture
+def run_commands() -> List[pe_commands.Command]:
+    """Get a run's commands, the last of which has not completed yet."""
+    return [
+        _make_command("command-1", pe_commands.CommandStatus.SUCCEEDED),
+        _make_command("command-2", pe_commands.CommandStatus.FAILED),
+        _make_command("command-3", pe_commands.CommandStatus.RUNNING),
+    ]
+
+
+@pytest.fixture
+def state_view(decoy: Decoy) -> StateView:
+    """Get a mock StateView."""
+    return decoy.mock(cls=StateView)
+
+
+@pytest.fixture
+def run_store(decoy: Decoy) -> RunStore:
+    """Get a mock RunStore."""
+    return decoy.mock(cls=RunStore)
+
+
+@pytest.fixture
+def action_dispatcher(decoy: Decoy) -> pe_actions.ActionDispatcher:
+    """Get a mock ActionDispatcher."""
+    return decoy.mock(cls=pe_actions.ActionDispatcher)
+
+
+@pytest.fixture
+def subject(
+    decoy: Decoy,
+    state_view: StateView,
+    run_store: RunStore,
+    action_dispatcher: pe_actions.ActionDispatcher,
+    run_commands: List[pe_commands.Command],
+) -> RunCommandPersister:
+    """Get a configured RunCommandPersister with its dependencies mocked out."""
+    total_length = len(run_commands)
+
+    for cursor in range(total_length + 1):
+        actual_cursor = min(cursor, total_length - 1)
+        decoy.when(state_view.commands.get_slice(cursor=cursor, length=2)).then_return(
+            CommandSlice(
+                cursor=actual_cursor,
+                total_length=total_length,
+                commands=run_commands[actual_cursor : actual_cursor + 2],
+            )
+        )
+
+    plugin = RunCommandPersister(
+        run_id="run-id",
+        run_store=run_store,
+        batch_size=2,
+        flush_interval=60,
+    )
+    plugin._configure(state=state_view, action_dispatcher=action_dispatcher)
+    return plugin
+
+
+async def test_flush_completed_commands(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should persist completed commands in order, in batches."""
+    await subject.flush()
+    await subject.flush()
+
+    decoy.verify(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[0:2],
+            start_index=0,
+        ),
+        times=1,
+    )
+    decoy.verify(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=matchers.Anything(),
+            start_index=2,
+        ),
+        times=0,
+    )
+    assert subject.persisted_count == 2
+
+
+async def test_flush_incomplete_commands(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should persist incomplete commands if asked to."""
+    await subject.flush()
+    await subject.flush(include_incomplete=True)
+
+    decoy.verify(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[2:],
+            start_index=2,
+        ),
+        times=1,
+    )
+    assert subject.persisted_count == 3
+
+
+async def test_flush_retries_failed_insert(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should retry commands that could not be persisted at the next flush."""
+    errors = [RuntimeError("oh no")]
+
+    def _insert_commands(*args: object, **kwargs: object) -> None:
+        if len(errors) > 0:
+            raise errors.pop()
+
+    decoy.when(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[0:2],
+            start_index=0,
+        )
+    ).then_do(_insert_commands)
+
+    await subject.flush()
+    assert subject.persisted_count == 0
+
+    await subject.flush()
+    assert subject.persisted_count == 2
+
+
+async def test_flush_in_worker_thread(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should write commands to the database off of the event loop."""
+    insert_threads = []
+
+    def _insert_commands(*args: object, **kwargs: object) -> None:
+        insert_threads.append(threading.get_ident())
+
+    decoy.when(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[0:2],
+            start_index=0,
+        )
+    ).then_do(_insert_commands)
+
+    await subject.flush()
+
+    assert len(insert_threads) == 1
+    assert insert_threads[0] != threading.get_ident()
+    assert subject.persisted_count == 2
+
+
+async def test_flush_on_batch_ready(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should flush in the background once enough commands are updated."""
+    subject.setup()
+
+    subject.handle_action(pe_actions.UpdateCommandAction(command=run_commands[0]))
+    await asyncio.sleep(0.1)
+    assert subject.persisted_count == 0
+
+    subject.handle_action(pe_actions.UpdateCommandAction(command=run_commands[1]))
+    await asyncio.sleep(0.1)
+    assert subject.persisted_count == 2
+
+    await subject.teardown()
+
+
+async def test_teardown_flushes_remaining_commands(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should persist every remaining command on teardown."""
+    subject.setup()
+    await subject.teardown()
+
+    decoy.verify(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[0:2],
+            start_index=0,
+        ),
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[2:],
+            start_index=2,
+        ),
+    )
+    assert subject.persisted_count == 3
+
+
+async def test_teardown_waits_for_flush_in_progress(
+    decoy: Decoy,
+    run_store: RunStore,
+    run_commands: List[pe_commands.Command],
+    subject: RunCommandPersister,
+) -> None:
+    """It should let a background flush finish writing before the final flush."""
+    insert_started = threading.Event()
+    finish_insert = threading.Event()
+    inserted: List[int] = []
+
+    def _insert_first_batch(*args: object, **kwargs: object) -> None:
+        insert_started.set()
+        finish_insert.wait(timeout=10)
+        inserted.append(0)
+
+    def _insert_last_batch(*args: object, **kwargs: object) -> None:
+        inserted.append(2)
+
+    decoy.when(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[0:2],
+            start_index=0,
+        )
+    ).then_do(_insert_first_batch)
+    decoy.when(
+        run_store.insert_commands(
+            run_id="run-id",
+            commands=run_commands[2:],
+            start_index=2,
+        )
+    ).then_do(_insert_last_batch)
+
+    subject.setup()
+    subject.handle_action(pe_actions.UpdateCommandAction(command=run_commands[0]))
+    subject.handle_action(pe_actions.UpdateCommandAction(command=run_commands[1]))
+
+    for _ in range(100):
+        if insert_started.is_set():
+            break
+        await asyncio.sleep(0.01)
+
+    teardown = asyncio.create_task(subject.teardown())
+    await asyncio.sleep(0.1)
+    assert not teardown.done()
+    assert inserted == []
+
+    finish_insert.set()
+    await asyncio.wait_for(teardown, timeout=10)
+
+    assert inserted == [0, 2]
+    assert subject.persisted_count == 3
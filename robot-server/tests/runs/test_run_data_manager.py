@@ -25,6 +25,7 @@ from robot_server.protocols import ProtocolResource
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 from robot_server.runs.run_data_manager import RunDataManager, RunNotCurrentError
 from robot_server.runs.run_models import Run
+from robot_server.runs.run_command_persister import RunCommandPersister
 from robot_server.runs.run_store import (
     RunStore,
     RunResource,
@@ -147,6 +148,10 @@ async def test_create(
         pipettes=engine_state_summary.pipettes,
         modules=engine_state_summary.modules,
     )
+    decoy.verify(
+        mock_engine_store.engine.add_plugin(matchers.IsA(RunCommandPersister)),
+        times=1,
+    )
 
 
 async def test_create_with_options(
@@ -480,7 +485,7 @@ async def test_update_current(
         mock_run_store.update_run_state(
             run_id=run_id,
             summary=engine_state_summary,
-            commands=[run_command],
+            commands=None,
         )
     ).then_return(run_resource)
 
@@ -609,7 +614,7 @@ async def test_create_archives_existing(
         mock_run_store.update_run_state(
             run_id=run_id_old,
             summary=engine_state_summary,
-            commands=[run_command],
+            commands=None,
         )
     )
 
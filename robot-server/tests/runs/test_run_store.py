@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from typing import List, Optional, Type
 
 import pytest
+import sqlalchemy
 from sqlalchemy.engine import Engine
 
 from robot_server.protocols.protocol_store import ProtocolNotFoundError
@@ -139,6 +140,132 @@ def test_update_run_state(
     assert commands_result.commands == protocol_commands
 
 
+def test_update_run_state_replaces_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should replace any previously stored commands on update."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[1:],
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=2,
+        commands=protocol_commands[1:],
+    )
+    with pytest.raises(CommandNotFoundError):
+        subject.get_command(run_id="run-id", command_id="pause-1")
+
+
+def test_update_run_state_keeps_inserted_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should leave incrementally inserted commands alone if given none."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        commands=protocol_commands,
+        start_index=0,
+    )
+    subject.update_run_state(run_id="run-id", summary=state_summary, commands=None)
+
+    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=3,
+        commands=protocol_commands,
+    )
+    assert subject.get_state_summary(run_id="run-id") == state_summary
+
+
+def test_insert_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should append batches of commands, replacing any at or after the start."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        commands=protocol_commands[:2],
+        start_index=0,
+    )
+    subject.insert_commands(
+        run_id="run-id",
+        commands=protocol_commands[1:],
+        start_index=1,
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=3,
+        commands=protocol_commands,
+    )
+    assert subject.get_command(run_id="run-id", command_id="pause-3") == (
+        protocol_commands[2]
+    )
+
+
+def test_insert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the commands' run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        subject.insert_commands(
+            run_id="run-not-found",
+            commands=protocol_commands,
+            start_index=0,
+        )
+
+
+def test_insert_commands_duplicate_id(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should not mistake other integrity errors for a missing run."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+
+    with pytest.raises(sqlalchemy.exc.IntegrityError, match="UNIQUE"):
+        subject.insert_commands(
+            run_id="run-id",
+            commands=[protocol_commands[0], protocol_commands[0]],
+            start_index=0,
+        )
+
+
 def test_update_state_run_not_found(
     subject: RunStore,
     state_summary: StateSummary,
@@ -272,7 +399,11 @@ def test_get_all_runs(subject: RunStore) -> None:
     ]
 
 
-def test_remove_run(subject: RunStore) -> None:
+def test_remove_run(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
     """It can remove a previously stored run entry."""
     action = RunAction(
         actionType=RunActionType.PLAY,
@@ -286,6 +417,11 @@ def test_remove_run(subject: RunStore) -> None:
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
     subject.insert_action(run_id="run-id", action=action)
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
     subject.remove(run_id="run-id")
 
     assert subject.get_all() == []
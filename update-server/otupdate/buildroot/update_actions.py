@@ -14,12 +14,7 @@ import subprocess
 import tempfile
 from typing import Callable, Generator, Optional
 
-from otupdate.common.file_actions import (
-    unzip_update,
-    hash_file,
-    HashMismatch,
-    verify_signature,
-)
+from otupdate.common.file_actions import stream_update
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 
 ROOTFS_SIG_NAME = "rootfs.ext4.hash.sig"
@@ -35,89 +30,32 @@ class RootPartitions(enum.Enum):
 
 
 class OT2UpdateActions(UpdateActionsInterface):
-    def validate_update(
+    def validate_and_write_update(
         self,
         filepath: str,
         progress_callback: Callable[[float], None],
         cert_path: Optional[str],
-    ) -> Optional[str]:
-        """Worker for validation. Call in an executor (so it can return things)
+    ) -> Partition:
+        """Validate the update file and write its rootfs to the next root partition
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
-        - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
                                   only for user information
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
-
-        :returns str: Path to the rootfs file to update
-
-        Will also raise an exception if validation fails
-        """
-
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
-        required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
-        if cert_path:
-            required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
-
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = open(hashfile, "rb").read().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
-        if cert_path:
-            sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
-            verify_signature(hashfile, sigfile, cert_path)
-
-        return rootfs
-
-    def write_update(
-        self,
-        rootfs_filepath: str,
-        progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
-        file_size: Optional[int] = None,
-    ) -> Partition:
-        """
-        Write the new rootfs to the next root partition
-
-        - Figure out, from the system, the correct root partition to write to
-        - Write the rootfs at ``rootfs_filepath`` there, with progress
-
-        :param rootfs_filepath: The path to a checked rootfs.ext4
-        :param progress_callback: A callback to call periodically with progress
-                                  between 0 and 1.0. May never reach precisely
-                                  1.0, best only for user information.
-        :param chunk_size: The size of file chunks to copy in between progress
-                           notifications
-        :param file_size: The total size of the update file (for generating
-                          progress percentage). If ``None``, generated with
-                          ``seek``/``tell``.
-        :returns: The root partition that the rootfs image was written to, e.g.
-                  ``RootPartitions.TWO`` or ``RootPartitions.THREE``.
+        :returns: The root partition that the rootfs image was written to
         """
         unused = _find_unused_partition()
-        part_path = unused.value.path
-        write_file(rootfs_filepath, part_path, progress_callback, chunk_size, file_size)
+        stream_update(
+            filepath,
+            progress_callback,
+            rootfs_name=ROOTFS_NAME,
+            hash_name=ROOTFS_HASH_NAME,
+            sig_name=ROOTFS_SIG_NAME,
+            cert_path=cert_path,
+            destination=unused.value.path,
+        )
         return unused.value
 
     @contextlib.contextmanager
@@ -164,43 +102,6 @@ def _find_unused_partition() -> RootPartitions:
     return {b"2": RootPartitions.TWO, b"3": RootPartitions.THREE}[which]
 
 
-def write_file(
-    infile: str,
-    outfile: str,
-    progress_callback: Callable[[float], None],
-    chunk_size: int = 1024,
-    file_size: Optional[int] = None,
-) -> None:
-    """Write a file to another file with progress callbacks.
-
-    :param infile: The input filepath
-    :param outfile: The output filepath
-    :param progress_callback: The callback to call for progress
-    :param chunk_size: The size of file chunks to copy in between progress
-                       notifications
-    :param file_size: The total size of the update file (for generating
-                      progress percentage). If ``None``, generated with
-                      ``seek``/``tell``.
-    """
-    total_written = 0
-    with open(infile, "rb") as img, open(outfile, "wb") as part:
-        if None is file_size:
-            file_size = img.seek(0, 2)
-            img.seek(0)
-            LOG.info(f"write_file: file size calculated as {file_size}B")
-        LOG.info(
-            f"write_file: writing {infile} ({file_size}B)"
-            f" to {outfile} in {chunk_size}B chunks"
-        )
-        while True:
-            chunk = img.read(chunk_size)
-            part.write(chunk)
-            total_written += len(chunk)
-            progress_callback(total_written / file_size)
-            if len(chunk) != chunk_size:
-                break
-
-
 def _mountpoint_root():
     """provides mountpoint location for :py:meth:`mount_update`.
 
@@ -6,14 +6,17 @@ handling hash and sig checking
 import binascii
 import hashlib
 import logging
+import lzma
 import os
 import subprocess
-from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
+from typing import BinaryIO, Callable, Sequence, Mapping, Optional, Tuple, List, Dict
 import tempfile
 import zipfile
 
 LOG = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class FileMissing(ValueError):
     def __init__(self, message: str) -> None:
@@ -180,6 +183,115 @@ def hash_file(
     return binascii.hexlify(hasher.digest())
 
 
+def stream_update(
+    filepath: str,
+    progress_callback: Callable[[float], None],
+    rootfs_name: str,
+    hash_name: str,
+    sig_name: str,
+    cert_path: Optional[str],
+    destination: str,
+    decompressor: Optional["lzma.LZMADecompressor"] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    algo: str = "sha256",
+) -> None:
+    """Validate an update file and write its rootfs in a single pass
+
+    Rather than unzipping the rootfs to disk, hashing it and then copying it,
+    the rootfs is read out of the zip once and each chunk is hashed and
+    written to ``destination`` (decompressing it first, if the rootfs is
+    compressed) as it is read.
+
+    If requested, the signature of the packaged hash is checked before the
+    rootfs is read. The hash of the rootfs is only known once it has been
+    written, so ``destination`` will hold an unverified image if this raises
+    :py:class:`HashMismatch`; it must not be booted from.
+
+    This function is blocking and takes a while. It calls ``progress_callback``
+    with 0 once the signature is checked and the rootfs is about to be
+    written, then with a number between 0 and 1 indicating how much of the
+    rootfs has been read.
+
+    :param filepath: The path to the update zip file
+    :param progress_callback: The callback to call with progress between 0 and
+                              1. May not ever be precisely 1.0.
+    :param rootfs_name: The name of the rootfs in the zip
+    :param hash_name: The name of the file holding the hash of the rootfs
+    :param sig_name: The name of the signature of the hash file
+    :param cert_path: Path to an x.509 certificate to check the signature
+                      against. If ``None``, signature checking is disabled
+    :param destination: The path to write the rootfs to
+    :param decompressor: If specified, the decompressor of an xz-compressed
+                         rootfs. The hash is of the compressed rootfs.
+    :param chunk_size: The size of the chunks to read in between progress
+                       notifications
+    :param algo: The algorithm of the hash. Can be anything used by
+                 :py:mod:`hashlib`
+
+    :raises FileMissing: If a mandatory file is missing
+    :raises SignatureMismatch: If the signature does not verify
+    :raises HashMismatch: If the hash of the rootfs does not match
+    """
+    required = [rootfs_name, hash_name]
+    if cert_path:
+        required.append(sig_name)
+    hasher = hashlib.new(algo)
+    have_read = 0
+    LOG.info(f"Streaming {rootfs_name} from {filepath} to {destination}")
+    with zipfile.ZipFile(filepath, "r") as zf:
+        names = zf.namelist()
+        for name in required:
+            if name not in names:
+                raise FileMissing(f"File {name} missing from zip")
+
+        packaged_hash = zf.read(hash_name).strip()
+        if cert_path:
+            directory = os.path.dirname(filepath)
+            verify_signature(
+                zf.extract(hash_name, directory),
+                zf.extract(sig_name, directory),
+                cert_path,
+            )
+
+        file_size = zf.getinfo(rootfs_name).file_size
+        progress_callback(0.0)
+        with zf.open(rootfs_name) as zipped, open(destination, "wb") as dest:
+            while True:
+                chunk = zipped.read(chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                if decompressor:
+                    _write_decompressed(decompressor, chunk, dest, chunk_size)
+                else:
+                    dest.write(chunk)
+                have_read += len(chunk)
+                progress_callback(have_read / file_size)
+
+    rootfs_hash = binascii.hexlify(hasher.digest())
+    if packaged_hash != rootfs_hash:
+        msg = (
+            f"Hash mismatch: calculated {rootfs_hash!r} != "
+            f"packaged {packaged_hash!r}"
+        )
+        LOG.error(msg)
+        raise HashMismatch(msg)
+    LOG.info(f"Wrote {rootfs_name} ({file_size}B) to {destination}")
+
+
+def _write_decompressed(
+    decompressor: "lzma.LZMADecompressor",
+    data: bytes,
+    dest: BinaryIO,
+    max_length: int,
+) -> None:
+    # Long runs of zeros in a filesystem image compress very well, so bound
+    # how much is decompressed into memory at once
+    dest.write(decompressor.decompress(data, max_length))
+    while not decompressor.needs_input and not decompressor.eof:
+        dest.write(decompressor.decompress(b"", max_length))
+
+
 def verify_signature(message_path: str, sigfile_path: str, cert_path: str) -> None:
     """
     Verify the signature (assumed, of the hash file)
@@ -106,32 +106,10 @@ async def _save_file(part: BodyPartReader, path: str) -> None:
         LOG.exception("File not written")
 
 
-def _begin_write(
-    session: UpdateSession,
-    loop: asyncio.AbstractEventLoop,
-    rootfs_file_path: str,
-    actions: update_actions.UpdateActionsInterface,
-) -> None:
-    """Start the write process."""
-    session.set_progress(0)
-    session.set_stage(Stages.WRITING)
-    write_future = asyncio.ensure_future(
-        loop.run_in_executor(
-            None,
-            actions.write_update,
-            rootfs_file_path,
-            session.set_progress,
-        )
-    )
-
-    def write_done(fut):
-        exc = fut.exception()
-        if exc:
-            session.set_error(getattr(exc, "short", str(type(exc))), str(exc))
-        else:
-            session.set_stage(Stages.DONE)
-
-    write_future.add_done_callback(write_done)
+def _set_write_progress(session: UpdateSession, progress: float) -> None:
+    if session.stage == Stages.VALIDATING:
+        session.set_stage(Stages.WRITING)
+    session.set_progress(progress)
 
 
 def _begin_validation(
@@ -140,17 +118,25 @@ def _begin_validation(
     loop: asyncio.AbstractEventLoop,
     downloaded_update_path: str,
     actions: update_actions.UpdateActionsInterface,
-) -> "asyncio.futures.Future[Optional[str]]":
-    """Start the validation process."""
+) -> "asyncio.futures.Future[update_actions.Partition]":
+    """Start the validation process.
+
+    The rootfs is hashed as it is written to the unused partition, so the
+    session moves on to the writing stage once the update file's signature
+    is checked and stays there until the hash of the written rootfs is.
+    """
     session.set_stage(Stages.VALIDATING)
     cert_path = config.update_cert_path if config.signature_required else None
 
+    def write_progress(progress: float) -> None:
+        loop.call_soon_threadsafe(_set_write_progress, session, progress)
+
     validation_future = asyncio.ensure_future(
         loop.run_in_executor(
             None,
-            actions.validate_update,
+            actions.validate_and_write_update,
             downloaded_update_path,
-            session.set_progress,
+            write_progress,
             cert_path,
         )
     )
@@ -160,8 +146,7 @@ def _begin_validation(
         if exc:
             session.set_error(getattr(exc, "short", str(type(exc))), str(exc))
         else:
-            rootfs_file = fut.result()
-            loop.call_soon_threadsafe(_begin_write, session, loop, rootfs_file, actions)
+            session.set_stage(Stages.DONE)
 
     validation_future.add_done_callback(validation_done)
     return validation_future
@@ -42,38 +42,30 @@ class UpdateActionsInterface:
         app[FILE_ACTIONS_VARNAME] = cls()
 
     @abc.abstractmethod
-    def validate_update(
+    def validate_and_write_update(
         self,
         filepath: str,
         progress_callback: Callable[[float], None],
         cert_path: Optional[str],
-    ) -> Optional[str]:
-        """Worker for validation. Call in an executor (so it can return things)
+    ) -> Partition:
+        """Worker for validation and writing. Call in an executor
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
         - If requested, checks the signature of the hash
+        - Writes the rootfs to the unused partition, hashing it as it goes,
+          in a single pass over the rootfs and without unzipping it to disk
+        - Checks the hash of the rootfs
+
         :param filepath: The path to the update zip file
-        :param progress_callback: The function to call with progress between 0
-                                  and 1.0. May never reach precisely 1.0, best
-                                  only for user information
+        :param progress_callback: The function to call with writing progress
+                                  between 0 and 1.0, starting with 0 once the
+                                  signature is checked. May never reach
+                                  precisely 1.0, best only for user information
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
-        :returns str: Path to the rootfs file to update
+        :returns: The root partition that the rootfs image was written to
 
-        Will also raise an exception if validation fails
-        """
-
-    @abc.abstractmethod
-    def write_update(
-        self,
-        rootfs_filepath: str,
-        progress_callback: Callable[[float], None],
-        chunk_size: int,
-        file_size: Optional[int],
-    ) -> Partition:
-        """
-        Write the object to a specific rootfs path
+        Will also raise an exception if validation fails, in which case the
+        partition must not be committed
         """
         ...
 
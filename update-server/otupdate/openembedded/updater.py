@@ -3,12 +3,7 @@ import contextlib
 import lzma
 import tempfile
 
-from otupdate.common.file_actions import (
-    unzip_update,
-    hash_file,
-    HashMismatch,
-    verify_signature,
-)
+from otupdate.common.file_actions import stream_update
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 from typing import Callable, Optional
 import enum
@@ -92,38 +87,6 @@ class PartitionManager:
 class RootFSInterface:
     """RootFS interface class."""
 
-    def write_update(
-        self,
-        rootfs_filepath: str,
-        part: Partition,
-        progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
-    ) -> None:
-        total_size = 0
-        written_size = 0
-        try:
-            # the double pass here is
-            # temporary until we have
-            # xz size decoding working
-            with lzma.open(rootfs_filepath, "rb") as fsrc:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    total_size += len(chunk)
-                    if len(chunk) != chunk_size:
-                        break
-            with lzma.open(rootfs_filepath, "rb") as fsrc, open(
-                part.path, "wb"
-            ) as fdst:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    fdst.write(chunk)
-                    written_size += chunk_size
-                    progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
-                        break
-        except Exception:
-            LOG.exception("RootFSInterface::write_update exception reading")
-
 
 class Updater(UpdateActionsInterface):
     """OE updater class."""
@@ -132,60 +95,37 @@ class Updater(UpdateActionsInterface):
         self.root_FS_intf = root_FS_intf
         self.part_mngr = part_mngr
 
-    def validate_update(
+    def validate_and_write_update(
         self,
         filepath: str,
         progress_callback: Callable[[float], None],
         cert_path: Optional[str],
-    ) -> Optional[str]:
-        """Worker for validation. Call in an executor (so it can return things)
+    ) -> Partition:
+        """Validate the update file, decompress its rootfs and write it
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
-        - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
                                   only for user information
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
-
-        :returns str: Path to the rootfs file to update
-
-        Will also raise an exception if validation fails
+        :returns: The partition that the rootfs image was written to
         """
-
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
-        required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
-        if cert_path:
-            required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
-
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = open(hashfile, "rb").read().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
-        if cert_path:
-            sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
-            verify_signature(hashfile, sigfile, cert_path)
-
-        return rootfs
+        unused_partition = self.part_mngr.find_unused_partition(
+            self.part_mngr.used_partition()
+        )
+        self.part_mngr.umount_fs(unused_partition.path)
+        stream_update(
+            filepath,
+            progress_callback,
+            rootfs_name=ROOTFS_NAME,
+            hash_name=ROOTFS_HASH_NAME,
+            sig_name=ROOTFS_SIG_NAME,
+            cert_path=cert_path,
+            destination=unused_partition.path,
+            decompressor=lzma.LZMADecompressor(),
+        )
+        return unused_partition
 
     def commit_update(self) -> None:
         """Switch the target boot partition."""
@@ -227,33 +167,3 @@ class Updater(UpdateActionsInterface):
     def write_machine_id(self, current_root: str, new_root: str) -> None:
         """Copy the machine id over to the new partition"""
         pass
-
-    def write_update(
-        self,
-        rootfs_filepath: str,
-        progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
-        file_size: Optional[int] = None,
-    ) -> Partition:
-        self.decomp_and_write(rootfs_filepath, progress_callback)
-        unused_partition = self.part_mngr.find_unused_partition(
-            self.part_mngr.used_partition()
-        )
-        return unused_partition
-
-    def decomp_and_write(
-        self, downloaded_update_path: str, progress_callback: Callable[[float], None]
-    ) -> None:
-        """Decompress and write update to partition
-
-        Function expects the update file to be a .xz compressed file
-
-        """
-
-        unused_partition = self.part_mngr.find_unused_partition(
-            self.part_mngr.used_partition()
-        )
-        self.part_mngr.umount_fs(unused_partition.path)
-        self.root_FS_intf.write_update(
-            downloaded_update_path, unused_partition, progress_callback
-        )
@@ -1,4 +1,7 @@
 from unittest import mock
+import binascii
+import hashlib
+import lzma
 import os
 import zipfile
 
@@ -95,3 +98,109 @@ def test_verify_signature_catches_bad_sig(extracted_update_file, testing_cert):
             os.path.join(extracted_update_file, "rootfs.ext4.hash.sig"),
             testing_cert,
         )
+
+
+def _stream_update(downloaded_update_file, destination, cb, cert_path, **kwargs):
+    file_actions.stream_update(
+        downloaded_update_file,
+        cb,
+        rootfs_name="rootfs.ext4",
+        hash_name="rootfs.ext4.hash",
+        sig_name="rootfs.ext4.hash.sig",
+        cert_path=cert_path,
+        destination=destination,
+        **kwargs,
+    )
+
+
+def test_stream_update(downloaded_update_file, testing_cert, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    _stream_update(
+        downloaded_update_file, destination, cb, testing_cert, chunk_size=1024
+    )
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        rootfs = zf.read("rootfs.ext4")
+    assert open(destination, "rb").read() == rootfs
+    # We should have a callback call as writing starts and for every chunk
+    assert cb.call_args_list[0] == mock.call(0.0)
+    assert cb.call_count == (len(rootfs) + 1023) // 1024 + 1
+    assert cb.call_args == mock.call(1.0)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_stream_update_does_not_require_sig(downloaded_update_file, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    _stream_update(downloaded_update_file, destination, cb, None)
+    assert os.path.exists(destination)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_stream_update_requires_sig(downloaded_update_file, testing_cert, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    with pytest.raises(file_actions.FileMissing):
+        _stream_update(downloaded_update_file, destination, cb, testing_cert)
+    assert not os.path.exists(destination)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash
+def test_stream_update_requires_hash(downloaded_update_file, testing_cert, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    with pytest.raises(file_actions.FileMissing):
+        _stream_update(downloaded_update_file, destination, cb, testing_cert)
+    assert not os.path.exists(destination)
+
+
+@pytest.mark.exclude_rootfs_ext4
+def test_stream_update_requires_rootfs(downloaded_update_file, testing_cert, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    with pytest.raises(file_actions.FileMissing):
+        _stream_update(downloaded_update_file, destination, cb, testing_cert)
+    assert not os.path.exists(destination)
+
+
+@pytest.mark.bad_sig
+def test_stream_update_checks_sig_first(downloaded_update_file, testing_cert, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    with pytest.raises(file_actions.SignatureMismatch):
+        _stream_update(downloaded_update_file, destination, cb, testing_cert)
+    assert not os.path.exists(destination)
+    cb.assert_not_called()
+
+
+@pytest.mark.bad_hash
+def test_stream_update_catches_bad_hash(downloaded_update_file, testing_cert, tmpdir):
+    cb = mock.Mock()
+    destination = os.path.join(tmpdir, "fake-partition")
+    with pytest.raises(file_actions.HashMismatch):
+        _stream_update(downloaded_update_file, destination, cb, testing_cert)
+
+
+def test_stream_update_decompresses(tmpdir):
+    # A mostly empty image decompresses to many times the chunk size
+    contents = bytes(1024 * 1024) + os.urandom(1024) + bytes(1024 * 1024)
+    compressed = lzma.compress(contents)
+    zip_path = os.path.join(tmpdir, "ot3-system.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("rootfs.xz", compressed)
+        zf.writestr(
+            "rootfs.xz.sha256", binascii.hexlify(hashlib.sha256(compressed).digest())
+        )
+    destination = os.path.join(tmpdir, "fake-partition")
+    file_actions.stream_update(
+        zip_path,
+        mock.Mock(),
+        rootfs_name="rootfs.xz",
+        hash_name="rootfs.xz.sha256",
+        sig_name="rootfs.xz.hash.sig",
+        cert_path=None,
+        destination=destination,
+        decompressor=lzma.LZMADecompressor(),
+        chunk_size=1024,
+    )
+    assert open(destination, "rb").read() == contents
@@ -6,6 +6,7 @@ import hashlib
 import os
 import zipfile
 from typing import Tuple
+from unittest import mock
 
 import pytest
 
@@ -74,9 +75,11 @@ async def test_commit_fails_wrong_state(test_cli, update_session):
     params=[
         (
             0,
-            lambda: Updater(RootFSInterface(), mock_partition_manager_valid_switch_()),
+            lambda partition_path: Updater(
+                RootFSInterface(), mock_partition_manager_valid_switch_(partition_path)
+            ),
         ),
-        (1, lambda: update_actions.OT2UpdateActions()),
+        (1, lambda partition_path: update_actions.OT2UpdateActions()),
     ]
 )
 def sys_handler(request):
@@ -97,23 +100,51 @@ async def test_updater_chain(
         conf,
         loop,
         downloaded_update_file_consolidated.pop(sys_handler[0]),
-        sys_handler[1](),
+        sys_handler[1](testing_partition),
     )
     assert session.stage == Stages.VALIDATING
+    stages = []
     last_progress = 0.0
-    while session.stage == Stages.VALIDATING:
+    while session.stage in (Stages.VALIDATING, Stages.WRITING):
+        if not stages or stages[-1] != session.stage:
+            stages.append(session.stage)
+            last_progress = 0.0
         assert session.state["progress"] >= last_progress
-        assert session.state["stage"] == "validating"
-        assert session.stage == Stages.VALIDATING
         last_progress = session.state["progress"]
         await asyncio.sleep(0.01)
-    assert fut.done()
-    last_progress = 0.0
-    while session.stage == Stages.WRITING:
-        assert session.state["progress"] >= last_progress
-        last_progress = session.state["progress"]
-        await asyncio.sleep(0.1)
+    await fut
     assert session.stage == Stages.DONE, session.error
+    assert stages in (
+        [Stages.VALIDATING, Stages.WRITING],
+        [Stages.VALIDATING],
+        [Stages.WRITING],
+    )
+
+
+async def test_session_reports_writing(otupdate_config, loop):
+    conf = config.load_from_path(otupdate_config)
+    session = UpdateSession(conf.download_storage_path)
+    stages = []
+    set_stage = session.set_stage
+
+    def record_stage(stage):
+        stages.append((stage, session.state["progress"]))
+        set_stage(stage)
+
+    def validate_and_write_update(filepath, progress_callback, cert_path):
+        progress_callback(0.0)
+        progress_callback(0.5)
+
+    session.set_stage = record_stage
+    actions = mock.Mock(spec=UpdateActionsInterface)
+    actions.validate_and_write_update.side_effect = validate_and_write_update
+    await update._begin_validation(session, conf, loop, "update.zip", actions)
+
+    assert stages == [
+        (Stages.VALIDATING, 0.0),
+        (Stages.WRITING, 0.0),
+        (Stages.DONE, 0.5),
+    ]
 
 
 @pytest.mark.exclude_rootfs_ext4
@@ -121,6 +152,7 @@ async def test_session_catches_validation_fail(
     otupdate_config,
     downloaded_update_file_consolidated,
     loop,
+    testing_partition,
     sys_handler,
 ):
     conf = config.load_from_path(otupdate_config)
@@ -130,7 +162,7 @@ async def test_session_catches_validation_fail(
         conf,
         loop,
         downloaded_update_file_consolidated.pop(sys_handler[0]),
-        sys_handler[1](),
+        sys_handler[1](testing_partition),
     )
     with pytest.raises(file_actions.FileMissing):
         await fut
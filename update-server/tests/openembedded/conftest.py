@@ -48,14 +48,16 @@ def mock_root_fs_interface() -> MagicMock:
     return MagicMock(spec=RootFSInterface)
 
 
-def mock_partition_manager_valid_switch_() -> MagicMock:
+def mock_partition_manager_valid_switch_(
+    partition_path: str = "/dev/mmcblk0p2",
+) -> MagicMock:
     """Mock Partition Manager."""
     mock = MagicMock(spec=PartitionManager)
     mock.find_unused_partition.return_value = Partition(
-        2, "/dev/mmcblk0p2", "/media/mmcblk0p2"
+        2, partition_path, "/media/mmcblk0p2"
     )
     mock.switch_partition.return_value = Partition(
-        2, "/dev/mmcblk0p2", "/media/mmcblk0p2"
+        2, partition_path, "/media/mmcblk0p2"
     )
     mock.resize_partition.return_value = True
     mock.mount_fs.return_value = True
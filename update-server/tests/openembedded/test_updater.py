@@ -1,6 +1,4 @@
 """Tests for OE Updater."""
-import os
-from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,11 +7,8 @@ from otupdate.common.update_actions import Partition
 from otupdate.openembedded.updater import (
     Updater,
     PartitionManager,
-    RootFSInterface,
 )
 
-import lzma
-
 
 # test valid partition switch
 
@@ -21,24 +16,16 @@ import lzma
 def test_update_valid_part_switch(
     mock_root_fs_interface: MagicMock, mock_partition_manager_valid_switch: MagicMock
 ):
-    """Test root fs being written to unused partition."""
+    """Test switching to the unused partition."""
 
     updater = Updater(
         root_FS_intf=mock_root_fs_interface,
         part_mngr=mock_partition_manager_valid_switch,
     )
-    # lambda just mocks progress callback,
-    # 2 here has no significance whatsoever.
-    updater.decomp_and_write("/mmc/blk0p1", lambda x: x(2))
-    mock_partition_manager_valid_switch.find_unused_partition.assert_called()
-    mock_root_fs_interface.write_update.assert_called()
     updater.commit_update()
     mock_partition_manager_valid_switch.find_unused_partition.assert_called()
     mock_partition_manager_valid_switch.switch_partition.assert_called()
 
-    updater.write_update("/mmc/blk0p1", lambda x: x(2))
-    mock_partition_manager_valid_switch.find_unused_partition.assert_called()
-
     updater.mount_update()
     mock_partition_manager_valid_switch.find_unused_partition.assert_called()
 
@@ -53,10 +40,6 @@ def test_update_invalid_part_switch(
         part_mngr=mock_partition_manager_invalid_switch,
     )
 
-    updater.decomp_and_write("/mmc/blk0p1", lambda x: x(2))
-    mock_partition_manager_invalid_switch.find_unused_partition.assert_called()
-    mock_root_fs_interface.write_update.assert_called()
-
     with pytest.raises(RuntimeError):
         updater.commit_update()
     mock_partition_manager_invalid_switch.find_unused_partition.assert_called()
@@ -76,20 +59,6 @@ def test_unused_partition(mock_root_fs_interface, test_input, expected):
     assert updater.part_mngr.find_unused_partition(test_input) == expected
 
 
-def test_decomp_and_write(
-    mock_root_fs_interface: MagicMock, mock_partition_manager_valid_switch: MagicMock
-):
-    """Test helper functions get called as expected in decomp_and_write"""
-    updater = Updater(
-        root_FS_intf=mock_root_fs_interface,
-        part_mngr=mock_partition_manager_valid_switch,
-    )
-
-    updater.decomp_and_write("test_path", lambda x: x(2))
-    mock_partition_manager_valid_switch.find_unused_partition.assert_called()
-    mock_root_fs_interface.write_update.assert_called()
-
-
 def test_commit_update(
     mock_root_fs_interface: MagicMock,
     mock_partition_manager_valid_switch: MagicMock,
@@ -102,34 +71,3 @@ def test_commit_update(
     updater.commit_update()
     mock_partition_manager_valid_switch.mount_fs.assert_called()
     mock_partition_manager_valid_switch.resize_partition.assert_called()
-
-
-def test_lzma(testing_partition, tmpdir):
-    """Test that lzma decompresses a .xz correctly.
-
-    Updater::write_update has a callback to report progress. callback gets kicked
-    off on writing every chunk.
-
-    This test uses callback call count to see if
-    the entire file decompresses correctly.
-    """
-    rfs_path = os.path.join(tmpdir, "rootfs.xz")
-    with lzma.open(rfs_path, "w") as f:
-        f.write(os.urandom(400000))
-    cb = mock.Mock()
-    root_FS_intf = RootFSInterface()
-    p = Partition(2, testing_partition, "/media/mmcblk0p2")
-    total_size = 0
-    chunk_size = 1024 * 32
-    with lzma.open(rfs_path, "rb") as fsrc:
-        while True:
-            chunk = fsrc.read(chunk_size)
-            total_size += len(chunk)
-            if len(chunk) != chunk_size:
-                break
-    root_FS_intf.write_update(rfs_path, p, cb, chunk_size)
-    if total_size % chunk_size != 0:
-        calls = int(total_size / chunk_size) + 1
-    else:
-        calls = total_size / chunk_size
-    assert cb.call_count == calls